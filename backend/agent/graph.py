@@ -1,7 +1,7 @@
 from typing import Any
 from langgraph.graph import START, StateGraph, END
 
-from backend.agent.schema import LegalFieldClassification, CaseCategoryClassification, classes
+from backend.agent.schema import CaseClassification, format_subcategories
 from backend.agent.state import LegalAgentState
 from backend.utils import markdown_to_prompt_template
 from experts.tools.swiss_law_retriever.retriever import LegalRetriever
@@ -9,36 +9,27 @@ from apertus.apertus import LangchainApertus
 from core.config import settings
 
 
-classify_legal_field_prompt = markdown_to_prompt_template(
-    "agent/prompts/classify_legal_field_prompt.md"
-)
-classify_case_category_prompt = markdown_to_prompt_template(
-    "agent/prompts/classify_case_category_prompt.md"
+classify_case_prompt = markdown_to_prompt_template(
+    "agent/prompts/classify_case_prompt.md"
 )
 
 
 # Create the runnable with the prompt and model
-classify_legal_field_runnable = classify_legal_field_prompt | LangchainApertus(
-    api_key=settings.APERTUS_API_KEY
-).with_structured_output(LegalFieldClassification)
-
-classify_case_category_runnable = classify_case_category_prompt | LangchainApertus(
+classify_case_runnable = classify_case_prompt | LangchainApertus(
     api_key=settings.APERTUS_API_KEY
-).with_structured_output(CaseCategoryClassification)
-
-
-def classify_legal_field(state: LegalAgentState) -> dict[str, Any]:
-    result: LegalFieldClassification = classify_legal_field_runnable.invoke(
-        {"question": state.question, "additional_context": ""}
-    )
-    return {"legal_field": result.legal_field}
+).with_structured_output(CaseClassification)
 
 
-def classify_case_category(state: LegalAgentState) -> dict[str, Any]:
-    result: CaseCategoryClassification = classify_case_category_runnable.invoke(
-        {"question": state.question, "additional_context": state.legal_field, "classes": classes.get(state.legal_field)}
+def classify_case(state: LegalAgentState) -> dict[str, Any]:
+    # Legal field and case category in one structured call
+    result: CaseClassification = classify_case_runnable.invoke(
+        {"question": state.question, "additional_context": "", "classes": format_subcategories()}
     )
-    return {"case_category": result.case_category}
+    return {
+        "legal_field": result.legal_field,
+        "case_category": result.subcategory,
+        "confidence": result.confidence,
+    }
 
 
 def search_similar_cases(state: LegalAgentState) -> dict[str, Any]:
@@ -51,15 +42,13 @@ def search_similar_cases(state: LegalAgentState) -> dict[str, Any]:
 workflow = StateGraph(LegalAgentState)
 
 # Add nodes
-workflow.add_node("classify_legal_field", classify_legal_field)
-workflow.add_node("classify_case_category", classify_case_category)
+workflow.add_node("classify_case", classify_case)
 # workflow.add_node("search_similar_cases", search_similar_cases)
 
 # Add edges
-workflow.add_edge(START, "classify_legal_field")
-workflow.add_edge("classify_legal_field", "classify_case_category")
-workflow.add_edge("classify_case_category", END)
-# workflow.add_edge("classify_case_category", "search_similar_cases")
+workflow.add_edge(START, "classify_case")
+workflow.add_edge("classify_case", END)
+# workflow.add_edge("classify_case", "search_similar_cases")
 
 
 # Compile the workflow
@@ -15,6 +15,10 @@ class LegalAgentState(BaseModel):
         default=None,
         description="The determined case category of the user's question/case.",
     )
+    confidence: float | None = Field(
+        default=None,
+        description="Confidence of the classification (0-1).",
+    )
     similar_cases: str = Field(
         "", description="Candidates of similar cases to the user's input."
     )
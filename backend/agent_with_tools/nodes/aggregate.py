@@ -66,11 +66,19 @@ def aggregate_node(state: AgentState) -> AgentState:
     else:
         time_str = f"{time_val} {time_unit}"
     
+    # Add the simulated spread when the estimate comes from the estimator tables
+    time_p10, time_p90 = state.time_estimate.p10, state.time_estimate.p90
+    if time_p10 is not None and time_p90 is not None and time_p10 < time_p90:
+        time_str += f" (P10–P90: {time_p10:.0f}–{time_p90:.0f} {time_unit})"
+    
     # Normalize cost estimate to string format
     if isinstance(state.cost_estimate, (int, float)):
         cost_output = f"{int(state.cost_estimate)} CHF"
     elif isinstance(state.cost_estimate, CostBreakdown):
         cost_output = f"{int(state.cost_estimate.total_chf)} CHF"
+        cost_p10, cost_p90 = state.cost_estimate.p10_chf, state.cost_estimate.p90_chf
+        if cost_p10 is not None and cost_p90 is not None and cost_p10 < cost_p90:
+            cost_output += f" (P10–P90: {int(cost_p10)}–{int(cost_p90)} CHF)"
     else:
         # Handle dict format from fallback estimation
         if hasattr(state.cost_estimate, 'total_chf'):
@@ -1,84 +1,70 @@
 """Categorization node for classifying legal cases."""
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from backend.agent_with_tools.schemas import AgentState
 from backend.agent_with_tools.tools.categorize_case import categorize_case
 from backend.agent_with_tools.tools.ask_user import ask_user
-from backend.agent_with_tools.policies import CATEGORIZE_PROMPT, MIN_CATEGORY_CONFIDENCE
+from backend.agent_with_tools.tools.historic_cases import embed_case_text
+from backend.agent_with_tools.tools.estimator_constants import CATEGORY_MAPPING
+from experts.tools.estimators import category_model
+from experts.tools.estimators.case_keywords import has_subcategory_match
+from backend.agent_with_tools.policies import (
+    CATEGORY_CLARIFICATION_QUESTION,
+    CATEGORY_MODEL_ENABLED,
+    MIN_CATEGORY_CONFIDENCE,
+)
 
 
-def categorize_node(state: AgentState, llm) -> AgentState:
+def categorize_node(state: AgentState, llm=None) -> AgentState:
     """
     Categorize the case into one of four legal categories.
     
     Args:
         state: Current agent state
-        llm: Apertus LLM instance
+        llm: Unused; kept for the node signature of the graph
         
     Returns:
         Updated state with category classification
     """
-    try:
-        # First attempt at categorization
-        category_result = categorize_case(state.case_input.text)
-        state.tool_call_count += 1
-        
-        # Check if confidence is sufficient
-        if category_result.confidence >= MIN_CATEGORY_CONFIDENCE:
-            state.category = category_result
-        else:
-            # Use LLM to generate a precise question for the user
-            messages = [
-                SystemMessage(content=CATEGORIZE_PROMPT),
-                HumanMessage(content=f"""
-                Case text: {state.case_input.text}
-                
-                The initial categorization has low confidence ({category_result.confidence:.2f}).
-                Generate a single, clear question to ask the user to clarify the case type.
-                Focus on distinguishing between: Arbeitsrecht, Immobilienrecht, Strafverkehrsrecht, Andere.
-                """)
-            ]
-            
-            response = llm.invoke(messages)
-            clarification_question = response.content.strip()
-            
-            # Ask user for clarification
-            missing_fields = ["case_type_clarification"]
-            additional_info = ask_user(clarification_question, missing_fields)
+    # Embedded once for the category classifier and reused for the similar cases of
+    # win_likelihood_node; without a trained classifier the similar cases embed it when needed
+    if state.case_embedding is None and CATEGORY_MODEL_ENABLED and category_model.CATEGORY_MODEL is not None:
+        state.case_embedding = embed_case_text(state.case_input.text)
+    
+    # First attempt at categorization (embedding classifier or one structured LLM call)
+    category_result = categorize_case(state.case_input.text, state.keyword_hits, state.case_embedding)
+    state.tool_call_count += 1
+    state.category = category_result
+    
+    if category_result.confidence < MIN_CATEGORY_CONFIDENCE:
+        try:
+            # Ask user for clarification and re-categorize once
+            additional_info = ask_user(CATEGORY_CLARIFICATION_QUESTION, ["case_type_clarification"])
             state.tool_call_count += 1
             
-            # Re-categorize with additional information
             augmented_text = f"{state.case_input.text}\n\nAdditional clarification: {additional_info}"
-            category_result = categorize_case(augmented_text)
+            category_result = categorize_case(augmented_text, state.keyword_hits, state.case_embedding)
             state.tool_call_count += 1
             state.category = category_result
             
             # Update case facts with additional info
             if state.case_facts:
                 state.case_facts["clarification"] = additional_info
-            
-    except NotImplementedError:
-        # Fallback: Use LLM for categorization when tool is not implemented
-        messages = [
-            SystemMessage(content=CATEGORIZE_PROMPT),
-            HumanMessage(content=f"Categorize this case: {state.case_input.text}")
-        ]
-        
-        response = llm.invoke(messages)
-        
-        # Parse LLM response (simplified - assumes LLM returns category name)
-        content = response.content.strip()
-        categories = ["Arbeitsrecht", "Immobilienrecht", "Strafverkehrsrecht", "Andere"]
-        
-        # Find matching category
-        category = "Andere"  # default
-        for cat in categories:
-            if cat.lower() in content.lower():
-                category = cat
-                break
-        
-        from backend.agent_with_tools.schemas import CategoryResult
-        state.category = CategoryResult(category=category, confidence=0.8)
+        except NotImplementedError:
+            # No user interaction available: keep the classification
+            print(
+                f"⚠️ Low category confidence ({category_result.confidence:.2f}), "
+                f"keeping {category_result.category}"
+            )
+    
+    # Case type of the classifier, unless a keyword rule already picked one in ingest_node
+    estimator_category = CATEGORY_MAPPING.get(state.category.category, "")
+    if (
+        state.category.subcategory
+        and state.subcategories is not None
+        and estimator_category in state.subcategories
+        and not has_subcategory_match(state.keyword_hits or [], estimator_category)
+    ):
+        state.subcategories[estimator_category] = state.category.subcategory
     
     # Update case facts with category
     if state.case_facts:
@@ -1,6 +1,8 @@
 """Ingest node - processes case input and initializes metadata."""
 
 from backend.agent_with_tools.schemas import AgentState
+from experts.tools.estimators.case_keywords import match_keywords, subcategories_for
+from experts.tools.vector_index.language import detect_language
 
 
 def ingest_node(state: AgentState) -> AgentState:
@@ -30,6 +32,18 @@ def ingest_node(state: AgentState) -> AgentState:
         if state.case_input.metadata.preferred_units:
             case_facts["preferred_units"] = state.case_input.metadata.preferred_units
     
+    # Detect the language locally if the client did not send it (routes statute retrieval)
+    if "language" not in case_facts:
+        language, confidence = detect_language(state.case_input.text)
+        if language:
+            case_facts["language"] = language
+            case_facts["language_confidence"] = round(confidence, 2)
+    
+    # Match all keywords once; categorization, retrieval queries and estimators reuse the hits
+    hits = match_keywords(state.case_input.text)
+    state.keyword_hits = sorted(hits)
+    state.subcategories = subcategories_for(hits)
+    
     # Update state
     state.case_facts = case_facts
     state.tool_call_count = 0
@@ -1,4 +1,10 @@
+from typing import Optional
 from backend.agent_with_tools.schemas import AgentState
+from backend.agent_with_tools.policies import (
+    FAST_MODE,
+    FAST_MODE_PURSUE_LIKELIHOOD,
+    FAST_MODE_UNCERTAIN_LIKELIHOOD,
+)
 from backend.apertus import get_apertus_model
 from langchain_core.prompts import ChatPromptTemplate
 from textwrap import dedent
@@ -51,16 +57,118 @@ else:
     """)
 
 
+# Templated answers of fast mode, per language of the case text
+ANDERE_ANSWERS = {
+    "de": "Ihr Fall fällt in keines der Rechtsgebiete, die wir derzeit beurteilen können "
+    "(Arbeitsrecht, Immobilienrecht, Strafverkehrsrecht). Erfolgschancen, Dauer und Kosten "
+    "können wir deshalb nicht schätzen. Bitte wenden Sie sich für eine individuelle "
+    "Beurteilung an unsere Rechtsberatung.",
+    "fr": "Votre cas ne relève d'aucun des domaines que nous pouvons actuellement évaluer "
+    "(droit du travail, droit immobilier, droit pénal de la circulation). Nous ne pouvons donc "
+    "pas estimer les chances de succès, la durée ni les coûts. Veuillez contacter nos "
+    "conseillers juridiques pour une évaluation individuelle.",
+    "it": "Il suo caso non rientra in nessuno degli ambiti che possiamo attualmente valutare "
+    "(diritto del lavoro, diritto immobiliare, diritto penale della circolazione). Non possiamo "
+    "quindi stimare le probabilità di successo, la durata né i costi. Si rivolga ai nostri "
+    "consulenti legali per una valutazione individuale.",
+    "en": "Your case does not fall into one of the areas we can currently assess "
+    "(employment law, real estate law, traffic criminal law). We therefore cannot estimate "
+    "its chances, duration or costs. Please contact our legal advisors for an individual "
+    "assessment.",
+}
+
+ESTIMATE_ANSWERS = {
+    "de": "Rechtsgebiet: {category}. Erfolgschance: {likelihood}. "
+    "Voraussichtliche Dauer: {estimated_time}. Voraussichtliche Kosten: {estimated_cost}. {recommendation}",
+    "fr": "Domaine juridique : {category}. Chances de succès : {likelihood}. "
+    "Durée prévue : {estimated_time}. Coûts prévus : {estimated_cost}. {recommendation}",
+    "it": "Ambito giuridico: {category}. Probabilità di successo: {likelihood}. "
+    "Durata prevista: {estimated_time}. Costi previsti: {estimated_cost}. {recommendation}",
+    "en": "Category: {category}. Chance of success: {likelihood}. "
+    "Expected duration: {estimated_time}. Expected cost: {estimated_cost}. {recommendation}",
+}
+
+# (pursue, uncertain, not recommended)
+RECOMMENDATIONS = {
+    "de": (
+        "Es lohnt sich, den Fall weiterzuverfolgen.",
+        "Der Ausgang ist unsicher; verfolgen Sie den Fall nur mit soliden Beweisen weiter.",
+        "Wir raten davon ab, den Fall weiterzuverfolgen.",
+    ),
+    "fr": (
+        "Il vaut la peine de poursuivre le cas.",
+        "L'issue est incertaine ; ne poursuivez le cas qu'avec des preuves solides.",
+        "Nous déconseillons de poursuivre le cas.",
+    ),
+    "it": (
+        "Vale la pena proseguire il caso.",
+        "L'esito è incerto; prosegua il caso solo con prove solide.",
+        "Sconsigliamo di proseguire il caso.",
+    ),
+    "en": (
+        "The case is worth pursuing.",
+        "The outcome is uncertain; pursue the case only with solid evidence.",
+        "Pursuing the case is not recommended.",
+    ),
+}
+
+
+def render_template_answer(state: AgentState) -> Optional[str]:
+    """
+    Templated final answer for cases where the LLM would not add anything.
+
+    Args:
+        state: Current agent state with the aggregated result
+
+    Returns:
+        Answer for 'Andere' cases and for cases whose likelihood is a confident
+        baseline (fast path), in the language of the case text; None otherwise
+    """
+    language = (state.case_facts or {}).get("language")
+    if language not in ANDERE_ANSWERS:
+        language = "en"
+
+    if state.result.category == "Andere":
+        return ANDERE_ANSWERS[language]
+    if not state.fast_path:
+        return None
+
+    likelihood = state.likelihood_win
+    pursue, uncertain, hopeless = RECOMMENDATIONS[language]
+    if likelihood >= FAST_MODE_PURSUE_LIKELIHOOD:
+        recommendation = pursue
+    elif likelihood >= FAST_MODE_UNCERTAIN_LIKELIHOOD:
+        recommendation = uncertain
+    else:
+        recommendation = hopeless
+    return ESTIMATE_ANSWERS[language].format(
+        category=state.result.category,
+        likelihood=state.result.likelihood_win,
+        estimated_time=state.result.estimated_time,
+        estimated_cost=state.result.estimated_cost,
+        recommendation=recommendation,
+    )
+
+
 def prepare_final_answer_node(state: AgentState) -> AgentState:
     """
     Formulate the final information in a helpful + user-friendly way.
 
+    In fast mode, 'Andere' cases and cases with a confident baseline get a
+    templated answer instead of an LLM call.
+
     Args:
         state: Current agent state with all analysis results
 
     Returns:
         Updated state with the final answer
     """
+    if FAST_MODE:
+        answer = render_template_answer(state)
+        if answer is not None:
+            state.result.final_answer = answer
+            return state
+
     model = get_apertus_model()
     runnable = ChatPromptTemplate.from_template(prepare_final_answer_prompt) | model
     # print("\n".join([part for part in state.explanation_parts]))
@@ -1,27 +1,24 @@
 """Time and cost estimation node."""
 
-from langchain_core.messages import HumanMessage, SystemMessage
 from backend.agent_with_tools.schemas import AgentState, TimeEstimate
-from backend.agent_with_tools.tools.rag_swiss_law import rag_swiss_law
-from backend.agent_with_tools.tools.historic_cases import historic_cases
 from backend.agent_with_tools.tools.estimate_time import estimate_time
 from backend.agent_with_tools.tools.estimate_cost import estimate_cost
+from backend.agent_with_tools.tools.estimator_constants import CATEGORY_MAPPING
+from experts.tools.estimators.complexity import assess_complexity
 from backend.agent_with_tools.policies import (
-    TIME_COST_PROMPT, 
-    DEFAULT_COMPLEXITY,
     DEFAULT_COURT_LEVEL,
     DEFAULT_HOURLY_RATE_LAWYER,
     DEFAULT_VAT_RATE
 )
 
 
-def time_and_cost_node(state: AgentState, llm) -> AgentState:
+def time_and_cost_node(state: AgentState, llm=None) -> AgentState:
     """
-    Estimate time and cost using multi-source analysis with RAG and business logic tools.
+    Estimate time and cost from the business logic tools and a local complexity assessment.
     
     Args:
         state: Current agent state
-        llm: Apertus LLM instance
+        llm: Unused; kept for the node signature of the graph
         
     Returns:
         Updated state with time and cost estimates
@@ -33,71 +30,17 @@ def time_and_cost_node(state: AgentState, llm) -> AgentState:
     enhanced_case_facts = dict(state.case_facts) if state.case_facts else {}
     enhanced_case_facts.update({
         "category": category,
-        "complexity": DEFAULT_COMPLEXITY,
         "court_level": enhanced_case_facts.get("court_level", DEFAULT_COURT_LEVEL),
     })
+    # Subcategory matched once in ingest_node (the estimators fall back to the case text)
+    subcategory = (state.subcategories or {}).get(CATEGORY_MAPPING.get(category, ""))
+    if subcategory:
+        enhanced_case_facts["subcategory"] = subcategory
     
-    # Try to enhance case facts with RAG and historic data
-    context_parts = [f"Case: {case_text}"]
-    
-    try:
-        # Get procedural information from Swiss law
-        procedural_query = f"{category} court procedure timeline Switzerland"
-        law_docs = rag_swiss_law(procedural_query, top_k=2)
-        state.tool_call_count += 1
-        
-        if law_docs:
-            law_info = " ".join([doc.snippet for doc in law_docs])
-            context_parts.append(f"Procedural Law: {law_info[:200]}...")
-            
-    except NotImplementedError:
-        context_parts.append("Procedural law: Not available")
-    
-    try:
-        # Get timing information from historic cases  
-        timing_query = f"{category} case duration time Switzerland"
-        similar_cases = historic_cases(timing_query, top_k=2)
-        state.tool_call_count += 1
-        
-        if similar_cases:
-            cases_info = " ".join([case.summary for case in similar_cases])
-            context_parts.append(f"Similar Cases: {cases_info[:200]}...")
-            
-    except NotImplementedError:
-        context_parts.append("Historic timing data: Not available")
-    
-    # Use LLM to analyze complexity and enhance case facts
-    analysis_context = "\n".join(context_parts)
-    messages = [
-        SystemMessage(content=TIME_COST_PROMPT),
-        HumanMessage(content=f"""
-        Analyze this case to determine complexity and key factors:
-        
-        {analysis_context}
-        
-        Based on the case description and legal context, assess:
-        1. Complexity level (low/medium/high)
-        2. Likely court level if not specified
-        3. Whether appeals are expected
-        4. Any procedural complications
-        
-        Respond with a brief analysis mentioning these factors.
-        """)
-    ]
-    
-    response = llm.invoke(messages)
-    analysis = response.content.strip()
-    
-    # Extract complexity from LLM response
-    if "high" in analysis.lower():
-        enhanced_case_facts["complexity"] = "high"
-    elif "low" in analysis.lower():
-        enhanced_case_facts["complexity"] = "low"
-    else:
-        enhanced_case_facts["complexity"] = "medium"
-    
-    # Check for appeal mentions
-    if "appeal" in analysis.lower():
+    # Complexity and expected appeals from local text features (no LLM round-trip)
+    assessment = assess_complexity(case_text, category)
+    enhanced_case_facts["complexity"] = assessment.complexity
+    if assessment.appeal_expected:
         enhanced_case_facts["appeal_expected"] = True
     
     # Get time estimate
@@ -128,6 +71,7 @@ def time_and_cost_node(state: AgentState, llm) -> AgentState:
         "time_estimate": state.time_estimate.model_dump(),
         "category": category,  # Add category for estimator mapping
         "case_text": case_text,  # Add case text for subcategory inference
+        "subcategory": subcategory,
         "hourly_rates": {
             "lawyer": DEFAULT_HOURLY_RATE_LAWYER,
         },
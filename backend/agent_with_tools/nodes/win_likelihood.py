@@ -4,8 +4,23 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from backend.agent_with_tools.schemas import AgentState
 from backend.agent_with_tools.tools.rag_swiss_law import rag_swiss_law
 from backend.agent_with_tools.tools.historic_cases import historic_cases
-from backend.agent_with_tools.tools.estimate_likelihood import estimate_business_likelihood, get_likelihood_explanation_context
-from backend.agent_with_tools.policies import WIN_LIKELIHOOD_PROMPT, MAX_RAG_CALLS, MAX_HISTORIC_CALLS, MAX_BUSINESS_LIKELIHOOD_CALLS
+from backend.agent_with_tools.tools.estimate_likelihood import (
+    estimate_business_likelihood,
+    get_likelihood_explanation_context,
+    is_confident_baseline,
+)
+from backend.agent_with_tools.tools.estimate_outcome import estimate_outcome_likelihood, format_outcome_context
+from backend.agent_with_tools.tools.estimator_constants import CATEGORY_MAPPING
+from experts.tools.estimators.case_keywords import has_subcategory_match, match_keywords
+from backend.agent_with_tools.policies import (
+    WIN_LIKELIHOOD_PROMPT,
+    MAX_RAG_CALLS,
+    MAX_HISTORIC_CALLS,
+    MAX_BUSINESS_LIKELIHOOD_CALLS,
+    FAST_MODE,
+    FAST_MODE_MAX_CHANCE_SPREAD,
+    OUTCOME_MODEL_ENABLED,
+)
 import os
 
 GEMINI_LLM = os.getenv("GEMINI_LLM", "FALSE") == "TRUE"
@@ -23,6 +38,9 @@ def win_likelihood_node(state: AgentState, llm) -> AgentState:
     """
     category = state.category.category if state.category else "Unknown"
     case_text = state.case_input.text
+    # Keyword groups matched once in ingest_node
+    hits = set(state.keyword_hits) if state.keyword_hits is not None else match_keywords(case_text)
+    subcategory = (state.subcategories or {}).get(CATEGORY_MAPPING.get(category, ""))
     
     # Initialize explanation parts and source documents if not already done
     if state.explanation_parts is None:
@@ -38,7 +56,7 @@ def win_likelihood_node(state: AgentState, llm) -> AgentState:
     baseline_likelihood = None
     
     if business_likelihood_calls < MAX_BUSINESS_LIKELIHOOD_CALLS:
-        business_result = estimate_business_likelihood(case_text, category)
+        business_result = estimate_business_likelihood(case_text, category, subcategory)
         state.tool_call_count += 1
         business_likelihood_calls += 1
         
@@ -49,38 +67,52 @@ def win_likelihood_node(state: AgentState, llm) -> AgentState:
         # Add explanation
         state.explanation_parts.append(business_result["explanation"])
     
+    # Fast mode: the LLM may only move a confident baseline within ±20%, so take it as is before any retrieval
+    if (
+        FAST_MODE
+        and baseline_likelihood is not None
+        and has_subcategory_match(hits, CATEGORY_MAPPING.get(category, ""))
+        and is_confident_baseline(business_result, FAST_MODE_MAX_CHANCE_SPREAD)
+    ):
+        state.likelihood_win = baseline_likelihood
+        state.fast_path = True
+        state.explanation_parts.append(
+            f"Win likelihood analysis: Business logic baseline of {baseline_likelihood}% "
+            f"({business_result['raw_estimate']}) applied without LLM review (fast mode)."
+        )
+        print(f"⚡ Fast mode: using baseline {baseline_likelihood}% for {business_result['subcategory']}")
+        return state
+    
     # Try to gather Swiss law context with focused queries
     rag_calls = 0
     try:
         if rag_calls < MAX_RAG_CALLS:
             # Create specific query based on case category and key terms from case
-            case_lower = case_text.lower()
-            
             if "Arbeitsrecht" in category:
-                if "terminated" in case_lower or "dismissal" in case_lower or "kündigung" in case_lower or "notice" in case_lower:
+                if "termination_law" in hits:
                     law_query = "employment termination dismissal notice period article 336 337 338 339 fristlose kündigung Arbeitsvertrag"
-                elif "wage" in case_lower or "salary" in case_lower or "lohn" in case_lower:
+                elif "wage_law" in hits:
                     law_query = "employment wage salary payment article 322 323 324 Lohn Arbeitslohn"
-                elif "mobbing" in case_lower or "harassment" in case_lower or "discrimination" in case_lower:
+                elif "harassment" in hits:
                     law_query = "employment protection harassment discrimination article 328 328a Fürsorgepflicht"
                 else:
                     law_query = "employment contract work Arbeitsvertrag article 319 320 321 employee rights obligations"
             elif "Immobilienrecht" in category:
-                if "defect" in case_lower or "damage" in case_lower or "mängel" in case_lower:
+                if "defect" in hits:
                     law_query = "property defects warranty article 197 208 Civil Code real estate purchase"
-                elif "rent" in case_lower or "miete" in case_lower or "lease" in case_lower:
+                elif "rent" in hits:
                     law_query = "rental law lease agreement tenant landlord article 253 Civil Code"
                 else:
                     law_query = "real estate property law Civil Code article 641 ownership purchase contract"
             elif "Strafverkehrsrecht" in category:
-                if "license" in case_lower or "driving" in case_lower:
+                if "license" in hits:
                     law_query = "Swiss traffic law license suspension OR Road Traffic Act penalties"
                 else:
                     law_query = "Swiss traffic criminal law violations fines"
             else:
                 law_query = f"Swiss law {category} legal regulations"
             
-            law_docs = rag_swiss_law(law_query)
+            law_docs = rag_swiss_law(law_query, category=category, language=(state.case_facts or {}).get("language"))
             state.tool_call_count += 1
             rag_calls += 1
             
@@ -181,13 +213,12 @@ def win_likelihood_node(state: AgentState, llm) -> AgentState:
     try:
         if historic_calls < MAX_HISTORIC_CALLS:
             # Create specific query based on case content and category for better matching
-            case_keywords = case_text.lower()
             if "Arbeitsrecht" in category:
-                if any(term in case_keywords for term in ["kündigung", "termination", "dismissed", "fired"]):
+                if "termination_cases" in hits:
                     cases_query = f"employment termination dismissal wrongful firing {category}"
-                elif any(term in case_keywords for term in ["wage", "salary", "lohn", "payment"]):
+                elif "wage_cases" in hits:
                     cases_query = f"employment wage salary payment dispute {category}"
-                elif any(term in case_keywords for term in ["mobbing", "harassment", "discrimination"]):
+                elif "harassment" in hits:
                     cases_query = f"employment harassment mobbing workplace discrimination {category}"
                 else:
                     cases_query = f"employment law workplace dispute {category}"
@@ -218,13 +249,41 @@ def win_likelihood_node(state: AgentState, llm) -> AgentState:
     except NotImplementedError:
         context_parts.append("Historic cases: Not available (stub implementation)")
     
+    # Data-driven likelihood from the outcome model and similar cases (no LLM)
+    data_likelihood = None
+    if OUTCOME_MODEL_ENABLED:
+        outcome_result = estimate_outcome_likelihood(case_text, embedding=state.case_embedding)
+        state.tool_call_count += 1
+        if outcome_result["likelihood"] is not None:
+            context_parts.append(f"Data-Driven Likelihood:\n{format_outcome_context(outcome_result, baseline_likelihood)}")
+        # Only a trained outcome model fixes the score; a neighbour vote alone is context for the LLM
+        if outcome_result["likelihood"] is not None and outcome_result["model_probability"] is not None:
+            data_likelihood = outcome_result["likelihood"]
+            if baseline_likelihood is not None:
+                # Same ±20% range around the business logic baseline as the LLM score
+                data_likelihood = max(max(1, baseline_likelihood - 20), min(min(100, baseline_likelihood + 20), data_likelihood))
+            state.explanation_parts.append(outcome_result["explanation"])
+    
     # Use LLM for synthesis and analysis
     full_context = "\n\n".join(context_parts)
     
     # Prepare enhanced prompt with baseline guidance
     baseline_guidance = ""
     adjustment_range = ""
-    if baseline_likelihood is not None:
+    if data_likelihood is not None:
+        # The score is fixed; the LLM only explains it
+        baseline_guidance = f"""
+        
+        FIXED SCORE: The win likelihood of this case is {data_likelihood}%, computed by the outcome model
+        from similar historic cases and the business logic baseline. Do not re-estimate it.
+        """
+        
+        adjustment_range = f"""
+        SCORING CONSTRAINTS:
+        - Your score MUST be exactly {data_likelihood}%
+        - Explain which precedents, Swiss law provisions and case facts support or weaken this likelihood
+        """
+    elif baseline_likelihood is not None:
         # Calculate allowed adjustment range (±20% max, but not below 1 or above 100)
         min_score = max(1, baseline_likelihood - 20)
         max_score = min(100, baseline_likelihood + 20)
@@ -313,6 +372,9 @@ def win_likelihood_node(state: AgentState, llm) -> AgentState:
     except (ValueError, AttributeError):
         pass  # Keep defaults
     
+    if data_likelihood is not None:
+        likelihood = data_likelihood
+    
     state.likelihood_win = likelihood
     
     # Add clean reasoning to explanation
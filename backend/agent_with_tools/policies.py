@@ -15,17 +15,11 @@ You have access to the following tools:
 Always think step-by-step and justify your reasoning."""
 
 # Node-specific prompts
-CATEGORIZE_PROMPT = """Classify the case into one of: Arbeitsrecht, Immobilienrecht, Strafverkehrsrecht, Andere. 
-
-If confidence < 0.6, call ask_user with a single clear question and missing_fields. Then re-classify once.
-
-Focus on key legal indicators:
-- Arbeitsrecht: Employment contracts, workplace disputes, dismissals, wages
-- Immobilienrecht: Property disputes, rental agreements, real estate transactions
-- Strafverkehrsrecht: Traffic violations, criminal traffic offenses, license issues
-- Andere: All other legal matters
-
-Be precise and confident in your classification."""
+# Asked (without an LLM call) when the category confidence is below MIN_CATEGORY_CONFIDENCE
+CATEGORY_CLARIFICATION_QUESTION = (
+    "Does your case concern employment (Arbeitsrecht), real estate or rent (Immobilienrecht), "
+    "traffic offences (Strafverkehrsrecht) or another legal matter?"
+)
 
 WIN_LIKELIHOOD_PROMPT = """You are a Swiss legal analyst. Provide a likelihood score (1-100) for winning this case.
 
@@ -44,17 +38,6 @@ Score ranges:
 
 Keep explanations concise and user-friendly. Focus on the key legal factors that determine the score."""
 
-TIME_COST_PROMPT = """Build case_facts from the text and retrieved knowledge, then estimate time and cost.
-
-Steps:
-1. Use RAG and historic cases to understand case complexity
-2. Build comprehensive case_facts dictionary
-3. Call estimate_time(case_facts) to get time estimate
-4. Prepare cost inputs including time_estimate and other factors
-5. Call estimate_cost with all available inputs
-
-If some inputs are missing, proceed with reasonable defaults and note assumptions internally."""
-
 AGGREGATE_PROMPT = """Validate and normalize all results into the final JSON format.
 
 Return JSON only:
@@ -83,8 +66,29 @@ else:
 MAX_BUSINESS_LIKELIHOOD_CALLS = 1
 MAX_ASK_USER_CALLS = 1
 
+# Vector index backend for the retrievers: "chroma", "flat" (exported NumPy index) or "ivf" (approximate)
+VECTOR_INDEX_BACKEND = os.getenv("VECTOR_INDEX_BACKEND", "chroma")
+
+# Fast mode: skip LLM calls that cannot change the answer (confident baselines, 'Andere' answers)
+FAST_MODE = os.getenv("FAST_MODE", "FALSE") == "TRUE"
+# Widest chance range (percentage points) of an estimator table row taken as is in fast mode
+FAST_MODE_MAX_CHANCE_SPREAD = 20
+# Likelihood thresholds of the recommendation in templated answers
+FAST_MODE_PURSUE_LIKELIHOOD = 50
+FAST_MODE_UNCERTAIN_LIKELIHOOD = 25
+
+# Win likelihood from the trained outcome model and the outcomes of similar cases (the LLM only writes the narrative);
+# without a model file the similar-case vote is only context for the LLM
+OUTCOME_MODEL_ENABLED = os.getenv("OUTCOME_MODEL", "TRUE") == "TRUE"
+# Similar cases retrieved for the outcome vote
+OUTCOME_NEIGHBOURS = 10
+
 # Confidence thresholds
 MIN_CATEGORY_CONFIDENCE = 0.6
+# Embedding classifier (experts/tools/estimators/category_model.py) first; the LLM classifier
+# only when its top-two probability margin is below this
+CATEGORY_MODEL_ENABLED = os.getenv("CATEGORY_MODEL", "TRUE") == "TRUE"
+CATEGORY_ESCALATION_MARGIN = 0.3
 
 # Default values for missing inputs
 DEFAULT_COMPLEXITY = "medium"
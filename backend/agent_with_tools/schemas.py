@@ -1,6 +1,6 @@
 """Pydantic models for I/O contracts in the legal agent."""
 
-from typing import Literal, Optional, Union, Dict, Any
+from typing import Literal, Optional, Union, Dict, Any, List
 from pydantic import BaseModel, Field
 
 
@@ -25,6 +25,7 @@ class CategoryResult(BaseModel):
 
     category: Literal["Arbeitsrecht", "Immobilienrecht", "Strafverkehrsrecht", "Andere"]
     confidence: float = Field(..., ge=0.0, le=1.0)
+    subcategory: Optional[str] = None  # Case type, when the classifier returns one
 
 
 class Doc(BaseModel):
@@ -45,6 +46,7 @@ class Case(BaseModel):
     summary: str
     outcome: str
     citation: Optional[str] = None
+    similarity: Optional[float] = None
 
 
 class TimeEstimate(BaseModel):
@@ -52,6 +54,10 @@ class TimeEstimate(BaseModel):
 
     value: int = Field(..., gt=0)
     unit: Literal["days", "weeks", "months"]
+    # Simulated percentiles of the duration, in ``unit``
+    p10: Optional[float] = None
+    p50: Optional[float] = None
+    p90: Optional[float] = None
 
 
 class CostBreakdown(BaseModel):
@@ -59,6 +65,10 @@ class CostBreakdown(BaseModel):
 
     total_chf: float = Field(..., ge=0)
     breakdown: Optional[Dict[str, float]] = None
+    # Simulated percentiles of the total cost
+    p10_chf: Optional[float] = None
+    p50_chf: Optional[float] = None
+    p90_chf: Optional[float] = None
 
 
 class AgentOutput(BaseModel):
@@ -99,7 +109,11 @@ class AgentState(BaseModel):
 
     # Working memory
     case_facts: Optional[Dict[str, Any]] = None
+    keyword_hits: Optional[list[str]] = None  # Keyword groups found in the case text
+    subcategories: Optional[Dict[str, str]] = None  # Estimator category -> subcategory
     tool_call_count: int = 0
+    fast_path: bool = False  # Likelihood taken from a confident baseline without the LLM
+    case_embedding: Optional[list[float]] = None  # Embedding of the case text, computed once
     explanation_parts: Optional[list[str]] = (
         None  # Collect explanation parts during analysis
     )
@@ -138,3 +152,24 @@ class CostInputs(BaseModel):
     filing_fees: Optional[float] = None
     expert_witness_fees: Optional[float] = None
     vat_rate: Optional[float] = 0.077  # Swiss VAT rate
+
+
+class PortfolioClaim(BaseModel):
+    """One open claim of a portfolio for batch estimation."""
+
+    category: str = Field(..., description="Legal case category (e.g., 'Arbeitsrecht')")
+    subcategory: Optional[str] = None
+    complexity: Optional[Literal["low", "medium", "high"]] = None
+    case_text: Optional[str] = Field(
+        None, description="Case text, used to match the subcategory if it is missing"
+    )
+    claim_id: Optional[str] = None
+
+
+class PortfolioRequest(BaseModel):
+    """Claims to estimate in one batch."""
+
+    claims: List[PortfolioClaim]
+    include_claims: bool = Field(
+        True, description="Return the per-claim estimates besides the summary"
+    )
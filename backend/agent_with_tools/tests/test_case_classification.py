@@ -0,0 +1,46 @@
+"""Test the structured output of the single case classification call."""
+
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from classifier.schema import CaseClassification, FIELD_SUBCATEGORIES, format_subcategories
+from experts.tools.estimators.estimator_agent import EmploymentLawCategory, TrafficCriminalLawCategory
+
+
+def test_classification_output():
+    """Field, case type and confidence are validated together."""
+    print("=== Testing Case Classification Output ===")
+    result = CaseClassification.model_validate(
+        {"legal_field": "employment_law", "subcategory": "fristlose_kuendigung", "confidence": 0.9}
+    )
+    assert result.legal_field == "employment_law" and result.subcategory == "fristlose_kuendigung"
+
+    # The case type decides the field; percentages become probabilities
+    result = CaseClassification.model_validate(
+        {"legal_field": "employment_law", "subcategory": "moderate_speeding", "confidence": 85}
+    )
+    assert result.legal_field == "traffic_law" and result.confidence == 0.85
+
+    # Unknown values fall back instead of failing the call
+    result = CaseClassification.model_validate({"legal_field": "tax_law", "subcategory": "unknown", "confidence": "high"})
+    assert result.legal_field == "other" and result.subcategory is None and result.confidence == 0.5
+    print("✓ Validation")
+
+
+def test_prompt_case_types():
+    """Every estimator enum value is offered to the LLM."""
+    print("\n=== Testing Prompt Case Types ===")
+    text = format_subcategories()
+    for category in list(TrafficCriminalLawCategory) + list(EmploymentLawCategory):
+        assert f"* {category.value}:" in text
+    assert set(FIELD_SUBCATEGORIES) == {"traffic_law", "employment_law"}
+    print("✓ Case types")
+
+
+if __name__ == "__main__":
+    test_classification_output()
+    test_prompt_case_types()
+    print("\n=== All case classification tests passed! ===")
@@ -0,0 +1,56 @@
+"""Test the court/year/citation normalization done when indexing historic cases."""
+
+import sys
+import os
+
+import pandas as pd
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.estimators.case_fields import case_court, case_year
+from legal_vectors.similar_cases_vectorizer.generate_vector_store import build_metadatas
+
+
+def test_case_fields_are_normalized_at_ingest():
+    """Missing courts and years are derived from the docref once, and stored typed."""
+    print("=== Testing Case Field Normalization ===")
+    df = pd.DataFrame(
+        {
+            "docref": ["4A_401/2016", "8C_12/2019", "misc", "9C_2/2021"],
+            "year": ["", "2018.0", None, ""],
+            "court": ["", "", "", "BGer"],
+            "outcome": ["approved", "dismissed", None, "approved"],
+            "email": ["a", "b", "c", "d"],
+        }
+    )
+    metadatas = build_metadatas(df)
+
+    assert "email" not in metadatas[0]
+    assert metadatas[0]["court"] == "Bundesgericht (Federal Supreme Court)"
+    assert metadatas[0]["year"] == 2016 and isinstance(metadatas[0]["year"], int)
+    assert metadatas[0]["citation"] == "4A_401/2016"
+    assert metadatas[1]["year"] == 2018
+    assert metadatas[2] == {"docref": "misc", "court": "Swiss Court", "year": 2020, "citation": "misc", "outcome": ""}
+    assert metadatas[3]["court"] == "BGer" and metadatas[3]["year"] == 2021
+    print("✓ Court, year, citation and outcome are precomputed")
+
+
+def test_legacy_metadata_fallbacks():
+    """Stores built before ingest normalization get the same fallbacks at query time."""
+    print("\n=== Testing Legacy Metadata Fallbacks ===")
+    assert case_court("", "4A_401/2016") == "Bundesgericht (Federal Supreme Court)"
+    assert case_court("Unknown Court", "misc") == "Swiss Court"
+    assert case_court("BGer", "4A_401/2016") == "BGer"
+    assert case_year("", "4A_401/2016") == 2016
+    assert case_year("2016.0", "") == 2016
+    assert case_year(2018, "4A_401/2016") == 2018
+    assert case_year("unbekannt", "Urteil vom 3. Mai 2019") == 2019
+    assert case_year(None, "misc") == 2020
+    print("✓ Court and year are derived from the docref when missing or malformed")
+
+
+if __name__ == "__main__":
+    test_case_fields_are_normalized_at_ingest()
+    test_legacy_metadata_fallbacks()
+    print("\n=== All case field tests passed! ===")
@@ -0,0 +1,49 @@
+"""Test the single-pass keyword matcher shared by the nodes and estimators."""
+
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.estimators.case_keywords import match_keywords, subcategories_for, subcategory_for
+from backend.agent_with_tools.tools.estimator_utils import extract_subcategory
+
+
+def test_match_keywords():
+    """Overlapping keywords and substrings are found in one pass."""
+    print("=== Testing Keyword Matcher ===")
+    hits = match_keywords("I was SPEEDING past a parked car and got a Fine. My Kündigung followed.")
+    assert {"speeding", "parking", "penalty", "termination_law", "termination_cases"} <= hits
+    # "payment" contains "pay": both salary groups are hit
+    assert {"salary", "wage_cases"} <= match_keywords("The payment is late")
+    assert "wage_law" not in match_keywords("The payment is late")
+    assert match_keywords("") == set() and match_keywords(None) == set()
+    print(f"✓ Groups: {sorted(hits)}")
+
+
+def test_subcategories():
+    """Subcategory rules keep the order of the former keyword checks."""
+    print("\n=== Testing Subcategories ===")
+    assert subcategory_for(match_keywords("parking accident in a garage"), "traffic_criminal_law") == (
+        "parking_lot_accident_chf_2500_no_witnesses"
+    )
+    assert subcategory_for(match_keywords("parking ticket"), "traffic_criminal_law") == "parking_fine_expired_few_minutes"
+    # Alcohol is checked before parking
+    assert subcategory_for(match_keywords("drunk in the parking lot"), "traffic_criminal_law") == (
+        "driving_under_influence_alcohol_license_withdrawal"
+    )
+    assert subcategory_for(set(), "employment_law") == "termination_poor_performance"
+    assert subcategory_for(set(), "real_estate_law") == "default"
+
+    subcategories = subcategories_for(match_keywords("My salary was not paid while I was sick"))
+    assert subcategories == {"employment_law": "lohn_ausstehend", "traffic_criminal_law": "moderate_speeding"}
+    assert extract_subcategory("", "employment_law") == "default"
+    assert extract_subcategory("I was fired on the spot", "employment_law") == "fristlose_kuendigung"
+    print("✓ Employment and traffic subcategories")
+
+
+if __name__ == "__main__":
+    test_match_keywords()
+    test_subcategories()
+    print("\n=== All keyword matcher tests passed! ===")
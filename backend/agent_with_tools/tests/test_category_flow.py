@@ -10,7 +10,7 @@ def test_andere_category():
     print("=" * 40)
     
     # Mock the categorize_case function to return 'Andere'
-    def mock_categorize_andere(text: str) -> CategoryResult:
+    def mock_categorize_andere(text: str, keyword_hits=None, embedding=None) -> CategoryResult:
         return CategoryResult(category="Andere", confidence=0.95)
     
     # Patch the function temporarily
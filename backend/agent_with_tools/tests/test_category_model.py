@@ -0,0 +1,90 @@
+"""Test the embedding category classifier of categorize_case."""
+
+import sys
+import os
+import tempfile
+import time
+
+import numpy as np
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.estimators.category_model import (
+    CATEGORIES,
+    classify_embedding,
+    load_category_model,
+    save_category_model,
+)
+from legal_vectors.similar_cases_vectorizer.train_category_model import load_case_examples, train_category_model
+
+
+class _Collection:
+    """In-memory stand-in for a Chroma collection with get(limit, offset)."""
+
+    def __init__(self, embeddings, metadatas, documents):
+        self.embeddings, self.metadatas, self.documents = embeddings, metadatas, documents
+
+    def count(self):
+        return len(self.embeddings)
+
+    def get(self, limit, offset, include):
+        return {
+            "embeddings": self.embeddings[offset:offset + limit],
+            "metadatas": self.metadatas[offset:offset + limit],
+            "documents": self.documents[offset:offset + limit],
+        }
+
+
+def _synthetic_cases(n=2000, dim=64, seed=0):
+    """Embeddings scattered around one direction per category."""
+    rng = np.random.default_rng(seed)
+    directions = rng.normal(size=(len(CATEGORIES), dim))
+    labels = rng.choice(len(CATEGORIES), size=n, p=[0.3, 0.1, 0.2, 0.4])
+    embeddings = directions[labels] + rng.normal(scale=2.0, size=(n, dim))
+    return embeddings, [CATEGORIES[label] for label in labels], directions
+
+
+def test_training():
+    """Centroids with a calibrated softmax classify most cases without escalation."""
+    print("=== Testing Category Model Training ===")
+    embeddings, labels, directions = _synthetic_cases()
+    metadatas = [{"category": label} for label in labels]
+    # Cases without category column are labeled from their text
+    metadatas[0] = {}
+    documents = [""] * len(labels)
+    documents[0] = "Mein Arbeitgeber hat mir fristlos gekündigt"
+    features, examples = load_case_examples(_Collection(embeddings, metadatas, documents), dim=32, batch_size=300)
+    assert features.shape == (2000, 32) and examples[0] == "Arbeitsrecht"
+
+    model = train_category_model(features, examples)
+    assert model.categories == CATEGORIES and model.metrics["accuracy"] > 0.85
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "category_model.npz")
+        save_category_model(model, path)
+        loaded = load_category_model(path)
+        print(f"✓ Metrics {model.metrics}, {os.path.getsize(path)} bytes")
+    assert loaded is not None and loaded.dim == 32
+    assert load_category_model(os.path.join(tmp, "missing.npz")) is None
+
+    prediction = classify_embedding(directions[2], loaded)
+    assert prediction.category == "Strafverkehrsrecht" and prediction.margin > 0.5
+    assert abs(sum(prediction.probabilities.values()) - 1) < 1e-6
+
+    # Halfway between two categories the margin is small and the LLM decides
+    ambiguous = classify_embedding(loaded.centroids[0] + loaded.centroids[3], loaded)
+    assert ambiguous.margin < 0.3
+
+    # Failed embedding requests return zero vectors
+    assert classify_embedding([0.0] * 64, loaded) is None
+    assert classify_embedding([0.1] * 16, loaded) is None
+
+    start = time.perf_counter()
+    for embedding in embeddings[:1000]:
+        classify_embedding(embedding, loaded)
+    print(f"✓ {(time.perf_counter() - start) * 1000:.0f} µs per case")
+
+
+if __name__ == "__main__":
+    test_training()
+    print("\n=== All category model tests passed! ===")
@@ -0,0 +1,82 @@
+"""Test the local complexity scorer of time_and_cost_node."""
+
+import sys
+import os
+import json
+import tempfile
+import time
+
+import pandas as pd
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.estimators.complexity import assess_complexity, extract_amount, load_complexity_model
+from legal_vectors.similar_cases_vectorizer.train_complexity_model import train_complexity_model
+
+SIMPLE_CASE = "I got a parking ticket because the meter expired a few minutes ago."
+PLAIN_CASE = "Mein Arbeitgeber hat mir fristlos gekündigt."
+COMPLEX_CASE = (
+    "My employer owes me CHF 45'000 in unpaid salary. Several colleagues are witnesses and an "
+    "expert report (Gutachten) exists. We will appeal to the Bundesgericht if necessary."
+)
+
+
+def test_amounts():
+    """Amounts in Swiss notations are parsed; the largest one counts."""
+    print("=== Testing Amount Extraction ===")
+    assert extract_amount("Fr. 3'200.- deposit") == 3200
+    assert extract_amount("damage of 12,500 francs and 5.50 CHF postage") == 12500
+    assert extract_amount("CHF 1’250’000") == 1250000
+    assert extract_amount("no amount in 2024") is None
+    print("✓ Amounts")
+
+
+def test_rule_scores():
+    """The rules separate simple, plain and complex cases in microseconds."""
+    print("\n=== Testing Complexity Rules ===")
+    assert assess_complexity(SIMPLE_CASE, model={}).complexity == "low"
+    assert assess_complexity(PLAIN_CASE, model={}).complexity == "medium"
+
+    complex_case = assess_complexity(COMPLEX_CASE, "Arbeitsrecht", model={})
+    assert complex_case.complexity == "high" and complex_case.appeal_expected
+    assert complex_case.amount_chf == 45000
+    assert not assess_complexity(PLAIN_CASE, "Arbeitsrecht", model={}).appeal_expected
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        assess_complexity(COMPLEX_CASE, "Arbeitsrecht", model={})
+    print(f"✓ {(time.perf_counter() - start) * 1000:.0f} µs per case")
+
+
+def test_trained_model():
+    """A model trained offline is exported to JSON and used without scikit-learn."""
+    print("\n=== Testing Trained Model ===")
+    cases = pd.DataFrame(
+        {
+            "text": [SIMPLE_CASE, "Parking fine of CHF 40", PLAIN_CASE, "My landlord keeps the deposit",
+                     COMPLEX_CASE, COMPLEX_CASE.replace("45'000", "120'000")],
+            "complexity": ["low", "low", "medium", "medium", "high", "high"],
+            "appeal_expected": [False, False, False, False, True, True],
+        }
+    )
+    model = train_complexity_model(cases, c=10.0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "complexity_model.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(model, f)
+        loaded = load_complexity_model(path)
+    assert loaded is not None and loaded["classes"] == ["high", "low", "medium"]
+
+    assert assess_complexity(SIMPLE_CASE, model=loaded).complexity == "low"
+    trained = assess_complexity(COMPLEX_CASE, model=loaded)
+    assert trained.complexity == "high" and trained.appeal_expected
+    assert load_complexity_model(os.path.join(tmp, "missing.json")) is None
+    print("✓ Exported model")
+
+
+if __name__ == "__main__":
+    test_amounts()
+    test_rule_scores()
+    test_trained_model()
+    print("\n=== All complexity tests passed! ===")
@@ -0,0 +1,95 @@
+"""Test the ingestion embedding engine (retries, failures, checkpoint and resume)."""
+
+import sys
+import os
+import tempfile
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.vector_index.embedding_engine import EmbeddingEngine, RateLimiter
+
+
+class ApiError(Exception):
+    def __init__(self, code: int):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+class FakeClient:
+    """Embeds a text as a vector derived from its length; fails on request."""
+
+    def __init__(self, dim: int, rate_limited_calls: int = 0):
+        self.dim = dim
+        self.calls = 0
+        self.rate_limited_calls = rate_limited_calls
+        self.lock = threading.Lock()
+        self.models = SimpleNamespace(embed_content=self.embed_content)
+
+    def embed_content(self, model, contents, config):
+        with self.lock:
+            self.calls += 1
+            if self.calls <= self.rate_limited_calls:
+                raise ApiError(429)
+        if any(text.startswith("bad") for text in contents):
+            raise ApiError(400)
+        return SimpleNamespace(
+            embeddings=[SimpleNamespace(values=[float(len(text))] + [1.0] * (self.dim - 1)) for text in contents]
+        )
+
+
+def test_retries_failures_and_resume():
+    """Transient errors are retried, permanent ones recorded, finished batches resumed."""
+    print("=== Testing Embedding Engine ===")
+    texts = [f"case {i}" * (i % 5 + 1) for i in range(25)] + ["bad input"] + ["case 0"]
+    with tempfile.TemporaryDirectory() as checkpoint_dir:
+        client = FakeClient(dim=8, rate_limited_calls=2)
+        engine = EmbeddingEngine(
+            dim=8, batch_size=4, max_in_flight=3, backoff=0.01, checkpoint_dir=checkpoint_dir, client=client
+        )
+        embeddings = engine.embed(texts)
+        engine.close()
+
+        assert engine.retries == 2, "Rate-limited requests are retried"
+        assert embeddings[25] is None, "Failed texts are None, not zero vectors"
+        assert [f["text"] for f in engine.failures] == ["bad input"], "Only the bad text fails"
+        assert os.path.exists(os.path.join(checkpoint_dir, "failed.jsonl"))
+        ok = [np.asarray(e) for e in embeddings if e is not None]
+        assert len(ok) == 26 and all(abs(np.linalg.norm(e) - 1) < 1e-5 for e in ok)
+        assert embeddings[26] == embeddings[0], "Duplicate texts share one embedding"
+
+        # A new run (e.g. after a crash) re-uses the checkpoint without any request
+        resumed_client = FakeClient(dim=8)
+        resumed = EmbeddingEngine(dim=8, batch_size=4, checkpoint_dir=checkpoint_dir, client=resumed_client)
+        again = resumed.embed([t for t, e in zip(texts, embeddings) if e is not None])
+        resumed.close()
+        assert resumed_client.calls == 0
+        assert np.allclose(again, [e for e in embeddings if e is not None])
+
+        resumed.clear_checkpoint()
+        assert not [n for n in os.listdir(checkpoint_dir) if n.endswith(".npy")]
+    print(f"✓ {engine.summary()}")
+
+
+def test_rate_limiter_spaces_requests():
+    """The limiter spaces requests to the configured rate."""
+    print("\n=== Testing Rate Limiter ===")
+    import time
+
+    limiter = RateLimiter(per_minute=1200)  # one request per 50 ms
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    elapsed = time.monotonic() - start
+    assert elapsed >= 0.19, f"5 requests at 1200/min took {elapsed:.3f}s"
+    print(f"✓ 5 requests in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    test_retries_failures_and_resume()
+    test_rate_limiter_spaces_requests()
+    print("\n=== All embedding engine tests passed! ===")
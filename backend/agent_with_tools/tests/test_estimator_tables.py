@@ -0,0 +1,73 @@
+"""Test the estimator tables loaded from the case spreadsheets."""
+
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.estimators.estimator import estimate_chance_of_winning, estimate_costs, estimate_time
+from experts.tools.estimators.tables import (
+    ESTIMATES,
+    Range,
+    get_estimate,
+    likelihood_of,
+    parse_costs,
+    parse_duration,
+    parse_percent,
+)
+
+
+def test_tables_loaded():
+    """Both spreadsheets are loaded into numeric estimates."""
+    print("=== Testing Estimator Tables ===")
+    assert len(ESTIMATES) == 10
+
+    salary = get_estimate("employment_law", "lohn_ausstehend")
+    assert (salary.likelihood, salary.months, salary.total_cost) == (95, 5, 5000.0)  # 100% is capped
+    assert salary.cost_breakdown == {"estimated_total": 5000.0}
+
+    speeding = get_estimate("traffic_criminal_law", "moderate_speeding")
+    assert speeding.chance == Range(10, 15) and speeding.likelihood == 12
+    assert speeding.duration == Range(3, 6, open_ended=True) and speeding.months == 4
+    assert speeding.duration_paid == Range(1, 1)
+    assert speeding.cost_breakdown == {"fine": 240, "admin_fees": 300, "lawyer": 3000, "court": 1650}
+    assert speeding.total_cost == 5190
+
+    # Insurance usually covers the defence: the private lawyer is an optional cost
+    accident = get_estimate("traffic_criminal_law", "parking_lot_accident_chf_2500_no_witnesses")
+    assert accident.total_cost == 600 and accident.optional_costs == {"private_lawyer": Range(1000, 4000)}
+
+    assert get_estimate("real_estate_law", "default") is None
+    print(f"✓ {len(ESTIMATES)} case types loaded")
+
+
+def test_estimator_text():
+    """The estimator functions still return the spreadsheet text."""
+    print("\n=== Testing Estimator Text ===")
+    assert estimate_chance_of_winning("employment_law", "termination_poor_performance") == "20%"
+    assert estimate_time("employment_law", "fristlose_kuendigung") == "6 Months"
+    assert estimate_costs("employment_law", "increase_in_workload") == "0"
+    assert estimate_time("traffic_criminal_law", "moderate_speeding") == "Paid: 30 days; Contested: 3–6 months+"
+    assert estimate_chance_of_winning("traffic_criminal_law", "unknown_case") == "unknown"
+    print("✓ Display text comes from the tables")
+
+
+def test_parsers():
+    """Estimate strings are parsed into ranges when the tables are loaded."""
+    print("\n=== Testing Estimate Parsers ===")
+    assert likelihood_of(parse_percent("<10% (almost hopeless)")) == 5
+    assert likelihood_of(parse_percent("0%")) == 1
+    assert parse_percent("unknown") is None
+    assert parse_duration("6–12 months+") == (Range(6, 12, open_ended=True), None)
+    assert parse_duration("2 weeks")[0].high < 1
+    costs, optional = parse_costs("Fine: CHF 500–10,000; Road Traffic fees: CHF 400–1,000")
+    assert costs == {"fine": Range(500, 10000), "road_traffic_fees": Range(400, 1000)} and optional == {}
+    print("✓ Percentages, durations and CHF amounts are parsed")
+
+
+if __name__ == "__main__":
+    test_tables_loaded()
+    test_estimator_text()
+    test_parsers()
+    print("\n=== All estimator table tests passed! ===")
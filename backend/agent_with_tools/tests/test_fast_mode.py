@@ -0,0 +1,67 @@
+"""Test the confident-baseline check and templated answers of fast mode."""
+
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from backend.agent_with_tools.schemas import AgentOutput, AgentState, CaseInput, CategoryResult
+from backend.agent_with_tools.tools.estimate_likelihood import estimate_business_likelihood, is_confident_baseline
+from backend.agent_with_tools.nodes.prepare_final_answer import render_template_answer
+from experts.tools.estimators.case_keywords import has_subcategory_match, match_keywords
+
+
+def test_confident_baseline():
+    """Only keyword-matched table rows with narrow ranges and consistent history are confident."""
+    print("=== Testing Confident Baselines ===")
+    result = estimate_business_likelihood("", "Strafverkehrsrecht", "moderate_speeding")
+    assert is_confident_baseline(result)
+    assert not is_confident_baseline(result, max_spread=4)
+
+    # Historic outcomes outside the baseline leave the decision to the LLM
+    contradicted = dict(result, empirical={"rate": 0.6, "cases": 100, "ci_low": 0.5, "ci_high": 0.7})
+    assert not is_confident_baseline(contradicted)
+    assert not is_confident_baseline(estimate_business_likelihood("", "Immobilienrecht"))
+
+    # The catch-all subcategory of a category is not a clean match
+    assert has_subcategory_match(match_keywords("I was caught speeding"), "traffic_criminal_law")
+    assert not has_subcategory_match(match_keywords("My boss is unfair"), "employment_law")
+    print("✓ Baseline confidence")
+
+
+def test_template_answers():
+    """'Andere' and fast-path cases get templated answers in the case language."""
+    print("\n=== Testing Templated Answers ===")
+    andere = AgentState(
+        case_input=CaseInput(text="Frage zu einer Erbschaft"),
+        category=CategoryResult(category="Andere", confidence=0.9),
+        case_facts={"language": "de"},
+        result=AgentOutput(category="Andere"),
+    )
+    assert render_template_answer(andere).startswith("Ihr Fall fällt in keines der Rechtsgebiete")
+
+    speeding = AgentState(
+        case_input=CaseInput(text="I was caught speeding"),
+        category=CategoryResult(category="Strafverkehrsrecht", confidence=0.9),
+        case_facts={"language": "en"},
+        likelihood_win=12,
+        result=AgentOutput(
+            category="Strafverkehrsrecht",
+            likelihood_win="12%",
+            estimated_time="4 months",
+            estimated_cost="5190 CHF",
+        ),
+    )
+    # Without the fast path the LLM writes the answer
+    assert render_template_answer(speeding) is None
+    speeding.fast_path = True
+    answer = render_template_answer(speeding)
+    assert "12%" in answer and "5190 CHF" in answer and answer.endswith("not recommended.")
+    print(f"✓ {answer}")
+
+
+if __name__ == "__main__":
+    test_confident_baseline()
+    test_template_answers()
+    print("\n=== All fast mode tests passed! ===")
@@ -0,0 +1,91 @@
+"""Test the flat NumPy vector index against brute-force reference results."""
+
+import sys
+import os
+
+import numpy as np
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.vector_index.flat_index import FlatVectorIndex, _metadata_table
+
+
+def _build_index(space: str = "l2", n: int = 500, dim: int = 32) -> tuple[FlatVectorIndex, np.ndarray]:
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(n, dim)).astype(np.float32)
+    table = _metadata_table(
+        ids=[f"doc_{i}" for i in range(n)],
+        documents=[f"Art. {i} text" for i in range(n)],
+        metadatas=[{"language": "de" if i % 2 else "en", "year": 2000 + i % 25} for i in range(n)],
+    )
+    return FlatVectorIndex(vectors, table, space=space), vectors
+
+
+def test_flat_index_matches_brute_force():
+    """Top-k ids and distances match a direct NumPy computation in every space."""
+    print("=== Testing Flat Index Exact Search ===")
+    for space in ("l2", "cosine", "ip"):
+        index, vectors = _build_index(space)
+        query = np.random.default_rng(1).normal(size=vectors.shape[1]).astype(np.float32)
+
+        if space == "l2":
+            expected = np.sum((vectors - query) ** 2, axis=1)
+        elif space == "cosine":
+            expected = 1 - vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+        else:
+            expected = 1 - vectors @ query
+        expected_ids = [f"doc_{i}" for i in np.argsort(expected)[:5]]
+
+        result = index.query([query.tolist()], n_results=5)
+        assert result["ids"][0] == expected_ids, f"Wrong neighbours for {space}"
+        assert np.allclose(result["distances"][0], np.sort(expected)[:5], atol=1e-3)
+        print(f"✓ {space} search matches brute force")
+
+
+def test_flat_index_filters():
+    """Chroma-style where filters restrict the candidate rows."""
+    print("\n=== Testing Flat Index Filters ===")
+    index, vectors = _build_index()
+
+    result = index.query([vectors[0]], n_results=10, where={"language": "de"})
+    assert all(meta["language"] == "de" for meta in result["metadatas"][0])
+
+    result = index.get(where={"$and": [{"year": {"$gte": 2020}}, {"language": {"$in": ["en"]}}]})
+    assert result["ids"], "Should find matching documents"
+    assert all(meta["year"] >= 2020 and meta["language"] == "en" for meta in result["metadatas"])
+
+    result = index.get(ids=["doc_3", "missing"], include=["embeddings"])
+    assert result["ids"] == ["doc_3"]
+    assert np.allclose(result["embeddings"][0], vectors[3])
+    print("✓ where, where_document and id lookups work")
+
+
+def test_compressed_index_recall():
+    """Truncated and quantized copies keep the nearest neighbours of the full index."""
+    print("\n=== Testing Quantized and Truncated Storage ===")
+    index, vectors = _build_index("cosine", n=1000, dim=64)
+    queries = vectors[:20]
+    reference = index.query(queries, n_results=10, include=[])["ids"]
+
+    for dim, dtype in ((64, "float16"), (64, "int8"), (48, "int8")):
+        compressed = index.compress(dim=dim, dtype=dtype)
+        assert compressed.dim == dim and compressed.dtype == dtype
+        assert compressed.nbytes < index.nbytes
+
+        # Full-size queries are truncated to the stored dimension
+        found = compressed.query(queries, n_results=10, include=["embeddings"])
+        recall = np.mean([len(set(a) & set(b)) / 10 for a, b in zip(found["ids"], reference)])
+        if dim == index.dim:
+            assert recall >= 0.9, f"Recall too low for {dtype}: {recall}"
+        # Random vectors are not Matryoshka-trained, so only the query itself must survive truncation
+        assert [ids[0] for ids in found["ids"]] == [ids[0] for ids in reference]
+        assert len(found["embeddings"][0][0]) == dim
+        print(f"✓ {dim} dims, {dtype}: recall@10 {recall:.2f}, {index.nbytes / compressed.nbytes:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    test_flat_index_matches_brute_force()
+    test_flat_index_filters()
+    test_compressed_index_recall()
+    print("\n=== All flat index tests passed! ===")
@@ -0,0 +1,36 @@
+"""Test the HNSW parameter helpers against a real (in-memory) Chroma collection."""
+
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.vector_index.hnsw import apply_search_ef, hnsw_metadata, hnsw_params
+
+
+def test_hnsw_parameters_roundtrip():
+    """Build parameters are stored on creation and search_ef can be changed later."""
+    print("=== Testing HNSW Parameters ===")
+    import chromadb
+
+    assert hnsw_metadata(space="cosine", M=None) == {"hnsw:space": "cosine"}
+
+    client = chromadb.EphemeralClient()
+    collection = client.create_collection(
+        name="test_hnsw",
+        metadata={"description": "test", **hnsw_metadata(space="cosine", M=32, construction_ef=200, search_ef=50)},
+    )
+    params = hnsw_params(collection)
+    assert params == {"space": "cosine", "M": 32, "construction_ef": 200, "search_ef": 50}
+
+    apply_search_ef(collection, 150)
+    params = hnsw_params(client.get_collection(name="test_hnsw"))
+    assert params["search_ef"] == 150 and params["M"] == 32
+    assert client.get_collection(name="test_hnsw").metadata.get("description") == "test"
+    print("✓ HNSW parameters are stored and search_ef is updated")
+
+
+if __name__ == "__main__":
+    test_hnsw_parameters_roundtrip()
+    print("\n=== All HNSW parameter tests passed! ===")
@@ -0,0 +1,63 @@
+"""Test the content-hash manifest used for incremental re-indexing."""
+
+import sys
+import os
+import tempfile
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+import chromadb
+
+from experts.tools.vector_index.ingest_manifest import IngestManifest, content_hash, delete_ids, upsert_batches
+
+
+def test_manifest_diff_and_config_change():
+    """New, changed and removed items are detected; a new config discards the manifest."""
+    print("=== Testing Ingest Manifest ===")
+    config = {"chunk_size": 2048, "chunk_overlap": 300, "embedding_dim": 3072}
+    assert content_hash("a", {"x": 1, "y": 2}) == content_hash("a", {"y": 2, "x": 1})
+    assert content_hash("ab", "c") != content_hash("a", "bc")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "pdf_vectors_gemini.ingest.json")
+        manifest = IngestManifest.load(path, config)
+        assert not manifest.config_changed and manifest.entries == {}
+        manifest.update("SR-101.pdf", "h1", ["SR-101.pdf_0", "SR-101.pdf_1"])
+        manifest.update("SR-220.pdf", "h2", ["SR-220.pdf_0"])
+        manifest.save()
+
+        reloaded = IngestManifest.load(path, dict(config))
+        new, changed, removed = reloaded.diff({"SR-101.pdf": "h1", "SR-220.pdf": "h2-new", "SR-311.pdf": "h3"})
+        assert (new, changed, removed) == (["SR-311.pdf"], ["SR-220.pdf"], [])
+        assert reloaded.diff({"SR-220.pdf": "h2"})[2] == ["SR-101.pdf"]
+        assert reloaded.ids(["SR-101.pdf", "SR-999.pdf"]) == ["SR-101.pdf_0", "SR-101.pdf_1"]
+
+        rechunked = IngestManifest.load(path, {**config, "chunk_size": 1024})
+        assert rechunked.config_changed and rechunked.entries == {}
+    print("✓ Diff, persistence and config invalidation work")
+
+
+def test_upsert_batches():
+    """Batched upserts are idempotent and overwrite records with the same id."""
+    print("\n=== Testing Batched Upsert ===")
+    collection = chromadb.EphemeralClient().create_collection("upsert_test")
+    ids = [f"email_{i}" for i in range(7)]
+    embeddings = [[float(i), 1.0] for i in range(7)]
+    upsert_batches(collection, ids, embeddings, documents=[f"mail {i}" for i in range(7)], batch_size=3)
+    upsert_batches(collection, ids, embeddings, documents=[f"mail {i}" for i in range(7)], batch_size=3)
+    assert collection.count() == 7
+
+    upsert_batches(collection, ids[:1], [[9.0, 1.0]], documents=["changed"], batch_size=3)
+    assert collection.count() == 7
+    assert collection.get(ids=["email_0"])["documents"] == ["changed"]
+
+    delete_ids(collection, ids[:5], batch_size=2)
+    assert collection.count() == 2
+    print("✓ Upserts in batches replace records instead of duplicating them")
+
+
+if __name__ == "__main__":
+    test_manifest_diff_and_config_change()
+    test_upsert_batches()
+    print("\n=== All ingest manifest tests passed! ===")
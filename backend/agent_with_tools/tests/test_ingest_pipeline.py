@@ -0,0 +1,67 @@
+"""Test the staged PDF ingestion pipeline of the legal vectorizer."""
+
+import sys
+import os
+import tempfile
+import threading
+from typing import List
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from legal_vectors.legal_vectorizer.pipeline import run_pipeline
+from legal_vectors.legal_vectorizer.text_cache import load_text, store_text
+
+
+def _fake_extract(path: str):
+    """Pretend every file has 3 pages and 7 chunks (runs in a worker process)."""
+    if path.endswith("broken.pdf"):
+        raise ValueError("cannot open file")
+    return 3, [
+        {"id": f"{path}_{i}", "document": f"{path} chunk {i}", "metadata": {"chunk_index": i}}
+        for i in range(7)
+    ]
+
+
+def test_pipeline_writes_every_chunk_once():
+    """All chunks are embedded and written exactly once; broken files are skipped."""
+    print("=== Testing Ingestion Pipeline ===")
+    paths = [f"SR-{i}.pdf" for i in range(20)] + ["broken.pdf"]
+    written: List[str] = []
+    lock = threading.Lock()
+
+    def embed(texts: List[str]) -> List[List[float]]:
+        return [[float(len(text))] for text in texts]
+
+    def write(records, embeddings):
+        assert len(records) == len(embeddings)
+        with lock:
+            written.extend(record["id"] for record in records)
+
+    stats = run_pipeline(paths, _fake_extract, embed, write, workers=2, embed_workers=3, batch_size=16)
+
+    assert sorted(written) == sorted(f"SR-{i}.pdf_{j}" for i in range(20) for j in range(7))
+    assert stats.files == 20 and stats.failed_files == 1
+    assert stats.pages == 60 and stats.chunks == stats.embeddings == stats.written == 140
+    assert all(rate > 0 for rate in stats.rates().values())
+    print(f"✓ {stats.summary()}")
+
+
+def test_text_cache_keyed_by_hash_and_extractor():
+    """Cached Markdown is found by PDF hash and extractor version only."""
+    print("\n=== Testing Text Cache ===")
+    text = "# Art. 1\n\nDie Würde des Menschen ist zu achten und zu schützen.\n" * 100
+    with tempfile.TemporaryDirectory() as cache_dir:
+        assert load_text(cache_dir, "ab" * 32, "pymupdf4llm-0.0.17") is None
+        path = store_text(cache_dir, "ab" * 32, "pymupdf4llm-0.0.17", 3, text)
+        assert os.path.getsize(path) < len(text.encode("utf-8")) / 5, "Entries are compressed"
+        assert load_text(cache_dir, "ab" * 32, "pymupdf4llm-0.0.17") == (3, text)
+        assert load_text(cache_dir, "ab" * 32, "pymupdf4llm-0.0.18") is None
+        assert load_text(cache_dir, "cd" * 32, "pymupdf4llm-0.0.17") is None
+    print("✓ Cache hits and misses work")
+
+
+if __name__ == "__main__":
+    test_pipeline_writes_every_chunk_once()
+    test_text_cache_keyed_by_hash_and_extractor()
+    print("\n=== All ingestion pipeline tests passed! ===")
@@ -0,0 +1,91 @@
+"""Test the IVF approximate index and sharded Chroma collections."""
+
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.vector_index.flat_index import FlatVectorIndex, _metadata_table
+from experts.tools.vector_index.ivf_index import IVFVectorIndex
+from experts.tools.vector_index.sharding import ShardedCollection, shard_for, shard_name
+
+
+def _clustered_index(space: str = "cosine", n: int = 2000, dim: int = 32) -> FlatVectorIndex:
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(20, dim))
+    vectors = (centers[rng.integers(0, 20, n)] + 0.3 * rng.normal(size=(n, dim))).astype(np.float32)
+    table = _metadata_table(
+        ids=[f"case_{i}" for i in range(n)],
+        documents=[f"email {i}" for i in range(n)],
+        metadatas=[{"outcome": "approved" if i % 2 else "dismissed"} for i in range(n)],
+    )
+    return FlatVectorIndex(vectors, table, space=space)
+
+
+def test_ivf_recall_and_persistence():
+    """IVF results approach exact search as nprobe grows and survive save/open."""
+    print("=== Testing IVF Index ===")
+    flat = _clustered_index()
+    queries = np.asarray(flat.vectors[:50])
+    exact = flat.query(queries, n_results=10, include=[])["ids"]
+
+    ivf = IVFVectorIndex.build(flat, nlist=32, nprobe=32)
+    found = ivf.query(queries, n_results=10, include=["distances"])
+    assert found["ids"] == exact, "Probing every list must equal exact search"
+
+    ivf.nprobe = 4
+    found = ivf.query(queries, n_results=10, include=[])["ids"]
+    recall = np.mean([len(set(a) & set(b)) / 10 for a, b in zip(found, exact)])
+    assert recall >= 0.8, f"Recall too low: {recall}"
+    print(f"✓ nprobe 4/32: recall@10 {recall:.2f}")
+
+    filtered = ivf.query(queries[:5], n_results=5, where={"outcome": "approved"})
+    assert all(meta["outcome"] == "approved" for metas in filtered["metadatas"] for meta in metas)
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        ivf.save(index_dir)
+        reopened = IVFVectorIndex.open(index_dir, nprobe=4)
+        assert reopened.nlist == 32 and reopened.metadata["index_backend"] == "ivf"
+        assert reopened.query(queries, n_results=10, include=[])["ids"] == found
+    print("✓ Filters and save/open work")
+
+
+def test_sharded_collection_merges_results():
+    """A sharded collection answers like one collection holding all documents."""
+    print("\n=== Testing Sharded Collections ===")
+    import chromadb
+
+    client = chromadb.EphemeralClient()
+    flat = _clustered_index(space="l2", n=300)
+    vectors = np.asarray(flat.vectors)
+    ids = flat.table.column("id").to_pylist()
+
+    single = client.create_collection(name="test_single", metadata={"hnsw:space": "l2"})
+    single.add(ids=ids, embeddings=vectors.tolist())
+    shards = [
+        client.create_collection(name=shard_name("test_sharded", k), metadata={"hnsw:space": "l2", "shard": k})
+        for k in range(3)
+    ]
+    for i, doc_id in enumerate(ids):
+        shards[shard_for(doc_id, 3)].add(ids=[doc_id], embeddings=[vectors[i].tolist()])
+    sharded = ShardedCollection(shards, "test_sharded")
+
+    assert sharded.count() == 300
+    expected = single.query(query_embeddings=[vectors[7].tolist()], n_results=5)
+    result = sharded.query(query_embeddings=[vectors[7].tolist()], n_results=5)
+    assert result["ids"] == expected["ids"]
+    assert np.allclose(result["distances"], expected["distances"], atol=1e-4)
+
+    page = sharded.get(limit=50, offset=90, include=[])
+    assert len(page["ids"]) == 50 and len(set(page["ids"])) == 50
+    print("✓ Sharded query and paging match a single collection")
+
+
+if __name__ == "__main__":
+    test_ivf_recall_and_persistence()
+    test_sharded_collection_merges_results()
+    print("\n=== All IVF index tests passed! ===")
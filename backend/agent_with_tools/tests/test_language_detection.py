@@ -0,0 +1,34 @@
+"""Test the local language detection used by ingest_node."""
+
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.vector_index.language import detect_language
+
+
+def test_detects_case_languages():
+    """German, French, Italian and English case texts are told apart; short texts stay undecided."""
+    print("=== Testing Language Detection ===")
+    cases = {
+        "de": "Mein Arbeitgeber hat mir fristlos gekündigt, nachdem ich zwei Wochen krank war.",
+        "fr": "Mon employeur m'a licencié sans préavis après un accident de travail.",
+        "it": "Il mio datore di lavoro mi ha licenziato senza preavviso dopo che sono stato malato.",
+        "en": "My employer fired me without notice after I was sick for two weeks.",
+    }
+    for expected, text in cases.items():
+        language, confidence = detect_language(text)
+        assert language == expected, (expected, language)
+        assert 0.5 <= confidence <= 1.0
+        print(f"✓ {expected}: confidence {confidence:.2f}")
+
+    assert detect_language("Art. 336c OR") == (None, 0.0)
+    assert detect_language("") == (None, 0.0)
+    print("✓ Texts without function words are left undecided")
+
+
+if __name__ == "__main__":
+    test_detects_case_languages()
+    print("\n=== All language detection tests passed! ===")
@@ -0,0 +1,95 @@
+"""Test the embedding outcome model and the similar-case outcome vote."""
+
+import sys
+import os
+import tempfile
+import time
+
+import numpy as np
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.estimators.outcome_model import (
+    combine_likelihood,
+    load_outcome_model,
+    neighbour_vote,
+    save_outcome_model,
+)
+from legal_vectors.similar_cases_vectorizer.train_outcome_model import load_training_data, train_outcome_model
+
+
+class _Collection:
+    """In-memory stand-in for a Chroma collection with get(limit, offset)."""
+
+    def __init__(self, embeddings, metadatas):
+        self.embeddings, self.metadatas = embeddings, metadatas
+
+    def count(self):
+        return len(self.embeddings)
+
+    def get(self, limit, offset, include):
+        return {
+            "embeddings": self.embeddings[offset:offset + limit],
+            "metadatas": self.metadatas[offset:offset + limit],
+        }
+
+
+def _synthetic_cases(n=2000, dim=64, seed=0):
+    """Embeddings whose first dimension separates won from lost cases."""
+    rng = np.random.default_rng(seed)
+    won = rng.random(n) < 0.3
+    embeddings = rng.normal(size=(n, dim))
+    embeddings[:, 0] += np.where(won, 1.5, -1.5)
+    outcomes = np.where(won, "approved", "dismissed").astype(object)
+    outcomes[::50] = ""  # Cases without outcome are not used
+    return embeddings, [{"outcome": outcome} for outcome in outcomes]
+
+
+def test_training():
+    """The calibrated model separates outcomes and survives the round-trip."""
+    print("=== Testing Outcome Model Training ===")
+    embeddings, metadatas = _synthetic_cases()
+    features, labels = load_training_data(_Collection(embeddings, metadatas), dim=32, batch_size=300)
+    assert features.shape == (1960, 32) and abs(labels.mean() - 0.3) < 0.05
+
+    model = train_outcome_model(features, labels)
+    assert model.metrics["roc_auc"] > 0.85 and model.metrics["brier"] < 0.15
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "outcome_model.npz")
+        save_outcome_model(model, path)
+        loaded = load_outcome_model(path)
+        print(f"✓ Metrics {model.metrics}, {os.path.getsize(path)} bytes")
+    assert loaded is not None and loaded.dim == 32
+    assert load_outcome_model(os.path.join(tmp, "missing.npz")) is None
+
+    # Calibrated: the mean predicted probability matches the win rate
+    predictions = np.array([loaded.predict(embedding) for embedding in embeddings[:500]])
+    assert abs(predictions.mean() - 0.3) < 0.05
+    assert loaded.predict(embeddings[0][:16]) is None
+
+    start = time.perf_counter()
+    for embedding in embeddings[:1000]:
+        loaded.predict(embedding)
+    print(f"✓ {(time.perf_counter() - start) * 1000:.0f} µs per case")
+
+
+def test_neighbour_vote():
+    """Neighbours vote with their similarity; the model counts as a prior."""
+    print("\n=== Testing Neighbour Vote ===")
+    share, weight = neighbour_vote([("approved", 0.9), ("dismissed", 0.3), ("", 0.8), ("approved", -0.1)])
+    assert abs(share - 0.75) < 1e-9 and abs(weight - 1.2) < 1e-9
+    assert neighbour_vote([("", 0.9)]) is None
+
+    assert combine_likelihood(None, None) is None
+    assert combine_likelihood(0.4, None) == 0.4
+    assert combine_likelihood(None, (share, weight)) == share
+    combined = combine_likelihood(0.4, (share, weight), prior_weight=2.0)
+    assert abs(combined - (0.8 + 0.9) / 3.2) < 1e-9
+    print(f"✓ Combined likelihood {combined:.0%}")
+
+
+if __name__ == "__main__":
+    test_training()
+    test_neighbour_vote()
+    print("\n=== All outcome model tests passed! ===")
@@ -0,0 +1,80 @@
+"""Test the empirical outcome statistics of historic cases."""
+
+import sys
+import os
+import tempfile
+
+import pandas as pd
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.estimators.case_keywords import label_case
+from experts.tools.estimators.outcome_stats import empirical_win_rate, load_outcome_stats, wilson_interval
+from legal_vectors.similar_cases_vectorizer.compute_outcome_stats import compute_outcome_stats, write_outcome_stats
+
+
+def _cases() -> pd.DataFrame:
+    """30 unpaid salary cases (24 won) at two courts and 10 speeding cases (1 won)."""
+    rows = []
+    for i in range(30):
+        court = "Bundesgericht" if i < 20 else "Kantonsgericht"
+        outcome = "approved" if i % 5 else "dismissed"
+        rows.append(("Arbeitsrecht", "lohn_ausstehend", court, 2020 + i % 2, outcome))
+    for i in range(10):
+        rows.append(("Strafverkehrsrecht", "moderate_speeding", "Bundesgericht", 2021, "approved" if i == 0 else "dismissed"))
+    rows.append(("Arbeitsrecht", "lohn_ausstehend", "Bundesgericht", 2020, ""))  # no outcome: ignored
+    return pd.DataFrame(rows, columns=["category", "subcategory", "court", "year", "outcome"])
+
+
+def test_wilson_interval():
+    """Wilson intervals match the closed form and stay inside [0, 1]."""
+    print("=== Testing Wilson Intervals ===")
+    low, high = wilson_interval([8, 0], [10, 5])
+    assert abs(low[0] - 0.4902) < 1e-4 and abs(high[0] - 0.9433) < 1e-4
+    assert low[1] == 0.0 and 0 < high[1] < 0.5
+    print(f"✓ 8/10 → [{low[0]:.3f}, {high[0]:.3f}]")
+
+
+def test_outcome_stats_lookup():
+    """Groups are aggregated per level and lookups back off to broader groups."""
+    print("\n=== Testing Outcome Statistics ===")
+    stats = compute_outcome_stats(_cases())
+    overall = stats[(stats["category"] == "Arbeitsrecht") & (stats["subcategory"] == "*")].iloc[0]
+    assert (overall["cases"], overall["wins"]) == (30, 24)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "outcome_stats.json")
+        write_outcome_stats(stats, path)
+        loaded = load_outcome_stats(path)
+    assert len(loaded) == len(stats)
+
+    # 10 cases per court and year are too few: back off to the court, then to the subcategory
+    stat = empirical_win_rate("Arbeitsrecht", "lohn_ausstehend", "Bundesgericht", 2020, min_cases=10, stats=loaded)
+    assert stat.key == ("Arbeitsrecht", "lohn_ausstehend", "Bundesgericht", "2020")
+    stat = empirical_win_rate("Arbeitsrecht", "lohn_ausstehend", "Bundesgericht", 2020, min_cases=20, stats=loaded)
+    assert stat.key == ("Arbeitsrecht", "lohn_ausstehend", "Bundesgericht", "*") and stat.cases == 20
+    stat = empirical_win_rate("Arbeitsrecht", "fristlose_kuendigung", min_cases=20, stats=loaded)
+    assert stat.key == ("Arbeitsrecht", "*", "*", "*") and stat.rate == 0.8
+    assert stat.ci_low < 0.8 < stat.ci_high
+
+    assert empirical_win_rate("Strafverkehrsrecht", "moderate_speeding", min_cases=20, stats=loaded) is None
+    assert load_outcome_stats(os.path.join(tmp, "missing.json")) == {}
+    print(f"✓ {len(loaded)} groups, Arbeitsrecht {stat.rate:.0%} [{stat.ci_low:.0%}, {stat.ci_high:.0%}]")
+
+
+def test_label_historic_cases():
+    """Historic cases are labeled with the keyword matcher of live cases."""
+    print("\n=== Testing Case Labels ===")
+    assert label_case("Mein Arbeitgeber hat den Lohn seit März nicht bezahlt.") == ("Arbeitsrecht", "lohn_ausstehend")
+    assert label_case("The driver was caught speeding by a radar.") == ("Strafverkehrsrecht", "moderate_speeding")
+    assert label_case("Der Vermieter kündigte den Mietvertrag.") == ("Immobilienrecht", "default")
+    assert label_case("Eine Erbschaftsfrage.") == ("Andere", "default")
+    print("✓ Categories and subcategories")
+
+
+if __name__ == "__main__":
+    test_wilson_interval()
+    test_outcome_stats_lookup()
+    test_label_historic_cases()
+    print("\n=== All outcome statistics tests passed! ===")
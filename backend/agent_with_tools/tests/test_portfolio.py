@@ -0,0 +1,74 @@
+"""Test the batch estimation of claim portfolios."""
+
+import sys
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from backend.agent_with_tools.tools.estimate_cost import estimate_cost
+from backend.agent_with_tools.tools.estimate_likelihood import estimate_business_likelihood
+from backend.agent_with_tools.tools.estimate_portfolio import estimate_portfolio
+from backend.agent_with_tools.tools.estimate_time import estimate_time
+
+
+def test_portfolio_matches_single_cases():
+    """Per-claim estimates equal those of the single-case tools."""
+    print("=== Testing Portfolio Against Single Cases ===")
+    claims = pd.DataFrame(
+        [
+            {"claim_id": "A", "category": "Strafverkehrsrecht", "subcategory": "moderate_speeding"},
+            {"claim_id": "B", "category": "Arbeitsrecht", "case_text": "My salary was not paid"},
+            {"claim_id": "C", "category": "Immobilienrecht", "complexity": "high"},
+        ]
+    )
+    result = estimate_portfolio(claims)["claims"].set_index("claim_id")
+
+    speeding = {"category": "Strafverkehrsrecht", "subcategory": "moderate_speeding"}
+    time_estimate = estimate_time(speeding)
+    cost_estimate = estimate_cost({**speeding, "time_estimate": time_estimate.model_dump()})
+    assert result.loc["A", "months"] == time_estimate.value
+    assert result.loc["A", "cost_chf"] == cost_estimate.total_chf
+    assert result.loc["A", "cost_p90_chf"] == cost_estimate.p90_chf
+    assert result.loc["A", "likelihood"] == estimate_business_likelihood("", "Strafverkehrsrecht", "moderate_speeding")["likelihood"]
+
+    # The subcategory is matched on the case text
+    assert result.loc["B", "subcategory"] == "lohn_ausstehend"
+    # Unsupported categories use the fallbacks and have no likelihood
+    assert result.loc["C", "months"] == 15 and np.isnan(result.loc["C", "likelihood"])
+    print("✓ Per-claim estimates match")
+
+
+def test_portfolio_summary():
+    """The summary aggregates all claims and large portfolios run in seconds."""
+    print("\n=== Testing Portfolio Summary ===")
+    rng = np.random.default_rng(0)
+    n = 100_000
+    claims = pd.DataFrame(
+        {
+            "category": rng.choice(["Arbeitsrecht", "Strafverkehrsrecht"], n),
+            "subcategory": rng.choice(["moderate_speeding", "lohn_ausstehend", "fristlose_kuendigung"], n),
+            "complexity": rng.choice(["low", "medium", "high"], n),
+        }
+    )
+    start = time.perf_counter()
+    result = estimate_portfolio(claims)
+    elapsed = time.perf_counter() - start
+
+    summary = result["summary"]
+    assert summary["claims"] == n
+    assert summary["total_cost_chf"] == result["claims"]["cost_chf"].sum()
+    assert summary["total_cost_p10_chf"] <= summary["total_cost_p50_chf"] <= summary["total_cost_p90_chf"]
+    assert sum(group["claims"] for group in summary["by_category"].values()) == n
+    assert estimate_portfolio([])["summary"]["claims"] == 0
+    print(f"✓ {n} claims in {elapsed:.2f}s, total {summary['total_cost_chf']:.0f} CHF")
+
+
+if __name__ == "__main__":
+    test_portfolio_matches_single_cases()
+    test_portfolio_summary()
+    print("\n=== All portfolio tests passed! ===")
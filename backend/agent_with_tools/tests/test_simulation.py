@@ -0,0 +1,80 @@
+"""Test the Monte Carlo percentiles of costs and durations."""
+
+import sys
+import os
+import time
+
+import numpy as np
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.estimators.simulation import (
+    DISTRIBUTIONS,
+    sample_ranges,
+    simulate_costs,
+    simulate_duration,
+    simulate_portfolio,
+)
+from experts.tools.estimators.tables import ESTIMATES, Range, get_estimate
+
+
+def test_distributions():
+    """Every distribution stays inside its range and handles zero-width ranges."""
+    print("=== Testing Distributions ===")
+    ranges = [Range(100.0, 300.0), Range(50.0, 50.0), Range(3.0, 6.0, open_ended=True)]
+    for name in DISTRIBUTIONS:
+        samples = sample_ranges(ranges, 5000, name)
+        assert samples.shape == (5000, 3)
+        assert samples[:, 0].min() >= 100 and samples[:, 0].max() <= 300
+        assert np.all(samples[:, 1] == 50)
+        # Open-ended ranges get a longer tail
+        assert samples[:, 2].max() > 6 and samples[:, 2].max() <= 9
+        assert abs(np.median(samples[:, 0]) - 200) < 10
+        print(f"✓ {name}")
+
+
+def test_case_percentiles():
+    """Percentiles bracket the point estimate and are deterministic."""
+    print("\n=== Testing Case Percentiles ===")
+    estimate = get_estimate("traffic_criminal_law", "moderate_speeding")
+    costs = simulate_costs(estimate)
+    assert costs["p10"] < costs["p50"] < costs["p90"]
+    assert costs["p10"] < estimate.total_cost < costs["p90"]
+    assert simulate_costs(estimate) == costs
+
+    uniform = simulate_costs(estimate, distribution={"lawyer": "uniform"})
+    assert uniform["p90"] - uniform["p10"] > costs["p90"] - costs["p10"]
+
+    months = simulate_duration(estimate)
+    assert estimate.duration.low <= months["p10"] < months["p50"] < months["p90"]
+    print(f"✓ Speeding: {costs['p10']:.0f}–{costs['p90']:.0f} CHF, {months['p10']:.1f}–{months['p90']:.1f} months")
+
+    start = time.perf_counter()
+    for _ in range(200):
+        simulate_costs(estimate)
+        simulate_duration(estimate)
+    per_case = (time.perf_counter() - start) / 200
+    print(f"✓ {per_case * 1000:.2f} ms per case")
+
+
+def test_portfolio():
+    """Batched percentiles match the per-case ones and the portfolio sums the cases."""
+    print("\n=== Testing Portfolio ===")
+    estimates = [estimate for estimate in ESTIMATES.values() if estimate.costs] * 50
+    result = simulate_portfolio(estimates)
+    assert result["costs"]["p50"].shape == (len(estimates),)
+
+    single = simulate_costs(estimates[0])
+    assert abs(result["costs"]["p50"][0] - single["p50"]) / single["p50"] < 0.05
+    total = sum(estimate.total_cost for estimate in estimates)
+    assert result["total_costs"]["p10"] < total < result["total_costs"]["p90"]
+    assert simulate_portfolio([])["costs"]["p50"].shape == (0,)
+    print(f"✓ {len(estimates)} cases: {result['total_costs']['p10']:.0f}–{result['total_costs']['p90']:.0f} CHF")
+
+
+if __name__ == "__main__":
+    test_distributions()
+    test_case_percentiles()
+    test_portfolio()
+    print("\n=== All simulation tests passed! ===")
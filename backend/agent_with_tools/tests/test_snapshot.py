@@ -0,0 +1,74 @@
+"""Test the versioned vector snapshot format."""
+
+import sys
+import os
+import json
+import tempfile
+
+import numpy as np
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.vector_index.flat_index import FlatVectorIndex, _metadata_table
+from experts.tools.vector_index.ivf_index import IVFVectorIndex
+from experts.tools.vector_index.snapshot import (
+    MANIFEST_FILE,
+    open_snapshot,
+    read_manifest,
+    verify_snapshot,
+)
+
+
+def _index(n: int = 400, dim: int = 16) -> FlatVectorIndex:
+    vectors = np.random.default_rng(0).normal(size=(n, dim)).astype(np.float32)
+    table = _metadata_table(
+        ids=[f"doc_{i}" for i in range(n)],
+        documents=[f"text {i}" for i in range(n)],
+        metadatas=[{"filename": f"SR-{i % 7}.pdf"} for i in range(n)],
+    )
+    return FlatVectorIndex(vectors, table, space="cosine", name="pdf_vectors_gemini")
+
+
+def test_snapshot_roundtrip_and_verification():
+    """Snapshots reopen read-only with identical results and detect corruption."""
+    print("=== Testing Vector Snapshots ===")
+    index = _index()
+    query = np.asarray(index.vectors[3])
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        index.save(snapshot_dir)
+        manifest = read_manifest(snapshot_dir)
+        assert manifest["format_version"] == 1
+        assert manifest["embedding_model"] == "gemini-embedding-001"
+        assert set(manifest["files"]) == {"vectors.npy", "norms.npy", "metadata.arrow"}
+        assert verify_snapshot(snapshot_dir) == []
+
+        reopened = open_snapshot(snapshot_dir, verify=True)
+        assert not reopened.vectors.flags.writeable, "Vectors must be a read-only memory map"
+        assert reopened.query([query], n_results=5) == index.query([query], n_results=5)
+        print("✓ Snapshot reopens read-only with identical results")
+
+        with open(os.path.join(snapshot_dir, "norms.npy"), "r+b") as f:
+            f.seek(-4, os.SEEK_END)
+            f.write(b"\x00\x00\x00\x00")
+        assert verify_snapshot(snapshot_dir) == ["checksum mismatch: norms.npy"]
+        print("✓ Corrupted files are detected")
+
+
+def test_ivf_snapshot_type():
+    """IVF snapshots are opened with the IVF index class."""
+    print("\n=== Testing IVF Snapshots ===")
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        IVFVectorIndex.build(_index(), nlist=8, nprobe=2).save(snapshot_dir)
+        with open(os.path.join(snapshot_dir, MANIFEST_FILE), encoding="utf-8") as f:
+            assert json.load(f)["index_type"] == "ivf"
+        reopened = open_snapshot(snapshot_dir, verify=True)
+        assert isinstance(reopened, IVFVectorIndex) and reopened.nprobe == 2
+    print("✓ IVF snapshot reopens as IVFVectorIndex")
+
+
+if __name__ == "__main__":
+    test_snapshot_roundtrip_and_verification()
+    test_ivf_snapshot_type()
+    print("\n=== All snapshot tests passed! ===")
@@ -0,0 +1,90 @@
+"""Test routing of Swiss law queries to SR-area shards."""
+
+import sys
+import os
+
+import chromadb
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from experts.tools.vector_index import ShardedCollection, open_collection, query_plan, route_collection, sr_area
+
+
+def _area_store():
+    """In-memory store with one shard per SR area (2xx, 3xx, 8xx and files without SR number)."""
+    client = chromadb.EphemeralClient()
+    for area, vector in (("2", [1.0, 0.0]), ("3", [0.0, 1.0]), ("8", [0.9, 0.1]), ("x", [0.5, 0.5])):
+        shard = client.get_or_create_collection(f"pdf_vectors_gemini_shard_{area}")
+        shard.upsert(
+            ids=[f"SR-{area}00_{i}" for i in range(3)],
+            embeddings=[vector] * 3,
+            documents=[f"Art. {i}" for i in range(3)],
+            metadatas=[{"sr_area": area if area != "x" else ""}] * 3,
+        )
+    return client
+
+
+def test_routes_categories_to_area_shards():
+    """Category queries only touch the category's shards; "Andere" searches all of them."""
+    print("=== Testing SR Area Routing ===")
+    assert sr_area("220") == "2" and sr_area("0.831.109") == "0" and sr_area("") == ""
+
+    collection = open_collection(_area_store(), "pdf_vectors_gemini")
+    assert isinstance(collection, ShardedCollection)
+    assert collection.shard_ids == ["2", "3", "8", "x"]
+
+    routed, where = route_collection(collection, "Arbeitsrecht")
+    assert where is None and routed.shard_ids == ["2", "8"]
+    assert route_collection(collection, "Arbeitsrecht")[0] is routed  # subsets are cached
+    result = routed.query(query_embeddings=[[0.0, 1.0]], n_results=6)
+    assert {metadata["sr_area"] for metadata in result["metadatas"][0]} == {"2", "8"}
+
+    assert route_collection(collection, "Andere") == (collection, None)
+    assert route_collection(collection, None) == (collection, None)
+    print("✓ Arbeitsrecht → SR 2xx and 8xx, Andere → all shards")
+
+
+def test_routes_unsharded_collections_by_filter():
+    """Single collections and exported indexes are routed with an sr_area filter."""
+    print("\n=== Testing SR Area Filter ===")
+    collection = chromadb.EphemeralClient().get_or_create_collection("pdf_vectors_gemini")
+    collection.upsert(
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]],
+        metadatas=[{"sr_area": "2"}, {"sr_area": "3"}, {"sr_area": "7"}],
+    )
+    routed, where = route_collection(collection, "Strafverkehrsrecht")
+    assert routed is collection and where == {"sr_area": {"$in": ["3", "7"]}}
+    result = collection.query(query_embeddings=[[1.0, 0.0]], n_results=3, where=where)
+    assert sorted(result["ids"][0]) == ["b", "c"]
+    print("✓ Strafverkehrsrecht → sr_area in [3, 7]")
+
+
+def test_query_plan_prefers_case_language():
+    """The case language is tried first, then both languages, then everything."""
+    print("\n=== Testing Language Query Plan ===")
+    collection = chromadb.EphemeralClient().get_or_create_collection("pdf_vectors_lang")
+    collection.upsert(
+        ids=["de_822", "en_220", "en_741"],
+        embeddings=[[1.0, 0.0], [0.9, 0.1], [0.0, 1.0]],
+        metadatas=[{"sr_area": "8", "language": "de"}, {"sr_area": "2", "language": "en"}, {"sr_area": "7", "language": "en"}],
+    )
+    plan = query_plan(collection, "Arbeitsrecht", "de")
+    area = {"sr_area": {"$in": ["2", "8"]}}
+    assert [where for _, where in plan] == [{"$and": [area, {"language": "de"}]}, area, None]
+
+    results = [collection.query(query_embeddings=[[1.0, 0.0]], n_results=2, where=where) for _, where in plan]
+    assert results[0]["ids"][0] == ["de_822"]  # too few: the retriever widens the search
+    assert results[1]["ids"][0] == ["de_822", "en_220"]
+
+    # Unknown language and category: a single unfiltered attempt
+    assert query_plan(collection, "Andere", None) == [(collection, None)]
+    print("✓ de → de chunks of SR 2xx/8xx, then both languages, then all")
+
+
+if __name__ == "__main__":
+    test_routes_categories_to_area_shards()
+    test_routes_unsharded_collections_by_filter()
+    test_query_plan_prefers_case_language()
+    print("\n=== All SR routing tests passed! ===")
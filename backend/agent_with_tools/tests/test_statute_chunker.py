@@ -0,0 +1,82 @@
+"""Test the article-aware chunker for Swiss statutes."""
+
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../")))
+
+from legal_vectors.legal_vectorizer.statute_chunker import (
+    StatuteChunker,
+    parse_statute_filename,
+    statute_citation,
+)
+
+STATUTE = """# Swiss Code of Obligations
+
+of 30 March 1911
+
+## Title Ten: The Employment Contract
+
+**Art. 319**
+
+A. Definition
+
+1 By means of an individual employment contract, the employee undertakes to work in the service of the employer.
+
+**Art. 320**
+
+Repealed
+
+**Art. 336c**
+
+Termination at an inopportune juncture
+
+{long}
+
+Section Two: Apprenticeship
+
+Art. 344 Definition
+The apprenticeship contract obliges the employer to train the apprentice.
+"""
+
+
+def test_article_chunks():
+    """Articles stay whole, short ones merge, long ones split with their article line."""
+    print("=== Testing Statute Chunker ===")
+    long_article = "\n\n".join(f"{i} The employer may not terminate the employment relationship. " * 6 for i in range(1, 9))
+    chunks = StatuteChunker(max_chars=1000, merge_below=200).split(STATUTE.format(long=long_article))
+
+    assert chunks[0]["article"] == "" and chunks[0]["text"].startswith("of 30 March 1911")
+    # Art. 320 ("Repealed") is merged into Art. 319
+    assert chunks[1]["article"] == "319-320"
+    assert chunks[1]["heading"] == "Title Ten: The Employment Contract"
+    assert "Art. 320" in chunks[1]["text"]
+
+    long_parts = [chunk for chunk in chunks if chunk["article"] == "336c"]
+    assert len(long_parts) > 1
+    assert all(chunk["text"].startswith("Art. 336c") and len(chunk["text"]) <= 1000 for chunk in long_parts)
+
+    assert chunks[-1]["article"] == "344"
+    assert chunks[-1]["heading"] == "Section Two: Apprenticeship"
+    print(f"✓ {len(chunks)} chunks, articles {[chunk['article'] for chunk in chunks]}")
+
+
+def test_filename_metadata():
+    """SR number and language come from the Fedlex file name."""
+    print("\n=== Testing Statute File Names ===")
+    assert parse_statute_filename("SR-748.131.3-01012025-EN.pdf") == {
+        "sr_number": "748.131.3",
+        "version": "01012025",
+        "language": "en",
+    }
+    assert parse_statute_filename("notes.pdf")["sr_number"] == ""
+    assert statute_citation("220", "336c") == "SR 220 Art. 336c"
+    assert statute_citation("220", "") == "SR 220"
+    print("✓ SR number, language and citations are parsed")
+
+
+if __name__ == "__main__":
+    test_article_chunks()
+    test_filename_metadata()
+    print("\n=== All statute chunker tests passed! ===")
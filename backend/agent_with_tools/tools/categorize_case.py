@@ -2,9 +2,25 @@
 
 import os
 import logging
+from typing import Iterable, List, Optional
 from backend.agent_with_tools.schemas import CategoryResult
+from backend.agent_with_tools.policies import (
+    CATEGORY_ESCALATION_MARGIN,
+    CATEGORY_MODEL_ENABLED,
+    MIN_CATEGORY_CONFIDENCE,
+)
+from experts.tools.estimators.case_keywords import match_keywords
+from experts.tools.estimators.category_model import classify_embedding
 from classifier.classifier_chain import get_classifier_chain
 
+# Legal fields of the classifier chain -> categories
+FIELD_CATEGORIES = {
+    "employment_law": "Arbeitsrecht",
+    "traffic_law": "Strafverkehrsrecht",
+    "real_estate_law": "Immobilienrecht",
+    "other": "Andere",
+}
+
 # Ensure environment variables are set from settings
 try:
     from core.config import settings
@@ -14,21 +30,37 @@ except ImportError:
     pass
 
 
-def categorize_case(text: str) -> CategoryResult:
+def categorize_case(
+    text: str, keyword_hits: Optional[Iterable[str]] = None, embedding: Optional[List[float]] = None
+) -> CategoryResult:
     """
-    Categorize a legal case into one of three categories.
+    Categorize a legal case into one of four categories.
     
     Args:
         text: Case description text to categorize
+        keyword_hits: Keyword groups matched by ingest_node; matched from text if None
+        embedding: Embedding of the case text for the local classifier
         
     Returns:
-        CategoryResult with category and confidence score
+        CategoryResult with category, confidence score and, from the LLM
+        classifier, the case type (subcategory)
         
     Note:
-        Uses the actual classifier chain that returns traffic_law and employment_law booleans.
-        Maps to: Arbeitsrecht (employment_law=True), Strafverkehrsrecht (traffic_law=True), 
-        Andere (both False or ambiguous cases).
+        The embedding classifier decides when its top category is clearly ahead
+        (calibrated probability as confidence). Otherwise the classifier chain
+        returns legal field, case type and confidence in one structured call.
     """
+    if CATEGORY_MODEL_ENABLED and embedding:
+        prediction = classify_embedding(embedding)
+        if (
+            prediction is not None
+            and prediction.margin >= CATEGORY_ESCALATION_MARGIN
+            and prediction.probability >= MIN_CATEGORY_CONFIDENCE
+        ):
+            return CategoryResult(category=prediction.category, confidence=round(prediction.probability, 2))
+        if prediction is not None:
+            print(f"⚠️ Ambiguous embedding classification (margin {prediction.margin:.2f}), asking the LLM classifier")
+    
     try:
         # Set the API key in the environment for the classifier
         if "APERTUS_API_KEY" in os.environ and "API_KEY" not in os.environ:
@@ -37,42 +69,19 @@ def categorize_case(text: str) -> CategoryResult:
         # Get the classifier chain
         classifier = get_classifier_chain()
         
-        # Run classification with empty chat history
+        # Legal field, case type and confidence from a single call (empty chat history)
         result = classifier.invoke({"user_input": text, "chat_history": []})
         
-        # Map classifier output to our schema
-        traffic_law = result.get("traffic_law", False)
-        employment_law = result.get("employment_law", False)
-        
-        # Determine category based on the boolean flags
-        if employment_law and not traffic_law:
-            category = "Arbeitsrecht"
-            confidence = 0.85  # High confidence for single match
-        elif traffic_law and not employment_law:
-            category = "Strafverkehrsrecht" 
-            confidence = 0.85  # High confidence for single match
-        elif employment_law and traffic_law:
-            # Both categories match - choose the more likely one or default to Andere
-            # For now, we'll default to Andere for ambiguous cases
-            category = "Andere"
-            confidence = 0.60  # Lower confidence for ambiguous cases
-        else:
-            # Neither category matches - check for real estate law patterns
-            text_lower = text.lower()
-            real_estate_terms = [
-                "immobilien", "haus", "wohnung", "grundstück", "eigentum", "miete", "vermieter", 
-                "mieter", "kaufvertrag", "mängel", "defekt", "property", "house", "apartment", 
-                "real estate", "purchase", "defect", "landlord", "tenant", "rent", "lease"
-            ]
-            
-            if any(term in text_lower for term in real_estate_terms):
+        category = FIELD_CATEGORIES[result.legal_field]
+        confidence = round(result.confidence, 2)
+        if category == "Andere":
+            # Real estate cases the classifier missed are still caught by their keywords
+            hits = set(keyword_hits) if keyword_hits is not None else match_keywords(text)
+            if "real_estate" in hits:
                 category = "Immobilienrecht"
                 confidence = 0.75  # Good confidence for pattern match
-            else:
-                category = "Andere"
-                confidence = 0.70  # Medium confidence for clear non-match
-            
-        return CategoryResult(category=category, confidence=confidence)
+        
+        return CategoryResult(category=category, confidence=confidence, subcategory=result.subcategory)
         
     except Exception as e:
         # Fallback in case of classifier failure
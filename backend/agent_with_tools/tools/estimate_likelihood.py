@@ -1,32 +1,59 @@
 """Business logic likelihood estimation tool.
 
-This tool uses the estimator functions from experts/tools/estimators/estimator.py
-to provide baseline likelihood estimates based on business logic and experience.
+This tool uses the estimator tables from experts/tools/estimators/tables.py
+(loaded from the case spreadsheets at startup) to provide baseline likelihood
+estimates based on business logic and experience, and the empirical win rates
+of historic cases from experts/tools/estimators/outcome_stats.py.
 """
 
-import re
 from typing import Dict, Any, Optional, Tuple
 from backend.agent_with_tools.tools.estimator_constants import CATEGORY_MAPPING
 from backend.agent_with_tools.tools.estimator_utils import extract_subcategory
-from experts.tools.estimators.estimator import estimate_chance_of_winning
+from experts.tools.estimators.outcome_stats import empirical_win_rate
+from experts.tools.estimators.tables import MAX_LIKELIHOOD, MIN_LIKELIHOOD, get_estimate, likelihood_of, parse_percent
 
 
-def estimate_business_likelihood(case_text: str, category: str) -> Dict[str, Any]:
+def estimate_business_likelihood(case_text: str, category: str, subcategory: Optional[str] = None) -> Dict[str, Any]:
     """
     Get baseline likelihood estimate using business logic.
     
     Args:
         case_text: The case description text
         category: Legal category (German format: "Arbeitsrecht", "Strafverkehrsrecht", etc.)
+        subcategory: Subcategory matched by ingest_node; extracted from case_text if None
         
     Returns:
         Dictionary containing:
         - likelihood: Numerical likelihood (1-100) or None if not supported
-        - raw_estimate: Original string from estimator function
+        - raw_estimate: Original text of the estimator table
         - explanation: Reasoning and warnings
         - category_mapped: English category used for estimation
         - subcategory: Subcategory used for estimation
+        - empirical: Win rate of similar historic cases (cases, wins, rate,
+          ci_low, ci_high, key) or None if there are not enough of them
     """
+    result = _table_likelihood(case_text, category, subcategory)
+    
+    # Data-backed baseline from the outcomes of historic cases
+    stat = empirical_win_rate(category, result["subcategory"])
+    result["empirical"] = stat.as_dict() if stat else None
+    if stat is None:
+        return result
+    
+    summary = (
+        f"{stat.rate:.0%} of {stat.cases} similar historic cases were won "
+        f"(95% CI {stat.ci_low:.0%}–{stat.ci_high:.0%})"
+    )
+    if result["likelihood"] is None:
+        result["likelihood"] = max(MIN_LIKELIHOOD, min(MAX_LIKELIHOOD, round(stat.rate * 100)))
+        result["explanation"] = f"Empirical baseline: {summary}. Business logic tables do not cover this case."
+    else:
+        result["explanation"] += f" Empirical check: {summary}."
+    return result
+
+
+def _table_likelihood(case_text: str, category: str, subcategory: Optional[str]) -> Dict[str, Any]:
+    """Baseline likelihood of the business logic tables (see estimate_business_likelihood)."""
     result = {
         "likelihood": None,
         "raw_estimate": None,
@@ -45,23 +72,24 @@ def estimate_business_likelihood(case_text: str, category: str) -> Dict[str, Any
     
     # Extract subcategory from case text
     try:
-        subcategory = extract_subcategory(case_text, english_category)
+        if subcategory is None:
+            subcategory = extract_subcategory(case_text, english_category)
         result["subcategory"] = subcategory
         
         if not subcategory or subcategory == "default":
             result["explanation"] = f"Could not determine specific subcategory for {category}. Using general analysis."
             return result
         
-        # Get business logic estimate
-        raw_estimate = estimate_chance_of_winning(english_category, subcategory)
-        result["raw_estimate"] = raw_estimate
-        
-        if raw_estimate == "unknown":
+        # Get business logic estimate (parsed when the tables were loaded)
+        estimate = get_estimate(english_category, subcategory)
+        if estimate is None:
+            result["raw_estimate"] = "unknown"
             result["explanation"] = f"Business logic estimator returned 'unknown' for {category}/{subcategory}. Using fallback analysis."
             return result
         
-        # Parse numerical likelihood from string estimate
-        likelihood = _parse_likelihood_percentage(raw_estimate)
+        raw_estimate = estimate.chance_text
+        likelihood = estimate.likelihood
+        result["raw_estimate"] = raw_estimate
         result["likelihood"] = likelihood
         
         if likelihood is not None:
@@ -79,52 +107,18 @@ def _parse_likelihood_percentage(estimate_string: str) -> Optional[int]:
     """
     Parse numerical percentage from estimator string.
     
+    The estimator tables are parsed once when they are loaded; this helper
+    applies the same rules to free-text estimates.
+    
     Args:
         estimate_string: String like "20%", "80%", "10–15% (usually hopeless)", etc.
         
     Returns:
-        Integer percentage (1-100) or None if cannot parse
+        Integer percentage (1-95, midpoint of ranges) or None if cannot parse
     """
     if not estimate_string or estimate_string == "unknown":
         return None
-    
-    # Look for percentage patterns
-    # Handle ranges like "10–15%" - take midpoint
-    range_pattern = r'(\d+)[-–](\d+)%'
-    range_match = re.search(range_pattern, estimate_string)
-    if range_match:
-        low = int(range_match.group(1))
-        high = int(range_match.group(2))
-        return (low + high) // 2
-    
-    # Handle single percentages like "20%", "80%"
-    single_pattern = r'(\d+)%'
-    single_match = re.search(single_pattern, estimate_string)
-    if single_match:
-        percentage = int(single_match.group(1))
-        # Cap 100% at 95% for more realistic modeling
-        if percentage == 100:
-            return 95
-        # Ensure it's in valid range
-        return max(1, min(100, percentage))
-    
-    # Handle special cases with qualitative descriptions
-    estimate_lower = estimate_string.lower()
-    
-    if "<10%" in estimate_string:
-        return 5  # Very low chance for <10%
-    elif any(word in estimate_lower for word in ["hopeless", "almost hopeless"]):
-        return 5  # Very low chance
-    elif "100%" in estimate_string:
-        return 95  # Very high but not absolute certainty
-    elif any(word in estimate_lower for word in ["low", "poor", "weak"]):
-        return 25  # Low chance
-    elif any(word in estimate_lower for word in ["good", "strong"]):
-        return 65  # Good chance
-    elif any(word in estimate_lower for word in ["moderate", "medium"]):
-        return 50  # Medium chance
-    
-    return None
+    return likelihood_of(parse_percent(estimate_string))
 
 
 def get_likelihood_explanation_context(business_result: Dict[str, Any]) -> str:
@@ -146,5 +140,40 @@ def get_likelihood_explanation_context(business_result: Dict[str, Any]) -> str:
         f"Raw Estimate: {business_result['raw_estimate']}",
         f"Note: {business_result['explanation']}"
     ]
+    empirical = business_result.get("empirical")
+    if empirical:
+        context_parts.insert(
+            3,
+            f"Historic Win Rate: {empirical['rate']:.0%} of {empirical['cases']} cases "
+            f"(95% CI {empirical['ci_low']:.0%}–{empirical['ci_high']:.0%})",
+        )
+    
+    return "\n".join([f"- {part}" for part in context_parts if part])
+
+
+def is_confident_baseline(business_result: Dict[str, Any], max_spread: float = 20) -> bool:
+    """
+    Whether a baseline is reliable enough to be used without LLM review.
+    
+    Args:
+        business_result: Result dictionary from estimate_business_likelihood
+        max_spread: Widest chance range of the estimator table (percentage points)
+        
+    Returns:
+        True if the baseline comes from an estimator table row with a narrow
+        chance range and, where historic outcomes are known, lies inside their
+        95% confidence interval
+    """
+    likelihood = business_result.get("likelihood")
+    if likelihood is None or business_result.get("raw_estimate") is None:
+        return False
+    
+    estimate = get_estimate(business_result["category_mapped"], business_result["subcategory"])
+    if estimate is None or estimate.chance is None or estimate.chance.high - estimate.chance.low > max_spread:
+        return False
     
-    return "\n".join([f"- {part}" for part in context_parts if part])
\ No newline at end of file
+    # Historic outcomes contradicting the table are left to the LLM
+    empirical = business_result.get("empirical")
+    if empirical and not empirical["ci_low"] * 100 <= likelihood <= empirical["ci_high"] * 100:
+        return False
+    return True
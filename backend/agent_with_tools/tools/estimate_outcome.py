@@ -0,0 +1,81 @@
+"""Data-driven win likelihood tool.
+
+Combines the calibrated outcome model of experts/tools/estimators/outcome_model.py
+(applied to the embedding of the case text) with a similarity-weighted vote over
+the outcomes of the most similar historic cases. Both are computed in process in
+milliseconds once the case text is embedded by the similar-cases retrieval.
+"""
+
+from typing import Any, Dict, List, Optional
+from backend.agent_with_tools.policies import OUTCOME_NEIGHBOURS
+from backend.agent_with_tools.tools.historic_cases import similar_case_outcomes
+from experts.tools.estimators import outcome_model
+from experts.tools.estimators.outcome_model import combine_likelihood, neighbour_vote
+from experts.tools.estimators.tables import MAX_LIKELIHOOD, MIN_LIKELIHOOD
+
+
+def estimate_outcome_likelihood(
+    case_text: str, top_k: int = OUTCOME_NEIGHBOURS, embedding: Optional[List[float]] = None
+) -> Dict[str, Any]:
+    """
+    Estimate the win likelihood from the outcome model and similar cases.
+
+    Args:
+        case_text: The case description text
+        top_k: Number of similar cases in the outcome vote
+        embedding: Embedding of the case text, if already computed
+
+    Returns:
+        Dictionary containing:
+        - likelihood: Numerical likelihood (1-100) or None without model and neighbours
+        - model_probability: Probability of the outcome model or None
+        - vote: Similarity-weighted win share of the neighbours or None
+        - neighbours: Number of neighbours with an outcome
+        - cases: The similar cases
+        - explanation: Sources of the estimate
+    """
+    cases, embedding = similar_case_outcomes(case_text, top_k=top_k, embedding=embedding)
+    model = outcome_model.OUTCOME_MODEL
+    model_probability = model.predict(embedding) if model is not None and embedding else None
+    vote = neighbour_vote([(case.outcome, case.similarity or 0.0) for case in cases])
+    probability = combine_likelihood(model_probability, vote)
+
+    result = {
+        "likelihood": None,
+        "model_probability": model_probability,
+        "vote": vote[0] if vote else None,
+        "neighbours": sum(1 for case in cases if case.outcome.strip()),
+        "cases": cases,
+        "explanation": "",
+    }
+    if probability is None:
+        return result
+
+    result["likelihood"] = max(MIN_LIKELIHOOD, min(MAX_LIKELIHOOD, round(probability * 100)))
+    sources = []
+    if model_probability is not None:
+        sources.append(f"outcome model {model_probability:.0%}")
+    if vote is not None:
+        sources.append(f"{vote[0]:.0%} similarity-weighted wins among {result['neighbours']} similar cases")
+    result["explanation"] = f"Data-driven likelihood: {result['likelihood']}% ({', '.join(sources)})."
+    return result
+
+
+def format_outcome_context(result: Dict[str, Any], baseline: Optional[int] = None) -> str:
+    """
+    Format the data-driven estimate for the LLM narrative prompt.
+
+    Args:
+        result: Result of estimate_outcome_likelihood
+        baseline: Business logic baseline, if any
+
+    Returns:
+        Formatted context string
+    """
+    lines = [result["explanation"]]
+    if baseline is not None:
+        lines.append(f"Business logic baseline: {baseline}%")
+    for case in result["cases"][:3]:
+        similarity = f", similarity {case.similarity:.2f}" if case.similarity is not None else ""
+        lines.append(f"- {case.citation} ({case.year}, {case.court}{similarity}): {case.outcome or 'unknown'}")
+    return "\n".join(lines)
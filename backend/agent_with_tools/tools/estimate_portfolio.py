@@ -0,0 +1,175 @@
+"""Batch estimation of claim portfolios.
+
+Runs the estimator layer (estimate_time, estimate_cost and
+estimate_business_likelihood) over many claims at once, without the LangGraph
+run and without LLM calls. Claims sharing category, subcategory and complexity
+get the same estimates, so every distinct combination is estimated once and the
+results are broadcast to the claims with NumPy indexing.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.agent_with_tools.policies import DEFAULT_COMPLEXITY, DEFAULT_HOURLY_RATE_LAWYER, DEFAULT_VAT_RATE
+from backend.agent_with_tools.tools.estimate_cost import estimate_cost
+from backend.agent_with_tools.tools.estimate_likelihood import estimate_business_likelihood
+from backend.agent_with_tools.tools.estimate_time import estimate_time
+from backend.agent_with_tools.tools.estimator_constants import CATEGORY_MAPPING
+from experts.tools.estimators.case_keywords import match_keywords, subcategory_for
+from experts.tools.estimators.simulation import DEFAULT_DISTRIBUTION, cost_moments
+from experts.tools.estimators.tables import get_estimate
+
+GROUP_COLUMNS = ["category", "subcategory", "complexity"]
+ESTIMATE_COLUMNS = [
+    "category_mapped",
+    "subcategory_used",
+    "likelihood",
+    "months",
+    "months_p10",
+    "months_p50",
+    "months_p90",
+    "cost_chf",
+    "cost_p10_chf",
+    "cost_p50_chf",
+    "cost_p90_chf",
+    "cost_mean_chf",
+    "cost_var_chf",
+]
+# Standard normal quantile of the 90th percentile
+Z_90 = 1.2815515655446004
+
+
+def _claims_frame(df: pd.DataFrame, text_column: str) -> pd.DataFrame:
+    """Category, subcategory and complexity of every claim, with defaults filled in."""
+    if "category" not in df.columns:
+        raise ValueError("Claims need a 'category' column")
+
+    keys = pd.DataFrame(index=df.index)
+    keys["category"] = df["category"].fillna("Andere").astype(str)
+    subcategory = df["subcategory"] if "subcategory" in df.columns else pd.Series("", index=df.index)
+    keys["subcategory"] = subcategory.fillna("").astype(str)
+    complexity = df["complexity"] if "complexity" in df.columns else pd.Series("", index=df.index)
+    keys["complexity"] = complexity.fillna("").astype(str).str.lower()
+    keys.loc[~keys["complexity"].isin(["low", "medium", "high"]), "complexity"] = DEFAULT_COMPLEXITY
+
+    # Claims without subcategory are matched on their text, like live cases in ingest_node
+    if text_column in df.columns:
+        missing = keys["subcategory"] == ""
+        for index in keys.index[missing]:
+            english_category = CATEGORY_MAPPING.get(keys.at[index, "category"], "other")
+            text = df.at[index, text_column]
+            if isinstance(text, str) and text:
+                keys.at[index, "subcategory"] = subcategory_for(match_keywords(text), english_category)
+    return keys
+
+
+def _estimate_group(category: str, subcategory: str, complexity: str) -> Dict[str, Any]:
+    """Estimates of one combination of category, subcategory and complexity."""
+    case_facts = {"category": category, "complexity": complexity, "subcategory": subcategory or None}
+    time_estimate = estimate_time(case_facts)
+    cost_estimate = estimate_cost(
+        {
+            "time_estimate": time_estimate.model_dump(),
+            "category": category,
+            "subcategory": subcategory or None,
+            "hourly_rates": {"lawyer": DEFAULT_HOURLY_RATE_LAWYER},
+            "vat_rate": DEFAULT_VAT_RATE,
+        }
+    )
+    likelihood = estimate_business_likelihood("", category, subcategory or None)
+
+    # Cost distributions exist only for claims covered by the estimator tables
+    estimate = get_estimate(CATEGORY_MAPPING.get(category, "other"), likelihood["subcategory"] or "")
+    if cost_estimate.p10_chf is not None and estimate is not None:
+        cost_mean, cost_var = cost_moments(estimate, DEFAULT_DISTRIBUTION)
+    else:
+        cost_mean, cost_var = cost_estimate.total_chf, 0.0
+
+    return {
+        "category_mapped": likelihood["category_mapped"] or "other",
+        "subcategory_used": likelihood["subcategory"] or subcategory or "default",
+        "likelihood": np.nan if likelihood["likelihood"] is None else float(likelihood["likelihood"]),
+        "months": float(time_estimate.value),
+        "months_p10": time_estimate.p10,
+        "months_p50": time_estimate.p50,
+        "months_p90": time_estimate.p90,
+        "cost_chf": float(cost_estimate.total_chf),
+        "cost_p10_chf": cost_estimate.p10_chf,
+        "cost_p50_chf": cost_estimate.p50_chf,
+        "cost_p90_chf": cost_estimate.p90_chf,
+        "cost_mean_chf": cost_mean,
+        "cost_var_chf": cost_var,
+    }
+
+
+def estimate_portfolio(claims, text_column: str = "case_text") -> Dict[str, Any]:
+    """
+    Estimate likelihood, duration and cost of many claims at once.
+
+    Args:
+        claims: DataFrame, pyarrow Table or list of dicts with a "category"
+                column (German, e.g. "Arbeitsrecht") and optional "subcategory"
+                and "complexity" columns; other columns are kept as metadata
+        text_column: Column with the case text, used to match the subcategory
+                     of claims without one
+
+    Returns:
+        Dictionary containing:
+        - claims: DataFrame with the input columns and likelihood, months,
+          months_p10/p50/p90, cost_chf and cost_p10/p50/p90_chf per claim
+        - summary: Aggregate estimates of the portfolio (total cost with
+          P10/P50/P90, mean duration, mean likelihood, per category totals)
+    """
+    if hasattr(claims, "to_pandas"):  # pyarrow Table
+        claims = claims.to_pandas()
+    claims = pd.DataFrame(claims).reset_index(drop=True)
+    if claims.empty and "category" not in claims.columns:
+        claims["category"] = pd.Series(dtype=str)
+    keys = _claims_frame(claims, text_column)
+
+    codes, groups = pd.factorize(pd.MultiIndex.from_frame(keys[GROUP_COLUMNS]))
+    estimates = pd.DataFrame([_estimate_group(*group) for group in groups], columns=ESTIMATE_COLUMNS)
+
+    result = claims.copy()
+    result["subcategory"] = keys["subcategory"].to_numpy()
+    result["complexity"] = keys["complexity"].to_numpy()
+    for column in estimates.columns:
+        result[column] = estimates[column].to_numpy()[codes]
+
+    return {"claims": result.drop(columns=["cost_mean_chf", "cost_var_chf"]), "summary": _summarize(result)}
+
+
+def _summarize(result: pd.DataFrame) -> Dict[str, Any]:
+    """Aggregate estimates; claims are independent, so the total cost is close to normal."""
+    mean = float(result["cost_mean_chf"].sum())
+    sd = float(np.sqrt(result["cost_var_chf"].sum()))
+    by_category = (
+        result.groupby("category", sort=True)
+        .agg(
+            claims=("cost_chf", "size"),
+            total_cost_chf=("cost_chf", "sum"),
+            mean_months=("months", "mean"),
+            mean_likelihood=("likelihood", "mean"),
+        )
+        .round(2)
+    )
+    return {
+        "claims": int(len(result)),
+        "total_cost_chf": float(result["cost_chf"].sum()),
+        "total_cost_p10_chf": max(0.0, mean - Z_90 * sd),
+        "total_cost_p50_chf": mean,
+        "total_cost_p90_chf": mean + Z_90 * sd,
+        "mean_months": _mean_or_none(result["months"]),
+        "mean_likelihood": _mean_or_none(result["likelihood"]),
+        "by_category": {
+            category: {key: (None if pd.isna(value) else value) for key, value in row.items()}
+            for category, row in by_category.to_dict(orient="index").items()
+        },
+    }
+
+
+def _mean_or_none(values: pd.Series) -> Optional[float]:
+    mean = values.mean()
+    return None if pd.isna(mean) else float(mean)
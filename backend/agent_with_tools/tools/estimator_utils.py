@@ -7,12 +7,16 @@ subcategories from case text, normalizing time estimates, and handling input for
 
 from typing import Union, Dict, Any
 from backend.agent_with_tools.schemas import TimeEstimate
+from experts.tools.estimators.case_keywords import match_keywords, subcategory_for
 
 
 def extract_subcategory(case_text: str, category: str) -> str:
     """
     Extract subcategory from case text based on keywords.
     
+    The graph matches the keywords once in ingest_node and passes the stored
+    subcategory to the tools; this scans the text for direct tool calls.
+    
     Args:
         case_text: The case description text
         category: The main legal category (employment_law, traffic_criminal_law, etc.)
@@ -23,36 +27,7 @@ def extract_subcategory(case_text: str, category: str) -> str:
     if not case_text:
         return "default"
     
-    case_lower = case_text.lower()
-    
-    if category == "employment_law":
-        if any(word in case_lower for word in ["salary", "wage", "pay", "lohn"]):
-            return "lohn_ausstehend"
-        elif any(word in case_lower for word in ["illness", "sick", "krankheit", "unfall"]):
-            return "kuendigung_waehrend_krankheit_unfall"
-        elif any(word in case_lower for word in ["dismissal", "fired", "fristlos"]):
-            return "fristlose_kuendigung"
-        elif any(word in case_lower for word in ["workload", "overtime", "work hours"]):
-            return "increase_in_workload" 
-        else:
-            return "termination_poor_performance"
-    
-    elif category == "traffic_criminal_law":
-        if any(word in case_lower for word in ["alcohol", "drunk", "dui", "influence"]):
-            return "driving_under_influence_alcohol_license_withdrawal"
-        elif any(word in case_lower for word in ["parking", "parked"]):
-            if "accident" in case_lower:
-                return "parking_lot_accident_chf_2500_no_witnesses"
-            else:
-                return "parking_fine_expired_few_minutes"
-        elif any(word in case_lower for word in ["speeding", "speed", "fast"]):
-            return "moderate_speeding"
-        elif any(word in case_lower for word in ["penalty", "fine"]):
-            return "alcohol_06_penalty_order"
-        else:
-            return "moderate_speeding"
-    
-    return "default"
+    return subcategory_for(match_keywords(case_text), category)
 
 
 def normalize_time_estimate(time_estimate: Union[TimeEstimate, Dict[str, Any]]) -> tuple[int, str]:
@@ -2,8 +2,10 @@
 
 import sys
 import os
-from typing import List
+from typing import List, Optional, Tuple
 from backend.agent_with_tools.schemas import Case
+from backend.agent_with_tools.policies import VECTOR_INDEX_BACKEND
+from experts.tools.estimators.case_fields import case_court, case_year
 
 # Ensure environment variables are set from settings
 try:
@@ -34,7 +36,8 @@ try:
             chroma_db_path = os.path.join(similar_cases_path, "chroma_db")
             _retriever = OptimizedChromaRetriever(
                 chroma_db_path=chroma_db_path,
-                collection_name="similar_vectors_gemini"
+                collection_name="similar_vectors_gemini",
+                index_backend=VECTOR_INDEX_BACKEND
             )
         return _retriever
         
@@ -43,6 +46,31 @@ except ImportError as e:
     _retriever = None
 
 
+def _get_available_retriever():
+    """Return the shared retriever, or None if it cannot be initialized"""
+    if _retriever is None:
+        return _get_retriever()
+    return _retriever
+
+
+def _to_case(result) -> Case:
+    """Map a retrieval result to a Case"""
+    # Court, year, citation and outcome are normalized at ingest
+    # (legal_vectors/similar_cases_vectorizer); stores built before that still
+    # get the docref fallbacks here
+    metadata = result.metadata
+    citation = str(metadata.get("citation") or metadata.get("Citation") or metadata.get("docref") or "")
+    return Case(
+        id=result.id,
+        court=case_court(metadata.get("court") or metadata.get("Court"), citation),
+        year=case_year(metadata.get("year") or metadata.get("Year"), citation),
+        summary=result.document,
+        outcome=str(metadata.get("outcome") or metadata.get("Outcome") or ""),
+        citation=citation,
+        similarity=result.similarity_score,
+    )
+
+
 def historic_cases(query: str, top_k: int = 5) -> List[Case]:
     """
     Retrieve similar historic cases.
@@ -55,11 +83,7 @@ def historic_cases(query: str, top_k: int = 5) -> List[Case]:
         List of relevant historic cases
     """
     try:
-        if _retriever is None:
-            retriever = _get_retriever()
-        else:
-            retriever = _retriever
-            
+        retriever = _get_available_retriever()
         if retriever is None:
             print("❌ Retriever not available, returning empty list")
             return []
@@ -70,88 +94,55 @@ def historic_cases(query: str, top_k: int = 5) -> List[Case]:
             n_results=top_k
         )
         
-        # Convert RetrievalResults to Case objects
-        cases = []
-        for result in response.results:
-            # Extract case information from metadata and document content
-            metadata = result.metadata
-            document_text = result.document
-            
-            # Try to parse structured information from the document content and metadata
-            case_summary = document_text
-            
-            # Extract relevant fields from metadata if available
-            case_id = result.id
-            
-            # Extract court information - try different metadata fields and document parsing
-            court = metadata.get("court", metadata.get("Court", ""))
-            if not court or court == "Unknown Court":
-                # Try to extract court from citation or document content
-                citation_text = metadata.get("citation", metadata.get("Citation", metadata.get("docref", "")))
-                if citation_text and isinstance(citation_text, str):
-                    # Swiss court citations often start with numbers like "4A_", "8C_", etc.
-                    if citation_text.startswith(("4A_", "4C_", "4P_")):
-                        court = "Bundesgericht (Federal Supreme Court)"
-                    elif citation_text.startswith(("8C_", "8G_")):
-                        court = "Kantonsgericht (Cantonal Court)"
-                    elif citation_text.startswith(("5A_", "5C_")):
-                        court = "Zivilgericht (Civil Court)"
-                    else:
-                        court = "Swiss Court"
-                else:
-                    court = "Swiss Court"  # Better default than "Unknown Court"
-            
-            # Extract year - try different metadata fields and citation parsing
-            year = metadata.get("year", metadata.get("Year", None))
-            if not year:
-                # Try to extract year from citation (format like "4A_401/2016")
-                citation_text = metadata.get("citation", metadata.get("Citation", metadata.get("docref", "")))
-                if citation_text and isinstance(citation_text, str):
-                    import re
-                    year_match = re.search(r'/(\d{4})$', citation_text)
-                    if year_match:
-                        year = int(year_match.group(1))
-                    else:
-                        # Try to find 4-digit year in the citation
-                        year_match = re.search(r'\b(20\d{2})\b', citation_text)
-                        if year_match:
-                            year = int(year_match.group(1))
-                        else:
-                            year = 2020  # More reasonable default for recent cases
-                else:
-                    year = 2020
-            
-            # Ensure year is an integer
-            if isinstance(year, str):
-                try:
-                    year = int(year)
-                except (ValueError, TypeError):
-                    year = 2020
-            
-            # Extract citation
-            citation = metadata.get("citation", metadata.get("Citation", metadata.get("docref", "")))
-            if not citation:
-                # Generate a basic citation from the case ID if available
-                if "email" in case_id:
-                    citation = f"Legal Assistance Case {case_id}"
-                else:
-                    citation = None
-            print(metadata.get("outcome", metadata.get("Outcome", "")))
-            # Create Case object
-            case = Case(
-                id=case_id,
-                court=str(court),
-                year=year,
-                summary=case_summary,
-                outcome=metadata.get("outcome", metadata.get("Outcome", "")), #normalized_outcome,
-                citation=str(citation) if citation else ""
-            )
-            
-            cases.append(case)
-        
-        return cases
+        return [_to_case(result) for result in response.results]
         
     except Exception as e:
         print(f"❌ Historic cases retrieval failed: {e}")
         # Return empty list on error to allow the agent to continue
-        return []
\ No newline at end of file
+        return []
+
+
+def embed_case_text(case_text: str) -> Optional[List[float]]:
+    """
+    Embed the case text with the embedding model of the similar cases collection.
+    
+    Args:
+        case_text: Description of the user's case
+        
+    Returns:
+        Embedding, or None if the retriever or the embedding request is unavailable
+    """
+    try:
+        retriever = _get_available_retriever()
+        return retriever.embed_query(case_text) if retriever is not None else None
+    except Exception as e:
+        print(f"❌ Case text embedding failed: {e}")
+        return None
+
+
+def similar_case_outcomes(
+    case_text: str, top_k: int = 10, embedding: Optional[List[float]] = None
+) -> Tuple[List[Case], Optional[List[float]]]:
+    """
+    Retrieve the cases most similar to the case text itself, with the query embedding.
+    
+    Args:
+        case_text: Description of the user's case
+        top_k: Maximum number of cases to return
+        embedding: Embedding of the case text from embed_case_text, if already computed
+        
+    Returns:
+        Tuple of (cases with similarity, embedding of the case text or None)
+    """
+    try:
+        retriever = _get_available_retriever()
+        if retriever is None:
+            return [], None
+        response = retriever.retrieve(
+            query_text=case_text, n_results=top_k, include_embedding=True, query_embedding=embedding
+        )
+        query_embedding = response.query_embedding if any(response.query_embedding) else None
+        return [_to_case(result) for result in response.results], query_embedding
+    except Exception as e:
+        print(f"❌ Similar case outcomes retrieval failed: {e}")
+        return [], None
@@ -2,8 +2,9 @@
 
 import sys
 import os
-from typing import List
+from typing import List, Optional
 from backend.agent_with_tools.schemas import Doc
+from backend.agent_with_tools.policies import VECTOR_INDEX_BACKEND
 
 # Ensure environment variables are set from settings
 try:
@@ -25,15 +26,19 @@ sys.path.insert(0, experts_path)
 from retriever_v2 import LegalRetriever
 
 # Initialize the retriever
-retriever = LegalRetriever()
+retriever = LegalRetriever(index_backend=VECTOR_INDEX_BACKEND)
 
-def rag_swiss_law(query: str, top_k: int = 5) -> List[Doc]:
+def rag_swiss_law(query: str, top_k: int = 5, category: Optional[str] = None, language: Optional[str] = None) -> List[Doc]:
     """
     Retrieve relevant Swiss law documents using RAG.
     
     Args:
         query: Search query for relevant law documents
         top_k: Maximum number of documents to return
+        category: Case category from categorize_node; searches only its SR areas
+            (all areas for "Andere" or if the areas return too few documents)
+        language: Language of the case (see ingest_node); statutes in that language
+            are preferred, both languages are merged if it has too few matches
         
     Returns:
         List of relevant Swiss law documents
@@ -41,7 +46,7 @@ def rag_swiss_law(query: str, top_k: int = 5) -> List[Doc]:
     try:
         
         # Get search results with improved query
-        search_results = retriever.retrieve(query, n_results=top_k)
+        search_results = retriever.retrieve(query, n_results=top_k, category=category, language=language)
         
         if not search_results or not search_results.get("documents") or not search_results["documents"][0]:
             return []
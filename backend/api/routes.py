@@ -4,8 +4,11 @@ API routes for the legal assistance application.
 
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
+import json
+import pandas as pd
 from backend.agent_with_tools.graph import create_legal_agent
-from backend.agent_with_tools.schemas import CaseInput, AgentOutput
+from backend.agent_with_tools.schemas import CaseInput, AgentOutput, PortfolioRequest
+from backend.agent_with_tools.tools.estimate_portfolio import estimate_portfolio
 from core.config import settings
 import logging
 
@@ -47,6 +50,27 @@ async def run_agent(case_input: CaseInput) -> AgentOutput:
         )
 
 
+@router.post("/portfolio_estimate")
+async def run_portfolio_estimate(request: PortfolioRequest) -> Dict[str, Any]:
+    """
+    Estimate likelihood, time and cost of many claims at once (no LLM calls).
+    """
+    try:
+        claims = pd.DataFrame([claim.model_dump() for claim in request.claims])
+        result = estimate_portfolio(claims)
+        response = {"summary": result["summary"]}
+        if request.include_claims:
+            # to_json turns NaN (no estimate) into null
+            response["claims"] = json.loads(result["claims"].to_json(orient="records"))
+        return response
+    except Exception as e:
+        logger.exception(e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"An error occurred during portfolio estimation: {str(e)}",
+        )
+
+
 @router.get("/")
 async def api_root() -> Dict[str, str]:
     """API root endpoint."""
@@ -4,17 +4,24 @@ from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers.json import JsonOutputParser
 
 from apertus.apertus import LangchainApertus
+from classifier.schema import CaseClassification, format_subcategories
 
 
 def get_classifier_chain():
+    """
+    Classification chain returning legal field, case type and confidence in one call
+
+    Invoke with {"user_input": ..., "chat_history": [...]}; returns a CaseClassification.
+    """
     prompt_template = PromptTemplate.from_template(
 """
 You are a helpful AI agent and an expert in classifying questions and statements in different fields of law.
-You are provided with a user input and a chat history. Use the provided classes for your classification.
-Your output should be a list of the classes and whether they are affected.
+You are provided with a user input and a chat history. Use the provided legal fields and case types for your classification.
+Choose the single legal field that fits best, the case type of that field if one of the listed case types fits, and
+your confidence as a probability between 0 and 1.
 Answer in the expected JSON format and don't generate any other content.
 
-classes:
+legal_fields:
 * traffic_law: Traffic law covers all legal provisions regulating road traffic. It governs the rights and obligations of road users and ensures safety and 
 order in traffic. This includes administrative fines such as speeding or parking violations, criminal offenses like driving under the influence of alcohol 
 with possible license withdrawal, and liability issues in connection with traffic accidents. It also encompasses related administrative and criminal 
@@ -25,11 +32,17 @@ It regulates employment contracts, working conditions, occupational health and s
 unemployment insurance also fall under employment law. It includes the ordinary termination of employment in private employment relationships, including 
 modification terminations. This particularly covers questions of nullity or abusive termination, notice periods, release from duties, termination 
 agreements, and protection against dismissal during statutory blocking periods due to illness, accident, or other reasons.
+* real_estate_law: Property and rental law: purchase of real estate, defects, ownership, leases, rent and deposits, tenant and landlord disputes.
+* other: Any other legal matter.
+
+case_types:
+{subcategories}
 
 expected_format:
 {{
-    "traffic_law": bool,
-    "employment_law": bool,
+    "legal_field": "traffic_law" | "employment_law" | "real_estate_law" | "other",
+    "subcategory": case type of the legal field or null,
+    "confidence": float,
 }}
 
 user_input:
@@ -42,7 +55,9 @@ chat_history:
     
     llm = LangchainApertus(api_key=os.environ["APERTUS_API_KEY"], temperature=0)
 
-    return prompt_template | llm | JsonOutputParser()
+    prompt_template = prompt_template.partial(subcategories=format_subcategories())
+
+    return prompt_template | llm | JsonOutputParser() | CaseClassification.model_validate
 
 
 if __name__ == "__main__":
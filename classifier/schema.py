@@ -0,0 +1,86 @@
+"""Structured output of the case classification call.
+
+Legal field, case type (subcategory) and confidence are returned by one LLM
+call, so no second round-trip is needed to pick the subcategory.
+"""
+
+from typing import Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+
+from experts.tools.estimators.estimator_agent import EmploymentLawCategory, TrafficCriminalLawCategory
+
+LEGAL_FIELDS = ("traffic_law", "employment_law", "real_estate_law", "other")
+
+# Case types of the legal fields with estimator tables
+FIELD_SUBCATEGORIES: Dict[str, List[str]] = {
+    "traffic_law": [category.value for category in TrafficCriminalLawCategory],
+    "employment_law": [category.value for category in EmploymentLawCategory],
+}
+SUBCATEGORY_FIELDS: Dict[str, str] = {
+    subcategory: field for field, subcategories in FIELD_SUBCATEGORIES.items() for subcategory in subcategories
+}
+
+SUBCATEGORY_DESCRIPTIONS: Dict[str, str] = {
+    TrafficCriminalLawCategory.MODERATE_SPEEDING.value: "Slightly exceeding the speed limit, handled as an administrative fine (Ordnungsbusse).",
+    TrafficCriminalLawCategory.DRIVING_UNDER_INFLUENCE.value: "Driving with a blood alcohol level above the legal limit: licence withdrawal, traffic medical assessment, fine or custodial sentence, possible insurance reductions.",
+    TrafficCriminalLawCategory.PARKING_LOT_ACCIDENT.value: "Damage to a parked car without witnesses.",
+    TrafficCriminalLawCategory.PARKING_FINE_EXPIRED.value: "Fine for parking longer than allowed or paid for, even by a few minutes.",
+    TrafficCriminalLawCategory.ALCOHOL_PENALTY_ORDER.value: "Penalty order for driving with a blood alcohol level of 0.6 per mille or more.",
+    EmploymentLawCategory.TERMINATION_POOR_PERFORMANCE.value: "Termination for poor performance.",
+    EmploymentLawCategory.INCREASE_IN_WORKLOAD.value: "Request to the employer for a higher workload (pensum).",
+    EmploymentLawCategory.LOHN_AUSSTEHEND.value: "Salary payment outstanding.",
+    EmploymentLawCategory.FRISTLOSE_KUENDIGUNG.value: "Termination without notice period, effective immediately.",
+    EmploymentLawCategory.KUENDIGUNG_WAEHREND_KRANKHEIT.value: "Termination during illness or after an accident.",
+}
+
+
+def format_subcategories() -> str:
+    """Case types per legal field as a bullet list for the classification prompts"""
+    lines = []
+    for field, subcategories in FIELD_SUBCATEGORIES.items():
+        lines.append(f"{field}:")
+        lines.extend(f"* {subcategory}: {SUBCATEGORY_DESCRIPTIONS[subcategory]}" for subcategory in subcategories)
+    return "\n".join(lines)
+
+
+class CaseClassification(BaseModel):
+    """Legal field, case type and confidence of a case."""
+
+    legal_field: Literal[*LEGAL_FIELDS] = Field(
+        "other", description="Legal field of the case: traffic_law, employment_law, real_estate_law or other"
+    )
+    subcategory: Optional[Literal[*SUBCATEGORY_FIELDS]] = Field(
+        None, description="Case type of the legal field, or null if none of the listed case types fits"
+    )
+    confidence: float = Field(
+        0.5, description="Probability between 0 and 1 that the legal field (and case type) is correct"
+    )
+
+    @field_validator("legal_field", mode="before")
+    @classmethod
+    def _known_field(cls, value):
+        return value if value in LEGAL_FIELDS else "other"
+
+    @field_validator("subcategory", mode="before")
+    @classmethod
+    def _known_subcategory(cls, value):
+        return value if value in SUBCATEGORY_FIELDS else None
+
+    @field_validator("confidence", mode="before")
+    @classmethod
+    def _probability(cls, value):
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return 0.5
+        # Some models answer in percent
+        value = value / 100 if value > 1 else value
+        return max(0.0, min(1.0, value))
+
+    @model_validator(mode="after")
+    def _field_of_subcategory(self):
+        # The case types are unique across fields, so the case type decides the field
+        if self.subcategory is not None:
+            self.legal_field = SUBCATEGORY_FIELDS[self.subcategory]
+        return self
@@ -0,0 +1,80 @@
+"""Court and year of historic cases, derived from their docref when missing.
+
+The similar-cases vectorizer (``legal_vectors/similar_cases_vectorizer``)
+normalizes court, year and citation once per case at ingest. Stores built
+before that still carry the raw columns (an empty year, "2016.0", no court),
+so ``historic_cases`` applies the same fallbacks to each result with the
+scalar helpers below.
+"""
+
+import re
+from typing import Any, Optional
+
+# Court of a case by docref prefix (e.g. "4A_401/2016"), when the data has no court
+COURT_BY_PREFIX = {
+    "4A_": "Bundesgericht (Federal Supreme Court)",
+    "4C_": "Bundesgericht (Federal Supreme Court)",
+    "4P_": "Bundesgericht (Federal Supreme Court)",
+    "8C_": "Kantonsgericht (Cantonal Court)",
+    "8G_": "Kantonsgericht (Cantonal Court)",
+    "5A_": "Zivilgericht (Civil Court)",
+    "5C_": "Zivilgericht (Civil Court)",
+}
+DEFAULT_COURT = "Swiss Court"
+# Court values that count as missing
+UNKNOWN_COURTS = ("", "Unknown Court")
+# Year of cases whose year is neither in the data nor in the docref
+DEFAULT_CASE_YEAR = 2020
+# Year in a docref: "4A_401/2016", else any 20xx
+CITATION_YEAR_PATTERNS = (r"/(\d{4})$", r"\b(20\d{2})\b")
+
+
+def parse_year(value: Any) -> Optional[int]:
+    """
+    Year of a metadata value ("2016", "2016.0", 2016.0, "", None)
+
+    Returns:
+        Year as int, or None if the value is not a number
+    """
+    try:
+        return int(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def case_court(court: Any, citation: str) -> str:
+    """
+    Court of a case
+
+    Args:
+        court: Court value of the metadata, if any
+        citation: Citation or docref of the case
+
+    Returns:
+        The court, else the court of the docref prefix, else DEFAULT_COURT
+    """
+    court = str(court or "").strip()
+    if court not in UNKNOWN_COURTS:
+        return court
+    return COURT_BY_PREFIX.get(citation[:3], DEFAULT_COURT)
+
+
+def case_year(year: Any, citation: str) -> int:
+    """
+    Year of a case
+
+    Args:
+        year: Year value of the metadata, if any
+        citation: Citation or docref of the case
+
+    Returns:
+        The year, else the year of the docref, else DEFAULT_CASE_YEAR
+    """
+    parsed = parse_year(year)
+    if parsed is not None:
+        return parsed
+    for pattern in CITATION_YEAR_PATTERNS:
+        match = re.search(pattern, citation)
+        if match:
+            return int(match.group(1))
+    return DEFAULT_CASE_YEAR
@@ -0,0 +1,180 @@
+"""Keyword matching on the case text, done once per case.
+
+The estimators, the categorizer and the win likelihood node all look for
+keywords in the case text (salary, parking, kündigung, ...). Instead of every
+caller lowercasing the text and scanning it with its own ``any(word in ...)``
+loops, all keywords are compiled into one regular expression at import time.
+``ingest_node`` runs it once and stores the keyword groups found and the
+estimator subcategories in the agent state for all downstream nodes.
+
+The outcome statistics job (legal_vectors/similar_cases_vectorizer) labels
+historic cases with the same matcher, so their categories and subcategories
+line up with those of live cases.
+"""
+
+import re
+from typing import Dict, Iterable, Set, Tuple
+
+# Keyword group -> keywords (matched as substrings of the lowercased text)
+KEYWORD_GROUPS: Dict[str, Tuple[str, ...]] = {
+    # Estimator subcategories
+    "salary": ("salary", "wage", "pay", "lohn"),
+    "illness": ("illness", "sick", "krankheit", "unfall"),
+    "dismissal": ("dismissal", "fired", "fristlos"),
+    "workload": ("workload", "overtime", "work hours"),
+    "alcohol": ("alcohol", "drunk", "dui", "influence"),
+    "parking": ("parking", "parked"),
+    "accident": ("accident",),
+    "speeding": ("speeding", "speed", "fast"),
+    "penalty": ("penalty", "fine"),
+    # Swiss law queries of the win likelihood node
+    "termination_law": ("terminated", "dismissal", "kündigung", "notice"),
+    "wage_law": ("wage", "salary", "lohn"),
+    "defect": ("defect", "damage", "mängel"),
+    "rent": ("rent", "miete", "lease"),
+    "license": ("license", "driving"),
+    # Historic case queries of the win likelihood node
+    "termination_cases": ("kündigung", "termination", "dismissed", "fired"),
+    "wage_cases": ("wage", "salary", "lohn", "payment"),
+    "harassment": ("mobbing", "harassment", "discrimination"),
+    # Category of historic cases (outcome statistics)
+    "employment": (
+        "employer", "employee", "employment", "arbeitgeber", "arbeitnehmer", "arbeitsvertrag",
+        "arbeitsverhältnis", "employeur", "datore di lavoro",
+    ),
+    "traffic": (
+        "traffic", "vehicle", "driver", "speeding", "verkehr", "fahrzeug", "führerausweis",
+        "lenker", "radar", "circulation routière", "permis de conduire",
+    ),
+    "property": (
+        "landlord", "tenant", "real estate", "mietvertrag", "vermieter", "grundstück",
+        "liegenschaft", "stockwerkeigentum", "immobilie", "bailleur", "locataire",
+    ),
+    # Real estate fallback of the categorizer
+    "real_estate": (
+        "immobilien", "haus", "wohnung", "grundstück", "eigentum", "miete", "vermieter",
+        "mieter", "kaufvertrag", "mängel", "defekt", "property", "house", "apartment",
+        "real estate", "purchase", "defect", "landlord", "tenant", "rent", "lease",
+    ),
+}
+
+# Estimator subcategory rules per category: (required groups, subcategory), first match wins
+SUBCATEGORY_RULES: Dict[str, Tuple[Tuple[Tuple[str, ...], str], ...]] = {
+    "employment_law": (
+        (("salary",), "lohn_ausstehend"),
+        (("illness",), "kuendigung_waehrend_krankheit_unfall"),
+        (("dismissal",), "fristlose_kuendigung"),
+        (("workload",), "increase_in_workload"),
+        ((), "termination_poor_performance"),
+    ),
+    "traffic_criminal_law": (
+        (("alcohol",), "driving_under_influence_alcohol_license_withdrawal"),
+        (("parking", "accident"), "parking_lot_accident_chf_2500_no_witnesses"),
+        (("parking",), "parking_fine_expired_few_minutes"),
+        (("speeding",), "moderate_speeding"),
+        (("penalty",), "alcohol_06_penalty_order"),
+        ((), "moderate_speeding"),
+    ),
+}
+
+# Case category -> keyword groups marking a historic case as such, first match wins
+CATEGORY_GROUPS: Dict[str, Tuple[str, ...]] = {
+    "Strafverkehrsrecht": ("traffic",),
+    "Arbeitsrecht": ("employment",),
+    "Immobilienrecht": ("property",),
+}
+
+# Case category -> estimator category with subcategory rules
+ESTIMATOR_CATEGORIES: Dict[str, str] = {
+    "Arbeitsrecht": "employment_law",
+    "Strafverkehrsrecht": "traffic_criminal_law",
+}
+
+_KEYWORDS = sorted({keyword for keywords in KEYWORD_GROUPS.values() for keyword in keywords}, key=len, reverse=True)
+# The lookahead finds the longest keyword starting at every position, so
+# overlapping keywords ("speeding" and "speed") are all found in one pass
+KEYWORD_RE = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in _KEYWORDS) + "))")
+# Keyword -> groups it belongs to, including the groups of keywords it contains
+_GROUPS_OF: Dict[str, Set[str]] = {
+    keyword: {group for group, keywords in KEYWORD_GROUPS.items() if any(other in keyword for other in keywords)}
+    for keyword in _KEYWORDS
+}
+
+
+def match_keywords(text: str) -> Set[str]:
+    """
+    Keyword groups found in a text
+
+    Args:
+        text: Case description
+
+    Returns:
+        Set of group names of KEYWORD_GROUPS with at least one keyword in the text
+    """
+    hits: Set[str] = set()
+    for keyword in set(KEYWORD_RE.findall((text or "").lower())):
+        hits |= _GROUPS_OF[keyword]
+    return hits
+
+
+def subcategory_for(hits: Iterable[str], category: str) -> str:
+    """
+    Estimator subcategory of a case from its keyword groups
+
+    Args:
+        hits: Keyword groups of the case (match_keywords)
+        category: English estimator category (employment_law, traffic_criminal_law, ...)
+
+    Returns:
+        Subcategory, or "default" for categories without estimator tables
+    """
+    hits = set(hits)
+    for required, subcategory in SUBCATEGORY_RULES.get(category, ()):
+        if hits.issuperset(required):
+            return subcategory
+    return "default"
+
+
+def has_subcategory_match(hits: Iterable[str], category: str) -> bool:
+    """Whether a keyword rule, rather than the catch-all of the category, picks the subcategory"""
+    hits = set(hits)
+    return any(required and hits.issuperset(required) for required, _ in SUBCATEGORY_RULES.get(category, ()))
+
+
+def subcategories_for(hits: Iterable[str]) -> Dict[str, str]:
+    """Estimator subcategory of a case for every category with estimator tables"""
+    hits = set(hits)
+    return {category: subcategory_for(hits, category) for category in SUBCATEGORY_RULES}
+
+
+def category_for(hits: Iterable[str]) -> str:
+    """
+    Case category of a historic case from its keyword groups
+
+    Args:
+        hits: Keyword groups of the case text (match_keywords)
+
+    Returns:
+        "Arbeitsrecht", "Strafverkehrsrecht", "Immobilienrecht" or "Andere"
+    """
+    hits = set(hits)
+    for category, groups in CATEGORY_GROUPS.items():
+        if hits.intersection(groups):
+            return category
+    return "Andere"
+
+
+def label_case(text: str) -> Tuple[str, str]:
+    """
+    Category and estimator subcategory of a historic case
+
+    Args:
+        text: Case text (e.g. the e-mail of a BGer case)
+
+    Returns:
+        Tuple of (category, subcategory); the subcategory is "default" for
+        categories without estimator tables
+    """
+    hits = match_keywords(text)
+    category = category_for(hits)
+    return category, subcategory_for(hits, ESTIMATOR_CATEGORIES.get(category, ""))
@@ -0,0 +1,148 @@
+"""Case category from the embedding of the case text.
+
+``legal_vectors/similar_cases_vectorizer/train_category_model.py`` computes one
+centroid per category from the embeddings of labeled cases (the BGer cases of
+the similar-cases collection and the case types of the estimator spreadsheets)
+and calibrates a softmax over the cosine similarities to the centroids on
+held-out cases. The result is saved to ``category_model.npz`` next to this
+module; classifying a case is one (categories x dim) matrix product.
+
+A prediction whose top-two margin is small is ambiguous and goes to the LLM
+classifier (see backend/agent_with_tools/tools/categorize_case.py).
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from experts.tools.vector_index.quantization import truncate_embeddings
+
+CATEGORIES = ("Arbeitsrecht", "Immobilienrecht", "Strafverkehrsrecht", "Andere")
+CATEGORY_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "category_model.npz")
+CATEGORY_MODEL_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CategoryModel:
+    """Nearest-centroid classifier with a calibrated softmax."""
+
+    categories: Tuple[str, ...]
+    centroids: np.ndarray  # (categories, dim), unit length
+    scale: float  # Softmax temperature of the cosine similarities
+    log_prior: np.ndarray  # (categories,)
+    embedding_model: str = ""
+    metrics: Dict = field(default_factory=dict)
+
+    @property
+    def dim(self) -> int:
+        return self.centroids.shape[1]
+
+    def predict_proba(self, embedding: Sequence[float]) -> Optional[Dict[str, float]]:
+        """
+        Category probabilities of a case
+
+        Args:
+            embedding: Embedding of the case text, at least ``dim`` values
+
+        Returns:
+            Dictionary category -> probability, or None if the embedding is
+            too short or zero (failed embedding request)
+        """
+        if len(embedding) < self.dim:
+            return None
+        vector = truncate_embeddings([embedding], self.dim)[0]
+        if not vector.any():
+            return None
+        probabilities = softmax(self.scale * (self.centroids @ vector) + self.log_prior)
+        return dict(zip(self.categories, probabilities.tolist()))
+
+
+@dataclass
+class CategoryPrediction:
+    """Most likely category and its lead over the runner-up."""
+
+    category: str
+    probability: float
+    margin: float
+    probabilities: Dict[str, float]
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """Softmax over the last axis"""
+    exp = np.exp(logits - logits.max(axis=-1, keepdims=True))
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def save_category_model(model: CategoryModel, path: str = CATEGORY_MODEL_PATH):
+    """Write the model as a compressed NumPy archive"""
+    info = {
+        "version": CATEGORY_MODEL_VERSION,
+        "categories": list(model.categories),
+        "scale": model.scale,
+        "embedding_model": model.embedding_model,
+        "metrics": model.metrics,
+    }
+    np.savez_compressed(
+        path,
+        centroids=model.centroids.astype(np.float32),
+        log_prior=model.log_prior.astype(np.float64),
+        info=np.array(json.dumps(info)),
+    )
+
+
+def load_category_model(path: str = CATEGORY_MODEL_PATH) -> Optional[CategoryModel]:
+    """
+    Load the model written by train_category_model.py
+
+    Returns:
+        CategoryModel, or None if the file does not exist or has another version
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as data:
+            info = json.loads(str(data["info"]))
+            centroids = data["centroids"].astype(np.float32)
+            log_prior = data["log_prior"].astype(np.float64)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Could not load category model {path}: {e}")
+        return None
+    if info.get("version") != CATEGORY_MODEL_VERSION:
+        print(f"⚠️ Ignoring category model of version {info.get('version')}, expected {CATEGORY_MODEL_VERSION}")
+        return None
+    return CategoryModel(
+        tuple(info["categories"]),
+        centroids,
+        float(info["scale"]),
+        log_prior,
+        info.get("embedding_model", ""),
+        info.get("metrics", {}),
+    )
+
+
+CATEGORY_MODEL: Optional[CategoryModel] = load_category_model()
+
+
+def classify_embedding(embedding: Sequence[float], model: Optional[CategoryModel] = None) -> Optional[CategoryPrediction]:
+    """
+    Classify a case by the embedding of its text
+
+    Args:
+        embedding: Embedding of the case text
+        model: Category model; defaults to CATEGORY_MODEL
+
+    Returns:
+        CategoryPrediction, or None without model or usable embedding
+    """
+    model = model or CATEGORY_MODEL
+    if model is None or embedding is None or len(embedding) == 0:
+        return None
+    probabilities = model.predict_proba(embedding)
+    if probabilities is None:
+        return None
+    ranked = sorted(probabilities.items(), key=lambda item: item[1], reverse=True)
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+    return CategoryPrediction(ranked[0][0], ranked[0][1], ranked[0][1] - runner_up, probabilities)
@@ -0,0 +1,223 @@
+"""Local complexity scoring of case texts.
+
+``time_and_cost_node`` needs a complexity level (low/medium/high) and whether
+an appeal is expected to pick the duration and cost fallbacks. Both are derived
+here from a few features of the case text: the largest amount in dispute, the
+number of parties involved, keywords marking complex or simple cases, explicit
+appeal wording and the length of the text. All keywords are compiled into one
+regular expression, so scoring a case takes microseconds.
+
+By default the features are combined with fixed rules. If
+``legal_vectors/similar_cases_vectorizer/train_complexity_model.py`` has
+exported a logistic regression fitted on labeled cases to
+``complexity_model.json`` next to this module, its coefficients are used
+instead (evaluated with NumPy, without scikit-learn).
+"""
+
+import json
+import math
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+COMPLEXITY_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "complexity_model.json")
+COMPLEXITY_MODEL_VERSION = 1
+
+COMPLEXITY_LEVELS = ("low", "medium", "high")
+FEATURE_NAMES = ("log_amount", "parties", "complex_terms", "simple_terms", "appeal_terms", "log_words")
+
+# Keyword group -> keywords (matched as substrings of the lowercased text)
+COMPLEXITY_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "appeal": (
+        "appeal", "berufung", "beschwerde", "rekurs", "weiterzieh", "recours", "ricorso",
+        "reclamo", "federal court", "bundesgericht", "tribunal fédéral", "tribunale federale",
+    ),
+    "complex": (
+        "expert", "gutachten", "expertise", "perizia", "witnesses", "zeugen", "témoins",
+        "testimoni", "international", "abroad", "ausland", "étranger", "estero",
+        "discrimination", "diskriminierung", "mobbing", "harassment", "injur", "verletz",
+        "invalid", "criminal proceedings", "strafverfahren", "counterclaim", "widerklage",
+        "insolvency", "bankrupt", "konkurs", "faillite", "fallimento", "several claims",
+        "multiple", "mehrere",
+    ),
+    "simple": (
+        "parking", "parkbusse", "ordnungsbusse", "few minutes", "paar minuten", "ticket",
+        "small amount", "geringfügig", "amende d'ordre", "multa disciplinare",
+    ),
+    # Parties, counted once per role
+    "party_employer": ("employer", "arbeitgeber", "employeur", "datore di lavoro"),
+    "party_employee": ("employee", "arbeitnehmer", "employé", "lavoratore", "colleague", "kollege", "collègue", "collega"),
+    "party_landlord": ("landlord", "vermieter", "bailleur", "locatore"),
+    "party_tenant": ("tenant", "mieter", "locataire", "inquilino"),
+    "party_insurance": ("insurance", "insurer", "versicherung", "assurance", "assicurazione"),
+    "party_authority": ("police", "polizei", "prosecutor", "staatsanwalt", "authority", "behörde", "ministère public"),
+    "party_company": ("company", "firma", "gmbh", "contractor", "unternehmer", "entreprise", "impresa"),
+    "party_neighbour": ("neighbour", "neighbor", "nachbar", "voisin", "vicino"),
+    "party_seller": ("seller", "buyer", "verkäufer", "käufer", "vendeur", "acheteur", "venditore", "acquirente"),
+}
+
+KEYWORD_RE = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keyword in sorted({k for keywords in COMPLEXITY_KEYWORDS.values() for k in keywords}, key=len, reverse=True)
+    )
+)
+_GROUP_OF: Dict[str, str] = {
+    keyword: group for group, keywords in COMPLEXITY_KEYWORDS.items() for keyword in keywords
+}
+
+# "CHF 12'000", "Fr. 5'000.-", "12,500 francs", "3000 Franken"
+_NUMBER = r"(?<![\d.,'’])(\d{1,3}(?:['’ ,.]\d{3})+|\d+)"
+AMOUNT_RE = re.compile(
+    rf"(?:chf|sfr\.?|fr\.)\s*{_NUMBER}|{_NUMBER}(?:\.[-–])?\s*(?:chf|sfr|fr\.|franken|francs|franchi)",
+    re.IGNORECASE,
+)
+
+# Rules used without a trained model: amounts from which a case counts as more complex (CHF)
+LARGE_AMOUNT = 10_000
+VERY_LARGE_AMOUNT = 100_000
+LONG_TEXT_WORDS = 300
+SHORT_TEXT_WORDS = 40
+# Scores up to LOW_SCORE are low, from HIGH_SCORE high complexity
+LOW_SCORE = -1.0
+HIGH_SCORE = 2.0
+# Minimum amount in dispute for an appeal to the Federal Supreme Court (BGG Art. 74)
+APPEAL_MIN_AMOUNT = 30_000
+APPEAL_MIN_AMOUNT_EMPLOYMENT_RENT = 15_000
+
+
+@dataclass(frozen=True)
+class ComplexityAssessment:
+    """Complexity level and appeal expectation of a case."""
+
+    complexity: str
+    appeal_expected: bool
+    score: float
+    amount_chf: Optional[float] = None
+    features: Dict[str, float] = field(default_factory=dict)
+
+
+def extract_amount(text: str) -> Optional[float]:
+    """Largest amount in CHF mentioned in the text, or None"""
+    amounts = []
+    for match in AMOUNT_RE.finditer(text or ""):
+        number = match.group(1) or match.group(2)
+        amounts.append(float(re.sub(r"['’ ,.]", "", number)))
+    return max(amounts) if amounts else None
+
+
+def complexity_features(text: str) -> Tuple[np.ndarray, Optional[float]]:
+    """
+    Feature vector of a case text
+
+    Returns:
+        Tuple of (features in the order of FEATURE_NAMES, largest amount in CHF or None)
+    """
+    text = (text or "").lower()
+    keywords = {match.group(0) for match in KEYWORD_RE.finditer(text)}
+    groups = [_GROUP_OF[keyword] for keyword in keywords]
+    amount = extract_amount(text)
+    features = np.array(
+        [
+            math.log10(1 + amount) if amount else 0.0,
+            len({group for group in groups if group.startswith("party_")}),
+            groups.count("complex"),
+            groups.count("simple"),
+            groups.count("appeal"),
+            math.log10(1 + len(text.split())),
+        ]
+    )
+    return features, amount
+
+
+def load_complexity_model(path: str = COMPLEXITY_MODEL_PATH) -> Optional[Dict]:
+    """
+    Load the logistic regression exported by train_complexity_model.py
+
+    Returns:
+        Model dictionary with NumPy arrays, or None if the file does not exist
+        or does not match the features
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not load complexity model {path}: {e}")
+        return None
+    if data.get("version") != COMPLEXITY_MODEL_VERSION or tuple(data.get("features", ())) != FEATURE_NAMES:
+        print(f"⚠️ Ignoring complexity model {path}: other version or features")
+        return None
+
+    model = {
+        "mean": np.array(data["mean"]),
+        "scale": np.array(data["scale"]),
+        "classes": list(data["classes"]),
+        "coef": np.array(data["coef"]),
+        "intercept": np.array(data["intercept"]),
+    }
+    if data.get("appeal"):
+        model["appeal_coef"] = np.array(data["appeal"]["coef"])
+        model["appeal_intercept"] = float(data["appeal"]["intercept"])
+    return model
+
+
+COMPLEXITY_MODEL: Optional[Dict] = load_complexity_model()
+
+
+def _rule_score(features: np.ndarray) -> float:
+    """Complexity score of the rules: 0 for a plain case, higher is more complex"""
+    log_amount, parties, complex_terms, simple_terms, appeal_terms, log_words = features
+    score = 0.5 * max(parties - 2, 0) + complex_terms - simple_terms + (appeal_terms > 0)
+    score += (log_amount >= math.log10(1 + LARGE_AMOUNT)) + (log_amount >= math.log10(1 + VERY_LARGE_AMOUNT))
+    if log_words >= math.log10(1 + LONG_TEXT_WORDS):
+        score += 1.0
+    elif log_words < math.log10(1 + SHORT_TEXT_WORDS):
+        score -= 0.5
+    return float(score)
+
+
+def assess_complexity(text: str, category: Optional[str] = None, model: Optional[Dict] = None) -> ComplexityAssessment:
+    """
+    Complexity level and appeal expectation of a case from its text
+
+    Args:
+        text: Case text
+        category: Case category (German, e.g. "Arbeitsrecht"); lowers the
+            appeal threshold for employment and rental cases
+        model: Model from load_complexity_model (default: the exported model,
+            falling back to the rules if there is none; {} forces the rules)
+
+    Returns:
+        ComplexityAssessment
+    """
+    model = COMPLEXITY_MODEL if model is None else model
+    features, amount = complexity_features(text)
+
+    if model:
+        logits = model["coef"] @ ((features - model["mean"]) / model["scale"]) + model["intercept"]
+        complexity = model["classes"][int(np.argmax(logits))]
+        score = float(logits.max())
+    else:
+        score = _rule_score(features)
+        complexity = "high" if score >= HIGH_SCORE else "low" if score <= LOW_SCORE else "medium"
+
+    if model and "appeal_coef" in model:
+        scaled = (features - model["mean"]) / model["scale"]
+        appeal_expected = float(model["appeal_coef"] @ scaled + model["appeal_intercept"]) > 0
+    else:
+        rental = category == "Immobilienrecht" and bool(re.search(r"miet|rent|lease|bail|locazion", (text or "").lower()))
+        min_amount = APPEAL_MIN_AMOUNT_EMPLOYMENT_RENT if category == "Arbeitsrecht" or rental else APPEAL_MIN_AMOUNT
+        appeal_expected = bool(features[4]) or (complexity == "high" and (amount or 0) >= min_amount)
+
+    return ComplexityAssessment(
+        complexity=complexity,
+        appeal_expected=appeal_expected,
+        score=score,
+        amount_chf=amount,
+        features=dict(zip(FEATURE_NAMES, features.tolist())),
+    )
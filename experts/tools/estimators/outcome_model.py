@@ -0,0 +1,142 @@
+"""Win likelihood from case embeddings and the outcomes of similar cases.
+
+``legal_vectors/similar_cases_vectorizer/train_outcome_model.py`` fits a
+calibrated logistic regression on the embeddings of the historic cases and
+their outcomes offline and saves its coefficients to ``outcome_model.npz``
+next to this module (a few KB). Scoring a case is one dot product with the
+embedding of its text.
+
+The model probability is combined with a similarity-weighted vote over the
+outcomes of the nearest historic cases: the vote counts as much as its total
+similarity, the model as much as ``VOTE_PRIOR_WEIGHT`` neighbours.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from experts.tools.estimators.outcome_stats import WIN_OUTCOMES
+from experts.tools.vector_index.quantization import truncate_embeddings
+
+OUTCOME_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "outcome_model.npz")
+OUTCOME_MODEL_VERSION = 1
+# Weight of the model probability, in neighbours of similarity 1
+VOTE_PRIOR_WEIGHT = 2.0
+
+
+@dataclass(frozen=True)
+class OutcomeModel:
+    """Calibrated logistic regression over (truncated) case embeddings."""
+
+    coef: np.ndarray
+    intercept: float
+    dim: int
+    embedding_model: str = ""
+    metrics: Dict = field(default_factory=dict)
+
+    def predict(self, embedding: Sequence[float]) -> Optional[float]:
+        """
+        Probability that a case with this embedding is won
+
+        Args:
+            embedding: Embedding of the case text, at least ``dim`` values
+
+        Returns:
+            Probability between 0 and 1, or None if the embedding is too short
+        """
+        if len(embedding) < self.dim:
+            return None
+        vector = truncate_embeddings([embedding], self.dim)[0]
+        return float(1.0 / (1.0 + np.exp(-(self.coef @ vector + self.intercept))))
+
+
+def save_outcome_model(model: OutcomeModel, path: str = OUTCOME_MODEL_PATH):
+    """Write the model as a compressed NumPy archive"""
+    info = {
+        "version": OUTCOME_MODEL_VERSION,
+        "dim": model.dim,
+        "embedding_model": model.embedding_model,
+        "metrics": model.metrics,
+    }
+    np.savez_compressed(
+        path,
+        coef=model.coef.astype(np.float32),
+        intercept=np.float64(model.intercept),
+        info=np.array(json.dumps(info)),
+    )
+
+
+def load_outcome_model(path: str = OUTCOME_MODEL_PATH) -> Optional[OutcomeModel]:
+    """
+    Load the model written by train_outcome_model.py
+
+    Returns:
+        OutcomeModel, or None if the file does not exist or has another version
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as data:
+            info = json.loads(str(data["info"]))
+            coef = data["coef"].astype(np.float32)
+            intercept = float(data["intercept"])
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Could not load outcome model {path}: {e}")
+        return None
+    if info.get("version") != OUTCOME_MODEL_VERSION:
+        print(f"⚠️ Ignoring outcome model of version {info.get('version')}, expected {OUTCOME_MODEL_VERSION}")
+        return None
+    return OutcomeModel(coef, intercept, int(info["dim"]), info.get("embedding_model", ""), info.get("metrics", {}))
+
+
+OUTCOME_MODEL: Optional[OutcomeModel] = load_outcome_model()
+
+
+def neighbour_vote(neighbours: Sequence[Tuple[str, float]]) -> Optional[Tuple[float, float]]:
+    """
+    Similarity-weighted share of won cases among the neighbours
+
+    Args:
+        neighbours: (outcome, similarity) of each similar case; cases without
+            outcome and non-positive similarities are ignored
+
+    Returns:
+        Tuple of (win share, total similarity), or None without usable neighbours
+    """
+    weights, wins = [], []
+    for outcome, similarity in neighbours:
+        outcome = str(outcome or "").strip().lower()
+        if outcome and similarity > 0:
+            weights.append(similarity)
+            wins.append(outcome in WIN_OUTCOMES)
+    if not weights:
+        return None
+    weights = np.asarray(weights, dtype=float)
+    return float(weights @ np.asarray(wins, dtype=float) / weights.sum()), float(weights.sum())
+
+
+def combine_likelihood(
+    model_probability: Optional[float],
+    vote: Optional[Tuple[float, float]],
+    prior_weight: float = VOTE_PRIOR_WEIGHT,
+) -> Optional[float]:
+    """
+    Weighted average of the model probability and the neighbour vote
+
+    Args:
+        model_probability: Probability from OutcomeModel.predict, or None
+        vote: (win share, total similarity) from neighbour_vote, or None
+        prior_weight: Weight of the model probability
+
+    Returns:
+        Win probability between 0 and 1, or None if neither is available
+    """
+    if vote is None:
+        return model_probability
+    share, weight = vote
+    if model_probability is None:
+        return share
+    return (prior_weight * model_probability + weight * share) / (prior_weight + weight)
@@ -0,0 +1,151 @@
+"""Empirical win rates of historic cases.
+
+``legal_vectors/similar_cases_vectorizer/compute_outcome_stats.py`` counts the
+outcomes of the BGer cases per category, subcategory, court and year offline
+and writes them, with Wilson confidence intervals, to ``outcome_stats.json``
+next to this module. The file is loaded once at import; a lookup is a few
+dictionary accesses, backing off from the most specific group to the whole
+category until a group has enough cases.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+OUTCOME_STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "outcome_stats.json")
+OUTCOME_STATS_VERSION = 1
+
+# Placeholder for a dimension aggregated over all values
+ALL = "*"
+LEVELS = ("category", "subcategory", "court", "year")
+# Outcomes counted as a win for the party bringing the case; other non-empty outcomes are losses
+WIN_OUTCOMES = frozenset(
+    {
+        "win",
+        "approved",
+        "approval",
+        "partially approved",
+        "partial approval",
+        "gutgeheissen",
+        "teilweise gutgeheissen",
+        "admis",
+        "partiellement admis",
+        "accolto",
+        "parzialmente accolto",
+    }
+)
+# z for a 95% confidence interval
+Z_95 = 1.96
+# Groups with fewer cases are skipped in favour of a broader group
+MIN_CASES = 20
+
+StatsKey = Tuple[str, str, str, str]
+
+
+@dataclass(frozen=True)
+class OutcomeStat:
+    """Win rate of a group of historic cases."""
+
+    key: StatsKey
+    cases: int
+    wins: int
+    rate: float
+    ci_low: float
+    ci_high: float
+
+    def as_dict(self) -> Dict:
+        return {**asdict(self), "key": dict(zip(LEVELS, self.key))}
+
+
+def wilson_interval(wins, cases, z: float = Z_95):
+    """
+    Wilson score interval of a binomial proportion, vectorized
+
+    Args:
+        wins: Number of wins (scalar or array)
+        cases: Number of cases (scalar or array, > 0)
+        z: Standard normal quantile (1.96 for 95%)
+
+    Returns:
+        Tuple of (lower bound, upper bound) arrays
+    """
+    wins = np.asarray(wins, dtype=float)
+    cases = np.asarray(cases, dtype=float)
+    rate = wins / cases
+    denominator = 1 + z**2 / cases
+    center = (rate + z**2 / (2 * cases)) / denominator
+    half = z * np.sqrt(rate * (1 - rate) / cases + z**2 / (4 * cases**2)) / denominator
+    return np.clip(center - half, 0.0, 1.0), np.clip(center + half, 0.0, 1.0)
+
+
+def load_outcome_stats(path: str = OUTCOME_STATS_PATH) -> Dict[StatsKey, OutcomeStat]:
+    """
+    Load the outcome statistics written by compute_outcome_stats.py
+
+    Returns:
+        Dictionary (category, subcategory, court, year) -> OutcomeStat; empty if
+        the file does not exist or has another version
+    """
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not load outcome statistics {path}: {e}")
+        return {}
+    if data.get("version") != OUTCOME_STATS_VERSION:
+        print(f"⚠️ Ignoring outcome statistics of version {data.get('version')}, expected {OUTCOME_STATS_VERSION}")
+        return {}
+
+    stats = {}
+    for category, subcategory, court, year, cases, wins, rate, ci_low, ci_high in data["rows"]:
+        key = (category, subcategory, court, str(year))
+        stats[key] = OutcomeStat(key, int(cases), int(wins), rate, ci_low, ci_high)
+    return stats
+
+
+OUTCOME_STATS: Dict[StatsKey, OutcomeStat] = load_outcome_stats()
+
+
+def empirical_win_rate(
+    category: str,
+    subcategory: Optional[str] = None,
+    court: Optional[str] = None,
+    year: Optional[int] = None,
+    min_cases: int = MIN_CASES,
+    stats: Optional[Dict[StatsKey, OutcomeStat]] = None,
+) -> Optional[OutcomeStat]:
+    """
+    Win rate of the most specific group of historic cases with enough cases
+
+    Args:
+        category: Case category ("Arbeitsrecht", ...)
+        subcategory: Estimator subcategory, if known
+        court: Court, if known
+        year: Year, if known
+        min_cases: Minimum number of cases of a group
+        stats: Statistics to search (default: the loaded outcome_stats.json)
+
+    Returns:
+        OutcomeStat of the first group with at least ``min_cases`` cases, trying
+        (category, subcategory, court, year), then without year, without court
+        and without subcategory; None if none qualifies
+    """
+    stats = OUTCOME_STATS if stats is None else stats
+    subcategory = subcategory or ALL
+    court = court or ALL
+    year = str(year) if year else ALL
+    for key in (
+        (category, subcategory, court, year),
+        (category, subcategory, court, ALL),
+        (category, subcategory, ALL, ALL),
+        (category, ALL, ALL, ALL),
+    ):
+        stat = stats.get(key)
+        if stat is not None and stat.cases >= min_cases:
+            return stat
+    return None
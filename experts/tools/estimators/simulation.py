@@ -0,0 +1,230 @@
+"""Monte Carlo percentiles of case costs and durations.
+
+The estimator tables give every cost component and the duration as a range
+("Lawyer: CHF 1,000–5,000", "3–6 months+"). Reporting only the midpoints hides
+the spread; here every range is sampled from a configurable distribution, the
+components are summed per sample and the P10/P50/P90 of the totals are
+reported. Sampling is vectorized with NumPy: one case with a few thousand
+samples takes well under a millisecond, and ``simulate_portfolio`` evaluates
+whole claim portfolios in chunks of cases.
+
+Results are deterministic for a given seed, so the same case always gets the
+same percentiles.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from experts.tools.estimators.tables import CaseEstimate, Range
+
+N_SAMPLES = 2000
+SIMULATION_SEED = 42
+PERCENTILES = (10, 50, 90)
+# Upper bound of open-ended ranges ("6–12 months+") is stretched by this factor
+OPEN_ENDED_TAIL = 1.5
+# Cases simulated at once by simulate_portfolio (bounds memory to N_SAMPLES x chunk x components)
+PORTFOLIO_CHUNK = 512
+
+Sampler = Callable[[np.random.Generator, np.ndarray, np.ndarray, tuple], np.ndarray]
+
+
+def _uniform(rng: np.random.Generator, low: np.ndarray, high: np.ndarray, size: tuple) -> np.ndarray:
+    return low + (high - low) * rng.random(size)
+
+
+def _triangular(rng: np.random.Generator, low: np.ndarray, high: np.ndarray, size: tuple) -> np.ndarray:
+    # Symmetric triangle with its mode at the midpoint, by inverse CDF (allows low == high)
+    u = rng.random(size)
+    width = high - low
+    return np.where(u < 0.5, low + width * np.sqrt(u / 2), high - width * np.sqrt((1 - u) / 2))
+
+
+def _pert(rng: np.random.Generator, low: np.ndarray, high: np.ndarray, size: tuple) -> np.ndarray:
+    # PERT with the mode at the midpoint: Beta(3, 3) scaled to the range
+    return low + (high - low) * rng.beta(3.0, 3.0, size)
+
+
+DISTRIBUTIONS: Dict[str, Sampler] = {
+    "uniform": _uniform,
+    "triangular": _triangular,
+    "pert": _pert,
+}
+DEFAULT_DISTRIBUTION = "triangular"
+# Variance of each distribution as a fraction of the squared range width
+VARIANCE_FACTORS: Dict[str, float] = {
+    "uniform": 1 / 12,
+    "triangular": 1 / 24,
+    "pert": 1 / 28,
+}
+
+
+def _bounds(ranges: Sequence[Range]) -> tuple:
+    low = np.array([r.low for r in ranges], dtype=float)
+    high = np.array([r.high * OPEN_ENDED_TAIL if r.open_ended else r.high for r in ranges], dtype=float)
+    return low, high
+
+
+def _sampler(distribution: str) -> Sampler:
+    try:
+        return DISTRIBUTIONS[distribution]
+    except KeyError:
+        raise ValueError(f"Unknown distribution '{distribution}', expected one of {sorted(DISTRIBUTIONS)}")
+
+
+def sample_ranges(
+    ranges: Sequence[Range],
+    n_samples: int = N_SAMPLES,
+    distribution: Union[str, Sequence[str]] = DEFAULT_DISTRIBUTION,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Sample every range independently
+
+    Args:
+        ranges: Ranges to sample (e.g. the cost components of a case)
+        n_samples: Number of samples
+        distribution: Distribution of all ranges, or one per range
+        rng: Random generator (default: seeded with SIMULATION_SEED)
+
+    Returns:
+        Array of shape (n_samples, len(ranges))
+    """
+    rng = rng if rng is not None else np.random.default_rng(SIMULATION_SEED)
+    low, high = _bounds(ranges)
+    if isinstance(distribution, str):
+        return _sampler(distribution)(rng, low, high, (n_samples, len(ranges)))
+    samples = np.empty((n_samples, len(ranges)))
+    for name in set(distribution):
+        columns = [i for i, value in enumerate(distribution) if value == name]
+        samples[:, columns] = _sampler(name)(rng, low[columns], high[columns], (n_samples, len(columns)))
+    return samples
+
+
+def percentiles(samples: np.ndarray, axis: int = 0) -> Dict[str, np.ndarray]:
+    """P10/P50/P90 of samples along an axis, as {"p10": ..., "p50": ..., "p90": ...}"""
+    values = np.percentile(samples, PERCENTILES, axis=axis)
+    return {f"p{p}": value for p, value in zip(PERCENTILES, values)}
+
+
+def simulate_costs(
+    estimate: CaseEstimate,
+    n_samples: int = N_SAMPLES,
+    distribution: Union[str, Dict[str, str]] = DEFAULT_DISTRIBUTION,
+    seed: int = SIMULATION_SEED,
+) -> Optional[Dict[str, float]]:
+    """
+    Percentiles of the total cost of a case
+
+    Args:
+        estimate: Estimator table entry
+        n_samples: Number of samples
+        distribution: Distribution of all components, or component -> distribution
+            (components not listed use DEFAULT_DISTRIBUTION)
+        seed: Random seed
+
+    Returns:
+        {"p10", "p50", "p90"} in CHF, or None if the case has no cost components
+    """
+    if not estimate.costs:
+        return None
+    names = list(estimate.costs)
+    if not isinstance(distribution, str):
+        distribution = [distribution.get(name, DEFAULT_DISTRIBUTION) for name in names]
+    samples = sample_ranges([estimate.costs[name] for name in names], n_samples, distribution, np.random.default_rng(seed))
+    return {key: float(value) for key, value in percentiles(samples.sum(axis=1)).items()}
+
+
+def simulate_duration(
+    estimate: CaseEstimate,
+    n_samples: int = N_SAMPLES,
+    distribution: str = DEFAULT_DISTRIBUTION,
+    seed: int = SIMULATION_SEED,
+) -> Optional[Dict[str, float]]:
+    """
+    Percentiles of the duration of a contested case
+
+    Returns:
+        {"p10", "p50", "p90"} in months, or None if the case has no duration
+    """
+    if estimate.duration is None:
+        return None
+    samples = sample_ranges([estimate.duration], n_samples, distribution, np.random.default_rng(seed))
+    return {key: float(value) for key, value in percentiles(samples[:, 0]).items()}
+
+
+def cost_moments(estimate: CaseEstimate, distribution: str = DEFAULT_DISTRIBUTION) -> Tuple[float, float]:
+    """
+    Exact mean and variance of the simulated total cost of a case
+
+    All distributions are symmetric around the midpoint of their range, so the
+    moments follow from the ranges without sampling. Used to aggregate large
+    portfolios, where the total of many independent cases is close to normal.
+
+    Returns:
+        Tuple of (mean, variance) in CHF; (0.0, 0.0) without cost components
+    """
+    if not estimate.costs:
+        return 0.0, 0.0
+    _sampler(distribution)
+    low, high = _bounds(list(estimate.costs.values()))
+    return float(((low + high) / 2).sum()), float((VARIANCE_FACTORS[distribution] * (high - low) ** 2).sum())
+
+
+def simulate_portfolio(
+    estimates: List[CaseEstimate],
+    n_samples: int = N_SAMPLES,
+    distribution: str = DEFAULT_DISTRIBUTION,
+    seed: int = SIMULATION_SEED,
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    Percentiles of costs and durations of many cases at once
+
+    The cost components of all cases are padded to a common width and sampled
+    as one (n_samples, cases, components) array per chunk of cases. Cases are
+    independent, so the portfolio total is the per-sample sum over all cases.
+
+    Args:
+        estimates: Estimator table entries, one per case
+        n_samples: Number of samples
+        distribution: Distribution of all ranges
+        seed: Random seed
+
+    Returns:
+        Dictionary with
+        - costs: {"p10", "p50", "p90"} arrays of the cost of every case (CHF)
+        - months: {"p10", "p50", "p90"} arrays of the duration of every case
+          (NaN for cases without duration)
+        - total_costs: {"p10", "p50", "p90"} of the cost of the whole portfolio
+    """
+    rng = np.random.default_rng(seed)
+    sampler = _sampler(distribution)
+    width = max((len(estimate.costs) for estimate in estimates), default=0)
+    portfolio_total = np.zeros(n_samples)
+    cost_parts, month_parts = [], []
+
+    for start in range(0, len(estimates), PORTFOLIO_CHUNK):
+        chunk = estimates[start:start + PORTFOLIO_CHUNK]
+        # Padding components are the range [0, 0] and add nothing
+        low = np.zeros((len(chunk), max(width, 1)))
+        high = np.zeros_like(low)
+        for i, estimate in enumerate(chunk):
+            if estimate.costs:
+                low[i, :len(estimate.costs)], high[i, :len(estimate.costs)] = _bounds(list(estimate.costs.values()))
+        costs = sampler(rng, low, high, (n_samples, *low.shape)).sum(axis=2)
+        portfolio_total += costs.sum(axis=1)
+        cost_parts.append(costs)
+
+        has_duration = np.array([estimate.duration is not None for estimate in chunk])
+        durations = [estimate.duration or Range(0.0, 0.0) for estimate in chunk]
+        months = sampler(rng, *_bounds(durations), (n_samples, len(chunk)))
+        month_parts.append(np.where(has_duration, months, np.nan))
+
+    if not estimates:
+        empty = {f"p{p}": np.empty(0) for p in PERCENTILES}
+        return {"costs": empty, "months": dict(empty), "total_costs": percentiles(portfolio_total)}
+    return {
+        "costs": percentiles(np.concatenate(cost_parts, axis=1)),
+        "months": percentiles(np.concatenate(month_parts, axis=1)),
+        "total_costs": percentiles(portfolio_total),
+    }
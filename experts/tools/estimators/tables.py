@@ -0,0 +1,349 @@
+"""Estimator tables loaded from the case spreadsheets.
+
+``Cases_Employment_Law.xlsx`` and ``Cases_Criminal_Traffic.xlsx`` hold the
+business-logic estimates per case type: chance of winning, duration and costs.
+They are read once at import time into numeric ranges keyed by
+(claims_type, subcategory), so a lookup is a single dictionary access and the
+request path never parses estimate strings. The original cell text is kept
+for display.
+
+An ``.xlsx`` file is a zip archive of XML sheets; the tables are read with the
+standard library, no Excel reader is needed at runtime.
+"""
+
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+ESTIMATORS_DIR = os.path.dirname(os.path.abspath(__file__))
+EMPLOYMENT_TABLE = os.path.join(ESTIMATORS_DIR, "Cases_Employment_Law.xlsx")
+TRAFFIC_TABLE = os.path.join(ESTIMATORS_DIR, "Cases_Criminal_Traffic.xlsx")
+
+# Case number in the spreadsheet -> subcategory (values of the estimator_agent enums)
+EMPLOYMENT_CASES: Dict[int, str] = {
+    1: "termination_poor_performance",
+    2: "increase_in_workload",
+    3: "lohn_ausstehend",
+    4: "fristlose_kuendigung",
+    5: "kuendigung_waehrend_krankheit_unfall",
+}
+TRAFFIC_CASES: Dict[int, str] = {
+    1: "moderate_speeding",
+    2: "driving_under_influence_alcohol_license_withdrawal",
+    3: "parking_lot_accident_chf_2500_no_witnesses",
+    4: "parking_fine_expired_few_minutes",
+    5: "alcohol_06_penalty_order",
+}
+
+# Cost labels in the traffic table that make up the expected total. Other
+# amounts (e.g. "private lawyer" when insurance usually covers the defence)
+# are kept as optional costs.
+COST_COMPONENTS: Dict[str, str] = {
+    "fine": "fine",
+    "lawyer": "lawyer",
+    "court": "court",
+    "admin fees": "admin_fees",
+    "road traffic fees": "road_traffic_fees",
+    "assessment": "assessment",
+    "deductible": "deductible",
+}
+
+# A certain win is still reported as 95%, a hopeless case as 1%
+MAX_LIKELIHOOD = 95
+MIN_LIKELIHOOD = 1
+MONTHS_PER_UNIT: Dict[str, float] = {"day": 1 / 30, "week": 12 / 52, "month": 1.0}
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_AMOUNT = r"\d[\d,']*(?:\.\d+)?"
+PERCENT_RE = re.compile(rf"(?P<below><)?\s*(?P<low>{_AMOUNT})(?:\s*[–-]\s*(?P<high>{_AMOUNT}))?\s*%")
+DURATION_RE = re.compile(
+    rf"(?P<low>{_AMOUNT})(?:\s*[–-]\s*(?P<high>{_AMOUNT}))?\s*(?P<unit>day|week|month)s?(?P<open>\+)?",
+    re.IGNORECASE,
+)
+COST_RE = re.compile(
+    rf"^(?P<label>[^:]*?)\s*:?\s*CHF\s*(?P<low>{_AMOUNT})(?:\s*[–-]\s*(?P<high>{_AMOUNT}))?",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class Range:
+    """Numeric range [low, high]; ``open_ended`` marks values like "6–12 months+"."""
+
+    low: float
+    high: float
+    open_ended: bool = False
+
+    @property
+    def mid(self) -> float:
+        return (self.low + self.high) / 2
+
+
+@dataclass(frozen=True)
+class CaseEstimate:
+    """Estimates of one case type, parsed once when the tables are loaded."""
+
+    claims_type: str
+    subcategory: str
+    title: str
+    # Chance of winning in percent
+    chance: Optional[Range]
+    # Duration in months of a contested case; duration_paid if the fine is simply paid
+    duration: Optional[Range]
+    duration_paid: Optional[Range]
+    # Cost components in CHF that make up the expected total, and optional extras
+    costs: Dict[str, Range]
+    optional_costs: Dict[str, Range] = field(default_factory=dict)
+    # Original spreadsheet text, for display
+    chance_text: str = "unknown"
+    duration_text: str = "unknown"
+    costs_text: str = "unknown"
+    # Point estimates used by the backend tools
+    likelihood: Optional[int] = None
+    months: Optional[int] = None
+    total_cost: Optional[float] = None
+    cost_breakdown: Dict[str, float] = field(default_factory=dict)
+
+
+def _number(text: str) -> float:
+    return float(text.replace(",", "").replace("'", ""))
+
+
+def _range(match: re.Match, scale: float = 1.0) -> Range:
+    low = _number(match["low"]) * scale
+    high = _number(match["high"]) * scale if match["high"] else low
+    return Range(low=low, high=high, open_ended=bool(match.groupdict().get("open")))
+
+
+def parse_percent(text: str) -> Optional[Range]:
+    """
+    Chance of winning in percent ("10–15% (usually hopeless)" -> 10..15, "<10%" -> 0..10)
+
+    Returns:
+        Range in percent, or None if the text has no percentage
+    """
+    match = PERCENT_RE.search(text or "")
+    if not match:
+        return None
+    if match["below"]:
+        return Range(low=0.0, high=_number(match["low"]))
+    return _range(match)
+
+
+def parse_duration(text: str) -> Tuple[Optional[Range], Optional[Range]]:
+    """
+    Duration in months ("Paid: 30 days; Contested: 3–6 months+")
+
+    Returns:
+        Tuple of (contested duration, duration if paid), either None if missing
+    """
+    contested, paid = None, None
+    for part in (text or "").split(";"):
+        match = DURATION_RE.search(part)
+        if not match:
+            continue
+        duration = _range(match, MONTHS_PER_UNIT[match["unit"].lower()])
+        if part.split(":")[0].strip().lower() == "paid":
+            paid = duration
+        else:
+            contested = duration
+    return contested, paid
+
+
+def parse_costs(text: str) -> Tuple[Dict[str, Range], Dict[str, Range]]:
+    """
+    Cost components in CHF ("Fine: CHF 240; Lawyer: CHF 1,000–5,000")
+
+    Returns:
+        Tuple of (components of the expected total, optional components)
+    """
+    costs, optional = {}, {}
+    for part in (text or "").split(";"):
+        match = COST_RE.match(part.strip())
+        if not match:
+            continue
+        label = match["label"].strip().lower()
+        if label in COST_COMPONENTS:
+            costs[COST_COMPONENTS[label]] = _range(match)
+        elif label:
+            optional[re.sub(r"\W+", "_", label).strip("_")] = _range(match)
+    return costs, optional
+
+
+def likelihood_of(chance: Optional[Range]) -> Optional[int]:
+    """Point likelihood (1-95) of a chance range: its midpoint, capped"""
+    if chance is None:
+        return None
+    return max(MIN_LIKELIHOOD, min(MAX_LIKELIHOOD, int(chance.mid)))
+
+
+def read_xlsx_rows(path: str) -> List[List[object]]:
+    """
+    Cell values of the first worksheet of an ``.xlsx`` file
+
+    Args:
+        path: Path to the workbook
+
+    Returns:
+        Rows of cell values (float for numbers, str for text, None for blanks)
+    """
+    with zipfile.ZipFile(path) as archive:
+        names = archive.namelist()
+        shared = []
+        if "xl/sharedStrings.xml" in names:
+            for item in ET.fromstring(archive.read("xl/sharedStrings.xml")).findall(f"{_NS}si"):
+                runs = item.findall(f"{_NS}t") + item.findall(f"{_NS}r/{_NS}t")
+                shared.append("".join(run.text or "" for run in runs))
+        sheets = sorted(name for name in names if re.fullmatch(r"xl/worksheets/sheet\d+\.xml", name))
+        sheet = ET.fromstring(archive.read(sheets[0]))
+
+    rows = []
+    for row in sheet.iter(f"{_NS}row"):
+        values: Dict[int, object] = {}
+        for cell in row.findall(f"{_NS}c"):
+            letters = re.match(r"[A-Z]+", cell.get("r", "A"))[0]
+            column = 0
+            for letter in letters:
+                column = column * 26 + ord(letter) - ord("A") + 1
+            kind = cell.get("t", "n")
+            raw = cell.find(f"{_NS}v")
+            if kind == "inlineStr":
+                value = "".join(t.text or "" for t in cell.iter(f"{_NS}t"))
+            elif raw is None or raw.text is None:
+                value = None
+            elif kind == "s":
+                value = shared[int(raw.text)]
+            elif kind in ("str", "e"):
+                value = raw.text
+            elif kind == "b":
+                value = raw.text == "1"
+            else:
+                value = float(raw.text)
+            values[column - 1] = value
+        rows.append([values.get(i) for i in range(max(values, default=-1) + 1)])
+    return rows
+
+
+def _case_number(label: object) -> Optional[int]:
+    match = re.search(r"\d+", str(label or ""))
+    return int(match[0]) if match else None
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:g}"
+
+
+def load_employment_table(path: str = EMPLOYMENT_TABLE) -> Dict[Tuple[str, str], CaseEstimate]:
+    """
+    Employment law estimates; one column per case, one row per field
+
+    Returns:
+        Dictionary (claims_type, subcategory) -> CaseEstimate
+    """
+    rows = read_xlsx_rows(path)
+    fields = {str(row[0]).strip().lower(): row for row in rows[1:] if row and row[0]}
+
+    def row_starting(prefix: str) -> List[object]:
+        return next(row for label, row in fields.items() if label.startswith(prefix))
+
+    chances, costs, durations = row_starting("chancen"), row_starting("kosten"), row_starting("dauer")
+    estimates = {}
+    for column, title in enumerate(rows[0][1:], start=1):
+        subcategory = EMPLOYMENT_CASES.get(_case_number(title))
+        if subcategory is None:
+            continue
+        # Chances are stored as a fraction (0.8) or as a percentage (80)
+        chance = float(chances[column])
+        percent = round(chance * 100 if chance <= 1 else chance, 1)
+        months, cost = float(durations[column]), float(costs[column])
+        estimates[("employment_law", subcategory)] = CaseEstimate(
+            claims_type="employment_law",
+            subcategory=subcategory,
+            title=str(title),
+            chance=Range(percent, percent),
+            duration=Range(months, months),
+            duration_paid=None,
+            costs={"estimated_total": Range(cost, cost)},
+            chance_text=f"{_format_number(percent)}%",
+            duration_text=f"{_format_number(months)} Months",
+            costs_text=_format_number(cost),
+            likelihood=likelihood_of(Range(percent, percent)),
+            months=int(months),
+            total_cost=cost,
+            cost_breakdown={"estimated_total": cost},
+        )
+    return estimates
+
+
+def load_traffic_table(path: str = TRAFFIC_TABLE) -> Dict[Tuple[str, str], CaseEstimate]:
+    """
+    Traffic criminal law estimates; one row per case
+
+    Returns:
+        Dictionary (claims_type, subcategory) -> CaseEstimate
+    """
+    rows = read_xlsx_rows(path)
+    header = {str(name).strip().lower(): index for index, name in enumerate(rows[0]) if name}
+    estimates = {}
+    for row in rows[1:]:
+        row = row + [None] * (len(rows[0]) - len(row))
+        subcategory = TRAFFIC_CASES.get(_case_number(row[header["case"]]))
+        if subcategory is None:
+            continue
+        chance_text = str(row[header["chance of winning"]] or "unknown")
+        duration_text = str(row[header["duration"]] or "unknown")
+        costs_text = str(row[header["costs"]] or "unknown")
+        chance = parse_percent(chance_text)
+        duration, duration_paid = parse_duration(duration_text)
+        costs, optional_costs = parse_costs(costs_text)
+        breakdown = {name: cost.mid for name, cost in costs.items()}
+        estimates[("traffic_criminal_law", subcategory)] = CaseEstimate(
+            claims_type="traffic_criminal_law",
+            subcategory=subcategory,
+            title=str(row[header["case"]]),
+            chance=chance,
+            duration=duration,
+            duration_paid=duration_paid,
+            costs=costs,
+            optional_costs=optional_costs,
+            chance_text=chance_text,
+            duration_text=duration_text,
+            costs_text=costs_text,
+            likelihood=likelihood_of(chance),
+            months=int(duration.mid) if duration else None,
+            total_cost=sum(breakdown.values()) if breakdown else None,
+            cost_breakdown=breakdown,
+        )
+    return estimates
+
+
+def load_estimates(
+    employment_path: str = EMPLOYMENT_TABLE, traffic_path: str = TRAFFIC_TABLE
+) -> Dict[Tuple[str, str], CaseEstimate]:
+    """
+    Load all estimator tables
+
+    A table that cannot be read is skipped with a warning; its case types then
+    fall back to the tools' generic estimates.
+
+    Returns:
+        Dictionary (claims_type, subcategory) -> CaseEstimate
+    """
+    estimates = {}
+    for loader, path in ((load_employment_table, employment_path), (load_traffic_table, traffic_path)):
+        try:
+            estimates.update(loader(path))
+        except Exception as e:
+            print(f"⚠️ Could not load estimator table {os.path.basename(path)}: {e}")
+    return estimates
+
+
+ESTIMATES: Dict[Tuple[str, str], CaseEstimate] = load_estimates()
+
+
+def get_estimate(claims_type: str, subcategory: str) -> Optional[CaseEstimate]:
+    """Estimates of a case type, or None if the tables do not cover it"""
+    return ESTIMATES.get((claims_type, subcategory))
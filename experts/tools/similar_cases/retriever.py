@@ -1,5 +1,6 @@
 import os
 from google import genai
+from google.genai import types
 import chromadb
 from chromadb.config import Settings
 from typing import List, Dict, Any, Optional, Union
@@ -62,7 +63,10 @@ class OptimizedChromaRetriever:
     def __init__(self, 
                  chroma_db_path: str = "./chroma_db", 
                  collection_name: str = "similar_vectors_gemini",
-                 embedding_model: str = "gemini-embedding-001"):
+                 embedding_model: str = "gemini-embedding-001",
+                 index_backend: str = "chroma",
+                 index_path: Optional[str] = None,
+                 nprobe: Optional[int] = None):
         """
         Initialize the retriever
         
@@ -70,13 +74,22 @@ class OptimizedChromaRetriever:
             chroma_db_path: Path to ChromaDB storage
             collection_name: Name of the collection to query
             embedding_model: Gemini embedding model to use
+            index_backend: "chroma", "flat" (exported NumPy index) or "ivf" (approximate index),
+                see experts.tools.vector_index
+            index_path: Directory of the exported index (default: <index_backend>_index/<collection_name>)
+            nprobe: IVF lists scanned per query (default: the value stored in the index)
         """
         self.chroma_db_path = chroma_db_path
         self.collection_name = collection_name
         self.embedding_model = embedding_model
+        self.index_backend = index_backend
+        self.index_path = index_path
+        self.nprobe = nprobe
         self.client = None
         self.collection = None
         self.genai_client = None
+        self.embedding_dim = None
+        self._collection_info = None
         
         # Initialize connections
         self._initialize_connections()
@@ -84,19 +97,40 @@ class OptimizedChromaRetriever:
     def _initialize_connections(self):
         """Initialize ChromaDB and Gemini API connections"""
         try:
-            # Initialize ChromaDB client
-            self.client = chromadb.PersistentClient(
-                path=self.chroma_db_path, 
-                settings=Settings()
-            )
+            if self.index_backend == "flat":
+                # Memory-mapped exact search, no ChromaDB client needed
+                from experts.tools.vector_index import FlatVectorIndex, default_index_path
+
+                self.collection = FlatVectorIndex.open(
+                    self.index_path or default_index_path(self.chroma_db_path, self.collection_name)
+                )
+            elif self.index_backend == "ivf":
+                # Approximate search over the full corpus, see experts.tools.vector_index.ivf_index
+                from experts.tools.vector_index import IVFVectorIndex, default_index_path
+                
+                self.collection = IVFVectorIndex.open(
+                    self.index_path or default_index_path(self.chroma_db_path, self.collection_name, kind="ivf"),
+                    nprobe=self.nprobe
+                )
+            else:
+                # Initialize ChromaDB client
+                self.client = chromadb.PersistentClient(
+                    path=self.chroma_db_path, 
+                    settings=Settings()
+                )
+                
+                # Get collection (or its shards, for the full-corpus build)
+                from experts.tools.vector_index import open_collection
+                
+                self.collection = open_collection(self.client, self.collection_name)
             
-            # Get collection
-            self.collection = self.client.get_collection(name=self.collection_name)
+            # Collections built with truncated (Matryoshka) embeddings record their dimension
+            self.embedding_dim = (self.collection.metadata or {}).get("embedding_dim")
             
             # Initialize Gemini client
             self.genai_client = genai.Client()
             
-            print(f"✅ Connected to ChromaDB collection: {self.collection_name}")
+            print(f"✅ Connected to {self.index_backend} collection: {self.collection_name}")
             print(f"📊 Collection count: {self.collection.count()}")
             
         except Exception as e:
@@ -114,14 +148,37 @@ class OptimizedChromaRetriever:
             List of embedding values
         """
         try:
+            config = None
+            if self.embedding_dim:
+                config = types.EmbedContentConfig(output_dimensionality=self.embedding_dim)
             result = self.genai_client.models.embed_content(
                 model=self.embedding_model,
-                contents=query_text
+                contents=query_text,
+                config=config
             )
-            return result.embeddings[0].values
+            embedding = result.embeddings[0].values
+            if self.embedding_dim:
+                # Truncated embeddings are not unit length; match the stored vectors
+                from experts.tools.vector_index import normalize_embedding
+                
+                embedding = normalize_embedding(embedding)
+            return embedding
         except Exception as e:
             print(f"❌ Error generating query embedding: {e}")
-            return [0.0] * 768  # Fallback embedding
+            return [0.0] * (self.embedding_dim or 3072)  # Fallback embedding
+    
+    def embed_query(self, query_text: str) -> Optional[List[float]]:
+        """
+        Embed a query once so it can be reused for several searches
+        
+        Args:
+            query_text: Text to embed
+            
+        Returns:
+            Embedding as used by retrieve(), or None if the embedding request failed
+        """
+        embedding = self._generate_query_embedding(query_text)
+        return list(embedding) if any(embedding) else None
     
     def get_collection_info(self) -> Dict[str, Any]:
         """
@@ -159,7 +216,8 @@ class OptimizedChromaRetriever:
                  n_results: int = 10,
                  where_filter: Optional[Dict[str, Any]] = None,
                  where_document_filter: Optional[Dict[str, str]] = None,
-                 include_embedding: bool = False) -> RetrievalResponse:
+                 include_embedding: bool = False,
+                 query_embedding: Optional[List[float]] = None) -> RetrievalResponse:
         """
         Comprehensive retrieval method that returns all available information
         
@@ -169,6 +227,7 @@ class OptimizedChromaRetriever:
             where_filter: Metadata filtering conditions
             where_document_filter: Document content filtering conditions
             include_embedding: Whether to include query embedding in response
+            query_embedding: Precomputed embedding of query_text (see embed_query)
             
         Returns:
             RetrievalResponse object with complete information
@@ -178,7 +237,8 @@ class OptimizedChromaRetriever:
         
         try:
             # Generate query embedding
-            query_embedding = self._generate_query_embedding(query_text)
+            if query_embedding is None:
+                query_embedding = self._generate_query_embedding(query_text)
             
             # Prepare query parameters
             query_params = {
@@ -213,8 +273,10 @@ class OptimizedChromaRetriever:
             # Calculate execution time
             execution_time = time.time() - start_time
             
-            # Get collection info
-            collection_info = self.get_collection_info()
+            # Get collection info (computed once, the collection is read-only here)
+            if self._collection_info is None:
+                self._collection_info = self.get_collection_info()
+            collection_info = self._collection_info
             
             # Create response object
             response = RetrievalResponse(
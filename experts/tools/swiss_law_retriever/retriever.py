@@ -10,35 +10,50 @@ class LegalRetriever:
     using Gemini embeddings for semantic search.
     """
 
-    def __init__(self, collection_name: str = "pdf_vectors_gemini"):
+    def __init__(self, collection_name: str = "pdf_vectors_gemini", index_backend: str = "chroma", index_path: Optional[str] = None):
         """
         Initialize the retriever and connect to the ChromaDB vector store.
 
         Args:
             collection_name (str): The name of the collection to query.
+            index_backend (str): "chroma", "flat" for the exported in-process NumPy index, or "ivf" for its approximate variant.
+            index_path (Optional[str]): Directory of the exported index (default: <index_backend>_index/<collection_name>).
         """
         # --- Configuration ---
         # Use the chroma_db directory relative to this file's location
         current_dir = os.path.dirname(os.path.abspath(__file__))
         self.db_path = os.path.join(current_dir, "chroma_db")
         self.collection_name = collection_name
+        self.index_backend = index_backend
         
         # --- Configure Gemini API ---
         # Ensure the Google API Key is set in the environment variables.
         if not os.environ.get("GOOGLE_API_KEY"):
             raise ValueError("Please set the GOOGLE_API_KEY environment variable.")
         
-        # --- Initialize ChromaDB Client ---
-        try:
-            # Create a persistent client that stores data on disk.
-            self.client = chromadb.PersistentClient(path=self.db_path, settings=Settings())
-            # Get the specified collection from the database.
-            self.collection = self.client.get_collection(name=self.collection_name)
-            print(f"✅ Successfully connected to collection '{self.collection_name}'.")
+        # --- Use the exported flat or IVF index instead of ChromaDB if requested ---
+        if index_backend in ("flat", "ivf"):
+            from experts.tools.vector_index import FlatVectorIndex, IVFVectorIndex, default_index_path
+
+            index_class = IVFVectorIndex if index_backend == "ivf" else FlatVectorIndex
+            self.collection = index_class.open(index_path or default_index_path(self.db_path, collection_name, kind=index_backend))
+            print(f"✅ Successfully opened {index_backend} index '{self.collection_name}'.")
             print(f"📊 Collection contains {self.collection.count()} documents.")
-        except Exception as e:
-            # Raise a connection error if the database connection fails.
-            raise ConnectionError(f"Failed to connect to ChromaDB at '{self.db_path}': {e}")
+        # --- Initialize ChromaDB Client ---
+        else:
+            try:
+                # Create a persistent client that stores data on disk.
+                self.client = chromadb.PersistentClient(path=self.db_path, settings=Settings())
+                # Get the specified collection from the database.
+                self.collection = self.client.get_collection(name=self.collection_name)
+                print(f"✅ Successfully connected to collection '{self.collection_name}'.")
+                print(f"📊 Collection contains {self.collection.count()} documents.")
+            except Exception as e:
+                # Raise a connection error if the database connection fails.
+                raise ConnectionError(f"Failed to connect to ChromaDB at '{self.db_path}': {e}")
+
+        # Collections built with truncated (Matryoshka) embeddings record their dimension.
+        self.embedding_dim = (self.collection.metadata or {}).get("embedding_dim")
 
     def _generate_embedding(self, text: str, model: str = "models/text-embedding-004") -> List[float]:
         """
@@ -58,13 +73,20 @@ class LegalRetriever:
             # Use the Gemini API to create an embedding for the content.
             result = genai.embed_content(
                 model=model,
-                content=text
+                content=text,
+                output_dimensionality=self.embedding_dim
             )
-            return result['embedding']
+            embedding = result['embedding']
+            if self.embedding_dim:
+                # Truncated embeddings are not unit length; match the stored vectors.
+                from experts.tools.vector_index import normalize_embedding
+
+                embedding = normalize_embedding(embedding)
+            return embedding
         except Exception as e:
             print(f"❌ Error generating embedding for query: {e}")
             # Return a zero vector as a fallback.
-            return [0.0] * 768
+            return [0.0] * (self.embedding_dim or 768)
 
     def _search_vector_store(self, query: str, n_results: int = 3) -> Optional[Dict]:
         """
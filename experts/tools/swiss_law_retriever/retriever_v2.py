@@ -2,6 +2,7 @@ import os
 import chromadb
 from chromadb.config import Settings
 from google import genai
+from google.genai import types
 from typing import List, Dict, Optional
 
 
@@ -11,36 +12,52 @@ class LegalRetriever:
     using Gemini embeddings for semantic search.
     """
 
-    def __init__(self, collection_name: str = "pdf_vectors_gemini"):
+    def __init__(self, collection_name: str = "pdf_vectors_gemini", index_backend: str = "chroma", index_path: Optional[str] = None):
         """
         Initialize the retriever and connect to the ChromaDB vector store.
 
         Args:
             collection_name (str): The name of the collection to query.
+            index_backend (str): "chroma", "flat" for the exported in-process NumPy index, or "ivf" for its approximate variant.
+            index_path (Optional[str]): Directory of the exported index (default: <index_backend>_index/<collection_name>).
         """
         # --- Configuration ---
         # Use the chroma_db directory relative to this file's location
         current_dir = os.path.dirname(os.path.abspath(__file__))
         self.db_path = os.path.join(current_dir, "chroma_db")
         self.collection_name = collection_name
+        self.index_backend = index_backend
         
         # --- Configure Gemini API ---
         # Ensure the Google API Key is set in the environment variables.
         if not os.environ.get("GOOGLE_API_KEY"):
             raise ValueError("Please set the GOOGLE_API_KEY environment variable.")
         
-        # --- Initialize ChromaDB Client ---
-        try:
-            # Create a persistent client that stores data on disk.
-            self.client = chromadb.PersistentClient(path=self.db_path, settings=Settings())
-            # Get the specified collection from the database.
-            self.collection = self.client.get_collection(name=self.collection_name)
-            print(f"✅ Successfully connected to collection '{self.collection_name}'.")
+        # --- Use the exported flat or IVF index instead of ChromaDB if requested ---
+        if index_backend in ("flat", "ivf"):
+            from experts.tools.vector_index import FlatVectorIndex, IVFVectorIndex, default_index_path
+
+            index_class = IVFVectorIndex if index_backend == "ivf" else FlatVectorIndex
+            self.collection = index_class.open(index_path or default_index_path(self.db_path, collection_name, kind=index_backend))
+            print(f"✅ Successfully opened {index_backend} index '{self.collection_name}'.")
             print(f"📊 Collection contains {self.collection.count()} documents.")
-        except Exception as e:
-            # Raise a connection error if the database connection fails.
-            raise ConnectionError(f"Failed to connect to ChromaDB at '{self.db_path}': {e}")
+        # --- Initialize ChromaDB Client ---
+        else:
+            try:
+                from experts.tools.vector_index import open_collection
+
+                # Create a persistent client that stores data on disk.
+                self.client = chromadb.PersistentClient(path=self.db_path, settings=Settings())
+                # Get the specified collection (or its SR-area shards) from the database.
+                self.collection = open_collection(self.client, self.collection_name)
+                print(f"✅ Successfully connected to collection '{self.collection_name}'.")
+                print(f"📊 Collection contains {self.collection.count()} documents.")
+            except Exception as e:
+                # Raise a connection error if the database connection fails.
+                raise ConnectionError(f"Failed to connect to ChromaDB at '{self.db_path}': {e}")
         
+        # Collections built with truncated (Matryoshka) embeddings record their dimension.
+        self.embedding_dim = (self.collection.metadata or {}).get("embedding_dim")
         self.client = genai.Client()
 
     def _generate_embedding(self, text: str) -> List[float]:
@@ -58,21 +75,30 @@ class LegalRetriever:
 
             result = self.client.models.embed_content(
                 model="gemini-embedding-001",
-                contents=text
+                contents=text,
+                config=types.EmbedContentConfig(output_dimensionality=self.embedding_dim) if self.embedding_dim else None
             )
-            return [embedding.values for embedding in result.embeddings][0]
+            embedding = [embedding.values for embedding in result.embeddings][0]
+            if self.embedding_dim:
+                # Truncated embeddings are not unit length; match the stored vectors.
+                from experts.tools.vector_index import normalize_embedding
+
+                embedding = normalize_embedding(embedding)
+            return embedding
         except Exception as e:
             print(f"❌ Error generating embedding for query: {e}")
             # Return a zero vector as a fallback.
-            return [0.0] * 768
+            return [0.0] * (self.embedding_dim or 3072)
 
-    def _search_vector_store(self, query: str, n_results: int = 3) -> Optional[Dict]:
+    def _search_vector_store(self, query: str, n_results: int = 3, category: Optional[str] = None, language: Optional[str] = None) -> Optional[Dict]:
         """
         Perform a semantic search in the ChromaDB collection.
 
         Args:
             query (str): The search query string.
             n_results (int): The number of top results to return.
+            category (Optional[str]): Case category; routes the query to the SR areas of that category.
+            language (Optional[str]): Language of the case; chunks in that language are searched first.
 
         Returns:
             Optional[Dict]: A dictionary containing search results, or None if an error occurs.
@@ -82,15 +108,24 @@ class LegalRetriever:
         if not any(query_embedding): # Check if the embedding is just a zero vector
              return None
 
-        # Query the collection for the most similar documents.
-        results = self.collection.query(
-            query_embeddings=[query_embedding],
-            n_results=n_results,
-            include=["documents", "metadatas", "distances"]
-        )
-        return results
+        from experts.tools.vector_index import query_plan
+
+        # Search the case language within the category's SR areas first, then
+        # both languages (merged by distance), then the whole collection.
+        plan = query_plan(self.collection, category, language)
+        for attempt, (collection, where) in enumerate(plan):
+            # Query the collection for the most similar documents.
+            results = collection.query(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                where=where,
+                include=["documents", "metadatas", "distances"]
+            )
+            if len(results["ids"][0]) >= n_results or attempt == len(plan) - 1:
+                return results
+            print(f"⚠️ Too few results for {where or 'the category'}, widening the search")
 
-    def retrieve(self, input: str, n_results: int = 3) -> dict:
+    def retrieve(self, input: str, n_results: int = 3, category: Optional[str] = None, language: Optional[str] = None) -> dict:
 
         """
         Retrieve relevant document contents based on a query string.
@@ -100,17 +135,19 @@ class LegalRetriever:
 
         Args:
             input (str): The user's query or question.
+            category (Optional[str]): Case category used to route the query to SR areas.
+            language (Optional[str]): Language of the case (de, fr, it, en).
 
         Returns:
             str: A string containing the combined content of the most
                  relevant documents, or a message if no results are found.
         """
         print(f"🔍 Retrieving documents for query: '{input}'")
-        search_results = self._search_vector_store(input, n_results)
+        search_results = self._search_vector_store(input, n_results, category, language)
         return search_results
     
     
-    def retrieve_str(self, input: str, n_results: int = 3) -> str:
+    def retrieve_str(self, input: str, n_results: int = 3, category: Optional[str] = None, language: Optional[str] = None) -> str:
         """
         Retrieve relevant document contents based on a query string.
 
@@ -119,13 +156,15 @@ class LegalRetriever:
 
         Args:
             input (str): The user's query or question.
+            category (Optional[str]): Case category used to route the query to SR areas.
+            language (Optional[str]): Language of the case (de, fr, it, en).
 
         Returns:
             str: A string containing the combined content of the most
                  relevant documents, or a message if no results are found.
         """
         print(f"🔍 Retrieving documents for query: '{input}'")
-        search_results = self._search_vector_store(input, n_results)
+        search_results = self._search_vector_store(input, n_results, category, language)
         if not search_results or not search_results.get("documents") or not search_results["documents"][0]:
             return "No relevant documents were found for your query."
 
@@ -135,7 +174,9 @@ class LegalRetriever:
         # Format the output with separators for clarity.
         formatted_output = []
         for i, doc in enumerate(retrieved_docs, 1):
-            source = search_results["metadatas"][0][i-1].get('filename', 'Unknown Source')
+            metadata = search_results["metadatas"][0][i-1] or {}
+            # Article-chunked collections cite "SR 220 Art. 336"; older ones only know the file
+            source = metadata.get('citation') or metadata.get('filename', 'Unknown Source')
             formatted_output.append(f"--- Retrieved Document [{i}] | Source: {source} ---\n\n{doc}")
 
         return "\n\n".join(formatted_output)
@@ -0,0 +1,34 @@
+from .embedding_engine import EmbeddingEngine
+from .flat_index import FlatVectorIndex, default_index_path, export_collection
+from .hnsw import apply_search_ef, hnsw_metadata, hnsw_params
+from .ingest_manifest import IngestManifest, content_hash
+from .ivf_index import IVFVectorIndex
+from .quantization import DEFAULT_EMBEDDING_DIM, normalize_embedding, truncate_embeddings
+from .language import detect_language
+from .routing import areas_for_category, query_plan, route_collection, sr_area
+from .sharding import ShardedCollection, open_collection, shard_for, shard_name
+
+__all__ = [
+    "EmbeddingEngine",
+    "FlatVectorIndex",
+    "IVFVectorIndex",
+    "ShardedCollection",
+    "default_index_path",
+    "export_collection",
+    "apply_search_ef",
+    "hnsw_metadata",
+    "hnsw_params",
+    "IngestManifest",
+    "content_hash",
+    "open_collection",
+    "areas_for_category",
+    "detect_language",
+    "query_plan",
+    "route_collection",
+    "sr_area",
+    "shard_for",
+    "shard_name",
+    "DEFAULT_EMBEDDING_DIM",
+    "normalize_embedding",
+    "truncate_embeddings",
+]
@@ -0,0 +1,343 @@
+"""Benchmarks for the vector index backends.
+
+Queries are sampled from the vectors already stored in the index, so the
+benchmarks need neither an embedding API key nor network access. Exact search
+over the flat index is the ground truth for recall.
+
+Usage:
+    python -m experts.tools.vector_index.benchmark backends \\
+        --chroma-path experts/tools/similar_cases/chroma_db \\
+        --collection similar_vectors_gemini
+
+    python -m experts.tools.vector_index.benchmark quantization \\
+        --index experts/tools/similar_cases/flat_index/similar_vectors_gemini \\
+        --dims 3072 1536 768 256 --dtypes float32 float16 int8
+
+    python -m experts.tools.vector_index.benchmark ivf \\
+        --index experts/tools/similar_cases/flat_index/similar_vectors_gemini \\
+        --nlists 256 1024 --nprobes 4 8 16 32
+
+    python -m experts.tools.vector_index.benchmark hnsw \\
+        --index experts/tools/similar_cases/flat_index/similar_vectors_gemini \\
+        --m 8 16 32 --construction-ef 100 200 --search-ef 10 50 100 200
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+from experts.tools.vector_index.flat_index import FlatVectorIndex, default_index_path
+from experts.tools.vector_index.hnsw import apply_search_ef, hnsw_metadata
+from experts.tools.vector_index.ivf_index import IVFVectorIndex
+from experts.tools.vector_index.sharding import open_collection
+
+
+def sample_queries(index: FlatVectorIndex, n_queries: int, seed: int = 42) -> np.ndarray:
+    """
+    Draw stored vectors to use as benchmark queries.
+
+    Args:
+        index: Index to sample from
+        n_queries: Number of queries
+        seed: Random seed
+
+    Returns:
+        (n_queries, dim) float32 query matrix
+    """
+    rng = np.random.default_rng(seed)
+    rows = rng.choice(index.count(), size=min(n_queries, index.count()), replace=False)
+    return np.asarray(index.vectors[np.sort(rows)], dtype=np.float32)
+
+
+def recall_at_k(found: Sequence[Sequence], truth: Sequence[Sequence]) -> float:
+    """Mean fraction of the true top-k neighbours present in the found top-k."""
+    scores = [
+        len(set(found_ids) & set(true_ids)) / len(true_ids)
+        for found_ids, true_ids in zip(found, truth)
+        if len(true_ids)
+    ]
+    return float(np.mean(scores)) if scores else 0.0
+
+
+def time_queries(run: Callable[[np.ndarray], List], queries: np.ndarray) -> Dict[str, object]:
+    """
+    Run one query at a time and collect latency percentiles.
+
+    Args:
+        run: Function executing a single query and returning the result ids
+        queries: Query matrix
+
+    Returns:
+        Dictionary with result ids and p50/p95/p99 latency in milliseconds
+    """
+    results, latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        results.append(run(query))
+        latencies.append((time.perf_counter() - start) * 1000)
+    return {
+        "ids": results,
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "p99_ms": float(np.percentile(latencies, 99)),
+    }
+
+
+def print_table(rows: List[Dict[str, object]]):
+    """Print benchmark rows as a Markdown table."""
+    if not rows:
+        return
+    headers = list(rows[0].keys())
+    print("| " + " | ".join(headers) + " |")
+    print("|" + "|".join("---" for _ in headers) + "|")
+    for row in rows:
+        cells = [f"{value:.3f}" if isinstance(value, float) else str(value) for value in row.values()]
+        print("| " + " | ".join(cells) + " |")
+
+
+def benchmark_backends(args):
+    """Compare Chroma against the flat NumPy index on the same collection."""
+    import chromadb
+    from chromadb.config import Settings
+
+    client = chromadb.PersistentClient(path=args.chroma_path, settings=Settings())
+    collection = open_collection(client, args.collection)
+    index = FlatVectorIndex.open(args.index or default_index_path(args.chroma_path, args.collection))
+    queries = sample_queries(index, args.queries)
+    k = args.k
+
+    flat = time_queries(lambda q: index.query([q], n_results=k, include=[])["ids"][0], queries)
+    chroma = time_queries(
+        lambda q: collection.query(query_embeddings=[q.tolist()], n_results=k, include=[])["ids"][0],
+        queries,
+    )
+
+    start = time.perf_counter()
+    batched_ids = index.query(queries, n_results=k, include=[])["ids"]
+    batched_ms = (time.perf_counter() - start) * 1000
+
+    rows = []
+    for name, result in (("chroma", chroma), ("flat", flat)):
+        rows.append(
+            {
+                "backend": name,
+                f"recall@{k}": recall_at_k(result["ids"], flat["ids"]),
+                "p50_ms": result["p50_ms"],
+                "p99_ms": result["p99_ms"],
+            }
+        )
+    rows.append(
+        {
+            "backend": f"flat (batch of {len(queries)})",
+            f"recall@{k}": recall_at_k(batched_ids, flat["ids"]),
+            "p50_ms": batched_ms / len(queries),
+            "p99_ms": batched_ms / len(queries),
+        }
+    )
+    print(f"\n📊 {collection.name}: {index.count()} vectors, dim {index.dim}, {len(queries)} queries\n")
+    print_table(rows)
+
+
+def benchmark_quantization(args):
+    """Recall, latency and memory of truncated/quantized copies of a flat index."""
+    index = FlatVectorIndex.open(args.index)
+    queries = sample_queries(index, args.queries)
+    k = args.k
+
+    reference = time_queries(lambda q: index.query([q], n_results=k, include=[])["ids"][0], queries)
+    rows = []
+    for dim in sorted({d for d in args.dims if d <= index.dim}, reverse=True):
+        for dtype in args.dtypes:
+            compressed = index.compress(dim=dim, dtype=dtype)
+            # Full-size queries are truncated to the index dimension by the index
+            result = time_queries(
+                lambda q: compressed.query([q], n_results=k, include=[])["ids"][0], queries
+            )
+            rows.append(
+                {
+                    "dim": dim,
+                    "dtype": dtype,
+                    f"recall@{k}": recall_at_k(result["ids"], reference["ids"]),
+                    "p50_ms": result["p50_ms"],
+                    "p99_ms": result["p99_ms"],
+                    "memory_mb": compressed.nbytes / 1e6,
+                    "reduction": index.nbytes / compressed.nbytes,
+                }
+            )
+
+    print(
+        f"\n📊 {index.name}: {index.count()} vectors, dim {index.dim} ({index.dtype}), "
+        f"{len(queries)} queries, reference p50 {reference['p50_ms']:.3f} ms\n"
+    )
+    print_table(rows)
+
+
+def benchmark_ivf(args):
+    """Recall and tail latency of IVF indexes for a grid of nlist/nprobe values."""
+    index = FlatVectorIndex.open(args.index)
+    queries = sample_queries(index, args.queries)
+    k = args.k
+
+    exact = time_queries(lambda q: index.query([q], n_results=k, include=[])["ids"][0], queries)
+    rows = [
+        {
+            "nlist": "-",
+            "nprobe": "exact",
+            f"recall@{k}": 1.0,
+            "p50_ms": exact["p50_ms"],
+            "p95_ms": exact["p95_ms"],
+            "p99_ms": exact["p99_ms"],
+            "build_s": 0.0,
+        }
+    ]
+    for nlist in args.nlists:
+        start = time.perf_counter()
+        ivf_index = IVFVectorIndex.build(index, nlist=nlist)
+        build_s = time.perf_counter() - start
+        for nprobe in args.nprobes:
+            if nprobe > ivf_index.nlist:
+                continue
+            ivf_index.nprobe = nprobe
+            result = time_queries(
+                lambda q: ivf_index.query([q], n_results=k, include=[])["ids"][0], queries
+            )
+            rows.append(
+                {
+                    "nlist": ivf_index.nlist,
+                    "nprobe": nprobe,
+                    f"recall@{k}": recall_at_k(result["ids"], exact["ids"]),
+                    "p50_ms": result["p50_ms"],
+                    "p95_ms": result["p95_ms"],
+                    "p99_ms": result["p99_ms"],
+                    "build_s": build_s,
+                }
+            )
+
+    print(
+        f"\n📊 {index.name}: {index.count()} vectors, dim {index.dim} ({index.dtype}), "
+        f"{len(queries)} queries\n"
+    )
+    print_table(rows)
+
+
+def directory_size(path: str) -> int:
+    """Total size of the files below ``path`` in bytes."""
+    return sum(
+        os.path.getsize(os.path.join(root, filename))
+        for root, _, filenames in os.walk(path)
+        for filename in filenames
+    )
+
+
+def benchmark_hnsw(args):
+    """Build Chroma HNSW collections for a grid of M/construction_ef and sweep search_ef."""
+    import chromadb
+    from chromadb.config import Settings
+
+    index = FlatVectorIndex.open(args.index)
+    queries = sample_queries(index, args.queries)
+    k = args.k
+    exact = time_queries(lambda q: index.query([q], n_results=k, include=[])["ids"][0], queries)
+    ids = index.table.column("id").to_pylist()
+
+    rows = []
+    for m in args.m:
+        for construction_ef in args.construction_ef:
+            with tempfile.TemporaryDirectory() as chroma_path:
+                client = chromadb.PersistentClient(path=chroma_path, settings=Settings())
+                collection = client.create_collection(
+                    name="hnsw_benchmark",
+                    metadata=hnsw_metadata(space=index.space, M=m, construction_ef=construction_ef),
+                )
+                batch_size = min(client.get_max_batch_size(), 5000)
+                start = time.perf_counter()
+                for offset in range(0, index.count(), batch_size):
+                    embeddings = index.get(
+                        ids=ids[offset : offset + batch_size], include=["embeddings"]
+                    )["embeddings"]
+                    collection.add(ids=ids[offset : offset + batch_size], embeddings=embeddings)
+                build_s = time.perf_counter() - start
+                size_mb = directory_size(chroma_path) / 1e6
+
+                for search_ef in args.search_ef:
+                    apply_search_ef(collection, search_ef)
+                    # A loaded HNSW index keeps its ef: reopen the database to pick up the change
+                    client.clear_system_cache()
+                    client = chromadb.PersistentClient(path=chroma_path, settings=Settings())
+                    collection = client.get_collection(name="hnsw_benchmark")
+                    result = time_queries(
+                        lambda q: collection.query(
+                            query_embeddings=[q.tolist()], n_results=k, include=[]
+                        )["ids"][0],
+                        queries,
+                    )
+                    rows.append(
+                        {
+                            "M": m,
+                            "construction_ef": construction_ef,
+                            "search_ef": search_ef,
+                            f"recall@{k}": recall_at_k(result["ids"], exact["ids"]),
+                            "p50_ms": result["p50_ms"],
+                            "p99_ms": result["p99_ms"],
+                            "build_s": build_s,
+                            "size_mb": size_mb,
+                        }
+                    )
+                client.clear_system_cache()
+
+    print(
+        f"\n📊 {index.name}: {index.count()} vectors, dim {index.dim}, space {index.space}, "
+        f"{len(queries)} queries, exact p50 {exact['p50_ms']:.3f} ms\n"
+    )
+    print_table(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector index benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backends = subparsers.add_parser("backends", help="Chroma vs flat NumPy index")
+    backends.add_argument("--chroma-path", required=True)
+    backends.add_argument("--collection", required=True)
+    backends.add_argument("--index", default=None, help="Flat index directory")
+    backends.add_argument("--queries", type=int, default=200)
+    backends.add_argument("--k", type=int, default=10)
+    backends.set_defaults(func=benchmark_backends)
+
+    quantization = subparsers.add_parser(
+        "quantization", help="Matryoshka truncation and float16/int8 storage vs full precision"
+    )
+    quantization.add_argument("--index", required=True, help="Full-precision flat index directory")
+    quantization.add_argument("--dims", type=int, nargs="+", default=[3072, 1536, 768, 256])
+    quantization.add_argument("--dtypes", nargs="+", default=["float32", "float16", "int8"])
+    quantization.add_argument("--queries", type=int, default=200)
+    quantization.add_argument("--k", type=int, default=10)
+    quantization.set_defaults(func=benchmark_quantization)
+
+    ivf = subparsers.add_parser("ivf", help="IVF nlist/nprobe sweep vs exact search")
+    ivf.add_argument("--index", required=True, help="Flat index directory")
+    ivf.add_argument("--nlists", type=int, nargs="+", default=[256, 1024])
+    ivf.add_argument("--nprobes", type=int, nargs="+", default=[4, 8, 16, 32, 64])
+    ivf.add_argument("--queries", type=int, default=200)
+    ivf.add_argument("--k", type=int, default=10)
+    ivf.set_defaults(func=benchmark_ivf)
+
+    hnsw = subparsers.add_parser("hnsw", help="Chroma HNSW M/construction_ef/search_ef sweep")
+    hnsw.add_argument("--index", required=True, help="Flat index directory (source vectors and ground truth)")
+    hnsw.add_argument("--m", type=int, nargs="+", default=[16, 32])
+    hnsw.add_argument("--construction-ef", type=int, nargs="+", default=[100, 200])
+    hnsw.add_argument("--search-ef", type=int, nargs="+", default=[10, 50, 100, 200])
+    hnsw.add_argument("--queries", type=int, default=200)
+    hnsw.add_argument("--k", type=int, default=10)
+    hnsw.set_defaults(func=benchmark_hnsw)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
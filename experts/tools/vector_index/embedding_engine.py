@@ -0,0 +1,299 @@
+"""Embedding engine for bulk ingestion.
+
+The vectorizers embed tens of thousands of chunks. ``EmbeddingEngine`` does this
+with:
+
+- one shared ``genai.Client`` for the whole run
+- several batches in flight (``max_in_flight`` threads), shared by all callers
+- a requests-per-minute rate limit
+- retries with exponential backoff and jitter for rate limits, server errors
+  and network errors
+- a checkpoint directory: every finished batch is saved as ``<batch>.npy`` plus
+  ``<batch>.keys.json`` (content hashes of its texts), so a crashed or
+  interrupted run re-uses everything embedded so far
+- failed items are returned as ``None`` and appended to ``failed.jsonl`` in the
+  checkpoint directory, never replaced by zero vectors; a batch rejected as a
+  whole (e.g. one over-long text) is split to isolate the failing texts
+
+Texts are identified by a hash of model, dimension and text, so the checkpoint
+is hit even if a resumed run batches the texts differently.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from experts.tools.vector_index.ingest_manifest import content_hash
+from experts.tools.vector_index.quantization import DEFAULT_EMBEDDING_DIM, truncate_embeddings
+from experts.tools.vector_index.snapshot import DEFAULT_EMBEDDING_MODEL
+
+FAILURES_FILE = "failed.jsonl"
+
+# HTTP status codes worth retrying; other client errors (e.g. 400) fail at once
+RETRYABLE_STATUS = {408, 429}
+
+
+class EmbeddingError(RuntimeError):
+    """An embedding batch failed after all retries."""
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter spacing requests evenly to at most ``per_minute`` per minute.
+    """
+
+    def __init__(self, per_minute: Optional[float] = None):
+        self.interval = 60.0 / per_minute if per_minute else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request may be sent."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Rate limits, timeouts, server and network errors are retried."""
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code in RETRYABLE_STATUS or code >= 500
+    return True
+
+
+class EmbeddingEngine:
+    """
+    Concurrent, rate-limited, resumable embedding of texts for ingestion.
+    """
+
+    def __init__(
+        self,
+        model: str = DEFAULT_EMBEDDING_MODEL,
+        dim: int = DEFAULT_EMBEDDING_DIM,
+        batch_size: int = 100,
+        max_in_flight: int = 4,
+        requests_per_minute: Optional[float] = None,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+        checkpoint_dir: Optional[str] = None,
+        client=None,
+    ):
+        """
+        Initialize the engine
+
+        Args:
+            model: Embedding model
+            dim: Output dimensionality; embeddings are normalized to unit length
+            batch_size: Texts per request
+            max_in_flight: Concurrent requests across all callers
+            requests_per_minute: Rate limit; None for no limit
+            max_retries: Retries per batch before its items are recorded as failed
+            backoff: Initial retry delay in seconds, doubled on every retry
+            checkpoint_dir: Directory for finished batches and failures; None disables it
+            client: Embedding client; defaults to one shared ``genai.Client()``
+        """
+        self.model = model
+        self.dim = dim
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.checkpoint_dir = checkpoint_dir
+        self.rate_limiter = RateLimiter(requests_per_minute)
+        self._client = client
+        self._client_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_in_flight), thread_name_prefix="embed")
+        self._lock = threading.Lock()
+        # Text key -> (checkpoint batch file, row)
+        self._checkpoint: Dict[str, Tuple[str, int]] = {}
+        self.failures: List[Dict] = []
+        self.requests = 0
+        self.retries = 0
+        if checkpoint_dir:
+            os.makedirs(checkpoint_dir, exist_ok=True)
+            self._load_checkpoint()
+
+    @property
+    def client(self):
+        with self._client_lock:
+            if self._client is None:
+                from google import genai
+
+                self._client = genai.Client()
+            return self._client
+
+    def text_key(self, text: str) -> str:
+        """Identity of a text's embedding under this model and dimension."""
+        return content_hash(self.model, self.dim, text)
+
+    # ------------------------------------------------------------------
+    # Checkpoint
+    # ------------------------------------------------------------------
+
+    def _load_checkpoint(self):
+        for name in sorted(os.listdir(self.checkpoint_dir)):
+            if not name.endswith(".keys.json"):
+                continue
+            batch_file = os.path.join(self.checkpoint_dir, name[: -len(".keys.json")] + ".npy")
+            if not os.path.exists(batch_file):
+                continue
+            with open(os.path.join(self.checkpoint_dir, name), encoding="utf-8") as f:
+                for row, key in enumerate(json.load(f)):
+                    self._checkpoint[key] = (batch_file, row)
+        if self._checkpoint:
+            print(f"♻️  Resuming with {len(self._checkpoint)} embeddings from {self.checkpoint_dir}")
+
+    def _save_batch(self, keys: List[str], vectors: np.ndarray):
+        """Persist a finished batch; the keys file is written last and marks it complete."""
+        batch_id = content_hash(*keys)[:32]
+        batch_file = os.path.join(self.checkpoint_dir, f"{batch_id}.npy")
+        np.save(batch_file, vectors.astype(np.float32))
+        tmp_path = os.path.join(self.checkpoint_dir, f"{batch_id}.keys.json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(keys, f)
+        os.replace(tmp_path, os.path.join(self.checkpoint_dir, f"{batch_id}.keys.json"))
+        with self._lock:
+            for row, key in enumerate(keys):
+                self._checkpoint[key] = (batch_file, row)
+
+    def _load_vector(self, key: str) -> List[float]:
+        batch_file, row = self._checkpoint[key]
+        return np.load(batch_file, mmap_mode="r")[row].tolist()
+
+    def _record_failures(self, texts: List[str], keys: List[str], error: Exception):
+        entries = [
+            {
+                "key": key,
+                "text": text[:200],
+                "error": f"{type(error).__name__}: {error}",
+                "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            }
+            for text, key in zip(texts, keys)
+        ]
+        with self._lock:
+            self.failures.extend(entries)
+            if self.checkpoint_dir:
+                with open(os.path.join(self.checkpoint_dir, FAILURES_FILE), "a", encoding="utf-8") as f:
+                    for entry in entries:
+                        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def clear_checkpoint(self):
+        """Delete the checkpoint once the embeddings are safely stored."""
+        if not self.checkpoint_dir or not os.path.isdir(self.checkpoint_dir):
+            return
+        for name in os.listdir(self.checkpoint_dir):
+            if name.endswith((".npy", ".keys.json")):
+                os.remove(os.path.join(self.checkpoint_dir, name))
+        self._checkpoint = {}
+
+    # ------------------------------------------------------------------
+    # Embedding
+    # ------------------------------------------------------------------
+
+    def _request(self, texts: List[str]) -> np.ndarray:
+        from google.genai import types
+
+        self.rate_limiter.acquire()
+        with self._lock:
+            self.requests += 1
+        result = self.client.models.embed_content(
+            model=self.model,
+            contents=texts,
+            config=types.EmbedContentConfig(output_dimensionality=self.dim),
+        )
+        vectors = np.asarray([embedding.values for embedding in result.embeddings], dtype=np.float32)
+        if vectors.shape != (len(texts), self.dim):
+            raise EmbeddingError(f"Expected {len(texts)} x {self.dim} embeddings, got {vectors.shape}")
+        # Only the full-size output is normalized by the API
+        return truncate_embeddings(vectors)
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed one batch, retrying transient errors with exponential backoff.
+
+        Raises:
+            Exception: The last error once retries are exhausted or the error is permanent
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._request(texts)
+            except Exception as e:
+                if attempt == self.max_retries or not is_retryable(e):
+                    raise
+                delay = self.backoff * (2**attempt) * (0.5 + random.random())
+                with self._lock:
+                    self.retries += 1
+                print(f"⚠️  Embedding request failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def _embed_and_checkpoint(self, texts: List[str], keys: List[str]) -> List[Optional[np.ndarray]]:
+        """Embed a batch; a permanent error splits it in halves to isolate the failing texts."""
+        try:
+            vectors = self.embed_batch(texts)
+        except Exception as e:
+            if len(texts) > 1 and not is_retryable(e):
+                middle = len(texts) // 2
+                return self._embed_and_checkpoint(texts[:middle], keys[:middle]) + self._embed_and_checkpoint(
+                    texts[middle:], keys[middle:]
+                )
+            print(f"❌ Error generating embeddings for {len(texts)} texts: {e}")
+            self._record_failures(texts, keys, e)
+            return [None] * len(texts)
+        if self.checkpoint_dir:
+            self._save_batch(keys, vectors)
+        return list(vectors)
+
+    def embed(self, texts: Sequence[str]) -> List[Optional[List[float]]]:
+        """
+        Embed texts with up to ``max_in_flight`` concurrent requests.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One unit-length embedding per text, in order; None for texts whose
+            batch failed (they are listed in ``failures``)
+        """
+        keys = [self.text_key(text) for text in texts]
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+
+        # Identical texts are embedded once
+        todo: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            if key in self._checkpoint:
+                embeddings[i] = self._load_vector(key)
+            else:
+                todo.setdefault(key, []).append(i)
+
+        pending = list(todo)
+        futures = []
+        for start in range(0, len(pending), self.batch_size):
+            batch_keys = pending[start : start + self.batch_size]
+            batch_texts = [texts[todo[key][0]] for key in batch_keys]
+            futures.append((batch_keys, self._executor.submit(self._embed_and_checkpoint, batch_texts, batch_keys)))
+
+        for batch_keys, future in futures:
+            for key, vector in zip(batch_keys, future.result()):
+                if vector is None:
+                    continue
+                for i in todo[key]:
+                    embeddings[i] = vector.tolist()
+        return embeddings
+
+    def summary(self) -> str:
+        return f"{self.requests} requests, {self.retries} retries, {len(self.failures)} failed texts"
+
+    def close(self):
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,92 @@
+"""Export a Chroma collection to a flat NumPy index, optionally with an IVF index.
+
+Usage:
+    python -m experts.tools.vector_index.export \\
+        --chroma-path experts/tools/swiss_law_retriever/chroma_db \\
+        --collection pdf_vectors_gemini
+
+    # 768 dimensions stored as int8 (16x smaller than 3072 x float32)
+    python -m experts.tools.vector_index.export \\
+        --chroma-path experts/tools/swiss_law_retriever/chroma_db \\
+        --collection pdf_vectors_gemini --dim 768 --dtype int8 \\
+        --out experts/tools/swiss_law_retriever/flat_index/pdf_vectors_gemini_768_int8
+
+    # Full (sharded) similar-cases corpus with an approximate IVF index
+    python -m experts.tools.vector_index.export \\
+        --chroma-path experts/tools/similar_cases/chroma_db \\
+        --collection similar_vectors_gemini --ivf --nlist 1024 --nprobe 16
+"""
+
+import argparse
+
+import chromadb
+from chromadb.config import Settings
+
+from experts.tools.vector_index.flat_index import (
+    FlatVectorIndex,
+    default_index_path,
+    export_collection,
+)
+from experts.tools.vector_index.ivf_index import DEFAULT_NPROBE, IVFVectorIndex
+from experts.tools.vector_index.sharding import open_collection
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a Chroma collection to a flat index")
+    parser.add_argument("--chroma-path", required=True, help="Path to the Chroma database")
+    parser.add_argument("--collection", required=True, help="Name of the collection to export")
+    parser.add_argument(
+        "--out",
+        default=None,
+        help="Output directory (default: flat_index/<collection> next to chroma_db)",
+    )
+    parser.add_argument(
+        "--space",
+        default=None,
+        choices=["l2", "cosine", "ip"],
+        help="Distance function (default: the collection's own)",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument(
+        "--dim",
+        type=int,
+        default=None,
+        help="Keep only the first N (Matryoshka) dimensions, re-normalized",
+    )
+    parser.add_argument(
+        "--dtype",
+        default="float32",
+        choices=["float32", "float16", "int8"],
+        help="Storage type of the vectors",
+    )
+    parser.add_argument(
+        "--ivf",
+        action="store_true",
+        help="Also build an IVF index in ivf_index/<collection>",
+    )
+    parser.add_argument("--nlist", type=int, default=None, help="IVF lists (default: 4 * sqrt(n))")
+    parser.add_argument("--nprobe", type=int, default=DEFAULT_NPROBE, help="IVF lists scanned per query")
+    args = parser.parse_args()
+
+    client = chromadb.PersistentClient(path=args.chroma_path, settings=Settings())
+    # Sharded collections (<collection>_shard_<k>) are exported as one index
+    collection = open_collection(client, args.collection)
+    out_dir = args.out or default_index_path(args.chroma_path, args.collection)
+    export_collection(
+        collection,
+        out_dir,
+        space=args.space,
+        batch_size=args.batch_size,
+        dim=args.dim,
+        dtype=args.dtype,
+    )
+
+    if args.ivf:
+        ivf_index = IVFVectorIndex.build(
+            FlatVectorIndex.open(out_dir), nlist=args.nlist, nprobe=args.nprobe
+        )
+        ivf_index.save(default_index_path(args.chroma_path, args.collection, kind="ivf"))
+
+
+if __name__ == "__main__":
+    main()
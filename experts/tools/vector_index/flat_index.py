@@ -0,0 +1,696 @@
+"""Exact in-process vector search over a memory-mapped NumPy matrix.
+
+A ``FlatVectorIndex`` is a read-only stand-in for a Chroma collection. The
+vectors live in a ``.npy`` file and ids, documents and metadata in an Arrow
+IPC file next to it (the snapshot layout, see ``snapshot``); both are
+memory-mapped, and a top-k query is a single matrix-vector product (a
+matrix-matrix product for a batch of queries).
+
+Vectors can be stored as float32, float16 or int8 (with per-row scales) and
+truncated to fewer Matryoshka dimensions at export time, see ``quantization``.
+
+The public ``query``/``get``/``count`` methods mirror the subset of the Chroma
+collection API used by the retrievers, so a retriever can swap its collection
+for a flat index without touching the result handling code.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from experts.tools.vector_index.quantization import (
+    STORAGE_DTYPES,
+    dequantize,
+    quantize,
+    truncate_embeddings,
+)
+from experts.tools.vector_index.snapshot import (
+    DEFAULT_EMBEDDING_MODEL,
+    read_manifest,
+    read_metadata_table,
+    write_manifest,
+    write_metadata_table,
+)
+
+VECTORS_FILE = "vectors.npy"
+NORMS_FILE = "norms.npy"
+SCALES_FILE = "scales.npy"
+
+# Distance functions supported by Chroma's HNSW index, reproduced exactly
+SUPPORTED_SPACES = ("l2", "cosine", "ip")
+
+
+def default_index_path(chroma_db_path: str, collection_name: str, kind: str = "flat") -> str:
+    """
+    Location of an index exported from a Chroma collection.
+
+    Args:
+        chroma_db_path: Path of the Chroma database the collection lives in
+        collection_name: Name of the exported collection
+        kind: Index type, "flat" or "ivf"
+
+    Returns:
+        ``<kind>_index/<collection_name>`` next to the ``chroma_db`` directory
+    """
+    base_dir = os.path.dirname(os.path.abspath(chroma_db_path))
+    return os.path.join(base_dir, f"{kind}_index", collection_name)
+
+
+def _metadata_table(
+    ids: List[str], documents: List[Optional[str]], metadatas: List[Optional[Dict[str, Any]]]
+) -> pa.Table:
+    """Build the id/document/metadata table written next to the vectors."""
+    columns = {
+        "id": pa.array(ids, type=pa.string()),
+        "document": pa.array(documents, type=pa.string()),
+    }
+    rows = [metadata or {} for metadata in metadatas]
+    if any(rows):
+        try:
+            columns["metadata"] = pa.array(rows)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Mixed value types under one key: fall back to strings
+            columns["metadata"] = pa.array(
+                [{key: str(value) for key, value in row.items()} for row in rows]
+            )
+    return pa.table(columns)
+
+
+def _row_norms(
+    vectors: np.ndarray, scales: Optional[np.ndarray] = None, block_size: int = 65536
+) -> np.ndarray:
+    """Compute the L2 norm of every (decoded) row without materialising a full copy."""
+    norms = np.empty(vectors.shape[0], dtype=np.float32)
+    for start in range(0, vectors.shape[0], block_size):
+        block_scales = None if scales is None else scales[start : start + block_size]
+        block = dequantize(vectors[start : start + block_size], block_scales)
+        norms[start : start + block_size] = np.linalg.norm(block, axis=1)
+    return norms
+
+
+def _collection_space(collection) -> str:
+    """Read the distance function a Chroma collection was created with."""
+    metadata = getattr(collection, "metadata", None) or {}
+    space = metadata.get("hnsw:space")
+    if space is None:
+        configuration = getattr(collection, "configuration", None) or {}
+        hnsw = configuration.get("hnsw") if isinstance(configuration, dict) else None
+        space = (hnsw or {}).get("space")
+    return space or "l2"
+
+
+def export_collection(
+    collection,
+    index_dir: str,
+    space: Optional[str] = None,
+    batch_size: int = 1000,
+    dim: Optional[int] = None,
+    dtype: str = "float32",
+    embedding_model: Optional[str] = None,
+) -> str:
+    """
+    Export a Chroma collection to a flat index snapshot directory.
+
+    Vectors are streamed into a preallocated ``.npy`` file, so memory use stays
+    bounded by ``batch_size`` regardless of the collection size.
+
+    Args:
+        collection: Chroma collection to export
+        index_dir: Output directory (created if missing)
+        space: Distance function; defaults to the collection's own ``hnsw:space``
+        batch_size: Number of records fetched from Chroma per request
+        dim: Keep only the first ``dim`` (Matryoshka) dimensions, re-normalized
+        dtype: Storage type, one of "float32", "float16" or "int8"
+        embedding_model: Model id recorded in the manifest; defaults to the
+            collection's ``embedding_model`` metadata or gemini-embedding-001
+
+    Returns:
+        Path of the written index directory
+    """
+    space = space or _collection_space(collection)
+    embedding_model = embedding_model or (collection.metadata or {}).get(
+        "embedding_model", DEFAULT_EMBEDDING_MODEL
+    )
+    if space not in SUPPORTED_SPACES:
+        raise ValueError(f"Unsupported distance space: {space}")
+    if dtype not in STORAGE_DTYPES:
+        raise ValueError(f"Unsupported storage dtype: {dtype}")
+
+    total = collection.count()
+    if total == 0:
+        raise ValueError(f"Collection '{collection.name}' is empty")
+
+    os.makedirs(index_dir, exist_ok=True)
+    vectors = None
+    scales = None
+    source_dim = None
+    ids: List[str] = []
+    documents: List[Optional[str]] = []
+    metadatas: List[Optional[Dict[str, Any]]] = []
+
+    for offset in range(0, total, batch_size):
+        batch = collection.get(
+            limit=batch_size,
+            offset=offset,
+            include=["embeddings", "documents", "metadatas"],
+        )
+        embeddings = np.asarray(batch["embeddings"], dtype=np.float32)
+        if source_dim is None:
+            source_dim = embeddings.shape[1]
+        if dim is not None and dim != source_dim:
+            embeddings = truncate_embeddings(embeddings, dim)
+        codes, code_scales = quantize(embeddings, dtype)
+        if vectors is None:
+            vectors = np.lib.format.open_memmap(
+                os.path.join(index_dir, VECTORS_FILE),
+                mode="w+",
+                dtype=codes.dtype,
+                shape=(total, codes.shape[1]),
+            )
+            if code_scales is not None:
+                scales = np.lib.format.open_memmap(
+                    os.path.join(index_dir, SCALES_FILE),
+                    mode="w+",
+                    dtype=np.float32,
+                    shape=(total,),
+                )
+        vectors[offset : offset + len(codes)] = codes
+        if scales is not None:
+            scales[offset : offset + len(codes)] = code_scales
+        ids.extend(batch["ids"])
+        documents.extend(batch["documents"] or [None] * len(batch["ids"]))
+        metadatas.extend(batch["metadatas"] or [None] * len(batch["ids"]))
+
+    vectors.flush()
+    if scales is not None:
+        scales.flush()
+    elif os.path.exists(os.path.join(index_dir, SCALES_FILE)):
+        # Left over from a previous int8 export into the same directory
+        os.remove(os.path.join(index_dir, SCALES_FILE))
+    np.save(os.path.join(index_dir, NORMS_FILE), _row_norms(vectors, scales))
+    files = [VECTORS_FILE, NORMS_FILE]
+    if scales is not None:
+        files.append(SCALES_FILE)
+    files.append(write_metadata_table(_metadata_table(ids, documents, metadatas), index_dir))
+    write_manifest(
+        index_dir,
+        {
+            "index_type": "flat",
+            "collection": collection.name,
+            "embedding_model": embedding_model,
+            "count": total,
+            "dim": int(vectors.shape[1]),
+            "source_dim": int(source_dim),
+            "dtype": dtype,
+            "space": space,
+        },
+        files,
+    )
+
+    print(
+        f"✅ Exported {total} vectors from '{collection.name}' to {index_dir} "
+        f"({vectors.shape[1]} dims, {dtype})"
+    )
+    return index_dir
+
+
+class FlatVectorIndex:
+    """
+    Brute-force vector index with a Chroma-compatible read API.
+    """
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        table: pa.Table,
+        space: str = "l2",
+        norms: Optional[np.ndarray] = None,
+        name: str = "flat_index",
+        scales: Optional[np.ndarray] = None,
+        source_dim: Optional[int] = None,
+        embedding_model: Optional[str] = None,
+    ):
+        """
+        Initialize the index from in-memory or memory-mapped arrays
+
+        Args:
+            vectors: (n, dim) float32, float16 or int8 matrix, one row per document
+            table: Arrow table with ``id``, ``document`` and optional ``metadata`` columns
+            space: Distance function ("l2", "cosine" or "ip")
+            norms: Precomputed row norms; computed on the fly if None
+            name: Name reported as the collection name
+            scales: Per-row scales, required for int8 vectors
+            source_dim: Dimension of the embeddings before truncation
+            embedding_model: Model the embeddings were generated with
+        """
+        if vectors.dtype == np.int8 and scales is None:
+            raise ValueError("int8 vectors require per-row scales")
+        if space not in SUPPORTED_SPACES:
+            raise ValueError(f"Unsupported distance space: {space}")
+        if len(vectors) != table.num_rows:
+            raise ValueError(
+                f"Vector count ({len(vectors)}) does not match metadata rows ({table.num_rows})"
+            )
+        self.vectors = vectors
+        self.table = table
+        self.space = space
+        self.scales = scales
+        self.norms = norms if norms is not None else _row_norms(vectors, scales)
+        self.name = name
+        self.source_dim = source_dim or int(vectors.shape[1])
+        self.embedding_model = embedding_model or DEFAULT_EMBEDDING_MODEL
+        self.metadata = {"hnsw:space": space, "index_backend": "flat"}
+        if self.dim < self.source_dim:
+            # Tells the retrievers to request embeddings of the stored size
+            self.metadata["embedding_dim"] = self.dim
+        self._id_positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def open(cls, index_dir: str) -> "FlatVectorIndex":
+        """
+        Memory-map an exported index directory.
+
+        Only the manifest and the file headers are read; checksums are checked
+        by ``snapshot.verify_snapshot``.
+
+        Args:
+            index_dir: Directory written by ``export_collection`` or ``save``
+
+        Returns:
+            FlatVectorIndex backed by read-only memory maps
+        """
+        info = read_manifest(index_dir)
+        vectors = np.load(os.path.join(index_dir, VECTORS_FILE), mmap_mode="r")
+        norms_path = os.path.join(index_dir, NORMS_FILE)
+        norms = np.load(norms_path, mmap_mode="r") if os.path.exists(norms_path) else None
+        scales_path = os.path.join(index_dir, SCALES_FILE)
+        scales = np.load(scales_path, mmap_mode="r") if os.path.exists(scales_path) else None
+        return cls(
+            vectors,
+            read_metadata_table(index_dir),
+            space=info.get("space", "l2"),
+            norms=norms,
+            name=info.get("collection", os.path.basename(index_dir)),
+            scales=scales,
+            source_dim=info.get("source_dim"),
+            embedding_model=info.get("embedding_model"),
+        )
+
+    def compress(self, dim: Optional[int] = None, dtype: str = "float32") -> "FlatVectorIndex":
+        """
+        Build an in-memory copy with truncated and/or quantized vectors.
+
+        Args:
+            dim: Keep only the first ``dim`` dimensions, re-normalized
+            dtype: Storage type, one of "float32", "float16" or "int8"
+
+        Returns:
+            New FlatVectorIndex sharing this index's metadata table
+        """
+        vectors = dequantize(self.vectors, self.scales)
+        if dim is not None and dim != self.dim:
+            vectors = truncate_embeddings(vectors, dim)
+        codes, scales = quantize(vectors, dtype)
+        return FlatVectorIndex(
+            codes,
+            self.table,
+            space=self.space,
+            name=self.name,
+            scales=scales,
+            source_dim=self.source_dim,
+            embedding_model=self.embedding_model,
+        )
+
+    def _index_info(self) -> Dict[str, Any]:
+        """Index description stored in the manifest."""
+        return {
+            "index_type": "flat",
+            "collection": self.name,
+            "embedding_model": self.embedding_model,
+            "count": self.count(),
+            "dim": self.dim,
+            "source_dim": self.source_dim,
+            "dtype": self.dtype,
+            "space": self.space,
+        }
+
+    def save(self, index_dir: str) -> str:
+        """
+        Write the index as a snapshot directory read by ``open``.
+
+        Args:
+            index_dir: Output directory (created if missing)
+
+        Returns:
+            Path of the written index directory
+        """
+        os.makedirs(index_dir, exist_ok=True)
+        write_manifest(index_dir, self._index_info(), self._write_files(index_dir))
+        return index_dir
+
+    def _write_files(self, index_dir: str) -> List[str]:
+        """Write the data files of the index and return their names."""
+        np.save(os.path.join(index_dir, VECTORS_FILE), np.asarray(self.vectors))
+        np.save(os.path.join(index_dir, NORMS_FILE), np.asarray(self.norms))
+        files = [VECTORS_FILE, NORMS_FILE]
+        scales_path = os.path.join(index_dir, SCALES_FILE)
+        if self.scales is not None:
+            np.save(scales_path, np.asarray(self.scales))
+            files.append(SCALES_FILE)
+        elif os.path.exists(scales_path):
+            os.remove(scales_path)
+        files.append(write_metadata_table(self.table, index_dir))
+        return files
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    @property
+    def dtype(self) -> str:
+        return str(self.vectors.dtype)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the vectors, norms and scales in bytes."""
+        size = self.vectors.nbytes + self.norms.nbytes
+        return size + (self.scales.nbytes if self.scales is not None else 0)
+
+    def count(self) -> int:
+        """Number of documents in the index."""
+        return int(self.vectors.shape[0])
+
+    def _scores(
+        self, queries: np.ndarray, rows: Optional[np.ndarray] = None, block_size: int = 1024
+    ) -> np.ndarray:
+        """
+        Inner products between the stored vectors (all, or ``rows``) and every query.
+
+        float16 and int8 vectors are decoded block by block into a float32
+        working copy small enough to stay in cache; int8 scales are applied to
+        the scores rather than to the vectors. NumPy has no fast float16
+        conversion, so float16 saves memory but scans slower than float32;
+        int8 at a reduced dimension is the fast and small combination.
+        """
+        vectors = self.vectors if rows is None else self.vectors[rows]
+        scales = self.scales if rows is None or self.scales is None else self.scales[rows]
+        if vectors.dtype == np.float32:
+            return vectors @ queries.T
+        scores = np.empty((len(vectors), queries.shape[0]), dtype=np.float32)
+        for start in range(0, len(vectors), block_size):
+            block = np.asarray(vectors[start : start + block_size], dtype=np.float32)
+            scores[start : start + block_size] = block @ queries.T
+        if scales is not None:
+            scores *= np.asarray(scales, dtype=np.float32)[:, None]
+        return scores
+
+    def _distances(self, queries: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Distances between the stored vectors and every query.
+
+        Args:
+            queries: (m, dim) float32 query matrix
+            rows: Row indices to score; all rows if None
+
+        Returns:
+            (n, m) distance matrix in the index's distance space
+        """
+        scores = self._scores(queries, rows)
+        if self.space == "ip":
+            return 1.0 - scores
+        norms = self.norms if rows is None else self.norms[rows]
+        query_norms = np.linalg.norm(queries, axis=1)
+        if self.space == "cosine":
+            denom = np.outer(norms, query_norms)
+            return 1.0 - scores / np.maximum(denom, 1e-12)
+        # Squared L2, as reported by Chroma
+        return np.square(norms)[:, None] - 2.0 * scores + np.square(query_norms)[None, :]
+
+    def _prepare_queries(self, query_embeddings: Sequence[Sequence[float]]) -> np.ndarray:
+        """Convert query embeddings to a float32 matrix of the index dimension."""
+        queries = np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32))
+        if self.dim < queries.shape[1] <= self.source_dim:
+            # Full-size query against a truncated index: use the same prefix
+            queries = truncate_embeddings(queries, self.dim)
+        if queries.shape[1] != self.dim:
+            raise ValueError(
+                f"Query dimension {queries.shape[1]} does not match index dimension {self.dim}"
+            )
+        return queries
+
+    def search(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        n_results: int = 10,
+        mask: Optional[np.ndarray] = None,
+    ) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Exact top-k search for a batch of queries.
+
+        Args:
+            query_embeddings: One embedding per query
+            n_results: Number of neighbours per query
+            mask: Optional boolean array selecting the rows eligible for search
+
+        Returns:
+            Tuple of (row indices, distances) per query, sorted by distance
+        """
+        queries = self._prepare_queries(query_embeddings)
+        distances = self._distances(queries)
+        if mask is not None:
+            distances[~mask] = np.inf
+            available = int(mask.sum())
+        else:
+            available = self.count()
+
+        k = min(n_results, available)
+        if k <= 0:
+            empty = np.empty(0, dtype=np.int64)
+            return [empty] * len(queries), [empty.astype(np.float32)] * len(queries)
+
+        if k < distances.shape[0]:
+            candidates = np.argpartition(distances, k - 1, axis=0)[:k]
+        else:
+            candidates = np.broadcast_to(
+                np.arange(distances.shape[0])[:, None], distances.shape
+            )
+
+        all_indices, all_distances = [], []
+        for column in range(queries.shape[0]):
+            rows = candidates[:, column]
+            row_distances = distances[rows, column]
+            order = np.argsort(row_distances, kind="stable")
+            all_indices.append(rows[order])
+            all_distances.append(row_distances[order].astype(np.float32))
+        return all_indices, all_distances
+
+    # ------------------------------------------------------------------
+    # Filtering
+    # ------------------------------------------------------------------
+
+    def _metadata_field(self, key: str) -> Optional[pa.ChunkedArray]:
+        if "metadata" not in self.table.column_names:
+            return None
+        metadata = self.table.column("metadata")
+        if key not in {field.name for field in metadata.type}:
+            return None
+        return pc.struct_field(metadata, key)
+
+    def _condition_mask(self, key: str, condition: Any) -> np.ndarray:
+        """Evaluate a single ``{key: condition}`` Chroma where clause."""
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+
+        column = self._metadata_field(key)
+        mask = np.ones(self.count(), dtype=bool)
+        for operator, value in condition.items():
+            if column is None:
+                # Missing keys only satisfy negative conditions, as in Chroma
+                mask &= operator in ("$ne", "$nin")
+                continue
+            if operator == "$eq":
+                result = pc.equal(column, value)
+            elif operator == "$ne":
+                result = pc.not_equal(column, value)
+            elif operator == "$gt":
+                result = pc.greater(column, value)
+            elif operator == "$gte":
+                result = pc.greater_equal(column, value)
+            elif operator == "$lt":
+                result = pc.less(column, value)
+            elif operator == "$lte":
+                result = pc.less_equal(column, value)
+            elif operator == "$in":
+                result = pc.is_in(column, value_set=pa.array(value))
+            elif operator == "$nin":
+                result = pc.invert(pc.is_in(column, value_set=pa.array(value)))
+            else:
+                raise ValueError(f"Unsupported where operator: {operator}")
+            mask &= pc.fill_null(result, operator in ("$ne", "$nin")).to_numpy(
+                zero_copy_only=False
+            )
+        return mask
+
+    def _where_mask(self, where: Dict[str, Any]) -> np.ndarray:
+        """Translate a Chroma ``where`` filter into a boolean row mask."""
+        mask = np.ones(self.count(), dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self._where_mask(clause)
+            elif key == "$or":
+                any_mask = np.zeros(self.count(), dtype=bool)
+                for clause in condition:
+                    any_mask |= self._where_mask(clause)
+                mask &= any_mask
+            else:
+                mask &= self._condition_mask(key, condition)
+        return mask
+
+    def _where_document_mask(self, where_document: Dict[str, str]) -> np.ndarray:
+        """Translate a Chroma ``where_document`` filter into a boolean row mask."""
+        documents = self.table.column("document")
+        mask = np.ones(self.count(), dtype=bool)
+        for operator, value in where_document.items():
+            if operator == "$contains":
+                result = pc.match_substring(documents, value)
+            elif operator == "$not_contains":
+                result = pc.invert(pc.match_substring(documents, value))
+            else:
+                raise ValueError(f"Unsupported where_document operator: {operator}")
+            mask &= pc.fill_null(result, False).to_numpy(zero_copy_only=False)
+        return mask
+
+    def _filter_mask(
+        self,
+        where: Optional[Dict[str, Any]],
+        where_document: Optional[Dict[str, str]],
+    ) -> Optional[np.ndarray]:
+        mask = None
+        if where:
+            mask = self._where_mask(where)
+        if where_document:
+            document_mask = self._where_document_mask(where_document)
+            mask = document_mask if mask is None else mask & document_mask
+        return mask
+
+    # ------------------------------------------------------------------
+    # Chroma-compatible API
+    # ------------------------------------------------------------------
+
+    def _rows(self, indices: np.ndarray, include: Sequence[str]) -> Dict[str, List[Any]]:
+        """Materialise ids, documents and metadata for the given rows only."""
+        subset = self.table.take(pa.array(indices, type=pa.int64()))
+        rows: Dict[str, List[Any]] = {"ids": subset.column("id").to_pylist()}
+        if "documents" in include:
+            rows["documents"] = subset.column("document").to_pylist()
+        if "metadatas" in include:
+            if "metadata" in subset.column_names:
+                rows["metadatas"] = [
+                    {key: value for key, value in (metadata or {}).items() if value is not None}
+                    for metadata in subset.column("metadata").to_pylist()
+                ]
+            else:
+                rows["metadatas"] = [{} for _ in range(len(indices))]
+        if "embeddings" in include:
+            scales = None if self.scales is None else self.scales[indices]
+            rows["embeddings"] = dequantize(self.vectors[indices], scales).tolist()
+        return rows
+
+    def query(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None,
+        include: Sequence[str] = ("documents", "metadatas", "distances"),
+    ) -> Dict[str, Any]:
+        """
+        Top-k query with the same result layout as ``chromadb.Collection.query``
+
+        Args:
+            query_embeddings: One embedding per query
+            n_results: Number of results per query
+            where: Metadata filter (Chroma syntax)
+            where_document: Document content filter (Chroma syntax)
+            include: Fields to include in the result
+
+        Returns:
+            Dictionary of per-query result lists (ids, documents, metadatas, distances)
+        """
+        mask = self._filter_mask(where, where_document)
+        all_indices, all_distances = self.search(query_embeddings, n_results, mask)
+
+        results: Dict[str, Any] = {
+            "ids": [],
+            "documents": [] if "documents" in include else None,
+            "metadatas": [] if "metadatas" in include else None,
+            "distances": [] if "distances" in include else None,
+            "embeddings": [] if "embeddings" in include else None,
+        }
+        for indices, distances in zip(all_indices, all_distances):
+            rows = self._rows(indices, include)
+            results["ids"].append(rows["ids"])
+            for field in ("documents", "metadatas", "embeddings"):
+                if results[field] is not None:
+                    results[field].append(rows[field])
+            if results["distances"] is not None:
+                results["distances"].append(distances.tolist())
+        return results
+
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        where_document: Optional[Dict[str, str]] = None,
+        include: Sequence[str] = ("documents", "metadatas"),
+    ) -> Dict[str, Any]:
+        """
+        Fetch documents by id and/or filter, as ``chromadb.Collection.get``
+
+        Args:
+            ids: Document ids to fetch
+            where: Metadata filter (Chroma syntax)
+            limit: Maximum number of documents
+            offset: Number of matching documents to skip
+            where_document: Document content filter (Chroma syntax)
+            include: Fields to include in the result
+
+        Returns:
+            Dictionary of flat result lists (ids, documents, metadatas, embeddings)
+        """
+        if ids is not None:
+            if self._id_positions is None:
+                self._id_positions = {
+                    doc_id: position
+                    for position, doc_id in enumerate(self.table.column("id").to_pylist())
+                }
+            candidates = np.array(
+                [self._id_positions[doc_id] for doc_id in ids if doc_id in self._id_positions],
+                dtype=np.int64,
+            )
+        else:
+            candidates = np.arange(self.count(), dtype=np.int64)
+
+        mask = self._filter_mask(where, where_document)
+        if mask is not None:
+            candidates = candidates[mask[candidates]]
+        end = None if limit is None else offset + limit
+        candidates = candidates[offset:end]
+
+        rows = self._rows(candidates, include)
+        return {
+            "ids": rows["ids"],
+            "documents": rows.get("documents"),
+            "metadatas": rows.get("metadatas"),
+            "embeddings": rows.get("embeddings"),
+        }
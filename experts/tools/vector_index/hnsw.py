@@ -0,0 +1,113 @@
+"""HNSW build and search parameters for the Chroma collections.
+
+Chroma builds an HNSW graph per collection. Its parameters are fixed when the
+collection is created, except ``search_ef``, which can be changed afterwards:
+
+- ``space``: distance function ("l2", "cosine" or "ip")
+- ``M``: graph neighbours per node; more means better recall and a larger index
+- ``construction_ef``: candidate list size while building; more means a better
+  graph and a slower build
+- ``search_ef``: candidate list size while querying; more means better recall
+  and slower queries
+
+The retrievers only read these settings. ``search_ef`` is set when the
+vectorizers build a collection, or afterwards with:
+
+    python -m experts.tools.vector_index.hnsw_tool \\
+        --chroma-path experts/tools/similar_cases/chroma_db \\
+        --collection similar_vectors_gemini --search-ef 200
+"""
+
+import argparse
+from typing import Any, Dict, Optional
+
+# Chroma's defaults, for reference in reports
+HNSW_DEFAULTS = {"space": "l2", "M": 16, "construction_ef": 100, "search_ef": 100}
+
+# Keys of the (legacy, still supported) collection metadata and of the
+# Chroma >= 1.0 collection configuration
+METADATA_KEYS = {
+    "space": "hnsw:space",
+    "M": "hnsw:M",
+    "construction_ef": "hnsw:construction_ef",
+    "search_ef": "hnsw:search_ef",
+}
+CONFIGURATION_KEYS = {
+    "space": "space",
+    "M": "max_neighbors",
+    "construction_ef": "ef_construction",
+    "search_ef": "ef_search",
+}
+
+
+def hnsw_metadata(
+    space: Optional[str] = None,
+    M: Optional[int] = None,
+    construction_ef: Optional[int] = None,
+    search_ef: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Collection metadata entries for the given HNSW parameters.
+
+    Args:
+        space: Distance function
+        M: Graph neighbours per node
+        construction_ef: Candidate list size while building
+        search_ef: Candidate list size while querying
+
+    Returns:
+        ``hnsw:*`` metadata for ``create_collection``; unset parameters are omitted
+    """
+    params = {"space": space, "M": M, "construction_ef": construction_ef, "search_ef": search_ef}
+    return {METADATA_KEYS[key]: value for key, value in params.items() if value is not None}
+
+
+def add_hnsw_arguments(parser: argparse.ArgumentParser):
+    """Add the HNSW build/search options to a vectorizer command line."""
+    group = parser.add_argument_group("HNSW index (default: Chroma defaults)")
+    group.add_argument("--space", choices=["l2", "cosine", "ip"], default=None)
+    group.add_argument("--hnsw-m", dest="M", type=int, default=None, help="Graph neighbours per node")
+    group.add_argument("--construction-ef", type=int, default=None, help="Candidate list size while building")
+    group.add_argument("--search-ef", type=int, default=None, help="Candidate list size while querying")
+
+
+def hnsw_params(collection) -> Dict[str, Any]:
+    """
+    HNSW parameters a Chroma collection was created with.
+
+    Args:
+        collection: Chroma collection
+
+    Returns:
+        Dictionary with space, M, construction_ef and search_ef
+    """
+    params = dict(HNSW_DEFAULTS)
+    configuration = getattr(collection, "configuration_json", None) or {}
+    hnsw = configuration.get("hnsw") or {}
+    metadata = collection.metadata or {}
+    for key in params:
+        if hnsw.get(CONFIGURATION_KEYS[key]) is not None:
+            params[key] = hnsw[CONFIGURATION_KEYS[key]]
+        elif metadata.get(METADATA_KEYS[key]) is not None:
+            params[key] = metadata[METADATA_KEYS[key]]
+    return params
+
+
+def apply_search_ef(collection, search_ef: int):
+    """
+    Change the query-time ``search_ef`` of a Chroma collection (or of every shard).
+
+    The setting is stored with the collection, so it applies to every client
+    opening the database. It takes effect for indexes loaded afterwards, so
+    running services pick it up when they restart.
+
+    Args:
+        collection: Chroma collection or ShardedCollection
+        search_ef: Candidate list size while querying
+    """
+    for shard in getattr(collection, "collections", [collection]):
+        try:
+            shard.modify(configuration={"hnsw": {"ef_search": search_ef}})
+        except TypeError:
+            # Chroma < 1.0: parameters live in the metadata, which modify replaces
+            shard.modify(metadata={**(shard.metadata or {}), "hnsw:search_ef": search_ef})
@@ -0,0 +1,41 @@
+"""Show or change the HNSW parameters of a Chroma collection.
+
+Usage:
+    # Print the HNSW parameters of the collection (or of each shard)
+    python -m experts.tools.vector_index.hnsw_tool \\
+        --chroma-path experts/tools/similar_cases/chroma_db \\
+        --collection similar_vectors_gemini
+
+    # Change search_ef; running services pick it up when they restart
+    python -m experts.tools.vector_index.hnsw_tool \\
+        --chroma-path experts/tools/similar_cases/chroma_db \\
+        --collection similar_vectors_gemini --search-ef 200
+"""
+
+import argparse
+
+import chromadb
+from chromadb.config import Settings
+
+from experts.tools.vector_index.hnsw import apply_search_ef, hnsw_params
+from experts.tools.vector_index.sharding import open_collection
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or change the HNSW parameters of a Chroma collection")
+    parser.add_argument("--chroma-path", required=True, help="Path to the Chroma database")
+    parser.add_argument("--collection", required=True, help="Name of the collection (or of its shards)")
+    parser.add_argument("--search-ef", type=int, default=None, help="New candidate list size while querying")
+    args = parser.parse_args()
+
+    client = chromadb.PersistentClient(path=args.chroma_path, settings=Settings())
+    collection = open_collection(client, args.collection)
+    if args.search_ef:
+        apply_search_ef(collection, args.search_ef)
+        print(f"✅ Set search_ef={args.search_ef} on '{args.collection}'")
+    for shard in getattr(collection, "collections", [collection]):
+        print(f"📊 {shard.name}: {hnsw_params(shard)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Content-hash manifest for incremental re-indexing.
+
+The vectorizers record, per source item (a statute PDF or a BGer case), the
+hash of its content and the ids of the vectors created from it, together with
+the configuration that shaped those vectors (chunker, embedding model and
+dimension, ...). On the next run only new or changed items are re-embedded,
+the vectors of changed and deleted items are removed, and everything else is
+left untouched. A different configuration invalidates the whole manifest and
+triggers a full rebuild.
+
+```json
+{
+  "config": {"chunk_size": 2048, "chunk_overlap": 300, "embedding_dim": 3072, ...},
+  "entries": {"SR-220-01012024-EN.pdf": {"hash": "9f2c...", "ids": ["...", ...]}}
+}
+```
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+MANIFEST_SUFFIX = ".ingest.json"
+
+
+def manifest_path(chroma_db_path: str, collection_name: str) -> str:
+    """Location of the ingest manifest of a collection, next to the Chroma database."""
+    return os.path.join(chroma_db_path, f"{collection_name}{MANIFEST_SUFFIX}")
+
+
+def content_hash(*parts: Any) -> str:
+    """
+    SHA-256 hex digest of one or more values.
+
+    Strings and bytes are hashed as-is; other values (dicts, numbers) as
+    canonical JSON, so the digest is stable across processes and runs.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, bytes):
+            data = part
+        elif isinstance(part, str):
+            data = part.encode("utf-8")
+        else:
+            data = json.dumps(part, sort_keys=True, default=str).encode("utf-8")
+        digest.update(len(data).to_bytes(8, "little"))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+class IngestManifest:
+    """
+    Hashes and vector ids of the items indexed into a collection.
+    """
+
+    def __init__(self, path: str, config: Dict[str, Any], entries: Optional[Dict[str, Dict]] = None):
+        """
+        Initialize the manifest
+
+        Args:
+            path: JSON file the manifest is saved to
+            config: Configuration the vectors are built with
+            entries: Item key -> {"hash": content hash, "ids": vector ids}
+        """
+        self.path = path
+        self.config = config
+        self.entries: Dict[str, Dict] = entries or {}
+        self.config_changed = False
+
+    @classmethod
+    def load(cls, path: str, config: Dict[str, Any]) -> "IngestManifest":
+        """
+        Load the manifest, discarding it if it was written with another configuration.
+
+        Args:
+            path: Manifest file (need not exist)
+            config: Configuration of the current run
+
+        Returns:
+            IngestManifest; ``config_changed`` is True if a stored manifest was discarded
+        """
+        if not os.path.exists(path):
+            return cls(path, config)
+        try:
+            with open(path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable ingest manifest {path}: {e}")
+            manifest = cls(path, config)
+            manifest.config_changed = True
+            return manifest
+
+        # Round-trip through JSON so tuples and ints compare like the stored values
+        if stored.get("config") != json.loads(json.dumps(config, default=str)):
+            manifest = cls(path, config)
+            manifest.config_changed = True
+            return manifest
+        return cls(path, config, stored.get("entries", {}))
+
+    def diff(self, hashes: Dict[str, str]) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Compare the current content hashes with the manifest.
+
+        Args:
+            hashes: Item key -> content hash of everything currently in the source
+
+        Returns:
+            Tuple of (new keys, changed keys, removed keys)
+        """
+        new, changed = [], []
+        for key, value in hashes.items():
+            entry = self.entries.get(key)
+            if entry is None:
+                new.append(key)
+            elif entry["hash"] != value:
+                changed.append(key)
+        removed = [key for key in self.entries if key not in hashes]
+        return new, changed, removed
+
+    def ids(self, keys: Iterable[str]) -> List[str]:
+        """Vector ids recorded for the given items."""
+        return [doc_id for key in keys for doc_id in self.entries.get(key, {}).get("ids", [])]
+
+    def update(self, key: str, hash_value: str, ids: List[str], **extra: Any):
+        """Record an item; ``extra`` stores additional fields such as partial hashes."""
+        self.entries[key] = {"hash": hash_value, "ids": list(ids), **extra}
+
+    def remove(self, key: str):
+        self.entries.pop(key, None)
+
+    def clear(self):
+        self.entries = {}
+
+    def save(self):
+        """Write the manifest atomically (a crash never leaves a truncated file)."""
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"config": self.config, "entries": self.entries}, f, default=str)
+        os.replace(tmp_path, self.path)
+
+
+def delete_ids(collection, ids: List[str], batch_size: int = 5000):
+    """Delete vectors from a Chroma collection in bounded batches."""
+    for start in range(0, len(ids), batch_size):
+        collection.delete(ids=ids[start : start + batch_size])
+
+
+def upsert_batches(
+    collection,
+    ids: List[str],
+    embeddings: List[List[float]],
+    documents: Optional[List[str]] = None,
+    metadatas: Optional[List[Dict]] = None,
+    batch_size: int = 500,
+):
+    """Upsert records into a Chroma collection in bounded batches."""
+    for start in range(0, len(ids), batch_size):
+        end = start + batch_size
+        collection.upsert(
+            ids=ids[start:end],
+            embeddings=embeddings[start:end],
+            documents=documents[start:end] if documents is not None else None,
+            metadatas=metadatas[start:end] if metadatas is not None else None,
+        )
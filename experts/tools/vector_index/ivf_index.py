@@ -0,0 +1,289 @@
+"""Approximate vector search with an inverted file (IVF) index.
+
+The vectors of a flat index are clustered with k-means into ``nlist`` lists and
+stored grouped by list, so every list is a contiguous slice of the
+memory-mapped matrix. A query first ranks the ``nlist`` centroids and then
+scores only the rows of the ``nprobe`` nearest lists, which makes the scan cost
+roughly ``nprobe / nlist`` of exact search.
+
+``nlist`` is fixed at build time; ``nprobe`` trades recall for latency and can
+be changed per index instance at query time.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pyarrow as pa
+
+from experts.tools.vector_index.flat_index import FlatVectorIndex
+from experts.tools.vector_index.quantization import dequantize, truncate_embeddings
+from experts.tools.vector_index.snapshot import read_manifest
+
+CENTROIDS_FILE = "centroids.npy"
+LIST_OFFSETS_FILE = "list_offsets.npy"
+
+DEFAULT_NPROBE = 16
+
+
+def default_nlist(count: int) -> int:
+    """Common IVF heuristic: about 4 * sqrt(n) lists, capped for small and huge collections."""
+    return int(min(max(1, 4 * np.sqrt(count)), 8192))
+
+
+class IVFVectorIndex(FlatVectorIndex):
+    """
+    Inverted file index with the same Chroma-compatible read API as FlatVectorIndex.
+    """
+
+    def __init__(
+        self,
+        vectors: np.ndarray,
+        table: pa.Table,
+        centroids: np.ndarray,
+        list_offsets: np.ndarray,
+        space: str = "l2",
+        norms: Optional[np.ndarray] = None,
+        name: str = "ivf_index",
+        scales: Optional[np.ndarray] = None,
+        source_dim: Optional[int] = None,
+        nprobe: int = DEFAULT_NPROBE,
+        embedding_model: Optional[str] = None,
+    ):
+        """
+        Initialize the index from vectors already grouped by list
+
+        Args:
+            vectors: (n, dim) matrix, rows of list ``i`` at ``list_offsets[i]:list_offsets[i + 1]``
+            table: Arrow table with ``id``, ``document`` and ``metadata`` in the same row order
+            centroids: (nlist, dim) float32 list centroids
+            list_offsets: (nlist + 1,) start offset of every list
+            space: Distance function ("l2", "cosine" or "ip")
+            norms: Precomputed row norms; computed on the fly if None
+            name: Name reported as the collection name
+            scales: Per-row scales, required for int8 vectors
+            source_dim: Dimension of the embeddings before truncation
+            nprobe: Number of lists scanned per query
+            embedding_model: Model the embeddings were generated with
+        """
+        super().__init__(
+            vectors,
+            table,
+            space=space,
+            norms=norms,
+            name=name,
+            scales=scales,
+            source_dim=source_dim,
+            embedding_model=embedding_model,
+        )
+        if len(list_offsets) != len(centroids) + 1 or list_offsets[-1] != len(vectors):
+            raise ValueError("List offsets do not match the centroids and vectors")
+        self.centroids = np.asarray(centroids, dtype=np.float32)
+        self.list_offsets = np.asarray(list_offsets, dtype=np.int64)
+        self.nprobe = nprobe
+        self.metadata["index_backend"] = "ivf"
+
+    @property
+    def nlist(self) -> int:
+        return int(len(self.centroids))
+
+    # ------------------------------------------------------------------
+    # Build and persistence
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def build(
+        cls,
+        index: FlatVectorIndex,
+        nlist: Optional[int] = None,
+        nprobe: int = DEFAULT_NPROBE,
+        sample_size: int = 100_000,
+        seed: int = 42,
+        block_size: int = 65536,
+    ) -> "IVFVectorIndex":
+        """
+        Cluster a flat index into an IVF index.
+
+        k-means is trained on a sample of at most ``sample_size`` vectors; all
+        vectors are then assigned to their nearest centroid block by block.
+
+        Args:
+            index: Source flat index (any storage dtype)
+            nlist: Number of lists; defaults to ``default_nlist(count)``
+            nprobe: Default number of lists scanned per query
+            sample_size: Maximum number of training vectors for k-means
+            seed: Random seed for sampling and k-means
+            block_size: Rows assigned per block
+
+        Returns:
+            In-memory IVFVectorIndex (use ``save`` to persist it)
+        """
+        from sklearn.cluster import MiniBatchKMeans
+
+        count = index.count()
+        nlist = min(nlist or default_nlist(count), count)
+
+        rng = np.random.default_rng(seed)
+        sample = np.sort(rng.choice(count, size=min(sample_size, count), replace=False))
+        training = cls._clustering_vectors(index, sample, index.space)
+        kmeans = MiniBatchKMeans(
+            n_clusters=nlist,
+            random_state=seed,
+            batch_size=max(1024, 4 * nlist),
+            n_init=1,
+        ).fit(training)
+        centroids = kmeans.cluster_centers_.astype(np.float32)
+        if index.space == "cosine":
+            centroids = truncate_embeddings(centroids)
+
+        labels = np.empty(count, dtype=np.int64)
+        for start in range(0, count, block_size):
+            rows = np.arange(start, min(start + block_size, count))
+            block = cls._clustering_vectors(index, rows, index.space)
+            labels[start : start + len(rows)] = np.argmin(
+                cls._centroid_distances(block, centroids, index.space), axis=1
+            )
+
+        order = np.argsort(labels, kind="stable")
+        list_offsets = np.zeros(nlist + 1, dtype=np.int64)
+        list_offsets[1:] = np.cumsum(np.bincount(labels, minlength=nlist))
+        scales = None if index.scales is None else np.asarray(index.scales)[order]
+
+        print(f"✅ Built IVF index with {nlist} lists over {count} vectors")
+        return cls(
+            np.asarray(index.vectors)[order],
+            index.table.take(pa.array(order, type=pa.int64())),
+            centroids,
+            list_offsets,
+            space=index.space,
+            norms=np.asarray(index.norms)[order],
+            name=index.name,
+            scales=scales,
+            source_dim=index.source_dim,
+            nprobe=nprobe,
+            embedding_model=index.embedding_model,
+        )
+
+    @classmethod
+    def open(cls, index_dir: str, nprobe: Optional[int] = None) -> "IVFVectorIndex":
+        """
+        Memory-map an IVF index directory written by ``save``.
+
+        Args:
+            index_dir: Index directory
+            nprobe: Lists scanned per query; defaults to the value stored at build time
+
+        Returns:
+            IVFVectorIndex backed by read-only memory maps
+        """
+        base = FlatVectorIndex.open(index_dir)
+        info = read_manifest(index_dir)
+        return cls(
+            base.vectors,
+            base.table,
+            np.load(os.path.join(index_dir, CENTROIDS_FILE), mmap_mode="r"),
+            np.load(os.path.join(index_dir, LIST_OFFSETS_FILE), mmap_mode="r"),
+            space=base.space,
+            norms=base.norms,
+            name=base.name,
+            scales=base.scales,
+            source_dim=base.source_dim,
+            nprobe=nprobe or info.get("nprobe", DEFAULT_NPROBE),
+            embedding_model=base.embedding_model,
+        )
+
+    def _index_info(self) -> Dict[str, Any]:
+        info = super()._index_info()
+        info.update({"index_type": "ivf", "nlist": self.nlist, "nprobe": self.nprobe})
+        return info
+
+    def _write_files(self, index_dir: str) -> List[str]:
+        files = super()._write_files(index_dir)
+        np.save(os.path.join(index_dir, CENTROIDS_FILE), self.centroids)
+        np.save(os.path.join(index_dir, LIST_OFFSETS_FILE), self.list_offsets)
+        return files + [CENTROIDS_FILE, LIST_OFFSETS_FILE]
+
+    def save(self, index_dir: str) -> str:
+        super().save(index_dir)
+        print(f"✅ Saved IVF index ({self.nlist} lists, nprobe {self.nprobe}) to {index_dir}")
+        return index_dir
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _clustering_vectors(index: FlatVectorIndex, rows: np.ndarray, space: str) -> np.ndarray:
+        """Decoded vectors as clustered: unit length for cosine, raw otherwise."""
+        scales = None if index.scales is None else index.scales[rows]
+        vectors = dequantize(index.vectors[rows], scales)
+        return truncate_embeddings(vectors) if space == "cosine" else vectors
+
+    @staticmethod
+    def _centroid_distances(queries: np.ndarray, centroids: np.ndarray, space: str) -> np.ndarray:
+        """(m, nlist) ranking scores between queries and centroids (lower is nearer)."""
+        scores = queries @ centroids.T
+        if space == "l2":
+            # ||q||^2 is constant per query and does not change the ranking
+            return np.square(centroids).sum(axis=1)[None, :] - 2.0 * scores
+        if space == "cosine":
+            scores /= np.maximum(np.linalg.norm(queries, axis=1, keepdims=True), 1e-12)
+        return -scores
+
+    def _probe_rows(self, list_ids: np.ndarray) -> np.ndarray:
+        """Row indices of the given lists."""
+        return np.concatenate(
+            [
+                np.arange(self.list_offsets[list_id], self.list_offsets[list_id + 1])
+                for list_id in np.sort(list_ids)
+            ]
+        )
+
+    def search(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        n_results: int = 10,
+        mask: Optional[np.ndarray] = None,
+    ) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Approximate top-k search scanning the ``nprobe`` nearest lists.
+
+        Filtered queries only return matching rows from the probed lists, so a
+        very selective filter can return fewer than ``n_results`` results.
+
+        Args:
+            query_embeddings: One embedding per query
+            n_results: Number of neighbours per query
+            mask: Optional boolean array selecting the rows eligible for search
+
+        Returns:
+            Tuple of (row indices, distances) per query, sorted by distance
+        """
+        queries = self._prepare_queries(query_embeddings)
+        nprobe = max(1, min(self.nprobe, self.nlist))
+        centroid_distances = self._centroid_distances(queries, self.centroids, self.space)
+        if nprobe < self.nlist:
+            probes = np.argpartition(centroid_distances, nprobe - 1, axis=1)[:, :nprobe]
+        else:
+            probes = np.broadcast_to(np.arange(self.nlist), centroid_distances.shape)
+
+        all_indices, all_distances = [], []
+        for query, list_ids in zip(queries, probes):
+            rows = self._probe_rows(list_ids)
+            if mask is not None:
+                rows = rows[mask[rows]]
+            k = min(n_results, len(rows))
+            if k <= 0:
+                all_indices.append(np.empty(0, dtype=np.int64))
+                all_distances.append(np.empty(0, dtype=np.float32))
+                continue
+
+            distances = self._distances(query[None, :], rows)[:, 0]
+            if k < len(rows):
+                top = np.argpartition(distances, k - 1)[:k]
+            else:
+                top = np.arange(len(rows))
+            order = top[np.argsort(distances[top], kind="stable")]
+            all_indices.append(rows[order])
+            all_distances.append(distances[order].astype(np.float32))
+        return all_indices, all_distances
@@ -0,0 +1,66 @@
+"""Cheap local language detection for case texts and statute chunks.
+
+Case descriptions arrive in German, French, Italian or English. A full
+language-identification model is not needed to tell these four apart: counting
+frequent function words (and a few diacritics) is enough for a sentence or
+more, runs in microseconds and needs no extra dependency or API call.
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+
+LANGUAGES = ("de", "fr", "it", "en")
+
+# Frequent function words that are (nearly) exclusive to one of the languages
+STOPWORDS: Dict[str, frozenset] = {
+    "de": frozenset(
+        "der die das und ist nicht ein eine einen dem den des mit von zu auf für sich auch "
+        "wurde wird hat habe ich mein meine mir mich wir sie er es bei nach über oder wenn "
+        "dass kann nur noch aus vom zum zur sind war".split()
+    ),
+    "fr": frozenset(
+        "le la les des du un une et est pas pour dans sur avec qui que ne au aux ce cette "
+        "mon ma mes je il elle nous vous ont été sont par son sa ses mais ou être avoir de en "
+        "sans après".split()
+    ),
+    "it": frozenset(
+        "il lo gli della delle dei del un una e è non per con che di da nel nella sono "
+        "mio mia io lui lei noi voi ha hanno stato essere ma anche come più alla al mi".split()
+    ),
+    "en": frozenset(
+        "the and is not a an of to in for on with that this my i he she we you they was "
+        "were have has been be by at from but or his her their it which".split()
+    ),
+}
+
+# Letters that only occur in one of the languages
+DIACRITICS: Dict[str, str] = {"de": "äöüß", "fr": "çêëîïôûœ", "it": "ìò"}
+
+_WORD_RE = re.compile(r"[a-zà-ÿœß]+")
+
+
+def detect_language(text: str, min_hits: int = 3) -> Tuple[Optional[str], float]:
+    """
+    Detect whether a text is German, French, Italian or English.
+
+    Args:
+        text: Text to classify
+        min_hits: Minimum number of function words/diacritics needed for an answer
+
+    Returns:
+        Tuple of (language code or None if undecided, confidence in [0, 1])
+    """
+    text = (text or "").lower()
+    scores = {language: 0.0 for language in LANGUAGES}
+    for word in _WORD_RE.findall(text):
+        for language in LANGUAGES:
+            if word in STOPWORDS[language]:
+                scores[language] += 1.0
+    for language, letters in DIACRITICS.items():
+        scores[language] += 0.5 * sum(text.count(letter) for letter in letters)
+
+    total = sum(scores.values())
+    language = max(scores, key=scores.get)
+    if total < min_hits or scores[language] == 0:
+        return None, 0.0
+    return language, scores[language] / total
@@ -0,0 +1,98 @@
+"""Dimension reduction and scalar quantization for stored embeddings.
+
+``gemini-embedding-001`` is trained with Matryoshka representation learning:
+the first ``d`` components of a 3072-dimensional embedding are themselves a
+usable ``d``-dimensional embedding once re-normalized. Combined with float16
+(2 bytes) or int8 (1 byte plus one float32 scale per row) storage, this shrinks
+a flat index by 4-16x compared to 3072-dimensional float32 vectors.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+# Full output dimension of gemini-embedding-001
+DEFAULT_EMBEDDING_DIM = 3072
+
+# Storage types supported by the flat index
+STORAGE_DTYPES = ("float32", "float16", "int8")
+
+INT8_MAX = 127.0
+
+
+def truncate_embeddings(embeddings: Sequence[Sequence[float]], dim: Optional[int] = None) -> np.ndarray:
+    """
+    Keep the first ``dim`` components of each embedding and re-normalize.
+
+    Args:
+        embeddings: (n, d) embeddings, or a single embedding
+        dim: Target dimension; None keeps the full dimension (still normalized)
+
+    Returns:
+        (n, dim) float32 matrix of unit-length rows (zero rows stay zero)
+    """
+    vectors = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+    if dim is not None:
+        if dim > vectors.shape[1]:
+            raise ValueError(f"Cannot truncate {vectors.shape[1]}-dimensional embeddings to {dim}")
+        vectors = vectors[:, :dim]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+def normalize_embedding(values: Sequence[float], dim: Optional[int] = None) -> list:
+    """
+    Truncate and re-normalize a single embedding returned by the API.
+
+    Args:
+        values: Embedding values
+        dim: Target dimension; None keeps the full dimension
+
+    Returns:
+        Unit-length embedding as a list of floats
+    """
+    return truncate_embeddings([values], dim)[0].tolist()
+
+
+def quantize(vectors: np.ndarray, dtype: str = "float32") -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Convert float32 vectors to the given storage type.
+
+    int8 uses symmetric per-row scaling: ``row ≈ codes * scale``.
+
+    Args:
+        vectors: (n, dim) float32 matrix
+        dtype: One of STORAGE_DTYPES
+
+    Returns:
+        Tuple of (stored vectors, per-row float32 scales or None)
+    """
+    if dtype not in STORAGE_DTYPES:
+        raise ValueError(f"Unsupported storage dtype: {dtype}")
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if dtype == "float32":
+        return vectors, None
+    if dtype == "float16":
+        return vectors.astype(np.float16), None
+
+    scales = np.abs(vectors).max(axis=1) / INT8_MAX
+    scales = np.where(scales > 0, scales, 1.0).astype(np.float32)
+    codes = np.clip(np.rint(vectors / scales[:, None]), -INT8_MAX, INT8_MAX).astype(np.int8)
+    return codes, scales
+
+
+def dequantize(vectors: np.ndarray, scales: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert stored vectors back to float32.
+
+    Args:
+        vectors: Stored (n, dim) matrix
+        scales: Per-row scales for int8 storage
+
+    Returns:
+        (n, dim) float32 matrix
+    """
+    decoded = np.asarray(vectors, dtype=np.float32)
+    if scales is not None:
+        decoded = decoded * np.asarray(scales, dtype=np.float32)[:, None]
+    return decoded
@@ -0,0 +1,127 @@
+"""Routing of statute queries to SR-area shards and languages.
+
+The Swiss law vectorizer writes one shard per area of the classified
+compilation of federal law (``pdf_vectors_gemini_shard_<area>``, the area
+being the first digit of the SR number). A query for a case category only
+searches the areas that category can touch; "Andere", unknown categories and
+areas that return too few hits fall back to all shards.
+
+Chunks also record their language. ``query_plan`` first restricts a query to
+chunks in the language of the case, then to the category's areas in all
+languages (results of both languages merged by distance), then to everything.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from experts.tools.vector_index.language import LANGUAGES
+
+# First digit of the SR number -> area of law
+SR_AREAS: Dict[str, str] = {
+    "0": "International law",
+    "1": "State, people, authorities",
+    "2": "Private law, civil procedure, debt enforcement",
+    "3": "Criminal law, criminal procedure",
+    "4": "Education, science, culture",
+    "5": "National defence",
+    "6": "Finance",
+    "7": "Public works, energy, transport",
+    "8": "Health, employment, social security",
+    "9": "Economy, technical cooperation",
+}
+
+# Case category (categorize_node) -> SR areas searched for it
+CATEGORY_AREAS: Dict[str, Tuple[str, ...]] = {
+    # Code of Obligations (220), Labour Act (822), social insurance (83x)
+    "Arbeitsrecht": ("2", "8"),
+    # Civil Code and Code of Obligations (210, 220), spatial planning and housing (7xx)
+    "Immobilienrecht": ("2", "7"),
+    # Criminal Code and procedure (311, 312), Road Traffic Act (741)
+    "Strafverkehrsrecht": ("3", "7"),
+}
+
+
+def sr_area(sr_number: str) -> str:
+    """
+    Area of an SR number ("220" -> "2", "0.831.109" -> "0")
+
+    Returns:
+        First digit of the SR number, or "" if it is empty
+    """
+    sr_number = (sr_number or "").strip()
+    return sr_number[0] if sr_number[:1].isdigit() else ""
+
+
+def areas_for_category(category: Optional[str]) -> Optional[List[str]]:
+    """
+    SR areas to search for a case category
+
+    Returns:
+        List of areas, or None to search all shards ("Andere", unknown or no category)
+    """
+    areas = CATEGORY_AREAS.get(category or "")
+    return list(areas) if areas else None
+
+
+def route_collection(collection, category: Optional[str]) -> Tuple[object, Optional[Dict]]:
+    """
+    Collection and metadata filter for a query of the given category
+
+    Sharded collections are narrowed to the category's area shards; other
+    collections and exported indexes are filtered on the ``sr_area`` metadata.
+
+    Args:
+        collection: Chroma collection, ShardedCollection or exported index
+        category: Case category
+
+    Returns:
+        Tuple of (collection to query, ``where`` filter or None); the input
+        collection and None if the query should go to all areas
+    """
+    areas = areas_for_category(category)
+    if not areas:
+        return collection, None
+    if hasattr(collection, "subset"):
+        routed = collection.subset(areas)
+        return (routed, None) if routed is not None else (collection, None)
+    return collection, {"sr_area": {"$in": areas}}
+
+
+def language_filter(language: Optional[str]) -> Optional[Dict]:
+    """``where`` filter on the chunk language, or None for unknown languages"""
+    return {"language": language} if language in LANGUAGES else None
+
+
+def merge_filters(*filters: Optional[Dict]) -> Optional[Dict]:
+    """Combine ``where`` filters with ``$and`` (None if there is none)"""
+    filters = [where for where in filters if where]
+    if not filters:
+        return None
+    return filters[0] if len(filters) == 1 else {"$and": filters}
+
+
+def query_plan(collection, category: Optional[str], language: Optional[str]) -> List[Tuple[Any, Optional[Dict]]]:
+    """
+    Query attempts from the most to the least specific
+
+    The caller runs them in order and keeps the first one that returns enough
+    results; the last attempt (all shards, all languages) is always accepted.
+
+    Args:
+        collection: Chroma collection, ShardedCollection or exported index
+        category: Case category (routes to SR areas)
+        language: Language of the case (de, fr, it, en)
+
+    Returns:
+        List of (collection, ``where`` filter) pairs without duplicates
+    """
+    routed, area_where = route_collection(collection, category)
+    attempts = [
+        (routed, merge_filters(area_where, language_filter(language))),
+        (routed, area_where),
+        (collection, None),
+    ]
+    plan = []
+    for attempt in attempts:
+        if not any(attempt[0] is other[0] and attempt[1] == other[1] for other in plan):
+            plan.append(attempt)
+    return plan
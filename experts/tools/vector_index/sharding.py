@@ -0,0 +1,229 @@
+"""Sharded Chroma collections behind a single collection-like object.
+
+The full similar-cases corpus is written to ``<name>_shard_<k>`` collections,
+with each case assigned to a shard by a stable hash of its docref; the Swiss
+law collection is sharded by SR area instead (see ``routing``). Queries fan
+out to all shards in parallel and the per-shard top-k lists are merged by
+distance, so callers see one collection; ``subset`` narrows a query to some
+shards.
+"""
+
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+
+SHARD_SEPARATOR = "_shard_"
+
+RESULT_FIELDS = ("ids", "documents", "metadatas", "distances", "embeddings")
+
+
+def shard_name(collection_name: str, shard: int) -> str:
+    """Name of shard ``shard`` of a sharded collection."""
+    return f"{collection_name}{SHARD_SEPARATOR}{shard}"
+
+
+def shard_for(key: str, num_shards: int) -> int:
+    """
+    Stable shard assignment (unlike ``hash``, identical across processes).
+
+    Args:
+        key: Sharding key, e.g. the docref of a case
+        num_shards: Number of shards
+
+    Returns:
+        Shard number in ``range(num_shards)``
+    """
+    return zlib.crc32(str(key).encode("utf-8")) % num_shards
+
+
+class ShardedCollection:
+    """
+    Read-only view over several Chroma collections with one collection's API.
+    """
+
+    def __init__(self, collections: List[Any], name: str, shard_ids: Optional[Sequence[str]] = None):
+        """
+        Initialize the view
+
+        Args:
+            collections: Shard collections, in shard order
+            name: Name of the logical collection
+            shard_ids: Shard suffix of each collection (default: "0", "1", ...)
+        """
+        if not collections:
+            raise ValueError(f"No shards given for collection '{name}'")
+        self.collections = collections
+        self.name = name
+        self.shard_ids = [str(shard) for shard in shard_ids] if shard_ids else [str(i) for i in range(len(collections))]
+        self.metadata = dict(collections[0].metadata or {})
+        self.metadata.pop("shard", None)
+        self._executor = ThreadPoolExecutor(max_workers=len(collections))
+        self._subsets: Dict[tuple, Optional["ShardedCollection"]] = {}
+
+    def subset(self, shard_ids: Sequence[str]) -> Optional["ShardedCollection"]:
+        """
+        View over some of the shards (cached per shard set).
+
+        Args:
+            shard_ids: Shard suffixes to keep; unknown ones are ignored
+
+        Returns:
+            ShardedCollection over the matching shards, or None if none exist
+        """
+        key = tuple(sorted({str(shard) for shard in shard_ids}))
+        if key not in self._subsets:
+            selected = [
+                (shard, collection)
+                for shard, collection in zip(self.shard_ids, self.collections)
+                if shard in key
+            ]
+            self._subsets[key] = (
+                ShardedCollection([collection for _, collection in selected], self.name, [shard for shard, _ in selected])
+                if selected
+                else None
+            )
+        return self._subsets[key]
+
+    def count(self) -> int:
+        """Number of documents across all shards."""
+        return sum(collection.count() for collection in self.collections)
+
+    def query(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        where_document: Optional[Dict[str, str]] = None,
+        include: Sequence[str] = ("documents", "metadatas", "distances"),
+    ) -> Dict[str, Any]:
+        """
+        Query every shard in parallel and merge the results by distance.
+
+        Args:
+            query_embeddings: One embedding per query
+            n_results: Number of results per query
+            where: Metadata filter (Chroma syntax)
+            where_document: Document content filter (Chroma syntax)
+            include: Fields to include in the result
+
+        Returns:
+            Dictionary of per-query result lists, as ``chromadb.Collection.query``
+        """
+        include = list(include)
+        shard_include = include if "distances" in include else include + ["distances"]
+        kwargs: Dict[str, Any] = {
+            "query_embeddings": [list(map(float, q)) for q in query_embeddings],
+            "n_results": n_results,
+            "include": shard_include,
+        }
+        if where:
+            kwargs["where"] = where
+        if where_document:
+            kwargs["where_document"] = where_document
+
+        shard_results = list(
+            self._executor.map(lambda collection: collection.query(**kwargs), self.collections)
+        )
+
+        merged: Dict[str, Any] = {
+            field: [] if field == "ids" or field in include else None for field in RESULT_FIELDS
+        }
+        for position in range(len(kwargs["query_embeddings"])):
+            candidates = []
+            for result in shard_results:
+                for rank, distance in enumerate(result["distances"][position]):
+                    candidates.append((distance, result, rank))
+            candidates.sort(key=lambda candidate: candidate[0])
+            candidates = candidates[:n_results]
+            for field in RESULT_FIELDS:
+                if merged[field] is not None:
+                    merged[field].append(
+                        [result[field][position][rank] for _, result, rank in candidates]
+                    )
+        return merged
+
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        where_document: Optional[Dict[str, str]] = None,
+        include: Sequence[str] = ("documents", "metadatas"),
+    ) -> Dict[str, Any]:
+        """
+        Fetch documents from the shards in shard order, as ``chromadb.Collection.get``
+
+        Args:
+            ids: Document ids to fetch
+            where: Metadata filter (Chroma syntax)
+            limit: Maximum number of documents
+            offset: Number of matching documents to skip
+            where_document: Document content filter (Chroma syntax)
+            include: Fields to include in the result
+
+        Returns:
+            Dictionary of flat result lists (ids, documents, metadatas, embeddings)
+        """
+        include = list(include)
+        merged: Dict[str, Any] = {
+            field: [] if field == "ids" or field in include else None
+            for field in ("ids", "documents", "metadatas", "embeddings")
+        }
+        filtered = ids is not None or where or where_document
+        for collection in self.collections:
+            if limit is not None and len(merged["ids"]) >= limit:
+                break
+            remaining = None if limit is None else limit - len(merged["ids"])
+            if filtered:
+                # Filters are evaluated per shard, so offsets apply to the merged stream
+                part = collection.get(
+                    ids=ids, where=where, where_document=where_document, include=include
+                )
+                skip = min(offset, len(part["ids"]))
+                offset -= skip
+                end = None if remaining is None else skip + remaining
+            else:
+                size = collection.count()
+                if offset >= size:
+                    offset -= size
+                    continue
+                part = collection.get(limit=remaining, offset=offset, include=include)
+                skip, end, offset = 0, None, 0
+            for field, values in merged.items():
+                if values is not None and part.get(field) is not None:
+                    values.extend(list(part[field])[skip:end])
+        return merged
+
+
+def open_collection(client, collection_name: str):
+    """
+    Open a Chroma collection, or its shards if it was written sharded.
+
+    Args:
+        client: Chroma client
+        collection_name: Name of the (logical) collection
+
+    Returns:
+        Chroma collection or ShardedCollection
+    """
+    try:
+        return client.get_collection(name=collection_name)
+    except Exception:
+        prefix = collection_name + SHARD_SEPARATOR
+        names = [
+            collection if isinstance(collection, str) else collection.name
+            for collection in client.list_collections()
+        ]
+        # Numbered shards (similar cases) or SR areas (Swiss law, "x" for files without an SR number)
+        shards = sorted(
+            (name for name in names if name.startswith(prefix) and name[len(prefix):].isalnum()),
+            key=lambda name: (not name[len(prefix):].isdigit(), len(name), name),
+        )
+        if not shards:
+            raise
+        return ShardedCollection(
+            [client.get_collection(name=name) for name in shards],
+            collection_name,
+            [name[len(prefix):] for name in shards],
+        )
@@ -0,0 +1,180 @@
+"""Versioned, memory-mappable snapshots of the vector collections.
+
+A snapshot is an index directory (see ``flat_index``) with a ``manifest.json``:
+
+```
+<snapshot>/
+├── manifest.json      # format version, embedding model, shape, checksums
+├── vectors.npy        # (n, dim) vectors, memory-mapped read-only
+├── norms.npy
+├── scales.npy         # int8 only
+├── metadata.arrow     # ids, documents, metadata (uncompressed Arrow IPC)
+└── centroids.npy, list_offsets.npy   # IVF snapshots only
+```
+
+Every file is opened with a read-only memory map, so opening a snapshot reads
+only the manifest and file headers, and all uvicorn workers on a host share
+the same pages through the OS page cache. Checksums are verified on demand
+(``verify``) rather than on every cold start.
+
+Use ``snapshot_tool`` to export, verify and import snapshots.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+MANIFEST_FILE = "manifest.json"
+METADATA_ARROW_FILE = "metadata.arrow"
+
+# Pre-snapshot layout, still readable
+LEGACY_INFO_FILE = "index.json"
+LEGACY_METADATA_FILE = "metadata.parquet"
+
+DEFAULT_EMBEDDING_MODEL = "gemini-embedding-001"
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_manifest(index_dir: str, info: Dict[str, Any], files: Sequence[str]) -> Dict[str, Any]:
+    """
+    Write ``manifest.json`` with the index description and file checksums.
+
+    Args:
+        index_dir: Snapshot directory
+        info: Index description (collection, count, dim, dtype, space, ...)
+        files: Data files of the snapshot, relative to ``index_dir``
+
+    Returns:
+        The written manifest
+    """
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **info,
+        "files": {
+            name: {
+                "bytes": os.path.getsize(os.path.join(index_dir, name)),
+                "sha256": file_sha256(os.path.join(index_dir, name)),
+            }
+            for name in files
+        },
+    }
+    with open(os.path.join(index_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    # The manifest replaces the pre-snapshot index description
+    legacy_info = os.path.join(index_dir, LEGACY_INFO_FILE)
+    if os.path.exists(legacy_info):
+        os.remove(legacy_info)
+    return manifest
+
+
+def read_manifest(index_dir: str) -> Dict[str, Any]:
+    """
+    Read the manifest of a snapshot (or the ``index.json`` of an older export).
+
+    Args:
+        index_dir: Snapshot directory
+
+    Returns:
+        Manifest dictionary; legacy exports report ``format_version`` 0
+    """
+    manifest_path = os.path.join(index_dir, MANIFEST_FILE)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format_version", 0) > SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"Snapshot format {manifest['format_version']} is newer than the supported "
+                f"version {SNAPSHOT_FORMAT_VERSION}: {index_dir}"
+            )
+        return manifest
+    with open(os.path.join(index_dir, LEGACY_INFO_FILE), encoding="utf-8") as f:
+        return {"format_version": 0, **json.load(f)}
+
+
+def write_metadata_table(table: pa.Table, index_dir: str) -> str:
+    """Write the id/document/metadata table as an uncompressed Arrow IPC file."""
+    path = os.path.join(index_dir, METADATA_ARROW_FILE)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    legacy_path = os.path.join(index_dir, LEGACY_METADATA_FILE)
+    if os.path.exists(legacy_path):
+        os.remove(legacy_path)
+    return METADATA_ARROW_FILE
+
+
+def read_metadata_table(index_dir: str) -> pa.Table:
+    """
+    Open the id/document/metadata table without copying it.
+
+    Arrow IPC files are memory-mapped zero-copy; older exports fall back to Parquet.
+    """
+    path = os.path.join(index_dir, METADATA_ARROW_FILE)
+    if os.path.exists(path):
+        return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+    return pq.read_table(os.path.join(index_dir, LEGACY_METADATA_FILE), memory_map=True)
+
+
+def verify_snapshot(index_dir: str) -> List[str]:
+    """
+    Check the files of a snapshot against its manifest.
+
+    Args:
+        index_dir: Snapshot directory
+
+    Returns:
+        List of problems; empty if the snapshot is intact
+    """
+    manifest = read_manifest(index_dir)
+    if manifest["format_version"] < 1:
+        return [f"{index_dir} is a legacy export without checksums"]
+    problems = []
+    for name, expected in manifest["files"].items():
+        path = os.path.join(index_dir, name)
+        if not os.path.exists(path):
+            problems.append(f"missing file: {name}")
+        elif os.path.getsize(path) != expected["bytes"]:
+            problems.append(f"size mismatch: {name}")
+        elif file_sha256(path) != expected["sha256"]:
+            problems.append(f"checksum mismatch: {name}")
+    return problems
+
+
+def open_snapshot(index_dir: str, verify: bool = False, nprobe: Optional[int] = None):
+    """
+    Open a snapshot read-only with the index class recorded in its manifest.
+
+    Args:
+        index_dir: Snapshot directory
+        verify: Check all checksums first (reads every file once)
+        nprobe: IVF lists scanned per query (IVF snapshots only)
+
+    Returns:
+        FlatVectorIndex or IVFVectorIndex
+    """
+    from experts.tools.vector_index.flat_index import FlatVectorIndex
+    from experts.tools.vector_index.ivf_index import IVFVectorIndex
+
+    if verify:
+        problems = verify_snapshot(index_dir)
+        if problems:
+            raise ValueError(f"Corrupt snapshot {index_dir}: {'; '.join(problems)}")
+    if read_manifest(index_dir).get("index_type") == "ivf":
+        return IVFVectorIndex.open(index_dir, nprobe=nprobe)
+    return FlatVectorIndex.open(index_dir)
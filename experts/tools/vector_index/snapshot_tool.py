@@ -0,0 +1,159 @@
+"""Export, verify and import vector collection snapshots.
+
+Usage:
+    # Export every collection of a Chroma database to flat_index/<collection>
+    python -m experts.tools.vector_index.snapshot_tool export \\
+        --chroma-path experts/tools/similar_cases/chroma_db
+
+    # Check the checksums and measure the cold-start open time
+    python -m experts.tools.vector_index.snapshot_tool verify \\
+        experts/tools/similar_cases/flat_index/similar_vectors_gemini
+
+    # Restore a Chroma collection from a snapshot
+    python -m experts.tools.vector_index.snapshot_tool import \\
+        experts/tools/similar_cases/flat_index/similar_vectors_gemini \\
+        --chroma-path experts/tools/similar_cases/chroma_db
+"""
+
+import argparse
+import os
+import time
+from typing import List, Optional
+
+import chromadb
+from chromadb.config import Settings
+
+from experts.tools.vector_index.flat_index import default_index_path, export_collection
+from experts.tools.vector_index.sharding import SHARD_SEPARATOR, open_collection
+from experts.tools.vector_index.snapshot import (
+    DEFAULT_EMBEDDING_MODEL,
+    open_snapshot,
+    read_manifest,
+    verify_snapshot,
+)
+
+
+def import_snapshot(
+    index_dir: str,
+    chroma_path: str,
+    collection_name: Optional[str] = None,
+    batch_size: int = 1000,
+):
+    """
+    Restore a Chroma collection from a snapshot.
+
+    Args:
+        index_dir: Snapshot directory
+        chroma_path: Path of the target Chroma database
+        collection_name: Target collection; defaults to the snapshot's collection name
+        batch_size: Records added per request
+
+    Returns:
+        The created Chroma collection
+    """
+    index = open_snapshot(index_dir, verify=True)
+    manifest = read_manifest(index_dir)
+    client = chromadb.PersistentClient(path=chroma_path, settings=Settings())
+    collection = client.create_collection(
+        name=collection_name or index.name,
+        metadata={
+            "hnsw:space": index.space,
+            "embedding_model": manifest.get("embedding_model", DEFAULT_EMBEDDING_MODEL),
+            "embedding_dim": index.dim,
+        },
+    )
+    ids = index.table.column("id").to_pylist()
+    for offset in range(0, len(ids), batch_size):
+        batch = index.get(
+            ids=ids[offset : offset + batch_size],
+            include=["documents", "metadatas", "embeddings"],
+        )
+        collection.add(
+            ids=batch["ids"],
+            documents=batch["documents"],
+            metadatas=[metadata or None for metadata in batch["metadatas"]],
+            embeddings=batch["embeddings"],
+        )
+    print(f"✅ Imported {collection.count()} records into '{collection.name}' at {chroma_path}")
+    return collection
+
+
+def _logical_collection_names(client) -> List[str]:
+    """Collection names with the shards of a sharded collection reported once."""
+    names = set()
+    for collection in client.list_collections():
+        name = collection if isinstance(collection, str) else collection.name
+        base, separator, shard = name.rpartition(SHARD_SEPARATOR)
+        names.add(base if separator and shard.isalnum() else name)
+    return sorted(names)
+
+
+def export_snapshots(args):
+    """Export the requested (default: all) collections of a Chroma database."""
+    client = chromadb.PersistentClient(path=args.chroma_path, settings=Settings())
+    for name in args.collection or _logical_collection_names(client):
+        out_dir = (
+            os.path.join(args.out, name)
+            if args.out
+            else default_index_path(args.chroma_path, name)
+        )
+        export_collection(
+            open_collection(client, name),
+            out_dir,
+            dim=args.dim,
+            dtype=args.dtype,
+            embedding_model=args.embedding_model,
+        )
+
+
+def verify_snapshots(args):
+    """Verify checksums and report the cold-start open time of each snapshot."""
+    failed = False
+    for index_dir in args.snapshots:
+        problems = verify_snapshot(index_dir)
+        start = time.perf_counter()
+        index = open_snapshot(index_dir)
+        open_ms = (time.perf_counter() - start) * 1000
+        if problems:
+            failed = True
+            print(f"❌ {index_dir}: {'; '.join(problems)}")
+        else:
+            print(
+                f"✅ {index_dir}: {index.count()} vectors, dim {index.dim} ({index.dtype}), "
+                f"opened in {open_ms:.1f} ms"
+            )
+    if failed:
+        raise SystemExit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vector collection snapshots")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export = subparsers.add_parser("export", help="Chroma collections -> snapshots")
+    export.add_argument("--chroma-path", required=True)
+    export.add_argument("--collection", action="append", help="Collection to export (repeatable; default: all)")
+    export.add_argument("--out", default=None, help="Parent directory (default: flat_index next to chroma_db)")
+    export.add_argument("--dim", type=int, default=None)
+    export.add_argument("--dtype", default="float32", choices=["float32", "float16", "int8"])
+    export.add_argument("--embedding-model", default=None, help="Recorded in the manifest (default: from the collection)")
+    export.set_defaults(func=export_snapshots)
+
+    verify = subparsers.add_parser("verify", help="Check snapshot checksums and open time")
+    verify.add_argument("snapshots", nargs="+")
+    verify.set_defaults(func=verify_snapshots)
+
+    restore = subparsers.add_parser("import", help="Snapshot -> Chroma collection")
+    restore.add_argument("snapshot")
+    restore.add_argument("--chroma-path", required=True)
+    restore.add_argument("--collection", default=None)
+    restore.set_defaults(
+        func=lambda args: import_snapshot(args.snapshot, args.chroma_path, args.collection)
+    )
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,135 +1,440 @@
+import argparse
+import functools
 import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pymupdf
 import pymupdf4llm  # PyMuPDF
+import numpy as np
 from google import genai
+from google.genai import types
 from chromadb.config import Settings
 import chromadb
-from typing import List
+from typing import Any, Dict, List, Optional, Tuple
 from langchain.text_splitter import MarkdownTextSplitter
 
-splitter = MarkdownTextSplitter(chunk_size=2048, chunk_overlap=300)
+# HNSW parameter helpers shared with the retrievers (experts/tools/vector_index)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from experts.tools.vector_index.embedding_engine import FAILURES_FILE, EmbeddingEngine  # noqa: E402
+from experts.tools.vector_index.hnsw import add_hnsw_arguments, hnsw_metadata  # noqa: E402
+from experts.tools.vector_index.ingest_manifest import (  # noqa: E402
+    IngestManifest,
+    delete_ids,
+    manifest_path,
+)
+from experts.tools.vector_index.language import detect_language  # noqa: E402
+from experts.tools.vector_index.quantization import DEFAULT_EMBEDDING_DIM, normalize_embedding  # noqa: E402
+from experts.tools.vector_index.routing import SR_AREAS, sr_area  # noqa: E402
+from experts.tools.vector_index.sharding import (  # noqa: E402
+    SHARD_SEPARATOR,
+    open_collection,
+    shard_name,
+)
+from experts.tools.vector_index.snapshot import file_sha256  # noqa: E402
+from legal_vectors.legal_vectorizer.pipeline import run_pipeline  # noqa: E402
+from legal_vectors.legal_vectorizer.statute_chunker import (  # noqa: E402
+    STATUTE_CHUNKER_VERSION,
+    StatuteChunker,
+    parse_statute_filename,
+    statute_citation,
+)
+from legal_vectors.legal_vectorizer.text_cache import (  # noqa: E402
+    DEFAULT_CACHE_DIR,
+    load_text,
+    store_text,
+)
+
+COLLECTION_NAME = "pdf_vectors_gemini"
+CHROMA_DB_PATH = "./chroma_db"
+# Embedded batches of an unfinished run, re-used when it is restarted
+CHECKPOINT_DIR = "./embedding_checkpoint"
+
+CHUNK_SIZE = 2048
+CHUNK_OVERLAP = 300
+# "statute" splits on articles (statute_chunker.py), "markdown" is the generic splitter
+CHUNKERS = ("statute", "markdown")
+DEFAULT_CHUNKER = "statute"
+
+# Part of the text cache key: a new extractor version re-extracts every PDF
+EXTRACTOR_VERSION = f"pymupdf4llm-{getattr(pymupdf4llm, '__version__', 'unknown')}"
+
+
+@functools.lru_cache(maxsize=None)
+def get_splitter(chunk_size: int = CHUNK_SIZE, chunk_overlap: int = CHUNK_OVERLAP) -> MarkdownTextSplitter:
+    """Markdown splitter for the given chunk configuration (one per process)"""
+    return MarkdownTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
+
+@functools.lru_cache(maxsize=None)
+def get_statute_chunker(chunk_size: int = CHUNK_SIZE) -> StatuteChunker:
+    """Article-aware chunker for the given chunk size (one per process)"""
+    return StatuteChunker(max_chars=chunk_size)
+
+
+def chunk_text(text: str, chunker: str, chunk_size: int, chunk_overlap: int) -> List[Dict[str, str]]:
+    """
+    Chunk the Markdown of a statute
 
+    Returns:
+        List of {"text", "article", "heading"}; article and heading are empty
+        for the generic Markdown splitter
+    """
+    if not text:
+        return []
+    if chunker == "statute":
+        return get_statute_chunker(chunk_size).split(text)
+    return [
+        {"text": chunk, "article": "", "heading": ""}
+        for chunk in get_splitter(chunk_size, chunk_overlap).split_text(text)
+    ]
 
-def extract_text_from_pdf(pdf_path: str) -> str:
-    """Extract text from PDF using pymupdf4llm"""
-    try:
-        doc = pymupdf4llm.to_markdown(pdf_path)
-        return doc  # pymupdf4llm.to_markdown returns a string directly
-    except Exception as e:
-        print(f"Error extracting text from {pdf_path}: {e}")
-        return ""
 
+def extract_pdf(pdf_path: str, cache_dir: Optional[str] = DEFAULT_CACHE_DIR) -> Tuple[int, str]:
+    """
+    Page count and Markdown text of a PDF, served from the text cache when possible
+
+    Args:
+        pdf_path: Path of the PDF
+        cache_dir: Text cache root; None disables the cache
 
-def get_gemini_embeddings(texts: List[str]) -> List[List[float]]:
+    Returns:
+        Tuple of (page count, Markdown text); the text is empty if extraction failed
+    """
+    file_hash = file_sha256(pdf_path) if cache_dir else None
+    if cache_dir:
+        cached = load_text(cache_dir, file_hash, EXTRACTOR_VERSION)
+        if cached is not None:
+            return cached
+
+    with pymupdf.open(pdf_path) as doc:
+        pages = doc.page_count
+        try:
+            text = pymupdf4llm.to_markdown(doc)
+        except Exception as e:
+            # Failures are not cached, so the next run retries them
+            print(f"Error extracting text from {pdf_path}: {e}")
+            return pages, ""
+
+    if cache_dir:
+        store_text(cache_dir, file_hash, EXTRACTOR_VERSION, pages, text)
+    return pages, text
+
+
+def extract_and_chunk(
+    pdf_path: str,
+    data_folder: str,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    chunk_size: int = CHUNK_SIZE,
+    chunk_overlap: int = CHUNK_OVERLAP,
+    chunker: str = DEFAULT_CHUNKER,
+) -> Tuple[int, List[Dict[str, Any]]]:
     """
-    Generate embeddings using Google's Gemini embedding model
+    Extract and chunk one PDF (runs in a worker process of the pipeline)
+
+    Args:
+        pdf_path: Path of the PDF
+        data_folder: Root folder, used to build stable chunk ids
+        cache_dir: Text cache root; None disables the cache
+        chunk_size: Maximum chunk length in characters
+        chunk_overlap: Characters shared by consecutive chunks (markdown chunker only)
+        chunker: "statute" (article-aware) or "markdown"
+
+    Returns:
+        Tuple of (page count, chunk records with id, document and metadata)
     """
-    embeddings = []
+    pages, text = extract_pdf(pdf_path, cache_dir)
+
+    filename = os.path.basename(pdf_path)
+    statute = parse_statute_filename(filename)
+    # Fedlex file names carry the language; detect it for other PDFs
+    language = statute["language"] or detect_language(text[:20000])[0] or ""
+    records = []
+    for i, chunk in enumerate(chunk_text(text, chunker, chunk_size, chunk_overlap)):
+        records.append(
+            {
+                "id": f"{os.path.relpath(pdf_path, data_folder)}_{i}",
+                "document": chunk["text"],
+                "metadata": {
+                    "source": pdf_path,
+                    "chunk_index": i,
+                    "filename": filename,
+                    "chunk_size": len(chunk["text"]),
+                    "sr_number": statute["sr_number"],
+                    "sr_area": sr_area(statute["sr_number"]),
+                    "language": language,
+                    "article": chunk["article"],
+                    "heading": chunk["heading"],
+                    "citation": statute_citation(statute["sr_number"], chunk["article"]) or filename,
+                },
+            }
+        )
+    return pages, records
 
-    # Process texts in batches to avoid API limits
-    batch_size = 100  # Adjust based on API limits
 
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i : i + batch_size]
-        try:
-            # Generate embeddings for the batch
+def find_pdfs(data_folder: str) -> List[str]:
+    """All PDFs below a folder, in a stable order"""
+    pdf_paths = []
+    for root, dirs, files in os.walk(data_folder):
+        pdf_paths.extend(os.path.join(root, f) for f in files if f.lower().endswith(".pdf"))
+    return sorted(pdf_paths)
 
-            client = genai.Client()
 
-            result = client.models.embed_content(
-                model="gemini-embedding-001", contents=batch
-            )
+# Output dimension of the stored embeddings (Matryoshka truncation, see
+# experts.tools.vector_index.quantization); retrievers read it from the collection metadata
+EMBEDDING_DIM = int(os.environ.get("EMBEDDING_DIM", DEFAULT_EMBEDDING_DIM))
 
-            embeddings.extend([embedding.values for embedding in result.embeddings])
-            print(f"✅ Generated embeddings for batch {i // batch_size + 1}")
 
-        except Exception as e:
-            print(
-                f"❌ Error generating embeddings for batch {i // batch_size + 1}: {e}"
-            )
-            # Add zero embeddings as fallback
-            fallback_embedding = [0.0] * 768  # Default embedding dimension
-            embeddings.extend([fallback_embedding] * len(batch))
+def ingest_config(
+    chunk_size: int = CHUNK_SIZE, chunk_overlap: int = CHUNK_OVERLAP, chunker: str = DEFAULT_CHUNKER
+) -> Dict[str, Any]:
+    """Settings that shape the stored vectors; changing any of them forces a full rebuild"""
+    if chunker == "statute":
+        splitter = f"{StatuteChunker.__name__}-{STATUTE_CHUNKER_VERSION}"
+        chunk_overlap = 0
+    else:
+        splitter = MarkdownTextSplitter.__name__
+    return {
+        "extractor": EXTRACTOR_VERSION,
+        "splitter": splitter,
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "embedding_model": "gemini-embedding-001",
+        "embedding_dim": EMBEDDING_DIM,
+        "shards": "sr_area",
+    }
+
+
+def area_of_file(filename: str) -> str:
+    """SR area shard of a statute PDF ("" for files without an SR number)"""
+    return sr_area(parse_statute_filename(os.path.basename(filename))["sr_number"])
+
 
-    return embeddings
+def stored_collections(client) -> List[str]:
+    """Names of the collection and its area shards currently in the database"""
+    names = [getattr(collection, "name", collection) for collection in client.list_collections()]
+    return [
+        name for name in names if name == COLLECTION_NAME or name.startswith(f"{COLLECTION_NAME}{SHARD_SEPARATOR}")
+    ]
 
 
-def generate_vector_store(data_folder: str = "../../data/selected_swiss_law"):
+class AreaShards:
+    """
+    Area shard collections of the statute store, opened or created on first use.
+    """
+
+    def __init__(self, client, hnsw_params: Optional[dict] = None):
+        self.client = client
+        self.hnsw_params = hnsw_params
+        self.collections: Dict[str, Any] = {}
+
+    def get(self, area: str):
+        """Shard of an SR area (PDFs without an SR number go to shard "x")"""
+        area = area or "x"
+        if area not in self.collections:
+            name = shard_name(COLLECTION_NAME, area)
+            try:
+                self.collections[area] = self.client.get_collection(name=name)
+            except Exception:
+                self.collections[area] = self.client.create_collection(
+                    name=name,
+                    metadata={
+                        "description": f"PDF vectors using Gemini embeddings, SR area {area}: {SR_AREAS.get(area, 'no SR number')}",
+                        "embedding_dim": EMBEDDING_DIM,
+                        "shard": area,
+                        **hnsw_metadata(**(self.hnsw_params or {})),
+                    },
+                )
+        return self.collections[area]
+
+
+def generate_vector_store(
+    data_folder: str = "../../data/selected_swiss_law",
+    hnsw_params: Optional[dict] = None,
+    workers: Optional[int] = None,
+    embed_workers: int = 4,
+    rebuild: bool = False,
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    chunk_size: int = CHUNK_SIZE,
+    chunk_overlap: int = CHUNK_OVERLAP,
+    requests_per_minute: Optional[float] = None,
+    chunker: str = DEFAULT_CHUNKER,
+):
     """
-    Generate vector store using Gemini embeddings
+    Generate or incrementally update the vector store using Gemini embeddings
+
+    PDFs are extracted and chunked by a process pool while batches of chunks
+    are embedded and written to Chroma in parallel stages (see pipeline.py).
+    Every SR area (first digit of the SR number) gets its own shard,
+    ``pdf_vectors_gemini_shard_<area>``, so queries can be routed to the areas
+    of a case category (see experts/tools/vector_index/routing.py).
+    A manifest next to the database records the content hash and chunk ids of
+    every PDF, so later runs only process new or changed PDFs and remove the
+    chunks of deleted ones.
+
+    Args:
+        data_folder: Folder searched recursively for PDFs
+        hnsw_params: HNSW index parameters (space, M, construction_ef, search_ef);
+            only applied when a shard is created
+        workers: Extraction processes; defaults to the number of cores
+        embed_workers: Concurrent embedding requests
+        requests_per_minute: Embedding API rate limit; None for no limit
+        rebuild: Drop the shards and re-index every PDF
+        cache_dir: Cache of extracted Markdown (see text_cache.py); None disables it
+        chunk_size: Maximum chunk length in characters
+        chunk_overlap: Characters shared by consecutive chunks (markdown chunker only)
+        chunker: "statute" (article chunks with SR number, article and language
+            metadata) or "markdown" (generic splitter with overlap)
     """
     # Initialize persistent ChromaDB client and collection
-    client = chromadb.PersistentClient(path="./chroma_db", settings=Settings())
+    client = chromadb.PersistentClient(path=CHROMA_DB_PATH, settings=Settings())
+    manifest = IngestManifest.load(
+        manifest_path(CHROMA_DB_PATH, COLLECTION_NAME), ingest_config(chunk_size, chunk_overlap, chunker)
+    )
 
-    # Delete existing collection if it exists to avoid conflicts
-    try:
-        client.delete_collection(name="pdf_vectors_gemini")
-    except:
-        pass
+    # Stores without a manifest predate the area shards and are rebuilt too
+    existing = stored_collections(client)
+    if rebuild or manifest.config_changed or not os.path.exists(manifest.path) or not existing:
+        if manifest.config_changed:
+            print("♻️  Chunker, embedding or shard settings changed, rebuilding the collection")
+        # Delete existing collections if they exist to avoid conflicts
+        for name in existing:
+            client.delete_collection(name=name)
+        manifest.clear()
+    shards = AreaShards(client, hnsw_params)
+
+    pdf_paths = {os.path.relpath(path, data_folder): path for path in find_pdfs(data_folder)}
+    hashes = {key: file_sha256(path) for key, path in pdf_paths.items()}
+    new, changed, removed = manifest.diff(hashes)
+    print(
+        f"📋 {len(pdf_paths)} PDFs: {len(new)} new, {len(changed)} changed, "
+        f"{len(removed)} removed, {len(pdf_paths) - len(new) - len(changed)} unchanged"
+    )
 
-    collection = client.create_collection(
-        name="pdf_vectors_gemini",
-        metadata={"description": "PDF vectors using Gemini embeddings"},
+    # Chunks of changed and deleted PDFs are removed before re-indexing
+    stale = 0
+    for key in changed + removed:
+        ids = manifest.ids([key])
+        if ids:
+            delete_ids(shards.get(area_of_file(key)), ids)
+            stale += len(ids)
+        manifest.remove(key)
+    if stale:
+        print(f"🗑️  Removed {stale} stale chunks")
+
+    engine = EmbeddingEngine(
+        dim=EMBEDDING_DIM,
+        max_in_flight=embed_workers,
+        requests_per_minute=requests_per_minute,
+        checkpoint_dir=os.path.join(CHECKPOINT_DIR, COLLECTION_NAME),
+    )
+    written_ids: Dict[str, List[str]] = {}
+
+    def write(records: List[Dict[str, Any]], embeddings: List[List[float]]):
+        # upsert: chunks of a run interrupted before the manifest was saved are overwritten
+        by_area: Dict[str, List[int]] = {}
+        for i, record in enumerate(records):
+            by_area.setdefault(record["metadata"]["sr_area"], []).append(i)
+        for area, rows in by_area.items():
+            shards.get(area).upsert(
+                ids=[records[i]["id"] for i in rows],
+                documents=[records[i]["document"] for i in rows],
+                metadatas=[records[i]["metadata"] for i in rows],
+                embeddings=[embeddings[i] for i in rows],
+            )
+        for record in records:
+            written_ids.setdefault(record["metadata"]["source"], []).append(record["id"])
+
+    stats = run_pipeline(
+        [pdf_paths[key] for key in sorted(new + changed)],
+        extract=functools.partial(
+            extract_and_chunk,
+            data_folder=data_folder,
+            cache_dir=cache_dir,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            chunker=chunker,
+        ),
+        embed=engine.embed,
+        write=write,
+        workers=workers,
+        embed_workers=embed_workers,
     )
 
-    total_chunks = 0
+    # Only PDFs whose chunks were all written are recorded; the others are retried next run
+    for key in new + changed:
+        path = pdf_paths[key]
+        ids = written_ids.get(path, [])
+        if path in stats.file_chunks and len(ids) == stats.file_chunks[path]:
+            manifest.update(key, hashes[key], sorted(ids))
+    manifest.save()
+
+    # Everything written is in the manifest now; failed chunks are retried next run
+    engine.close()
+    engine.clear_checkpoint()
+    print(f"📡 Embedding API: {engine.summary()}")
+    if engine.failures:
+        print(
+            f"⚠️  {len(engine.failures)} chunks could not be embedded and were skipped, see "
+            f"{os.path.join(engine.checkpoint_dir, FAILURES_FILE)}"
+        )
 
-    # Recursively traverse all subfolders
-    for root, dirs, files in os.walk(data_folder):
-        pdf_files = [f for f in files if f.lower().endswith(".pdf")]
-
-        for filename in pdf_files:
-            pdf_path = os.path.join(root, filename)
-            print(f"📄 Processing: {pdf_path}")
-
-            # Extract and chunk text
-            text = extract_text_from_pdf(pdf_path)
-            if not text:
-                print(f"⚠️  No text extracted from {pdf_path}")
-                continue
-
-            chunks = [doc for doc in splitter.split_text(text)]
-            print(f"📝 Created {len(chunks)} chunks from {filename}")
-
-            if not chunks:
-                print(f"⚠️  No chunks created from {pdf_path}")
-                continue
-
-            # Generate embeddings using Gemini
-            embeddings = get_gemini_embeddings(chunks)
-
-            # Add each chunk + its embedding to ChromaDB
-            doc_ids = []
-            documents = []
-            metadatas = []
-            embeddings_list = []
-
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                doc_id = f"{os.path.relpath(pdf_path, data_folder)}_{i}"
-                doc_ids.append(doc_id)
-                documents.append(chunk)
-                embeddings_list.append(embedding)
-                metadatas.append(
-                    {
-                        "source": pdf_path,
-                        "chunk_index": i,
-                        "filename": filename,
-                        "chunk_size": len(chunk),
-                    }
-                )
+    try:
+        collection = open_collection(client, COLLECTION_NAME)
+    except Exception:
+        print("⚠️  No PDFs were indexed")
+        return None
+    for area, shard in sorted(shards.collections.items()):
+        print(f"   Shard {area} ({SR_AREAS.get(area, 'no SR number')}): {shard.count()} chunks")
+    print(f"🎉 Total chunks processed: {stats.written} ({collection.count()} in the collection)")
+    return collection
 
-            # Batch add to ChromaDB
-            collection.add(
-                documents=documents,
-                embeddings=embeddings_list,
-                ids=doc_ids,
-                metadatas=metadatas,
-            )
 
-            total_chunks += len(chunks)
-            print(f"✅ Added {len(chunks)} chunks from {filename}")
+def rechunk_corpus(
+    data_folder: str = "../../data/selected_swiss_law",
+    cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+    chunk_size: int = CHUNK_SIZE,
+    chunk_overlap: int = CHUNK_OVERLAP,
+    workers: Optional[int] = None,
+    chunker: str = DEFAULT_CHUNKER,
+) -> Dict[str, float]:
+    """
+    Chunk the whole corpus without embedding it, for chunking experiments
 
-    print(f"🎉 Total chunks processed: {total_chunks}")
-    return collection
+    With a warm text cache no PDF is converted, so this takes seconds.
+
+    Returns:
+        Chunk statistics (files, chunks, mean and max chunk length, seconds)
+    """
+    pdf_paths = find_pdfs(data_folder)
+    extract = functools.partial(
+        extract_and_chunk,
+        data_folder=data_folder,
+        cache_dir=cache_dir,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        chunker=chunker,
+    )
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        lengths = [
+            record["metadata"]["chunk_size"]
+            for _, records in pool.map(extract, pdf_paths, chunksize=4)
+            for record in records
+        ]
+    stats = {
+        "files": len(pdf_paths),
+        "chunks": len(lengths),
+        "mean_chunk_size": float(np.mean(lengths)) if lengths else 0.0,
+        "max_chunk_size": max(lengths, default=0),
+        "seconds": time.perf_counter() - start,
+    }
+    print(
+        f"✂️  {chunker} chunker, chunk_size {chunk_size}, overlap {chunk_overlap}: {stats['chunks']} chunks from "
+        f"{stats['files']} PDFs (mean {stats['mean_chunk_size']:.0f}, max {stats['max_chunk_size']} chars) "
+        f"in {stats['seconds']:.1f}s"
+    )
+    return stats
 
 
 def query_gemini_embedding(
@@ -142,12 +447,14 @@ def query_gemini_embedding(
         client = genai.Client()
 
         result = client.models.embed_content(
-            model="gemini-embedding-001", contents=query_text
+            model="gemini-embedding-001",
+            contents=query_text,
+            config=types.EmbedContentConfig(output_dimensionality=EMBEDDING_DIM),
         )
-        return [embedding.values for embedding in result.embeddings][0]
+        return normalize_embedding(result.embeddings[0].values)
     except Exception as e:
         print(f"❌ Error generating query embedding: {e}")
-        return [0.0] * 768  # Fallback
+        return [0.0] * EMBEDDING_DIM  # Fallback
 
 
 def query(collection, query_text: str = None, n_results: int = 3):
@@ -175,6 +482,8 @@ def query(collection, query_text: str = None, n_results: int = 3):
 
         print(f"📄 Result {i + 1}")
         print(f"📁 Source: {metadata.get('filename', 'Unknown')}")
+        if metadata.get("citation"):
+            print(f"⚖️  Citation: {metadata['citation']}")
         print(f"🔢 Similarity Score: {1 - distance:.4f}")
         print(f"📏 Distance: {distance:.4f}")
         print(f"📝 Content Preview:\n{doc[:300]}...")
@@ -185,16 +494,82 @@ def main():
     """
     Main function to run the vectorization and query process
     """
+    parser = argparse.ArgumentParser(description="Vectorize the Swiss law PDFs")
+    parser.add_argument(
+        "--data-folder", default="../../data/selected_swiss_law", help="Folder searched recursively for PDFs"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Extraction processes (default: number of cores)"
+    )
+    parser.add_argument("--embed-workers", type=int, default=4, help="Concurrent embedding requests")
+    parser.add_argument(
+        "--requests-per-minute",
+        type=float,
+        default=float(os.environ.get("EMBEDDING_RPM", 0)) or None,
+        help="Embedding API rate limit (default: $EMBEDDING_RPM, unlimited if unset)",
+    )
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Re-index every PDF instead of only new or changed ones"
+    )
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument(
+        "--chunk-overlap", type=int, default=CHUNK_OVERLAP, help="Overlap of the markdown chunker"
+    )
+    parser.add_argument(
+        "--chunker",
+        choices=CHUNKERS,
+        default=DEFAULT_CHUNKER,
+        help="'statute' splits on articles (no overlap), 'markdown' is the generic splitter",
+    )
+    parser.add_argument(
+        "--text-cache", default=DEFAULT_CACHE_DIR, help="Cache of extracted Markdown ('' disables it)"
+    )
+    parser.add_argument(
+        "--chunk-only",
+        action="store_true",
+        help="Only chunk the corpus (from the text cache) and report chunk statistics",
+    )
+    add_hnsw_arguments(parser)
+    args = parser.parse_args()
+    cache_dir = args.text_cache or None
+
+    if args.chunk_only:
+        rechunk_corpus(
+            args.data_folder, cache_dir, args.chunk_size, args.chunk_overlap, args.workers, args.chunker
+        )
+        return
+
     # Check if API key is set
     if not os.environ.get("GOOGLE_API_KEY"):
         print("❌ Please set your GOOGLE_API_KEY environment variable")
         print("   export GOOGLE_API_KEY='your_api_key_here'")
         return
 
+    hnsw_params = {
+        "space": args.space,
+        "M": args.M,
+        "construction_ef": args.construction_ef,
+        "search_ef": args.search_ef,
+    }
+
     print("🚀 Starting PDF vectorization with Gemini embeddings...")
 
     # Generate vector store
-    collection = generate_vector_store()
+    collection = generate_vector_store(
+        data_folder=args.data_folder,
+        hnsw_params=hnsw_params,
+        workers=args.workers,
+        embed_workers=args.embed_workers,
+        rebuild=args.rebuild,
+        cache_dir=cache_dir,
+        chunk_size=args.chunk_size,
+        chunk_overlap=args.chunk_overlap,
+        requests_per_minute=args.requests_per_minute,
+        chunker=args.chunker,
+    )
+
+    if collection is None:
+        return
 
     # Query the collection
     query(collection)
@@ -0,0 +1,185 @@
+"""Staged ingestion pipeline for the Swiss law PDFs.
+
+Three stages run concurrently and are connected by bounded queues:
+
+1. extract: a process pool converts PDFs to Markdown and chunks them
+   (CPU-bound, one process per core)
+2. embed: a few threads send batches of chunks to the embedding API
+   (network-bound)
+3. write: a single thread adds the embedded batches to Chroma
+
+While the API embeds one batch, the pool keeps extracting the next files and
+the writer stores the previous batch. The bounded queues keep memory flat when
+one stage is slower than the others.
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# One extracted chunk: id, document text and Chroma metadata
+Record = Dict[str, Any]
+
+# Marks the end of a queue
+_DONE = None
+
+
+class PipelineStats:
+    """Thread-safe throughput counters of a pipeline run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.files = 0
+        self.failed_files = 0
+        self.pages = 0
+        self.chunks = 0
+        self.embeddings = 0
+        self.failed_embeddings = 0
+        self.written = 0
+        # Chunks extracted per file, for callers tracking which files are complete
+        self.file_chunks: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def add(self, **counts: int):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def rates(self) -> Dict[str, float]:
+        """Pages, chunks and embeddings per second since the start."""
+        elapsed = max(self.elapsed, 1e-9)
+        return {
+            "pages_per_s": self.pages / elapsed,
+            "chunks_per_s": self.chunks / elapsed,
+            "embeddings_per_s": self.embeddings / elapsed,
+        }
+
+    def summary(self) -> str:
+        rates = self.rates()
+        return (
+            f"{self.files} files, {self.pages} pages, {self.chunks} chunks, "
+            f"{self.written} written, {self.failed_embeddings} failed in {self.elapsed:.1f}s "
+            f"({rates['pages_per_s']:.1f} pages/s, {rates['chunks_per_s']:.1f} chunks/s, "
+            f"{rates['embeddings_per_s']:.1f} embeddings/s)"
+        )
+
+
+def run_pipeline(
+    paths: Sequence[str],
+    extract: Callable[[str], Tuple[int, List[Record]]],
+    embed: Callable[[List[str]], List[List[float]]],
+    write: Callable[[List[Record], List[List[float]]], None],
+    workers: Optional[int] = None,
+    embed_workers: int = 2,
+    batch_size: int = 100,
+    queue_size: int = 8,
+) -> PipelineStats:
+    """
+    Extract, embed and write a set of files with overlapping stages.
+
+    Args:
+        paths: Files to ingest
+        extract: Picklable function returning (page count, records) for one file;
+            runs in a worker process
+        embed: Function embedding a list of texts (one batch); None marks a failed
+            text, whose record is not written
+        write: Function storing a batch of records with their embeddings
+        workers: Extraction processes; defaults to the number of cores
+        embed_workers: Concurrent embedding requests
+        batch_size: Chunks per embedding request / write
+        queue_size: Batches buffered between two stages
+
+    Returns:
+        PipelineStats of the run
+    """
+    stats = PipelineStats()
+    embed_queue: "queue.Queue[Optional[List[Record]]]" = queue.Queue(maxsize=queue_size)
+    write_queue: "queue.Queue[Optional[Tuple[List[Record], List[List[float]]]]]" = queue.Queue(
+        maxsize=queue_size
+    )
+
+    def embed_stage():
+        while True:
+            batch = embed_queue.get()
+            if batch is _DONE:
+                break
+            try:
+                embeddings = embed([record["document"] for record in batch])
+            except Exception as e:
+                print(f"❌ Error embedding batch of {len(batch)} chunks: {e}")
+                stats.add(failed_embeddings=len(batch))
+                continue
+            embedded = [(record, emb) for record, emb in zip(batch, embeddings) if emb is not None]
+            stats.add(embeddings=len(embedded), failed_embeddings=len(batch) - len(embedded))
+            if embedded:
+                write_queue.put(([record for record, _ in embedded], [emb for _, emb in embedded]))
+
+    def write_stage():
+        while True:
+            item = write_queue.get()
+            if item is _DONE:
+                break
+            batch, embeddings = item
+            try:
+                write(batch, embeddings)
+                stats.add(written=len(batch))
+            except Exception as e:
+                print(f"❌ Error writing batch of {len(batch)} chunks: {e}")
+
+    embed_threads = [
+        threading.Thread(target=embed_stage, name=f"embed-{i}", daemon=True)
+        for i in range(max(1, embed_workers))
+    ]
+    writer = threading.Thread(target=write_stage, name="write", daemon=True)
+    for thread in embed_threads + [writer]:
+        thread.start()
+
+    workers = workers or os.cpu_count() or 1
+    print(f"🚀 Extracting {len(paths)} files with {workers} processes, {len(embed_threads)} embedding threads")
+
+    pending: List[Record] = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(extract, path): path for path in paths}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    pages, records = future.result()
+                except Exception as e:
+                    print(f"❌ Error extracting {path}: {e}")
+                    stats.add(failed_files=1)
+                    continue
+
+                stats.add(files=1, pages=pages, chunks=len(records))
+                stats.file_chunks[path] = len(records)
+                if not records:
+                    print(f"⚠️  No chunks created from {path}")
+                    continue
+                print(
+                    f"📄 [{stats.files}/{len(paths)}] {os.path.basename(path)}: "
+                    f"{pages} pages, {len(records)} chunks"
+                )
+
+                pending.extend(records)
+                while len(pending) >= batch_size:
+                    embed_queue.put(pending[:batch_size])
+                    pending = pending[batch_size:]
+        if pending:
+            embed_queue.put(pending)
+    finally:
+        for _ in embed_threads:
+            embed_queue.put(_DONE)
+        for thread in embed_threads:
+            thread.join()
+        write_queue.put(_DONE)
+        writer.join()
+
+    print(f"📈 {stats.summary()}")
+    return stats
@@ -0,0 +1,229 @@
+"""Article-aware chunking of Swiss federal statutes (SR / Fedlex PDFs).
+
+A generic Markdown splitter cuts statutes at arbitrary character offsets and
+repeats the overlap in every chunk. Statutes have a natural unit instead: the
+article. ``StatuteChunker`` splits the extracted Markdown on "Art. N" lines and
+structural headings (Title, Chapter, Section, ...):
+
+- an article that fits ``max_chars`` becomes one chunk, without overlap
+- consecutive short articles under the same heading are merged
+  (``article`` "3-5")
+- a longer article is split on paragraph boundaries, and every part repeats
+  the article line ("Art. 336 ...") so it can be cited on its own
+- text before the first article (title, preamble) is chunked by paragraphs
+
+Every chunk carries its article number and the nearest heading; the SR number
+and language come from the Fedlex file name (``SR-220-01012024-EN.pdf``).
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# Bump when the chunking rules change; part of the ingest configuration
+STATUTE_CHUNKER_VERSION = 1
+
+MAX_CHARS = 2048
+# Articles shorter than this are merged with the previous article
+MERGE_BELOW = 400
+# Article and heading lines are short; longer lines are running text
+MAX_HEADER_CHARS = 200
+
+_MARKUP = r"[#>*_\s]*"
+_ARTICLE_NUMBER = (
+    r"\d+[a-z]?(?:\s?(?:bis|ter|quater|quinquies|sexies|septies|octies|novies|nonies|decies))?"
+)
+ARTICLE_RE = re.compile(
+    rf"^{_MARKUP}Art\.?\s*(?P<article>{_ARTICLE_NUMBER}(?:\s*[-–]\s*{_ARTICLE_NUMBER})?)\b(?!\.\d)",
+    re.IGNORECASE,
+)
+HEADING_RE = re.compile(
+    rf"^(?:#{{1,6}}\s+\S|{_MARKUP}(?:Title|Chapter|Section|Part|Division|Titel|Kapitel|Abschnitt|Teil|"
+    r"Titre|Chapitre|Partie|Titolo|Capitolo|Sezione|Parte)\s+\w)",
+    re.IGNORECASE,
+)
+FILENAME_RE = re.compile(r"^SR-(?P<sr_number>\d+(?:\.\d+)*)-(?P<version>\d{8})-(?P<language>[A-Z]{2})\b", re.IGNORECASE)
+
+
+def parse_statute_filename(filename: str) -> Dict[str, str]:
+    """
+    SR number, version date and language of a Fedlex file name
+
+    Args:
+        filename: e.g. ``SR-220-01012024-EN.pdf``
+
+    Returns:
+        Dictionary with sr_number ("220"), version ("01012024") and language ("en");
+        empty strings if the name does not follow the Fedlex pattern
+    """
+    match = FILENAME_RE.match(filename)
+    if not match:
+        return {"sr_number": "", "version": "", "language": ""}
+    return {
+        "sr_number": match["sr_number"],
+        "version": match["version"],
+        "language": match["language"].lower(),
+    }
+
+
+def statute_citation(sr_number: str, article: str) -> str:
+    """Human-readable citation of a chunk, e.g. ``SR 220 Art. 336``"""
+    citation = f"SR {sr_number}" if sr_number else ""
+    if article:
+        citation = f"{citation} Art. {article}".strip()
+    return citation
+
+
+def _clean_header(line: str) -> str:
+    return re.sub(r"[#*_]+", "", line).strip()
+
+
+def _split_long(text: str, max_chars: int) -> List[str]:
+    """Split one paragraph longer than ``max_chars`` at sentence ends, then at spaces"""
+    parts, current = [], ""
+    for sentence in re.split(r"(?<=[.;:])\s+", text):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            parts.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        parts.append(current)
+    return parts
+
+
+def pack_paragraphs(text: str, max_chars: int, prefix: str = "") -> List[str]:
+    """
+    Greedily pack the paragraphs of a text into chunks of at most ``max_chars``
+
+    Args:
+        text: Text whose paragraphs are separated by blank lines
+        max_chars: Maximum chunk length, including the prefix
+        prefix: Line put at the start of every chunk (the article line)
+
+    Returns:
+        List of chunks, without overlap
+    """
+    budget = max(max_chars - len(prefix) - 2, max_chars // 2)
+    paragraphs = []
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if paragraph:
+            paragraphs.extend(_split_long(paragraph, budget) if len(paragraph) > budget else [paragraph])
+
+    chunks, current = [], ""
+    for paragraph in paragraphs:
+        if current and len(current) + 2 + len(paragraph) > budget:
+            chunks.append(current)
+            current = paragraph
+        else:
+            current = f"{current}\n\n{paragraph}" if current else paragraph
+    if current:
+        chunks.append(current)
+    if prefix:
+        chunks = [f"{prefix}\n\n{chunk}" for chunk in chunks]
+    return chunks
+
+
+class StatuteChunker:
+    """
+    Splits the Markdown of a statute into article chunks.
+    """
+
+    def __init__(self, max_chars: int = MAX_CHARS, merge_below: int = MERGE_BELOW):
+        """
+        Initialize the chunker
+
+        Args:
+            max_chars: Maximum chunk length in characters
+            merge_below: Articles shorter than this are merged with the previous
+                article under the same heading (0 disables merging)
+        """
+        self.max_chars = max_chars
+        self.merge_below = merge_below
+
+    def sections(self, text: str) -> List[Dict[str, str]]:
+        """
+        Split a statute into its articles
+
+        Returns:
+            List of {"article", "heading", "text"}; text before the first
+            article has an empty article number
+        """
+        sections = []
+        heading = ""
+        current: Dict = {"article": "", "heading": "", "lines": []}
+
+        def close():
+            body = "\n".join(current["lines"]).strip()
+            if body:
+                sections.append({"article": current["article"], "heading": current["heading"], "text": body})
+
+        for line in text.splitlines():
+            stripped = line.strip()
+            if len(stripped) <= MAX_HEADER_CHARS:
+                article = ARTICLE_RE.match(stripped)
+                if article:
+                    close()
+                    number = re.sub(r"\s+", " ", article["article"]).replace("–", "-")
+                    current = {"article": number, "heading": heading, "lines": [_clean_header(stripped)]}
+                    continue
+                if stripped and HEADING_RE.match(stripped):
+                    close()
+                    heading = _clean_header(stripped)
+                    current = {"article": "", "heading": heading, "lines": []}
+                    continue
+            current["lines"].append(line)
+        close()
+        return sections
+
+    def split(self, text: str) -> List[Dict[str, str]]:
+        """
+        Chunk a statute
+
+        Args:
+            text: Markdown of the statute
+
+        Returns:
+            List of chunks {"article", "heading", "text"}, in document order
+        """
+        chunks: List[Dict[str, str]] = []
+        # Index of the last whole-article chunk that may still absorb short articles
+        open_chunk: Optional[int] = None
+        for section in self.sections(text):
+            body = section["text"]
+            if not section["article"]:
+                for part in pack_paragraphs(body, self.max_chars):
+                    chunks.append({"article": "", "heading": section["heading"], "text": part})
+                open_chunk = None
+                continue
+
+            if len(body) <= self.max_chars:
+                previous = chunks[open_chunk] if open_chunk is not None else None
+                if (
+                    previous is not None
+                    and len(body) < self.merge_below
+                    and previous["heading"] == section["heading"]
+                    and len(previous["text"]) + 2 + len(body) <= self.max_chars
+                ):
+                    first = previous["article"].split("-")[0]
+                    previous["article"] = f"{first}-{section['article'].split('-')[-1]}"
+                    previous["text"] = f"{previous['text']}\n\n{body}"
+                else:
+                    chunks.append({"article": section["article"], "heading": section["heading"], "text": body})
+                    open_chunk = len(chunks) - 1
+                continue
+
+            # Long article: paragraphs, each part headed by the article line
+            header, _, rest = body.partition("\n")
+            for part in pack_paragraphs(rest, self.max_chars, prefix=header):
+                chunks.append({"article": section["article"], "heading": section["heading"], "text": part})
+            open_chunk = None
+        return chunks
@@ -0,0 +1,74 @@
+"""On-disk cache of the Markdown extracted from the statute PDFs.
+
+PDF to Markdown conversion is by far the slowest step before embedding. The
+cache stores its output once per PDF content and extractor version, so
+chunking and embedding experiments (other chunk sizes, splitters, models)
+start from the cached text instead of re-running the extractor:
+
+```
+text_cache/
+└── 9f/
+    └── 9f2c...e1.pymupdf4llm-0.0.17.json.gz   # {"pages": 42, "text": "# ..."}
+```
+
+Entries are keyed by the SHA-256 of the PDF, so renamed or moved files hit the
+cache and changed files miss it. A new extractor version writes new entries;
+old ones can simply be deleted.
+"""
+
+import gzip
+import json
+import os
+import re
+from typing import Optional, Tuple
+
+DEFAULT_CACHE_DIR = "./text_cache"
+
+
+def cache_path(cache_dir: str, file_hash: str, extractor: str) -> str:
+    """Cache file of a PDF hash and extractor version."""
+    extractor = re.sub(r"[^A-Za-z0-9._-]", "_", extractor)
+    return os.path.join(cache_dir, file_hash[:2], f"{file_hash}.{extractor}.json.gz")
+
+
+def load_text(cache_dir: str, file_hash: str, extractor: str) -> Optional[Tuple[int, str]]:
+    """
+    Cached extraction of a PDF.
+
+    Args:
+        cache_dir: Cache root
+        file_hash: SHA-256 of the PDF
+        extractor: Extractor name and version
+
+    Returns:
+        Tuple of (page count, Markdown text), or None on a cache miss
+    """
+    path = cache_path(cache_dir, file_hash, extractor)
+    if not os.path.exists(path):
+        return None
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            entry = json.load(f)
+        return entry["pages"], entry["text"]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️  Ignoring corrupt text cache entry {path}: {e}")
+        return None
+
+
+def store_text(cache_dir: str, file_hash: str, extractor: str, pages: int, text: str) -> str:
+    """
+    Store the extraction of a PDF.
+
+    The entry is written to a temporary file and renamed, so concurrent workers
+    and interrupted runs never leave a partial entry.
+
+    Returns:
+        Path of the cache entry
+    """
+    path = cache_path(cache_dir, file_hash, extractor)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+        json.dump({"pages": pages, "text": text}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,168 @@
+import argparse
+import json
+import os
+import sys
+from datetime import date
+from typing import Optional
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from experts.tools.estimators.case_keywords import label_case  # noqa: E402
+from experts.tools.estimators.outcome_stats import (  # noqa: E402
+    ALL,
+    LEVELS,
+    OUTCOME_STATS_PATH,
+    OUTCOME_STATS_VERSION,
+    WIN_OUTCOMES,
+    Z_95,
+    wilson_interval,
+)
+from legal_vectors.similar_cases_vectorizer.generate_vector_store import (  # noqa: E402
+    EMAIL_COLUMN,
+    _first_column,
+    iter_email_batches,
+    load_case_metadata,
+    normalize_case_fields,
+)
+
+
+def label_cases(data_folder: str, batch_size: int = 2000) -> pd.DataFrame:
+    """
+    Category and subcategory of every case with an email
+
+    The emails are streamed and labeled with the keyword matcher the agent
+    uses for live cases (experts/tools/estimators/case_keywords.py).
+
+    Returns:
+        DataFrame with the columns docref, category and subcategory
+    """
+    frames = []
+    for batch in iter_email_batches(data_folder, columns=["docref", EMAIL_COLUMN], batch_size=batch_size):
+        df = batch.to_pandas()
+        labels = [label_case(str(text)) for text in df[EMAIL_COLUMN]]
+        frames.append(
+            pd.DataFrame(
+                {
+                    "docref": df["docref"],
+                    "category": [category for category, _ in labels],
+                    "subcategory": [subcategory for _, subcategory in labels],
+                }
+            )
+        )
+    if not frames:
+        return pd.DataFrame(columns=["docref", "category", "subcategory"])
+    return pd.concat(frames, ignore_index=True).drop_duplicates("docref", keep="last")
+
+
+def build_case_table(data_folder: str, path_base_df: str, batch_size: int = 2000) -> pd.DataFrame:
+    """
+    One row per case with its category, subcategory, court, year and outcome
+
+    Category and subcategory columns of the data take precedence over the
+    labels derived from the emails; court and year are normalized as for the
+    similar cases index.
+    """
+    metadata = load_case_metadata(data_folder, path_base_df).drop_duplicates("docref", keep="last")
+    fields = normalize_case_fields(metadata)
+    cases = pd.DataFrame(
+        {
+            "docref": metadata["docref"].astype(str),
+            "category": _first_column(metadata, "category"),
+            "subcategory": _first_column(metadata, "subcategory"),
+            "court": fields["court"],
+            "year": fields["year"],
+            "outcome": fields["outcome"],
+        }
+    )
+    labels = label_cases(data_folder, batch_size).set_index("docref")
+    for column in ("category", "subcategory"):
+        derived = cases["docref"].map(labels[column]).fillna("")
+        cases[column] = cases[column].where(cases[column] != "", derived)
+    return cases
+
+
+def compute_outcome_stats(cases: pd.DataFrame, z: float = Z_95) -> pd.DataFrame:
+    """
+    Win rates per category, subcategory, court and year
+
+    Cases without an outcome are ignored. Besides the full groups, every
+    prefix of the grouping (category; category and subcategory; ... ) is
+    aggregated, with "*" in the aggregated dimensions, so lookups can back off
+    to broader groups.
+
+    Args:
+        cases: DataFrame with the columns category, subcategory, court, year and outcome
+        z: Standard normal quantile of the confidence intervals
+
+    Returns:
+        DataFrame with the columns category, subcategory, court, year, cases,
+        wins, rate, ci_low and ci_high
+    """
+    outcome = cases["outcome"].astype(str).str.strip().str.lower()
+    decided = cases.assign(
+        year=cases["year"].astype(str),
+        win=outcome.isin(WIN_OUTCOMES),
+    )[(outcome != "") & (outcome != "nan") & (cases["category"].astype(str) != "")]
+
+    tables = []
+    for depth in range(1, len(LEVELS) + 1):
+        keys = list(LEVELS[:depth])
+        table = decided.groupby(keys, sort=True)["win"].agg(cases="size", wins="sum").reset_index()
+        for level in LEVELS[depth:]:
+            table[level] = ALL
+        tables.append(table[[*LEVELS, "cases", "wins"]])
+    stats = pd.concat(tables, ignore_index=True)
+
+    stats["wins"] = stats["wins"].astype(int)
+    stats["rate"] = stats["wins"] / stats["cases"]
+    stats["ci_low"], stats["ci_high"] = wilson_interval(stats["wins"].to_numpy(), stats["cases"].to_numpy(), z)
+    return stats
+
+
+def write_outcome_stats(stats: pd.DataFrame, path: str = OUTCOME_STATS_PATH, source: Optional[str] = None, z: float = Z_95):
+    """
+    Write the statistics as compact JSON (one row per group) for outcome_stats.load_outcome_stats
+    """
+    rows = [
+        [category, subcategory, court, str(year), int(cases), int(wins), round(rate, 4), round(low, 4), round(high, 4)]
+        for category, subcategory, court, year, cases, wins, rate, low, high in stats[
+            [*LEVELS, "cases", "wins", "rate", "ci_low", "ci_high"]
+        ].itertuples(index=False)
+    ]
+    data = {
+        "version": OUTCOME_STATS_VERSION,
+        "generated": date.today().isoformat(),
+        "source": source or "",
+        "z": z,
+        "columns": [*LEVELS, "cases", "wins", "rate", "ci_low", "ci_high"],
+        "rows": rows,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+
+def main():
+    """
+    Compute the empirical outcome statistics of the BGer cases
+    """
+    parser = argparse.ArgumentParser(description="Compute win rates of the historic cases")
+    parser.add_argument("--data-folder", default="../../data/emails_federal_court/*.parquet")
+    parser.add_argument("--base-csv", default="../../data/bger-2024-3.csv")
+    parser.add_argument("--output", default=OUTCOME_STATS_PATH)
+    parser.add_argument("--batch-size", type=int, default=2000, help="Email rows per labeling batch")
+    args = parser.parse_args()
+
+    print("📊 Computing outcome statistics of the historic cases...")
+    cases = build_case_table(args.data_folder, args.base_csv, args.batch_size)
+    stats = compute_outcome_stats(cases)
+    write_outcome_stats(stats, args.output, source=os.path.basename(args.base_csv))
+
+    overall = stats[stats["subcategory"] == ALL]
+    for row in overall.itertuples(index=False):
+        print(f"   {row.category}: {row.rate:.1%} won of {row.cases} cases (95% CI {row.ci_low:.1%}–{row.ci_high:.1%})")
+    print(f"✅ {len(stats)} groups written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,68 +1,498 @@
+import argparse
+import glob
 import os
+import sys
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 from google import genai
+from google.genai import types
 from chromadb.config import Settings
 import chromadb
-from typing import List
-from tqdm import tqdm
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Shared shard naming with the retriever (experts/tools/vector_index)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from experts.tools.estimators.case_fields import (  # noqa: E402
+    CITATION_YEAR_PATTERNS,
+    COURT_BY_PREFIX,
+    DEFAULT_CASE_YEAR,
+    DEFAULT_COURT,
+    UNKNOWN_COURTS,
+)
+from experts.tools.vector_index.embedding_engine import FAILURES_FILE, EmbeddingEngine  # noqa: E402
+from experts.tools.vector_index.hnsw import add_hnsw_arguments, hnsw_metadata  # noqa: E402
+from experts.tools.vector_index.ingest_manifest import (  # noqa: E402
+    IngestManifest,
+    content_hash,
+    delete_ids,
+    manifest_path,
+    upsert_batches,
+)
+from experts.tools.vector_index.quantization import DEFAULT_EMBEDDING_DIM, normalize_embedding  # noqa: E402
+from experts.tools.vector_index.sharding import (  # noqa: E402
+    SHARD_SEPARATOR,
+    ShardedCollection,
+    shard_for,
+    shard_name,
+)
+
+COLLECTION_NAME = "similar_vectors_gemini"
+CHROMA_DB_PATH = "./chroma_db"
+# Embedded batches of an unfinished run, re-used when it is restarted
+CHECKPOINT_DIR = "./embedding_checkpoint"
+
+EMAIL_COLUMN = "email"
+# Records per Chroma upsert request
+UPSERT_BATCH_SIZE = 500
+# Bytes of CSV parsed per block while streaming the base table
+CSV_BLOCK_SIZE = 16 << 20
+
+
+# Output dimension of the stored embeddings (Matryoshka truncation, see
+# experts.tools.vector_index.quantization); retrievers read it from the collection metadata
+EMBEDDING_DIM = int(os.environ.get("EMBEDDING_DIM", DEFAULT_EMBEDDING_DIM))
+
+
+def create_embedding_engine(embed_workers: int = 4, requests_per_minute: Optional[float] = None) -> EmbeddingEngine:
+    """
+    Embedding engine of a vectorizer run
 
+    Embedded batches are checkpointed in ./embedding_checkpoint/similar_vectors_gemini,
+    so an interrupted run does not pay for them again.
 
-def get_gemini_embeddings(texts: List[str]) -> List[List[float]]:
+    Args:
+        embed_workers: Concurrent embedding requests
+        requests_per_minute: Embedding API rate limit; None for no limit
     """
-    Generate embeddings using Google's Gemini embedding model
+    return EmbeddingEngine(
+        dim=EMBEDDING_DIM,
+        max_in_flight=embed_workers,
+        requests_per_minute=requests_per_minute,
+        checkpoint_dir=os.path.join(CHECKPOINT_DIR, COLLECTION_NAME),
+    )
+
+
+def finish_embedding(engine: EmbeddingEngine):
+    """Drop the checkpoint once everything is stored and report skipped cases"""
+    engine.close()
+    engine.clear_checkpoint()
+    print(f"📡 Embedding API: {engine.summary()}")
+    if engine.failures:
+        print(
+            f"⚠️  {len(engine.failures)} cases could not be embedded and were skipped, see "
+            f"{os.path.join(engine.checkpoint_dir, FAILURES_FILE)}"
+        )
+
+
+def _first_column(df, *names: str):
+    """First of the given columns present in the frame, as stripped strings ("" for NaN)"""
+    for name in names:
+        if name in df.columns:
+            return df[name].astype(object).where(df[name].notna(), "").astype(str).str.strip()
+    return pd.Series("", index=df.index)
+
+
+def normalize_case_fields(df) -> pd.DataFrame:
     """
-    embeddings = []
+    Normalized court, year, citation and outcome of every case, computed once at ingest
 
-    # Process texts in batches to avoid API limits
-    batch_size = 100  # Adjust based on API limits
+    ``historic_cases`` builds its results from these fields directly:
 
-    for i in tqdm(range(0, len(texts), batch_size)):
-        batch = texts[i : i + batch_size]
-        try:
-            # Generate embeddings for the batch
-            client = genai.Client()
+    - court: the court column, else derived from the docref prefix (``4A_`` ...)
+    - year: the year column, else the year of the docref (``.../2016``), as int
+    - citation: the citation column, else the docref
+    - outcome: the outcome column
 
-            result = client.models.embed_content(
-                model="gemini-embedding-001", contents=batch
+    Returns:
+        DataFrame with the columns court, year, citation and outcome
+    """
+    docref = _first_column(df, "docref")
+    citation = _first_column(df, "citation", "Citation")
+    citation = citation.where(citation != "", docref)
+
+    court = _first_column(df, "court", "Court")
+    derived = citation.str[:3].map(COURT_BY_PREFIX).fillna(DEFAULT_COURT)
+    court = court.where(~court.isin(UNKNOWN_COURTS), derived)
+
+    year = pd.to_numeric(_first_column(df, "year", "Year"), errors="coerce")
+    for pattern in CITATION_YEAR_PATTERNS:
+        year = year.fillna(pd.to_numeric(citation.str.extract(pattern)[0], errors="coerce"))
+    year = year.fillna(DEFAULT_CASE_YEAR).astype(int)
+
+    return pd.DataFrame(
+        {"court": court, "year": year, "citation": citation, "outcome": _first_column(df, "outcome", "Outcome")},
+        index=df.index,
+    )
+
+
+def build_metadatas(df) -> List[dict]:
+    """
+    Create metadata from all columns except the email, as strings ("" for NaN),
+    with the normalized court, year (int), citation and outcome of the case
+    """
+    metadata = df.drop(columns=[EMAIL_COLUMN], errors="ignore").astype(object)
+    metadata = metadata.where(metadata.notna(), "").astype(str)
+    fields = normalize_case_fields(df)
+    metadata = metadata.drop(columns=[column for column in fields.columns if column in metadata.columns])
+    records = metadata.to_dict("records")
+    for record, court, year, citation, outcome in zip(
+        records, fields["court"], fields["year"].tolist(), fields["citation"], fields["outcome"]
+    ):
+        record.update(court=court, year=year, citation=citation, outcome=outcome)
+    return records
+
+
+def iter_email_batches(
+    data_folder: str, columns: Optional[List[str]] = None, batch_size: int = 2000
+) -> Iterator[pa.RecordBatch]:
+    """
+    Stream the generated email parquet files in record batches
+
+    Rows without an email are dropped and ``docref`` is read as a string.
+
+    Args:
+        data_folder: Glob of the parquet files
+        columns: Columns to read (must include the email column); None reads all
+        batch_size: Rows per batch
+    """
+    for path in sorted(glob.glob(data_folder)):
+        parquet = pq.ParquetFile(path)
+        for batch in parquet.iter_batches(batch_size=batch_size, columns=columns):
+            batch = batch.filter(pc.is_valid(batch.column(EMAIL_COLUMN)))
+            if batch.num_rows:
+                docref = batch.schema.get_field_index("docref")
+                yield batch.set_column(docref, "docref", pc.cast(batch.column(docref), pa.string()))
+
+
+def iter_csv_batches(path: str, block_size: int = CSV_BLOCK_SIZE) -> Iterator[pa.RecordBatch]:
+    """
+    Stream a CSV file in record batches with every column read as a string
+
+    Reading strings keeps the values as written in the file and avoids type
+    inference conflicts between blocks.
+    """
+    read_options = pv.ReadOptions(block_size=block_size)
+    names = pv.open_csv(path, read_options=read_options).schema.names
+    convert_options = pv.ConvertOptions(column_types={name: pa.string() for name in names})
+    with pv.open_csv(path, read_options=read_options, convert_options=convert_options) as reader:
+        for batch in reader:
+            yield batch
+
+
+def load_case_metadata(data_folder: str, path_base_df: str):
+    """
+    Metadata of every case with an email: the base CSV joined with the
+    non-email columns of the email files, without the email texts
+
+    Both inputs are streamed; only rows of cases that have an email are kept,
+    so memory grows with the number of indexed cases and not with the size of
+    the CSV or of the email texts.
+
+    Returns:
+        DataFrame in base CSV order, like ``pd.merge(df_base, df_emails)`` minus the email column
+    """
+    # The email texts are dropped batch by batch
+    email_side = [
+        batch.select([name for name in batch.schema.names if name != EMAIL_COLUMN])
+        for batch in iter_email_batches(data_folder)
+    ]
+    df_email_side = pa.Table.from_batches(email_side).to_pandas().drop_duplicates("docref", keep="last")
+    docrefs = pa.array(df_email_side["docref"], type=pa.string())
+
+    base = pa.Table.from_batches(
+        [
+            batch.filter(pc.is_in(batch.column("docref"), value_set=docrefs))
+            for batch in iter_csv_batches(path_base_df)
+        ]
+    )
+    return base.to_pandas().merge(df_email_side, on="docref", how="inner")
+
+
+def open_shards(client, num_shards: int, hnsw_params: Optional[dict], recreate: bool) -> Optional[List]:
+    """
+    Get the shard collections, or (re)create all of them
+
+    Returns None if ``recreate`` is False and a shard is missing.
+    """
+    if recreate:
+        # Shards left over from a run with more shards would still be queried
+        for collection in client.list_collections():
+            name = getattr(collection, "name", collection)
+            if name.startswith(f"{COLLECTION_NAME}{SHARD_SEPARATOR}"):
+                client.delete_collection(name=name)
+
+    collections = []
+    for shard in range(num_shards):
+        name = shard_name(COLLECTION_NAME, shard)
+        if not recreate:
+            try:
+                collections.append(client.get_collection(name=name))
+                continue
+            except Exception:
+                return None
+        # Delete existing shard if it exists to avoid conflicts
+        try:
+            client.delete_collection(name=name)
+        except Exception:
+            pass
+        collections.append(
+            client.create_collection(
+                name=name,
+                metadata={
+                    "description": "emails similar cases vectors using Gemini embeddings (full corpus)",
+                    "embedding_dim": EMBEDDING_DIM,
+                    "shard": shard,
+                    "num_shards": num_shards,
+                    **hnsw_metadata(**(hnsw_params or {})),
+                },
             )
+        )
+    return collections
 
-            embeddings.extend([embedding.values for embedding in result.embeddings])
-            # print(f"✅ Generated embeddings for batch {i//batch_size + 1}")
 
-        except Exception as e:
-            print(
-                f"❌ Error generating embeddings for batch {i // batch_size + 1}: {e}"
+def case_id(docref: str, email: str) -> str:
+    """
+    Stable id of a case: content hash of its docref and e-mail text
+
+    Identical across processes and runs (unlike ``hash``), so re-runs upsert
+    instead of duplicating, and a changed e-mail gets a new id.
+    """
+    return f"email_{content_hash(docref, email)[:32]}"
+
+
+class CaseIndexer:
+    """
+    Incrementally indexes batches of joined cases (metadata + email) into one
+    or more collections, using the ingest manifest to skip unchanged cases.
+    """
+
+    def __init__(
+        self,
+        collections: List,
+        collection_index: Callable[[str], int],
+        manifest: IngestManifest,
+        engine: EmbeddingEngine,
+        upsert_batch_size: int = UPSERT_BATCH_SIZE,
+    ):
+        """
+        Initialize the indexer
+
+        Args:
+            collections: Target Chroma collections
+            collection_index: Maps a docref to the index of its collection (its shard)
+            manifest: Ingest manifest of the collections
+            engine: Embedding engine
+            upsert_batch_size: Records per upsert request
+        """
+        self.collections = collections
+        self.collection_index = collection_index
+        self.manifest = manifest
+        self.engine = engine
+        self.upsert_batch_size = upsert_batch_size
+        self.seen = set()
+        # E-mail text hash -> docref of its first occurrence
+        self.texts: Dict[str, str] = {}
+        self.duplicates: List[tuple] = []
+        self.counts = {"cases": 0, "embedded": 0, "metadata_updates": 0, "failed": 0, "removed": 0}
+
+    def add(self, df):
+        """Index one batch of cases (columns: docref, email and the metadata columns)"""
+        docrefs = df["docref"].astype(str).tolist()
+        emails = df[EMAIL_COLUMN].astype(str).tolist()
+        metadatas = build_metadatas(df)
+        text_hashes = [content_hash(email) for email in emails]
+
+        # The same e-mail under another docref is indexed once
+        rows = []
+        for i, (docref, text_hash) in enumerate(zip(docrefs, text_hashes)):
+            first = self.texts.setdefault(text_hash, docref)
+            if first != docref:
+                self.duplicates.append((docref, first))
+                continue
+            rows.append(i)
+        self.seen.update(docrefs[i] for i in rows)
+        self.counts["cases"] += len(rows)
+
+        hashes = {i: content_hash(emails[i], metadatas[i]) for i in rows}
+        entries = {i: self.manifest.entries.get(docrefs[i], {}) for i in rows}
+        changed = [i for i in rows if entries[i].get("hash") != hashes[i]]
+
+        # Cases whose e-mail is unchanged only get their metadata updated
+        metadata_only = [i for i in changed if entries[i].get("text_hash") == text_hashes[i]]
+        for i in metadata_only:
+            ids = self.manifest.ids([docrefs[i]])
+            self.collections[self.collection_index(docrefs[i])].update(
+                ids=ids, metadatas=[metadatas[i]] * len(ids)
             )
-            # Add zero embeddings as fallback
-            fallback_embedding = [0.0] * 768  # Default embedding dimension
-            embeddings.extend([fallback_embedding] * len(batch))
+            self.manifest.update(docrefs[i], hashes[i], ids, text_hash=text_hashes[i])
+        self.counts["metadata_updates"] += len(metadata_only)
+
+        # Only new cases and cases with a changed e-mail are embedded
+        rows = [i for i in changed if entries[i].get("text_hash") != text_hashes[i]]
+        if rows:
+            embedded = self.engine.embed([emails[i] for i in rows])
+            # Failed cases stay out of the manifest and are retried next run
+            self.counts["failed"] += sum(embedding is None for embedding in embedded)
+            embeddings = {i: embedding for i, embedding in zip(rows, embedded) if embedding is not None}
+            rows = list(embeddings)
+            self._write(rows, docrefs, emails, metadatas, embeddings)
+            for i in rows:
+                self.manifest.update(
+                    docrefs[i], hashes[i], [case_id(docrefs[i], emails[i])], text_hash=text_hashes[i]
+                )
+            self.counts["embedded"] += len(rows)
+            if rows:
+                print(f"✅ Indexed {len(rows)} new or changed cases ({self.counts['cases']} cases seen)")
+
+        if metadata_only or rows:
+            self.manifest.save()
+
+    def _write(self, rows: List[int], docrefs, emails, metadatas, embeddings: Dict[int, List[float]]):
+        by_collection: Dict[int, List[int]] = {}
+        for i in rows:
+            by_collection.setdefault(self.collection_index(docrefs[i]), []).append(i)
+        for index, collection_rows in sorted(by_collection.items()):
+            collection = self.collections[index]
+            doc_ids = [case_id(docrefs[i], emails[i]) for i in collection_rows]
+            # Ids of the previous version of a changed case
+            stale_ids = [
+                old_id
+                for i, doc_id in zip(collection_rows, doc_ids)
+                for old_id in self.manifest.ids([docrefs[i]])
+                if old_id != doc_id
+            ]
+            if stale_ids:
+                delete_ids(collection, stale_ids)
+            upsert_batches(
+                collection,
+                ids=doc_ids,
+                embeddings=[embeddings[i] for i in collection_rows],
+                documents=[emails[i] for i in collection_rows],
+                metadatas=[metadatas[i] for i in collection_rows],
+                batch_size=self.upsert_batch_size,
+            )
+
+    def finish(self) -> Dict[str, int]:
+        """Remove cases that are no longer in the data, save the manifest and report"""
+        removed = [docref for docref in self.manifest.entries if docref not in self.seen]
+        for docref in removed:
+            delete_ids(self.collections[self.collection_index(docref)], self.manifest.ids([docref]))
+            self.manifest.remove(docref)
+        self.counts["removed"] = len(removed)
+        self.counts["duplicates"] = len(self.duplicates)
+        self.manifest.save()
+
+        if removed:
+            print(f"🗑️  Removed {len(removed)} cases no longer in the data")
+        if self.duplicates:
+            examples = ", ".join(f"{docref} = {first}" for docref, first in self.duplicates[:5])
+            print(f"⚠️  Skipped {len(self.duplicates)} duplicate e-mails (e.g. {examples})")
+        return self.counts
+
+
+def open_case_manifest(name: str, config: Dict, rebuild: bool):
+    """
+    Load the ingest manifest of a collection and decide whether to rebuild it
 
-    return embeddings
+    Collections without a manifest were built before incremental indexing and
+    use other ids, so they are rebuilt too.
 
+    Returns:
+        Tuple of (manifest, recreate)
+    """
+    path = manifest_path(CHROMA_DB_PATH, name)
+    manifest = IngestManifest.load(path, config)
+    if manifest.config_changed:
+        print("♻️  Embedding or shard settings changed, rebuilding")
+    recreate = rebuild or manifest.config_changed or not os.path.exists(path)
+    if recreate:
+        manifest.clear()
+    return manifest, recreate
 
-def generate_vector_store(
+
+def generate_sharded_vector_store(
     data_folder: str = "../../data/emails_federal_court/*.parquet",
     path_base_df: str = "../../data/bger-2024-3.csv",
+    num_shards: int = 8,
+    batch_size: int = 2000,
+    hnsw_params: Optional[dict] = None,
+    rebuild: bool = False,
+    embed_workers: int = 4,
+    requests_per_minute: Optional[float] = None,
 ):
     """
-    Generate vector store using Gemini embeddings
+    Index every case of the BGer join (no balancing, no sampling) into sharded collections
+
+    The email files are streamed in batches of ``batch_size`` rows; each batch is joined
+    with the case metadata (see ``load_case_metadata``), embedded and written before the
+    next one is read, so the email texts are never all in memory. Cases are assigned to
+    ``similar_vectors_gemini_shard_<k>`` by a stable hash of their docref.
+    ``hnsw_params`` (space, M, construction_ef, search_ef) apply to every shard when
+    the shards are created.
+
+    A manifest next to the database records a hash of every case (e-mail and
+    metadata), so later runs only embed new cases and cases with a changed e-mail,
+    update the metadata of the others in place and remove cases that are no
+    longer in the data. ``rebuild`` drops the shards and starts over.
+    Cases whose embedding fails are skipped and picked up again by the next run.
     """
-    # Initialize persistent ChromaDB client and collection
-    client = chromadb.PersistentClient(path="./chroma_db", settings=Settings())
-
-    import pandas as pd
-    import glob
+    client = chromadb.PersistentClient(path=CHROMA_DB_PATH, settings=Settings())
+    config = {"embedding_model": "gemini-embedding-001", "embedding_dim": EMBEDDING_DIM, "num_shards": num_shards}
+    manifest, recreate = open_case_manifest(COLLECTION_NAME, config, rebuild)
+
+    collections = None if recreate else open_shards(client, num_shards, hnsw_params, recreate=False)
+    if collections is None:
+        collections = open_shards(client, num_shards, hnsw_params, recreate=True)
+        manifest.clear()
+
+    df_metadata = load_case_metadata(data_folder, path_base_df).drop_duplicates("docref", keep="last")
+    engine = create_embedding_engine(embed_workers, requests_per_minute)
+    indexer = CaseIndexer(collections, lambda docref: shard_for(docref, num_shards), manifest, engine)
+
+    for batch in iter_email_batches(data_folder, columns=["docref", EMAIL_COLUMN], batch_size=batch_size):
+        df = batch.to_pandas().drop_duplicates(subset=["docref"], keep="last")
+        df = df.merge(df_metadata, on="docref", how="inner").reset_index(drop=True)
+        if not df.empty:
+            indexer.add(df)
+
+    counts = indexer.finish()
+    finish_embedding(engine)
+
+    print(
+        f"🎉 Total cases in {num_shards} shards: {counts['cases']} "
+        f"({counts['embedded']} embedded, {counts['metadata_updates']} metadata updates, "
+        f"{counts['failed']} failed, {counts['duplicates']} duplicates skipped)"
+    )
+    return ShardedCollection(collections, COLLECTION_NAME)
 
-    files = glob.glob(data_folder)
-    df_emails = pd.concat([pd.read_parquet(f) for f in files], ignore_index=True)
 
-    df_base = pd.read_csv(path_base_df)
+def generate_vector_store(
+    data_folder: str = "../../data/emails_federal_court/*.parquet",
+    path_base_df: str = "../../data/bger-2024-3.csv",
+    hnsw_params: Optional[dict] = None,
+    embed_workers: int = 4,
+    requests_per_minute: Optional[float] = None,
+    rebuild: bool = False,
+    batch_size: int = 2000,
+):
+    """
+    Generate vector store using Gemini embeddings
 
-    df = pd.merge(df_base, df_emails, on="docref", how="inner")
+    Indexes a balanced 10% sample of the cases. Like the sharded store it is
+    updated incrementally: cases already in the collection are kept, cases that
+    left the sample are removed.
 
-    # Drop rows where the 'email' column is empty
-    df.dropna(subset=["email"], inplace=True)
+    ``hnsw_params`` (space, M, construction_ef, search_ef) configure the HNSW index
+    when the collection is created
+    """
+    # Initialize persistent ChromaDB client and collection
+    client = chromadb.PersistentClient(path=CHROMA_DB_PATH, settings=Settings())
 
-    import pandas as pd
+    # Metadata of all cases with an email (streamed join, no email texts in memory)
+    df = load_case_metadata(data_folder, path_base_df)
 
     # First, find the number of samples in the smallest class
     min_count = df["outcome"].value_counts().min()
@@ -78,63 +508,52 @@ def generate_vector_store(
 
     df_balanced = df_balanced.sample(frac=0.1, random_state=42)
 
-    # Delete existing collection if it exists to avoid conflicts
-    try:
-        client.delete_collection(name="similar_vectors_gemini")
-    except:
-        pass
-
-    collection = client.create_collection(
-        name="similar_vectors_gemini",
-        metadata={
-            "description": "emails similar cases vectors using Gemini embeddings"
-        },
-    )
+    config = {"embedding_model": "gemini-embedding-001", "embedding_dim": EMBEDDING_DIM}
+    manifest, recreate = open_case_manifest(f"{COLLECTION_NAME}.sample", config, rebuild)
+    collection = None
+    if not recreate:
+        try:
+            collection = client.get_collection(name=COLLECTION_NAME)
+        except Exception:
+            manifest.clear()
+    if collection is None:
+        # Delete existing collection if it exists to avoid conflicts
+        try:
+            client.delete_collection(name=COLLECTION_NAME)
+        except:
+            pass
+
+        collection = client.create_collection(
+            name=COLLECTION_NAME,
+            metadata={
+                "description": "emails similar cases vectors using Gemini embeddings",
+                "embedding_dim": EMBEDDING_DIM,
+                **hnsw_metadata(**(hnsw_params or {})),
+            },
+        )
 
-    # TODO: Prepare emails from the 'email' column
-    emails_prepared = df_balanced["email"].astype(str).tolist()
-
-    embeddings = get_gemini_embeddings(emails_prepared)
-
-    doc_ids = []
-    documents = []
-    metadatas = []
-    embeddings_list = []
-
-    for i, (chunk, embedding) in enumerate(zip(emails_prepared, embeddings)):
-        # TODO: Create unique document ID
-        doc_id = f"email_{i}_{hash(chunk) % 1000000}"
-        doc_ids.append(doc_id)
-        documents.append(chunk)
-        embeddings_list.append(embedding)
-
-        # TODO: Create metadata from all other columns
-        row_metadata = {}
-        for col in df_balanced.columns:
-            if (
-                col != "email"
-            ):  # Exclude the email column since it's the document content
-                value = df_balanced.iloc[i][col]
-                # Convert to string and handle NaN values
-                if pd.isna(value):
-                    row_metadata[col] = ""
-                else:
-                    row_metadata[col] = str(value)
-
-        metadatas.append(row_metadata)
-
-    # Batch add to ChromaDB
-    collection.add(
-        documents=documents,
-        embeddings=embeddings_list,
-        ids=doc_ids,
-        metadatas=metadatas,
+    # Stream the email texts of the sampled cases only
+    sampled = pa.array(df_balanced["docref"], type=pa.string())
+    emails_by_docref = {}
+    for batch in iter_email_batches(data_folder, columns=["docref", EMAIL_COLUMN]):
+        batch = batch.filter(pc.is_in(batch.column("docref"), value_set=sampled))
+        emails_by_docref.update(zip(batch.column("docref").to_pylist(), batch.column(EMAIL_COLUMN).to_pylist()))
+    df_balanced = df_balanced.assign(
+        **{EMAIL_COLUMN: [str(emails_by_docref[docref]) for docref in df_balanced["docref"]]}
+    ).drop_duplicates(subset=["docref"], keep="last")
+
+    engine = create_embedding_engine(embed_workers, requests_per_minute)
+    indexer = CaseIndexer([collection], lambda docref: 0, manifest, engine)
+    for start in range(0, len(df_balanced), batch_size):
+        indexer.add(df_balanced.iloc[start : start + batch_size])
+    counts = indexer.finish()
+    finish_embedding(engine)
+
+    print(
+        f"🎉 Total cases in the sample: {counts['cases']} ({counts['embedded']} embedded, "
+        f"{counts['failed']} failed, {counts['duplicates']} duplicates skipped)"
     )
 
-    print(f"✅ Added {len(df_balanced)} chunks from {path_base_df}")
-
-    print(f"🎉 Total chunks processed: {len(df_balanced)}")
-
     return collection
 
 
@@ -148,12 +567,14 @@ def query_gemini_embedding(
         client = genai.Client()
 
         result = client.models.embed_content(
-            model="gemini-embedding-001", contents=query_text
+            model="gemini-embedding-001",
+            contents=query_text,
+            config=types.EmbedContentConfig(output_dimensionality=EMBEDDING_DIM),
         )
-        return [embedding.values for embedding in result.embeddings][0]
+        return normalize_embedding(result.embeddings[0].values)
     except Exception as e:
         print(f"❌ Error generating query embedding: {e}")
-        return [0.0] * 768  # Fallback
+        return [0.0] * EMBEDDING_DIM  # Fallback
 
 
 def query(collection, query_text: str = None, n_results: int = 3):
@@ -206,10 +627,54 @@ def main():
         print("   export GOOGLE_API_KEY='your_api_key_here'")
         return
 
+    parser = argparse.ArgumentParser(description="Vectorize the similar cases emails")
+    parser.add_argument(
+        "--full-corpus",
+        action="store_true",
+        help="Index all cases into sharded collections instead of a balanced 10%% sample",
+    )
+    parser.add_argument("--num-shards", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=2000, help="Email rows per ingestion batch")
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Re-index every case instead of only new or changed ones",
+    )
+    parser.add_argument("--embed-workers", type=int, default=4, help="Concurrent embedding requests")
+    parser.add_argument(
+        "--requests-per-minute",
+        type=float,
+        default=float(os.environ.get("EMBEDDING_RPM", 0)) or None,
+        help="Embedding API rate limit (default: $EMBEDDING_RPM, unlimited if unset)",
+    )
+    add_hnsw_arguments(parser)
+    args = parser.parse_args()
+    hnsw_params = {
+        "space": args.space,
+        "M": args.M,
+        "construction_ef": args.construction_ef,
+        "search_ef": args.search_ef,
+    }
+
     print("🚀 Starting df vectorization with Gemini embeddings...")
 
     # Generate vector store
-    collection = generate_vector_store()
+    if args.full_corpus:
+        collection = generate_sharded_vector_store(
+            num_shards=args.num_shards,
+            batch_size=args.batch_size,
+            hnsw_params=hnsw_params,
+            rebuild=args.rebuild,
+            embed_workers=args.embed_workers,
+            requests_per_minute=args.requests_per_minute,
+        )
+    else:
+        collection = generate_vector_store(
+            hnsw_params=hnsw_params,
+            rebuild=args.rebuild,
+            embed_workers=args.embed_workers,
+            requests_per_minute=args.requests_per_minute,
+        )
 
     # Query the collection
     query(collection)
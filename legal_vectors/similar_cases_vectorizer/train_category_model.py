@@ -0,0 +1,180 @@
+import argparse
+import os
+import sys
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from experts.tools.estimators.case_keywords import label_case  # noqa: E402
+from experts.tools.estimators.category_model import (  # noqa: E402
+    CATEGORIES,
+    CATEGORY_MODEL_PATH,
+    CategoryModel,
+    save_category_model,
+    softmax,
+)
+from experts.tools.vector_index.quantization import truncate_embeddings  # noqa: E402
+
+DEFAULT_DIM = 256
+# Claims types of the estimator spreadsheets -> category
+TABLE_CATEGORIES = {"employment_law": "Arbeitsrecht", "traffic_criminal_law": "Strafverkehrsrecht"}
+# Candidate softmax temperatures of the calibration
+SCALES = np.geomspace(1.0, 200.0, 60)
+# Top-two margin below which the agent asks the LLM classifier (reported in the metrics)
+REPORT_MARGIN = 0.3
+
+
+def load_case_examples(collection, dim: int = DEFAULT_DIM, batch_size: int = 5000) -> Tuple[np.ndarray, List[str]]:
+    """
+    Embeddings and categories of the historic cases
+
+    The category column of the case metadata is used where present, otherwise
+    the case text is labeled with the keyword matcher of the agent.
+
+    Returns:
+        Tuple of (embeddings (n, dim), categories)
+    """
+    features, labels = [], []
+    for offset in range(0, collection.count(), batch_size):
+        batch = collection.get(limit=batch_size, offset=offset, include=["embeddings", "metadatas", "documents"])
+        features.append(truncate_embeddings(batch["embeddings"], dim))
+        for metadata, document in zip(batch["metadatas"], batch["documents"]):
+            category = str((metadata or {}).get("category") or "")
+            labels.append(category if category in CATEGORIES else label_case(document or "")[0])
+    if not features:
+        return np.empty((0, dim), dtype=np.float32), []
+    return np.vstack(features), labels
+
+
+def load_table_examples(dim: int = DEFAULT_DIM) -> Tuple[np.ndarray, List[str]]:
+    """
+    Embeddings of the case titles of the estimator spreadsheets
+
+    Returns:
+        Tuple of (embeddings (n, dim), categories); empty if embedding fails
+    """
+    from experts.tools.estimators.tables import load_estimates
+    from legal_vectors.similar_cases_vectorizer.generate_vector_store import query_gemini_embedding
+
+    rows, labels = [], []
+    for estimate in load_estimates().values():
+        embedding = query_gemini_embedding(estimate.title)
+        if any(embedding) and len(embedding) >= dim:
+            rows.append(embedding)
+            labels.append(TABLE_CATEGORIES[estimate.claims_type])
+    if not rows:
+        return np.empty((0, dim), dtype=np.float32), []
+    return truncate_embeddings(rows, dim), labels
+
+
+def train_category_model(
+    features: np.ndarray,
+    labels: List[str],
+    weights: Optional[np.ndarray] = None,
+    seed: int = 42,
+    embedding_model: str = "gemini-embedding-001",
+) -> CategoryModel:
+    """
+    Fit category centroids and calibrate their softmax on held-out cases
+
+    80% of the cases give the (weighted) centroids and class priors, the
+    softmax temperature minimizing the log loss of the other 20% is kept.
+    Categories without examples get no centroid.
+
+    Args:
+        features: Unit-length embeddings (n, dim)
+        labels: Category of each embedding
+        weights: Optional weight of each embedding (e.g. spreadsheet examples)
+
+    Returns:
+        CategoryModel with held-out metrics
+    """
+    labels = np.asarray(labels)
+    weights = np.ones(len(labels)) if weights is None else np.asarray(weights, dtype=float)
+    categories = tuple(category for category in CATEGORIES if (labels == category).any())
+
+    rng = np.random.default_rng(seed)
+    held_out = rng.random(len(labels)) < 0.2
+    train = ~held_out
+
+    centroids, priors = [], []
+    for category in categories:
+        mask = train & (labels == category)
+        centroid = weights[mask] @ features[mask]
+        centroids.append(centroid / (np.linalg.norm(centroid) or 1.0))
+        priors.append(weights[mask].sum())
+    centroids = np.asarray(centroids, dtype=np.float32)
+    log_prior = np.log(np.asarray(priors) / np.sum(priors))
+
+    similarities = features[held_out] @ centroids.T
+    index = {category: i for i, category in enumerate(categories)}
+    targets = np.array([index[label] for label in labels[held_out]], dtype=int)
+    losses = [
+        -np.mean(np.log(softmax(scale * similarities + log_prior)[np.arange(len(targets)), targets] + 1e-12))
+        for scale in SCALES
+    ]
+    scale = float(SCALES[int(np.argmin(losses))])
+
+    probabilities = softmax(scale * similarities + log_prior)
+    ranked = np.sort(probabilities, axis=1)
+    confident = ranked[:, -1] - ranked[:, -2] >= REPORT_MARGIN if len(categories) > 1 else np.ones(len(targets), bool)
+    correct = probabilities.argmax(axis=1) == targets
+    metrics = {
+        "cases": int(len(labels)),
+        "categories": {category: int((labels == category).sum()) for category in categories},
+        "log_loss": round(float(min(losses)), 4),
+        "accuracy": round(float(correct.mean()), 4),
+        f"share_margin_{REPORT_MARGIN}": round(float(confident.mean()), 4),
+        f"accuracy_margin_{REPORT_MARGIN}": round(float(correct[confident].mean()), 4) if confident.any() else None,
+    }
+    return CategoryModel(categories, centroids, scale, log_prior, embedding_model, metrics)
+
+
+def main():
+    """
+    Train the embedding category classifier
+    """
+    parser = argparse.ArgumentParser(description="Train the embedding category classifier")
+    parser.add_argument("--chroma-path", default="../../experts/tools/similar_cases/chroma_db")
+    parser.add_argument("--collection", default="similar_vectors_gemini")
+    parser.add_argument("--index", default=None, help="Exported flat index directory (instead of Chroma)")
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM, help="Leading embedding dimensions used")
+    parser.add_argument("--table-weight", type=float, default=20.0, help="Weight of each spreadsheet case type")
+    parser.add_argument("--no-tables", action="store_true", help="Do not embed the spreadsheet case types")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--output", default=CATEGORY_MODEL_PATH)
+    args = parser.parse_args()
+
+    if args.index:
+        from experts.tools.vector_index import FlatVectorIndex
+
+        collection = FlatVectorIndex.open(args.index)
+    else:
+        import chromadb
+        from chromadb.config import Settings
+        from experts.tools.vector_index import open_collection
+
+        collection = open_collection(chromadb.PersistentClient(path=args.chroma_path, settings=Settings()), args.collection)
+
+    print(f"📊 Loading labeled case embeddings ({args.dim} dimensions)...")
+    features, labels = load_case_examples(collection, args.dim, args.batch_size)
+    weights = np.ones(len(labels))
+    if not args.no_tables:
+        table_features, table_labels = load_table_examples(args.dim)
+        print(f"   {len(table_labels)} spreadsheet case types (weight {args.table_weight:g})")
+        features = np.vstack([features, table_features])
+        labels = labels + table_labels
+        weights = np.concatenate([weights, np.full(len(table_labels), args.table_weight)])
+    if len(set(labels)) < 2:
+        print("❌ Need labeled cases of at least two categories to train")
+        return
+
+    model = train_category_model(features, labels, weights)
+    save_category_model(model, args.output)
+    print(f"   Held-out metrics: {model.metrics}")
+    print(f"✅ Model written to {args.output} ({os.path.getsize(args.output)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+import argparse
+import json
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from experts.tools.estimators.complexity import (  # noqa: E402
+    COMPLEXITY_LEVELS,
+    COMPLEXITY_MODEL_PATH,
+    COMPLEXITY_MODEL_VERSION,
+    FEATURE_NAMES,
+    complexity_features,
+)
+
+
+def train_complexity_model(cases: pd.DataFrame, c: float = 1.0) -> dict:
+    """
+    Fit logistic regressions of the complexity level (and appeals) on the text features
+
+    Args:
+        cases: DataFrame with the columns text and complexity (low/medium/high)
+            and optionally appeal_expected (bool)
+        c: Inverse regularization strength
+
+    Returns:
+        Model dictionary as written to complexity_model.json
+    """
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.preprocessing import StandardScaler
+
+    cases = cases[cases["complexity"].isin(COMPLEXITY_LEVELS)]
+    features = np.vstack([complexity_features(str(text))[0] for text in cases["text"]])
+    scaler = StandardScaler().fit(features)
+    # Constant features get scale 1 instead of 0
+    scale = np.where(scaler.scale_ > 0, scaler.scale_, 1.0)
+    scaled = (features - scaler.mean_) / scale
+
+    classifier = LogisticRegression(C=c, max_iter=1000).fit(scaled, cases["complexity"])
+    coef, intercept = classifier.coef_, classifier.intercept_
+    if len(classifier.classes_) == 2:
+        # Binary models have one row of coefficients for the second class
+        coef, intercept = np.vstack([-coef, coef]) / 2, np.array([-intercept[0], intercept[0]]) / 2
+
+    model = {
+        "version": COMPLEXITY_MODEL_VERSION,
+        "generated": date.today().isoformat(),
+        "features": list(FEATURE_NAMES),
+        "mean": scaler.mean_.tolist(),
+        "scale": scale.tolist(),
+        "classes": classifier.classes_.tolist(),
+        "coef": coef.tolist(),
+        "intercept": intercept.tolist(),
+    }
+
+    if "appeal_expected" in cases.columns and cases["appeal_expected"].nunique() == 2:
+        appeal = LogisticRegression(C=c, max_iter=1000).fit(scaled, cases["appeal_expected"].astype(bool))
+        model["appeal"] = {"coef": appeal.coef_[0].tolist(), "intercept": float(appeal.intercept_[0])}
+    return model
+
+
+def main():
+    """
+    Train the complexity model on labeled cases
+    """
+    parser = argparse.ArgumentParser(description="Train the local complexity scorer")
+    parser.add_argument("--cases", required=True, help="CSV with text, complexity and optional appeal_expected columns")
+    parser.add_argument("--output", default=COMPLEXITY_MODEL_PATH)
+    parser.add_argument("--c", type=float, default=1.0, help="Inverse regularization strength")
+    args = parser.parse_args()
+
+    print(f"📊 Training complexity model on {args.cases}...")
+    cases = pd.read_csv(args.cases)
+    model = train_complexity_model(cases, args.c)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(model, f, indent=2)
+    print(f"✅ Model with classes {model['classes']} written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import argparse
+import os
+import sys
+from typing import Dict, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from experts.tools.estimators.outcome_model import OUTCOME_MODEL_PATH, OutcomeModel, save_outcome_model  # noqa: E402
+from experts.tools.estimators.outcome_stats import WIN_OUTCOMES  # noqa: E402
+from experts.tools.vector_index.quantization import truncate_embeddings  # noqa: E402
+
+DEFAULT_DIM = 256
+
+
+def load_training_data(collection, dim: int = DEFAULT_DIM, batch_size: int = 5000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Embeddings and outcomes of all cases with an outcome
+
+    Args:
+        collection: Chroma collection, ShardedCollection or exported flat index
+        dim: Leading (Matryoshka) dimensions kept, re-normalized
+        batch_size: Cases fetched per request
+
+    Returns:
+        Tuple of (embeddings (n, dim), labels (n,) with 1 for won cases)
+    """
+    features, labels = [], []
+    for offset in range(0, collection.count(), batch_size):
+        batch = collection.get(limit=batch_size, offset=offset, include=["embeddings", "metadatas"])
+        rows, batch_labels = [], []
+        for embedding, metadata in zip(batch["embeddings"], batch["metadatas"]):
+            outcome = str((metadata or {}).get("outcome") or "").strip().lower()
+            if outcome and outcome != "nan":
+                rows.append(embedding)
+                batch_labels.append(outcome in WIN_OUTCOMES)
+        if rows:
+            features.append(truncate_embeddings(rows, dim))
+            labels.extend(batch_labels)
+    if not features:
+        return np.empty((0, dim), dtype=np.float32), np.empty(0, dtype=int)
+    return np.vstack(features), np.asarray(labels, dtype=int)
+
+
+def train_outcome_model(
+    features: np.ndarray,
+    labels: np.ndarray,
+    c: float = 1.0,
+    seed: int = 42,
+    embedding_model: str = "gemini-embedding-001",
+) -> OutcomeModel:
+    """
+    Fit a logistic regression and calibrate it with Platt scaling
+
+    60% of the cases train the regression, 20% fit the sigmoid calibration of
+    its scores and 20% are held out for the reported metrics. Platt scaling is
+    an affine map of the logit, so the calibrated model is again one
+    logistic regression and is saved as a single coefficient vector.
+
+    Returns:
+        OutcomeModel with held-out metrics (Brier score, log loss, ROC AUC)
+    """
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import brier_score_loss, log_loss, roc_auc_score
+    from sklearn.model_selection import train_test_split
+
+    train_x, rest_x, train_y, rest_y = train_test_split(
+        features, labels, test_size=0.4, random_state=seed, stratify=labels
+    )
+    calib_x, test_x, calib_y, test_y = train_test_split(
+        rest_x, rest_y, test_size=0.5, random_state=seed, stratify=rest_y
+    )
+
+    classifier = LogisticRegression(C=c, max_iter=1000).fit(train_x, train_y)
+    platt = LogisticRegression(C=1e6, max_iter=1000).fit(classifier.decision_function(calib_x)[:, None], calib_y)
+    a, b = float(platt.coef_[0, 0]), float(platt.intercept_[0])
+    coef = a * classifier.coef_[0]
+    intercept = a * float(classifier.intercept_[0]) + b
+
+    probabilities = 1.0 / (1.0 + np.exp(-(test_x @ coef + intercept)))
+    metrics: Dict[str, float] = {
+        "cases": int(len(labels)),
+        "win_rate": round(float(labels.mean()), 4),
+        "brier": round(float(brier_score_loss(test_y, probabilities)), 4),
+        "log_loss": round(float(log_loss(test_y, probabilities)), 4),
+        "roc_auc": round(float(roc_auc_score(test_y, probabilities)), 4),
+    }
+    return OutcomeModel(coef.astype(np.float32), intercept, features.shape[1], embedding_model, metrics)
+
+
+def main():
+    """
+    Train the win likelihood model on the similar-cases embeddings
+    """
+    parser = argparse.ArgumentParser(description="Train the win likelihood model on case embeddings")
+    parser.add_argument("--chroma-path", default="../../experts/tools/similar_cases/chroma_db")
+    parser.add_argument("--collection", default="similar_vectors_gemini")
+    parser.add_argument("--index", default=None, help="Exported flat index directory (instead of Chroma)")
+    parser.add_argument("--dim", type=int, default=DEFAULT_DIM, help="Leading embedding dimensions used")
+    parser.add_argument("--c", type=float, default=1.0, help="Inverse regularization strength")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--output", default=OUTCOME_MODEL_PATH)
+    args = parser.parse_args()
+
+    if args.index:
+        from experts.tools.vector_index import FlatVectorIndex
+
+        collection = FlatVectorIndex.open(args.index)
+    else:
+        import chromadb
+        from chromadb.config import Settings
+        from experts.tools.vector_index import open_collection
+
+        collection = open_collection(chromadb.PersistentClient(path=args.chroma_path, settings=Settings()), args.collection)
+
+    print(f"📊 Loading embeddings and outcomes ({args.dim} dimensions)...")
+    features, labels = load_training_data(collection, args.dim, args.batch_size)
+    print(f"   {len(labels)} cases with outcome, {labels.mean():.1%} won" if len(labels) else "   No cases with outcome")
+    if len(labels) < 50 or labels.min() == labels.max():
+        print("❌ Not enough labeled cases of both outcomes to train")
+        return
+
+    model = train_outcome_model(features, labels, args.c)
+    save_outcome_model(model, args.output)
+    print(f"   Held-out metrics: {model.metrics}")
+    print(f"✅ Model written to {args.output} ({os.path.getsize(args.output)} bytes)")
+
+
+if __name__ == "__main__":
+    main()